@@ -0,0 +1,66 @@
+"""Run the Benchmark Suites.
+
+Run every suite, or those named, print the results and write them as a JSON report. Given a baseline report, list
+the measurements that regressed by more than the tolerance and exit with status 1 if any did.
+Every client is given the stub server's URL and a dummy token, which take precedence over `API_URL` and `TOKEN`
+from the shell or `.env`, so no suite reaches the live API.
+
+    python -m benchmarks [--suite schemas --suite sync] [--quick] [--output results.json]
+                         [--baseline previous.json] [--tolerance 0.1]
+"""
+
+import argparse
+import sys
+
+from typing import Any, Callable, Dict, List
+
+from . import bench_memory, bench_schemas, bench_sync, bench_throughput
+from .harness import Result, compare, emit, read_report
+
+
+SUITES: Dict[str, Callable[..., List[Result]]] = {
+    bench_schemas.SUITE: bench_schemas.run,
+    bench_throughput.SUITE: bench_throughput.run,
+    bench_sync.SUITE: bench_sync.run,
+    bench_memory.SUITE: bench_memory.run,
+}
+
+# Smaller runs, for a smoke test in CI.
+QUICK: Dict[str, Dict[str, Any]] = {
+    bench_schemas.SUITE: {"repeat": 1, "min_time": 0.005},
+    bench_throughput.SUITE: {"requests": 50, "latency": 0.005, "workers": 4},
+    bench_sync.SUITE: {"systems": 10, "waypoints": 20, "latency": 0.0, "workers": 4},
+    bench_memory.SUITE: {"ships": 20, "waypoints": 40},
+}
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suite", action="append", choices=list(SUITES), help="Run only this suite; repeatable.")
+    parser.add_argument("--quick", action="store_true", help="Run small sizes, to check the suites work.")
+    parser.add_argument("--output", help="Write the results as a JSON report to this path, or - for stdout.")
+    parser.add_argument("--baseline", help="Compare the results with this earlier JSON report.")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Relative change counted as a regression.")
+    args = parser.parse_args()
+
+    results: List[Result] = []
+    for suite in args.suite or list(SUITES):
+        results.extend(SUITES[suite](**(QUICK[suite] if args.quick else {})))
+    emit(results, args.output)
+
+    if args.baseline:
+        regressions = compare(read_report(args.baseline), results, args.tolerance)
+        for regression in regressions:
+            result = regression.result
+            print(
+                f"REGRESSION {result.suite} {result.name} {result.metric}: "
+                f"{regression.baseline:.3f} -> {result.value:.3f} {result.unit} ({regression.change:+.0%})",
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark Import Time.
+
+Time importing the SDK in fresh interpreters, against building every schema up front.
+
+    python -m benchmarks.bench_import [--repeat 5]
+"""
+
+import argparse
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import Dict
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+STATEMENTS: Dict[str, str] = {
+    "package": "import spacetraders_python_sdk",
+    "sync client": "from spacetraders_python_sdk import SpaceTradersClient",
+    "async client": "from spacetraders_python_sdk import AsyncSpaceTradersClient",
+    "first call": "import spacetraders_python_sdk as sdk\nsdk.SpaceTradersClient(token='-', api_url='-').agents",
+    "all schemas": "import spacetraders_python_sdk.models.models",
+}
+
+
+def measure_import(statement: str, repeat: int = 5) -> float:
+    """Return the best wall time, in seconds, of running `statement` in a fresh interpreter."""
+    script = f"import time\nstart = time.perf_counter()\n{statement}\nprint(time.perf_counter() - start)"
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, check=True, text=True, cwd=ROOT)
+        timings.append(float(result.stdout))
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, statement in STATEMENTS.items():
+        print(f"{name:<14} {measure_import(statement, args.repeat) * 1000:8.1f} ms  {statement.splitlines()[-1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark Cache Memory.
+
+Measure the bytes each cached ship and waypoint keeps allocated, for every form the SDK can hold them in: parsed
+schemas, the `FleetState` mirror, the slim views, and the raw JSON bodies `GalaxyCache` stores.
+
+    python -m benchmarks.bench_memory [--ships 500] [--waypoints 2000] [--json results.json]
+"""
+
+import argparse
+import json
+
+from typing import Any, Callable, List, Tuple
+
+from spacetraders_python_sdk.cache import FleetState
+from spacetraders_python_sdk.models import models
+from spacetraders_python_sdk.testing import payloads
+from spacetraders_python_sdk.views import ShipView
+
+from .harness import Result, emit, retained_bytes
+
+
+SUITE = "memory"
+
+
+def run(ships: int = 500, waypoints: int = 2000) -> List[Result]:
+    """Measure the retained bytes per ship and per waypoint of each form."""
+    ship_bodies = [json.dumps(payloads.make_ship(f"BILLY1-{index + 1}", seed=index)) for index in range(ships)]
+    waypoint_bodies = [
+        json.dumps(waypoint)
+        for index in range(0, waypoints, 40)
+        for waypoint in payloads.make_system_waypoints(f"X1-A{index}", min(40, waypoints - index))
+    ]
+
+    def fleet_state() -> FleetState:
+        """Return a fleet state holding every ship."""
+        state = FleetState()
+        state.set_ships(models.ShipSchema.model_validate_json(body) for body in ship_bodies)
+        return state
+
+    cases: List[Tuple[str, str, int, Callable[[], Any]]] = [
+        ("ship", "ShipSchema", ships, lambda: [models.ShipSchema.model_validate_json(body) for body in ship_bodies]),
+        ("ship", "FleetState", ships, fleet_state),
+        ("ship", "ShipView", ships, lambda: [ShipView.from_json(body) for body in ship_bodies]),
+        ("ship", "JSON bytes", ships, lambda: [body.encode() for body in ship_bodies]),
+        (
+            "waypoint",
+            "WaypointSchema",
+            waypoints,
+            lambda: [models.WaypointSchema.model_validate_json(body) for body in waypoint_bodies],
+        ),
+        ("waypoint", "JSON bytes", waypoints, lambda: [body.encode() for body in waypoint_bodies]),
+    ]
+
+    results = []
+    for item, form, count, build in cases:
+        _, retained = retained_bytes(build)
+        name = f"{item} as {form}"
+        results.append(Result(SUITE, name, "bytes_per_item", retained / count, "B", params={item: count}))
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ships", type=int, default=500)
+    parser.add_argument("--waypoints", type=int, default=2000)
+    parser.add_argument("--json", help="Also write the results as a JSON report to this path, or - for stdout.")
+    args = parser.parse_args()
+
+    emit(run(ships=args.ships, waypoints=args.waypoints), args.json)
+
+
+if __name__ == "__main__":
+    main()
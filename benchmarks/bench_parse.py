@@ -0,0 +1,64 @@
+"""Benchmark Response Parsing.
+
+Compare validating a response body through `json.loads` + `model_validate` with validating the raw bytes
+through `model_validate_json`, on large waypoint and ship list payloads.
+
+    python -m benchmarks.bench_parse [--waypoints 1000] [--ships 200] [--repeat 20]
+"""
+
+import argparse
+import json
+
+from typing import Type
+
+from pydantic import BaseModel
+
+from spacetraders_python_sdk.models.models import (
+    ListShipsResponseSchema,
+    ListWaypointsResponseSchema,
+)
+from spacetraders_python_sdk.testing import payloads
+
+from .harness import measure
+
+
+def compare(name: str, schema: Type[BaseModel], body: bytes, repeat: int) -> None:
+    """Print both parse paths side by side for one payload."""
+    via_dicts = measure(lambda: schema.model_validate(json.loads(body)), repeat)
+    via_bytes = measure(lambda: schema.model_validate_json(body), repeat)
+    print(f"{name} ({len(body) / 1024:.0f} KiB)")
+    for label, result in (("model_validate(json.loads())", via_dicts), ("model_validate_json(bytes)", via_bytes)):
+        print(f"  {label:<30} {result['cpu_ms']:8.2f} ms cpu {result['peak_kib']:10.0f} KiB peak")
+    print(
+        f"  {'savings':<30} {1 - via_bytes['cpu_ms'] / via_dicts['cpu_ms']:8.0%} cpu"
+        f" {1 - via_bytes['peak_kib'] / via_dicts['peak_kib']:14.0%} peak"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--waypoints", type=int, default=1000)
+    parser.add_argument("--ships", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    waypoints = payloads.make_system_waypoints("X1-GJ54", args.waypoints)
+    ships = [payloads.make_ship(f"BILLY1-{index + 1}", seed=index) for index in range(args.ships)]
+
+    compare(
+        "ListWaypointsResponseSchema",
+        ListWaypointsResponseSchema,
+        json.dumps(payloads.make_page(waypoints, total=len(waypoints))).encode(),
+        args.repeat,
+    )
+    compare(
+        "ListShipsResponseSchema",
+        ListShipsResponseSchema,
+        json.dumps(payloads.make_page(ships, total=len(ships))).encode(),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Benchmark Response Validation.
+
+Time `model_validate_json` for every response schema of the SDK, on bodies sized like the live API's: full pages
+of 20 items for list endpoints, a market trading every good with its recent transactions, and so on.
+
+    python -m benchmarks.bench_schemas [--repeat 5] [--json results.json]
+"""
+
+import argparse
+import inspect
+import json
+import re
+
+from typing import Any, Callable, Dict, List, Type
+
+from pydantic import BaseModel
+
+from spacetraders_python_sdk.models import models
+from spacetraders_python_sdk.testing import payloads
+
+from .harness import Result, emit, time_per_call
+
+
+SUITE = "schemas"
+
+SCHEMA_NAME = re.compile(r"Res?ponseSchema$")
+
+
+def _data(value: Any) -> Dict[str, Any]:
+    """Wrap a value like a single item endpoint."""
+    return {"data": value}
+
+
+def _ship(index: int = 0) -> Dict[str, Any]:
+    """Return a ship."""
+    return payloads.make_ship(f"BILLY1-{index + 1}", seed=index)
+
+
+def _market() -> Dict[str, Any]:
+    """Return a market trading every good, with a page of recent transactions."""
+    market = payloads.make_market("X1-GJ54-A1", goods=payloads.TRADE_SYMBOLS)
+    market["transactions"] = [
+        payloads.make_transaction(f"AGENT{index}-1", payloads.TRADE_SYMBOLS[index % 18], 10 + index, 50 + index)
+        for index in range(20)
+    ]
+    return market
+
+
+def _surveys() -> List[Dict[str, Any]]:
+    """Return the surveys of one survey action."""
+    return [payloads.make_survey(f"X1-GJ54-B2-{index:08X}") for index in range(3)]
+
+
+def _extraction() -> Dict[str, Any]:
+    """Return the yield of one extraction."""
+    return {"shipSymbol": "BILLY1-1", "yield": {"symbol": "IRON_ORE", "units": 7}}
+
+
+# Body of a typical response, per schema name.
+BODIES: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "StatusReponseSchema": payloads.make_status,
+    "AgentResponseSchema": lambda: _data(payloads.make_agent()),
+    "ListAgentsResponseSchema": lambda: payloads.make_page(
+        [payloads.make_agent(f"AGENT{index}") for index in range(20)], total=1200
+    ),
+    "ContractResponseSchema": lambda: _data(payloads.make_contract()),
+    "ListContractsResponseSchema": lambda: payloads.make_page(
+        [payloads.make_contract(f"cm0contract{index:04d}") for index in range(20)], total=60
+    ),
+    "AcceptContractResponseSchema": lambda: _data(
+        {"agent": payloads.make_agent(), "contract": payloads.make_contract(accepted=True)}
+    ),
+    "FactionResponseSchema": lambda: _data(payloads.make_faction()),
+    "ListFactionsResponseSchema": lambda: payloads.make_page(
+        [payloads.make_faction(symbol) for symbol in payloads.FACTION_SYMBOLS], total=len(payloads.FACTION_SYMBOLS)
+    ),
+    "WaypointResponseSchema": lambda: _data(payloads.make_system_waypoints("X1-GJ54", 1)[0]),
+    "ListWaypointsResponseSchema": lambda: payloads.make_page(
+        payloads.make_system_waypoints("X1-GJ54", 20), total=80
+    ),
+    "SystemResponseSchema": lambda: _data(payloads.make_system("X1-GJ54", waypoint_count=40)),
+    "ListSystemsResponseSchema": lambda: payloads.make_page(
+        [payloads.make_system(f"X1-A{index}", waypoint_count=40, seed=index) for index in range(20)], total=8000
+    ),
+    "MarketResponseSchema": lambda: _data(_market()),
+    "ShipResponseSchema": lambda: _data(_ship()),
+    "ListShipsResponseSchema": lambda: payloads.make_page([_ship(index) for index in range(20)], total=60),
+    "ShipyardResponseSchema": lambda: _data(payloads.make_shipyard("X1-GJ54-A2", payloads.SHIP_TYPES)),
+    "JumpGateResponseSchema": lambda: _data(
+        payloads.make_jump_gate("X1-GJ54-I61", [f"X1-B{index}-I{index}" for index in range(6)])
+    ),
+    "ConstructionResponseSchema": lambda: _data(payloads.make_construction("X1-GJ54-I61")),
+    "SupplyConstructionResponseSchema": lambda: _data(
+        {"construction": payloads.make_construction("X1-GJ54-I61", fulfilled=40), "cargo": _ship()["cargo"]}
+    ),
+    "ShipCargoResponseSchema": lambda: _data(_ship()["cargo"]),
+    "ShipOrbitResponseSchema": lambda: _data({"nav": _ship()["nav"]}),
+    "NavigateShipResponseSchema": lambda: _data({"fuel": _ship()["fuel"], "nav": _ship()["nav"], "events": []}),
+    "PatchShipNavResponseSchema": lambda: _data(_ship()["nav"]),
+    "RefuelShipResponseSchema": lambda: _data(
+        {
+            "agent": payloads.make_agent(),
+            "fuel": _ship()["fuel"],
+            "transaction": payloads.make_transaction("BILLY1-1", "FUEL", 100, 72, transaction_type="PURCHASE"),
+        }
+    ),
+    "ExtractResponseSchema": lambda: _data(
+        {
+            "cooldown": payloads.make_cooldown("BILLY1-1", 70),
+            "extraction": _extraction(),
+            "cargo": _ship()["cargo"],
+            "events": [],
+        }
+    ),
+    "CreateSurveyResponseSchema": lambda: _data(
+        {"cooldown": payloads.make_cooldown("BILLY1-1", 60), "surveys": _surveys()}
+    ),
+    "SellCargoResponseSchema": lambda: _data(
+        {
+            "agent": payloads.make_agent(),
+            "cargo": _ship()["cargo"],
+            "transaction": payloads.make_transaction("BILLY1-1", "IRON_ORE", 10, 40),
+        }
+    ),
+    "DeliverContractResponseSchema": lambda: _data(
+        {"contract": payloads.make_contract(accepted=True), "cargo": _ship()["cargo"]}
+    ),
+}
+
+
+def response_schemas() -> Dict[str, Type[BaseModel]]:
+    """Return every response schema of the SDK, by name."""
+    return {
+        name: schema
+        for name, schema in vars(models).items()
+        if inspect.isclass(schema) and issubclass(schema, BaseModel) and SCHEMA_NAME.search(name)
+    }
+
+
+def run(repeat: int = 5, min_time: float = 0.05) -> List[Result]:
+    """Time validating the typical body of every response schema."""
+    schemas = response_schemas()
+    missing = sorted(set(schemas) - set(BODIES))
+    if missing:
+        raise KeyError(f"No benchmark body for {', '.join(missing)}; add one to BODIES.")
+
+    results = []
+    for name, schema in sorted(schemas.items()):
+        body = json.dumps(BODIES[name]()).encode()
+        seconds = time_per_call(lambda: schema.model_validate_json(body), repeat=repeat, min_time=min_time)
+        results.append(Result(SUITE, name, "validate_json", seconds * 1e6, "us", params={"body_bytes": len(body)}))
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="Also write the results as a JSON report to this path, or - for stdout.")
+    args = parser.parse_args()
+
+    results = run(repeat=args.repeat)
+    emit(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
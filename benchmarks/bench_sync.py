@@ -0,0 +1,94 @@
+"""Benchmark Galaxy Sync.
+
+Time downloading every system and every waypoint of a synthetic galaxy served by the local stub server, the way a
+bot maps the galaxy after a reset: one page at a time, with concurrent pages and systems, and again from a warm
+`GalaxyCache`.
+
+    python -m benchmarks.bench_sync [--systems 100] [--waypoints 40] [--latency 0.01] [--workers 8] [--json PATH]
+"""
+
+import argparse
+import tempfile
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from spacetraders_python_sdk import SpaceTradersClient
+from spacetraders_python_sdk.cache import GalaxyCache
+from spacetraders_python_sdk.testing import StubServer
+from spacetraders_python_sdk.transport import RateLimiter
+
+from .harness import Result, emit
+
+
+SUITE = "sync"
+
+
+def sync_galaxy(client: SpaceTradersClient, workers: int) -> Tuple[int, int]:
+    """Download every system and its waypoints, `workers` pages or systems at a time; return how many of each."""
+    systems = client.systems.fetch_all_systems(max_workers=workers)
+
+    def waypoints(system_symbol: str) -> int:
+        return len(client.systems.fetch_all_waypoints_in_system(system_symbol=system_symbol, max_workers=workers))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return len(systems), sum(executor.map(waypoints, [system.symbol for system in systems]))
+
+
+def run(systems: int = 100, waypoints: int = 40, latency: float = 0.01, workers: int = 8) -> List[Result]:
+    """Time syncing the galaxy sequentially, concurrently and from a warm cache."""
+    results = []
+    server = StubServer(ships=1, systems=systems, waypoints_per_system=waypoints, latency=latency)
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = GalaxyCache(Path(directory) / "galaxy.db")
+        cases: List[Tuple[str, int, Optional[GalaxyCache]]] = [
+            ("sequential", 1, None),
+            ("concurrent", workers, None),
+            ("concurrent cold cache", workers, cache),
+            ("concurrent warm cache", workers, cache),
+        ]
+        for name, case_workers, galaxy_cache in cases:
+            client = SpaceTradersClient(
+                token="token",
+                api_url="http://stub/v2",
+                rate_limiter=RateLimiter(rate=1e9, burst=0),
+                galaxy_cache=galaxy_cache,
+            )
+            client.session.mount("http://", server.adapter())
+            requests_before = server.stats["requests"]
+
+            start = time.perf_counter()
+            synced_systems, synced_waypoints = sync_galaxy(client, case_workers)
+            seconds = time.perf_counter() - start
+
+            params = {
+                "systems": synced_systems,
+                "waypoints": synced_waypoints,
+                "requests": server.stats["requests"] - requests_before,
+                "latency": latency,
+                "workers": case_workers,
+            }
+            results.append(Result(SUITE, name, "seconds", seconds, "s", params=params))
+        cache.close()
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--systems", type=int, default=100)
+    parser.add_argument("--waypoints", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--json", help="Also write the results as a JSON report to this path, or - for stdout.")
+    args = parser.parse_args()
+
+    results = run(systems=args.systems, waypoints=args.waypoints, latency=args.latency, workers=args.workers)
+    emit(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Benchmark Client Throughput.
+
+Measure requests per second through `SpaceTradersClient` and `AsyncSpaceTradersClient` against the local stub
+server: the SDK's own overhead per call with an instant server, concurrency with a server answering after
+`--latency` seconds, retries of injected 429s, replay from a recorded cassette, and a real HTTP round trip on
+localhost. The client-side rate limit
+is lifted, so the numbers measure the SDK rather than the API's budget.
+
+    python -m benchmarks.bench_throughput [--requests 500] [--latency 0.02] [--workers 16] [--json results.json]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from spacetraders_python_sdk import AsyncSpaceTradersClient, SpaceTradersClient
+from spacetraders_python_sdk.cassette import Cassette, CassetteRecorder
+from spacetraders_python_sdk.testing import StubServer
+from spacetraders_python_sdk.transport import RateLimiter, RetryPolicy
+
+from .harness import Result, emit
+
+
+SUITE = "throughput"
+
+
+def unlimited() -> RateLimiter:
+    """Return a rate limiter that never waits."""
+    return RateLimiter(rate=1e9, burst=0)
+
+
+def make_client(server: StubServer, api_url: str = "http://stub/v2") -> SpaceTradersClient:
+    """Return a client answered by `server`, in process unless `api_url` points to it on localhost."""
+    client = SpaceTradersClient(
+        token="token",
+        api_url=api_url,
+        rate_limiter=unlimited(),
+        retry_policy=RetryPolicy(max_retries=10, backoff_base=0),
+    )
+    if api_url.startswith("http://stub"):
+        client.session.mount("http://", server.adapter())
+    return client
+
+
+def requests_per_second(call: Callable[[int], Any], requests: int, workers: int = 1) -> float:
+    """Return how many calls per second `call` sustains, called `requests` times from `workers` threads."""
+    call(0)
+    start = time.perf_counter()
+    if workers == 1:
+        for index in range(requests):
+            call(index)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(call, range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+def async_requests_per_second(server: StubServer, requests: int, concurrency: int) -> float:
+    """Return how many `get_ship` calls per second the async client sustains with `concurrency` in flight."""
+
+    async def run() -> float:
+        async with AsyncSpaceTradersClient(
+            token="token",
+            api_url="http://stub/v2",
+            max_connections=concurrency,
+            rate_limiter=unlimited(),
+            transport=server.async_transport(),
+        ) as client:
+            semaphore = asyncio.Semaphore(concurrency)
+            ships = list(server.ships)
+
+            async def call(index: int) -> None:
+                async with semaphore:
+                    await client.fleet.get_ship(ship_symbol=ships[index % len(ships)])
+
+            await call(0)
+            start = time.perf_counter()
+            await asyncio.gather(*(call(index) for index in range(requests)))
+            return requests / (time.perf_counter() - start)
+
+    return asyncio.run(run())
+
+
+def run(requests: int = 500, latency: float = 0.02, workers: int = 16) -> List[Result]:
+    """Measure the throughput of each case."""
+    results = []
+
+    def record(name: str, rps: float, **params: Any) -> None:
+        results.append(Result(SUITE, name, "rps", rps, "req/s", higher_is_better=True, params=params))
+
+    server = StubServer(ships=20)
+    client = make_client(server)
+    ships = list(server.ships)
+    record(
+        "get_ship",
+        requests_per_second(lambda index: client.fleet.get_ship(ship_symbol=ships[index % 20]), requests),
+        requests=requests,
+    )
+    record(
+        "orbit_ship",
+        requests_per_second(lambda index: client.fleet.orbit_ship(ship_symbol=ships[index % 20]), requests),
+        requests=requests,
+    )
+    record(
+        "list_waypoints_in_system",
+        requests_per_second(
+            lambda index: client.systems.list_waypoints_in_system(system_symbol="X1-GJ54", traits="", limit=20),
+            requests,
+        ),
+        requests=requests,
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "throughput.jsonl.gz")
+        with CassetteRecorder(path) as recorder:
+            client.session.mount("http://", recorder.adapter(server.adapter()))
+            for ship in ships:
+                client.fleet.get_ship(ship_symbol=ship)
+        Cassette.load(path).mount(client.session)
+        record(
+            "get_ship replayed",
+            requests_per_second(lambda index: client.fleet.get_ship(ship_symbol=ships[index % 20]), requests),
+            requests=requests,
+        )
+
+    injected = StubServer(ships=20, inject_429=0.1, retry_after=0)
+    client = make_client(injected)
+    record(
+        "get_ship with 10% 429s",
+        requests_per_second(lambda index: client.fleet.get_ship(ship_symbol=ships[index % 20]), requests),
+        requests=requests,
+        retried=injected.stats["injected_429"],
+    )
+
+    slow = StubServer(ships=20, latency=latency)
+    client = make_client(slow)
+    slow_requests = max(workers, round(requests * latency * 10))
+    parameters: Dict[str, Any] = {"requests": slow_requests, "latency": latency, "workers": workers}
+    record(
+        "get_ship threaded",
+        requests_per_second(lambda index: client.fleet.get_ship(ship_symbol=ships[index % 20]), slow_requests, workers),
+        **parameters,
+    )
+    record("get_ship async", async_requests_per_second(slow, slow_requests, workers), **parameters)
+    start = time.perf_counter()
+    client.fleet.orbit_ships(ship_symbols=ships, max_workers=workers)
+    record("orbit_ships batch", len(ships) / (time.perf_counter() - start), ships=len(ships), **parameters)
+
+    with server.serve() as http:
+        client = make_client(server, api_url=http.url)
+        record(
+            "get_ship over localhost",
+            requests_per_second(lambda index: client.fleet.get_ship(ship_symbol=ships[index % 20]), requests),
+            requests=requests,
+        )
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--json", help="Also write the results as a JSON report to this path, or - for stdout.")
+    args = parser.parse_args()
+
+    results = run(requests=args.requests, latency=args.latency, workers=args.workers)
+    emit(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
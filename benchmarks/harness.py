@@ -0,0 +1,169 @@
+"""Benchmark Harness.
+
+Shared measurement helpers and the JSON report every suite writes, so results can be compared across releases:
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --output new.json --baseline results.json
+"""
+
+import gc
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from importlib import metadata
+from os import PathLike
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+
+REPORT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Result:
+    """One measurement: `value` in `unit` of `metric`, for the case `name` of a suite."""
+
+    suite: str
+    name: str
+    metric: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        """Return what identifies the measurement across reports."""
+        return self.suite, self.name, self.metric
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A measurement that got worse than its baseline by more than the tolerance."""
+
+    result: Result
+    baseline: float
+
+    @property
+    def change(self) -> float:
+        """Return the relative change from the baseline, positive when worse."""
+        if not self.baseline:
+            return 0.0
+        change = (self.result.value - self.baseline) / self.baseline
+        return -change if self.result.higher_is_better else change
+
+
+def measure(run: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Return the best CPU time and the peak traced allocation of `run`."""
+    run()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        run()
+        best = min(best, time.process_time() - start)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"cpu_ms": best * 1000, "peak_kib": peak / 1024}
+
+
+def time_per_call(run: Callable[[], Any], repeat: int = 5, min_time: float = 0.05) -> float:
+    """Return the best wall time, in seconds, of one call of `run`, timing batches of calls lasting `min_time`."""
+    timer = timeit.Timer(run)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def retained_bytes(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """Return what `build` returns and how many bytes of it are still allocated once it has returned."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        built = build()
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return built, after - before
+
+
+def environment() -> Dict[str, str]:
+    """Return what the results depend on besides the code: versions and machine."""
+    versions = {}
+    for package in ("spacetraders-python-sdk", "pydantic", "pydantic-core", "requests", "httpx"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = "unknown"
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        **versions,
+    }
+
+
+def write_report(results: Iterable[Result], path: Union[str, PathLike, None] = None) -> Dict[str, Any]:
+    """Write the results as a JSON report to `path`, or to stdout for `-`, and return the report."""
+    report = {
+        "version": REPORT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "results": [asdict(result) for result in results],
+    }
+    if path is not None:
+        text = json.dumps(report, indent=2) + "\n"
+        if str(path) == "-":
+            sys.stdout.write(text)
+        else:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text)
+    return report
+
+
+def read_report(path: Union[str, PathLike]) -> List[Result]:
+    """Read the results of a report written by `write_report`."""
+    with open(path, encoding="utf-8") as file:
+        report = json.load(file)
+    if report.get("version") != REPORT_VERSION:
+        raise ValueError(f"Unsupported benchmark report version {report.get('version')!r} in {path}.")
+    return [Result(**result) for result in report["results"]]
+
+
+def compare(baseline: Iterable[Result], current: Iterable[Result], tolerance: float = 0.1) -> List[Regression]:
+    """Return the current results worse than their baseline by more than `tolerance`, worst first.
+
+    Results without a baseline, e.g. new benchmarks, are not regressions.
+    """
+    previous = {result.key: result.value for result in baseline}
+    regressions = [Regression(result, previous[result.key]) for result in current if result.key in previous]
+    return sorted(
+        (regression for regression in regressions if regression.change > tolerance),
+        key=lambda regression: -regression.change,
+    )
+
+
+def print_results(results: Iterable[Result], stream: Any = None) -> None:
+    """Print the results as a table."""
+    for result in results:
+        print(
+            f"{result.suite:<10} {result.name:<44} {result.metric:<16} {result.value:14.3f} {result.unit}",
+            file=stream or sys.stdout,
+        )
+
+
+def emit(results: List[Result], json_path: Union[str, PathLike, None] = None) -> None:
+    """Print the results, and write them as a JSON report if given a path; the table goes to stderr for `-`."""
+    print_results(results, sys.stderr if str(json_path) == "-" else None)
+    write_report(results, json_path)
@@ -1,8 +1,25 @@
 """Init SpaceTraders SDK."""
 
-from .client import SpaceTradersClient
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_getattr
+
+
+if TYPE_CHECKING:
+    from .async_client import AsyncSpaceTradersClient
+    from .client import SpaceTradersClient
+
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "AsyncSpaceTradersClient": ".async_client",
+        "SpaceTradersClient": ".client",
+    },
+)
 
 
 __all__ = [
+    "AsyncSpaceTradersClient",
     "SpaceTradersClient",
 ]
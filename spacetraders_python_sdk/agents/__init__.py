@@ -1,8 +1,25 @@
 """Init Agents."""
 
-from .agents import Agents
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_getattr
+
+
+if TYPE_CHECKING:
+    from .agents import Agents
+    from .async_agents import AsyncAgents
+
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "AsyncAgents": ".async_agents",
+        "Agents": ".agents",
+    },
+)
 
 
 __all__ = [
     "Agents",
+    "AsyncAgents",
 ]
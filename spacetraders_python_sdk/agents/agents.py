@@ -1,14 +1,23 @@
 """Agents."""
 
-from typing import Annotated, Tuple
+from typing import Annotated, List, Optional, Tuple
 
 import requests
 
 from pydantic import Field
 
-from ..models.models import AgentResponseSchema, ListAgentsResponseSchema
+from ..cache import FleetState
+from ..models.models import (
+    AgentResponseSchema,
+    AgentSchema,
+    ListAgentsResponseSchema,
+)
+from ..pagination import Paginator
+from ..tracing import traced
+from ..transport import parse_response
 
 
+@traced
 class Agents:
     """Agents."""
 
@@ -16,25 +25,41 @@ def __init__(
         self,
         api_url: str,
         session: requests.Session,
+        fleet_state: Optional[FleetState] = None,
     ) -> None:
-        """Init."""
+        """Init.
+
+        Every response is recorded into `fleet_state` when one is given, and reads are served from it.
+        """
         self.api_url = api_url
         self.session = session
+        self.fleet_state = fleet_state
 
     def get_agent(
         self,
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the fleet state.")] = True,
     ) -> Tuple[str, AgentResponseSchema | None]:
         """Fetch your agent's details."""
         try:
+            if use_cache and self.fleet_state:
+                cached = self.fleet_state.agent
+                if cached:
+                    return "Successfully fetched agent details.", AgentResponseSchema(data=cached)
+
             response = self.session.get(
                 url=f"{self.api_url}/my/agent",
             )
 
             response.raise_for_status()
 
+            agent = parse_response(AgentResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.set_agent(agent.data)
+
             return (
                 "Successfully fetched agent details.",
-                AgentResponseSchema.model_validate(response.json())
+                agent
             )
 
         except requests.exceptions.HTTPError as error:
@@ -60,7 +85,7 @@ def list_agents(
 
             return (
                 "Successfully fetched agents details.",
-                ListAgentsResponseSchema.model_validate(response.json())
+                parse_response(ListAgentsResponseSchema, response)
             )
 
         except requests.exceptions.HTTPError as error:
@@ -68,6 +93,26 @@ def list_agents(
                 case _:
                     return f"Unknown error: {error.response.text}", None
 
+    def iter_agents(
+        self,
+        page: Annotated[int, Field(description="What page to start from.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+    ) -> Paginator[AgentSchema]:
+        """Iterate lazily over all the agents, page by page."""
+        return Paginator(
+            fetch_page=self.list_agents,
+            page=page,
+            limit=limit,
+        )
+
+    def fetch_all_agents(
+        self,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+        max_workers: Annotated[int, Field(description="How many pages to fetch concurrently.", ge=1, default=8)] = 8,
+    ) -> List[AgentSchema]:
+        """Fetch all the agents, downloading the pages concurrently."""
+        return self.iter_agents(limit=limit).fetch_all(max_workers=max_workers)
+
     def get_public_agent(
         self,
         agent_symbol: Annotated[str, Field(description="The agent symbol.", default="FEBA66")] = "FEBA66",
@@ -82,7 +127,7 @@ def get_public_agent(
 
             return (
                 "Successfully fetched agent details.",
-                AgentResponseSchema.model_validate(response.json())
+                parse_response(AgentResponseSchema, response)
             )
 
         except requests.exceptions.HTTPError as error:
@@ -0,0 +1,136 @@
+"""Async Agents."""
+
+from typing import Annotated, List, Optional, Tuple
+
+import httpx
+
+from pydantic import Field
+
+from ..cache import FleetState
+from ..models.models import (
+    AgentResponseSchema,
+    AgentSchema,
+    ListAgentsResponseSchema,
+)
+from ..pagination import AsyncPaginator
+from ..tracing import traced
+from ..transport import parse_response
+
+
+@traced
+class AsyncAgents:
+    """Async Agents."""
+
+    def __init__(
+        self,
+        api_url: str,
+        session: httpx.AsyncClient,
+        fleet_state: Optional[FleetState] = None,
+    ) -> None:
+        """Init.
+
+        Every response is recorded into `fleet_state` when one is given, and reads are served from it.
+        """
+        self.api_url = api_url
+        self.session = session
+        self.fleet_state = fleet_state
+
+    async def get_agent(
+        self,
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the fleet state.")] = True,
+    ) -> Tuple[str, AgentResponseSchema | None]:
+        """Fetch your agent's details."""
+        try:
+            if use_cache and self.fleet_state:
+                cached = self.fleet_state.agent
+                if cached:
+                    return "Successfully fetched agent details.", AgentResponseSchema(data=cached)
+
+            response = await self.session.get(
+                url=f"{self.api_url}/my/agent",
+            )
+
+            response.raise_for_status()
+
+            agent = parse_response(AgentResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.set_agent(agent.data)
+
+            return (
+                "Successfully fetched agent details.",
+                agent
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def list_agents(
+        self,
+        page: Annotated[int, Field(description="What entry offset to request.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to return per page.", ge=1, le=20, default=10)] = 10,
+    ) -> Tuple[str, ListAgentsResponseSchema | None]:
+        """Fetch agents details."""
+        try:
+            parameters = f"page={page}"
+            parameters += f"&limit={limit}"
+
+            response = await self.session.get(
+                url=f"{self.api_url}/agents?{parameters}",
+            )
+
+            response.raise_for_status()
+
+            return (
+                "Successfully fetched agents details.",
+                parse_response(ListAgentsResponseSchema, response)
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    def iter_agents(
+        self,
+        page: Annotated[int, Field(description="What page to start from.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+    ) -> AsyncPaginator[AgentSchema]:
+        """Iterate lazily over all the agents, page by page."""
+        return AsyncPaginator(
+            fetch_page=self.list_agents,
+            page=page,
+            limit=limit,
+        )
+
+    async def fetch_all_agents(
+        self,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+        max_workers: Annotated[int, Field(description="How many pages to fetch concurrently.", ge=1, default=8)] = 8,
+    ) -> List[AgentSchema]:
+        """Fetch all the agents, downloading the pages concurrently."""
+        return await self.iter_agents(limit=limit).fetch_all(max_workers=max_workers)
+
+    async def get_public_agent(
+        self,
+        agent_symbol: Annotated[str, Field(description="The agent symbol.", default="FEBA66")] = "FEBA66",
+    ) -> Tuple[str, AgentResponseSchema | None]:
+        """Fetch agent details."""
+        try:
+            response = await self.session.get(
+                url=f"{self.api_url}/agents/{agent_symbol}",
+            )
+
+            response.raise_for_status()
+
+            return (
+                "Successfully fetched agent details.",
+                parse_response(AgentResponseSchema, response)
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
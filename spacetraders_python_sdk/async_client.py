@@ -0,0 +1,198 @@
+"""Async Client SDK for the SpaceTraders API."""
+
+import sys
+
+from functools import cached_property
+from os import environ
+from typing import TYPE_CHECKING, Optional
+
+import httpx
+
+from .cache import FleetState, GalaxyCache, ResponseCache
+from .lazy import load_env
+from .metrics import MetricsHooks
+from .tracing import Tracer
+from .transport import (
+    AsyncSpaceTradersSession,
+    RateLimiter,
+    RetryPolicy,
+    parse_response,
+)
+
+
+if TYPE_CHECKING:
+    from .agents import AsyncAgents
+    from .contracts import AsyncContracts
+    from .factions import AsyncFactions
+    from .fleet import AsyncFleet
+    from .models.models import StatusReponseSchema
+    from .systems import AsyncSystems
+
+
+class AsyncSpaceTradersClient:
+    """Async Client SDK for the SpaceTraders API.
+
+    Every subclient shares one pooled `httpx.AsyncClient`, so a single event loop can keep many ships busy
+    without one thread per ship. Use it as an async context manager, or call `aclose` when done.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        api_url: Optional[str] = None,
+        max_connections: int = 20,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        galaxy_cache: Optional[GalaxyCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        fleet_state: Optional[FleetState] = None,
+        metrics: Optional[MetricsHooks] = None,
+        tracer: Optional[Tracer] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """Init the Client.
+
+        `token` and `api_url` default to the `TOKEN` and `API_URL` environment variables, also read from `.env`.
+        `max_connections` bounds the connection pool shared by all subclients.
+        `rate_limiter` defaults to the server's sustained and burst limits; every subclient waits on it.
+        `retry_policy` decides which failed requests are sent again; see `RetryPolicy` for the defaults.
+        `galaxy_cache` keeps systems, waypoints and jump gates on disk until the next server reset.
+        `response_cache` reuses recent markets, shipyards and construction sites; your own sales and refuels drop
+        the market they traded at.
+        `fleet_state` is kept current from every response, so agent, ship and contract reads need no request.
+        `metrics` hooks get the latency, status, size, retries and validation time of every request.
+        `tracer` emits a span for every subclient call, with its rate limiter waits, HTTP attempts, retry
+        backoffs and validation as child spans.
+        `transport` replaces the network transport, e.g. with an `httpx.MockTransport` pointing at a local stub.
+        Subclients and their schemas are imported on first use.
+        """
+        load_env()
+
+        api_url = api_url or environ.get("API_URL")
+        if not api_url:
+            print("API URL not found")
+            sys.exit(1)
+        self.api_url: str = api_url
+
+        self.token = token or environ.get("TOKEN")
+        if not self.token:
+            print("TOKEN not found")
+            sys.exit(1)
+
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+
+        self.session = AsyncSpaceTradersSession(
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            metrics=metrics,
+            tracer=tracer,
+            headers={
+                "Accept": "Accept: application/json",
+                "Authorization": f"Bearer {self.token}",
+                "Content-Type": "application/json",
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+
+        self.galaxy_cache = galaxy_cache
+        self.response_cache = response_cache
+        self.fleet_state = fleet_state
+        self.metrics = metrics
+        self.tracer = tracer
+
+    @cached_property
+    def agents(self) -> "AsyncAgents":
+        """Agents subclient."""
+        from .agents import AsyncAgents  # pylint: disable=import-outside-toplevel
+
+        return AsyncAgents(
+            api_url=self.api_url,
+            session=self.session,
+            fleet_state=self.fleet_state,
+        )
+
+    @cached_property
+    def contracts(self) -> "AsyncContracts":
+        """Contracts subclient."""
+        from .contracts import AsyncContracts  # pylint: disable=import-outside-toplevel
+
+        return AsyncContracts(
+            api_url=self.api_url,
+            session=self.session,
+            fleet_state=self.fleet_state,
+        )
+
+    @cached_property
+    def factions(self) -> "AsyncFactions":
+        """Factions subclient."""
+        from .factions import AsyncFactions  # pylint: disable=import-outside-toplevel
+
+        return AsyncFactions(
+            api_url=self.api_url,
+            session=self.session,
+        )
+
+    @cached_property
+    def fleet(self) -> "AsyncFleet":
+        """Fleet subclient."""
+        from .fleet import AsyncFleet  # pylint: disable=import-outside-toplevel
+
+        return AsyncFleet(
+            api_url=self.api_url,
+            session=self.session,
+            fleet_state=self.fleet_state,
+            response_cache=self.response_cache,
+        )
+
+    @cached_property
+    def systems(self) -> "AsyncSystems":
+        """Systems subclient."""
+        from .systems import AsyncSystems  # pylint: disable=import-outside-toplevel
+
+        return AsyncSystems(
+            api_url=self.api_url,
+            session=self.session,
+            galaxy_cache=self.galaxy_cache,
+            response_cache=self.response_cache,
+            fleet_state=self.fleet_state,
+        )
+
+    async def __aenter__(self) -> "AsyncSpaceTradersClient":
+        """Enter the async context."""
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Close the pooled connections on exit."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self.session.aclose()
+
+    async def get_status(
+        self,
+    ) -> "StatusReponseSchema":
+        """Return the status of the game server.
+
+        This also includes a few global elements, such as announcements, server reset dates and leaderboards.
+        A new reset date invalidates the galaxy cache.
+        """
+        from .models.models import StatusReponseSchema  # pylint: disable=import-outside-toplevel  # isort: skip
+
+        response = await self.session.get(
+            url=f"{self.api_url}/",
+        )
+
+        response.raise_for_status()
+
+        status = parse_response(StatusReponseSchema, response)
+
+        if self.galaxy_cache:
+            self.galaxy_cache.set_reset_date(status.resetDate)
+
+        return status
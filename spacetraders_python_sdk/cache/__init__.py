@@ -0,0 +1,13 @@
+"""Init Cache."""
+
+from .fleet_state import FleetState
+from .galaxy_cache import GalaxyCache
+from .response_cache import CacheStats, ResponseCache
+
+
+__all__ = [
+    "CacheStats",
+    "FleetState",
+    "GalaxyCache",
+    "ResponseCache",
+]
@@ -0,0 +1,160 @@
+"""Fleet State."""
+
+import math
+import threading
+import time
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+SHIP_PARTS = ("nav", "fuel", "cargo", "cooldown")
+
+
+class FleetState:
+    """In-process mirror of your agent, ships and contracts, kept current from the responses of your actions.
+
+    `Fleet`, `Contracts` and `Agents` record every response they get into the state they are given, so the
+    nav, fuel, cargo and cooldown of a ship, your credits and your contracts can be read without spending a
+    request. Parts of a ship are tracked even before the whole ship was fetched. Reads account for time: a
+    ship in transit is reported in orbit at its destination once its arrival time has passed, and cooldowns
+    count down. Values are the parsed schemas, shared between callers: treat them as read-only.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        """Init."""
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._agent: Optional[Any] = None
+        self._ships: Dict[str, Any] = {}
+        self._parts: Dict[str, Dict[str, Any]] = {}
+        self._contracts: Dict[str, Any] = {}
+
+    def __contains__(self, ship_symbol: object) -> bool:
+        """Return whether anything is known about a ship."""
+        return ship_symbol in self._parts
+
+    @property
+    def agent(self) -> Optional[Any]:
+        """Return your `AgentSchema`, if known."""
+        return self._agent
+
+    def set_agent(self, agent: Any) -> None:
+        """Record your `AgentSchema`."""
+        self._agent = agent
+
+    def ship(self, ship_symbol: str) -> Optional[Any]:
+        """Return the `ShipSchema` of a ship with its latest known parts, if the whole ship was fetched once."""
+        with self._lock:
+            ship = self._ships.get(ship_symbol)
+            if ship is None:
+                return None
+            nav, cooldown = self._current(ship.nav, ship.cooldown)
+            if nav is ship.nav and cooldown is ship.cooldown:
+                return ship
+            return ship.model_copy(update={"nav": nav, "cooldown": cooldown})
+
+    def ships(self) -> List[Any]:
+        """Return every fetched `ShipSchema`."""
+        return [ship for ship in map(self.ship, list(self._ships)) if ship is not None]
+
+    def set_ship(self, ship: Any) -> None:
+        """Record a whole `ShipSchema`."""
+        with self._lock:
+            self._ships[ship.symbol] = ship
+            self._parts[ship.symbol] = {part: getattr(ship, part) for part in SHIP_PARTS}
+
+    def set_ships(self, ships: Iterable[Any]) -> None:
+        """Record several `ShipSchema`."""
+        for ship in ships:
+            self.set_ship(ship)
+
+    def update_ship(self, ship_symbol: str, **parts: Any) -> None:
+        """Record new `nav`, `fuel`, `cargo` or `cooldown` schemas of a ship; None values are ignored."""
+        parts = {part: value for part, value in parts.items() if value is not None}
+        unknown = set(parts) - set(SHIP_PARTS)
+        if unknown:
+            raise ValueError(f"Unknown ship parts: {', '.join(sorted(unknown))}.")
+
+        with self._lock:
+            self._parts.setdefault(ship_symbol, {}).update(parts)
+            ship = self._ships.get(ship_symbol)
+            if ship is not None and parts:
+                self._ships[ship_symbol] = ship.model_copy(update=parts)
+
+    def nav(self, ship_symbol: str) -> Optional[Any]:
+        """Return the `ShipNavSchema` of a ship, if known."""
+        with self._lock:
+            nav = self._parts.get(ship_symbol, {}).get("nav")
+            return self._current(nav, None)[0]
+
+    def fuel(self, ship_symbol: str) -> Optional[Any]:
+        """Return the `ShipFuelSchema` of a ship, if known."""
+        return self._parts.get(ship_symbol, {}).get("fuel")
+
+    def cargo(self, ship_symbol: str) -> Optional[Any]:
+        """Return the `ShipCargoSchema` of a ship, if known."""
+        return self._parts.get(ship_symbol, {}).get("cargo")
+
+    def cooldown(self, ship_symbol: str) -> Optional[Any]:
+        """Return the `CooldownSchema` of a ship, if known."""
+        with self._lock:
+            cooldown = self._parts.get(ship_symbol, {}).get("cooldown")
+            return self._current(None, cooldown)[1]
+
+    def contract(self, contract_id: str) -> Optional[Any]:
+        """Return a `ContractSchema`, if known."""
+        return self._contracts.get(contract_id)
+
+    def contracts(self) -> List[Any]:
+        """Return every known `ContractSchema`."""
+        return list(self._contracts.values())
+
+    def set_contract(self, contract: Any) -> None:
+        """Record a `ContractSchema`."""
+        self._contracts[contract.id] = contract
+
+    def set_contracts(self, contracts: Iterable[Any]) -> None:
+        """Record several `ContractSchema`."""
+        for contract in contracts:
+            self.set_contract(contract)
+
+    def record(self, data: Any, ship_symbol: Optional[str] = None) -> None:
+        """Record the `data` of an action response, e.g. of `navigate_ship`, `extract_resources` or `sell_cargo`.
+
+        Every agent, contract and ship part the response carries is recorded; ship parts belong to `ship_symbol`.
+        """
+        agent = getattr(data, "agent", None)
+        if agent is not None:
+            self.set_agent(agent)
+        contract = getattr(data, "contract", None)
+        if contract is not None:
+            self.set_contract(contract)
+        if ship_symbol is not None:
+            self.update_ship(ship_symbol, **{part: getattr(data, part, None) for part in SHIP_PARTS})
+
+    def clear(self) -> None:
+        """Forget everything, e.g. after a server reset."""
+        with self._lock:
+            self._agent = None
+            self._ships.clear()
+            self._parts.clear()
+            self._contracts.clear()
+
+    def _current(self, nav: Optional[Any], cooldown: Optional[Any]) -> Tuple[Optional[Any], Optional[Any]]:
+        """Return a nav and a cooldown brought forward to now."""
+        now = self.clock()
+        if nav is not None and nav.status == "IN_TRANSIT":
+            if datetime.fromisoformat(nav.route.arrival).timestamp() <= now:
+                from ..models.models import ShipNavStatusEnum  # pylint: disable=import-outside-toplevel  # isort: skip
+
+                nav = nav.model_copy(
+                    update={"status": ShipNavStatusEnum.IN_ORBIT, "waypointSymbol": nav.route.destination.symbol}
+                )
+
+        if cooldown is not None and cooldown.remainingSeconds > 0 and cooldown.expiration:
+            remaining = max(0, math.ceil(datetime.fromisoformat(cooldown.expiration).timestamp() - now))
+            if remaining != cooldown.remainingSeconds:
+                cooldown = cooldown.model_copy(update={"remainingSeconds": remaining})
+
+        return nav, cooldown
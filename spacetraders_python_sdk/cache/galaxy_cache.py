@@ -0,0 +1,90 @@
+"""Galaxy Cache."""
+
+import sqlite3
+import threading
+
+from os import PathLike
+from typing import List, Optional, Tuple, Union
+
+
+class GalaxyCache:
+    """Persistent SQLite cache for the galaxy data that only changes when the server resets.
+
+    Systems, waypoints and jump gates are stored as the raw JSON bodies returned by the API, so a cached read
+    is a single row lookup plus `model_validate_json`. The cache remembers the server's reset date: when
+    `SpaceTradersClient.get_status` reports a different one, every entry is dropped.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, PathLike],
+    ) -> None:
+        """Init."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "kind TEXT NOT NULL, key TEXT NOT NULL, payload BLOB NOT NULL, PRIMARY KEY (kind, key))"
+            )
+
+    @property
+    def reset_date(self) -> Optional[str]:
+        """Return the server reset date the cached entries belong to."""
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM meta WHERE name = 'reset_date'").fetchone()
+        return row[0] if row else None
+
+    def set_reset_date(self, reset_date: str) -> bool:
+        """Record the server reset date, dropping every entry if it changed. Return whether it changed."""
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT value FROM meta WHERE name = 'reset_date'").fetchone()
+            if row and row[0] == reset_date:
+                return False
+
+            self._connection.execute("DELETE FROM entries")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('reset_date', ?)",
+                (reset_date,),
+            )
+            return True
+
+    def get(self, kind: str, key: str) -> Optional[bytes]:
+        """Return the cached JSON body for `key`, if any."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM entries WHERE kind = ? AND key = ?",
+                (kind, key),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, kind: str, key: str, payload: bytes) -> None:
+        """Store the JSON body for `key`."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (kind, key, payload) VALUES (?, ?, ?)",
+                (kind, key, payload),
+            )
+
+    def entries(self, kind: str) -> List[Tuple[str, bytes]]:
+        """Return the key and JSON body of every cached entry of `kind`."""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT key, payload FROM entries WHERE kind = ? ORDER BY key",
+                (kind,),
+            ).fetchall()
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
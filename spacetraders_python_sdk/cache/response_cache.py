@@ -0,0 +1,110 @@
+"""Response Cache."""
+
+import threading
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Hit and miss counters of the response cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """Bounded in-process cache of parsed responses, with a time to live per endpoint.
+
+    Entries expire after the TTL of their endpoint, and the least recently used entry is evicted once
+    `maxsize` entries are held. Endpoints without a TTL are not cached. Cached values are the parsed
+    `*ResponseSchema` models, shared between callers: treat them as read-only.
+    """
+
+    DEFAULT_TTLS: Mapping[str, float] = {
+        "market": 60.0,
+        "shipyard": 300.0,
+        "construction": 120.0,
+    }
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttls: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Init."""
+        self.maxsize = maxsize
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Tuple[str, Hashable], Tuple[float, Any]] = OrderedDict()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._evictions: Dict[str, int] = {}
+
+    def get(self, endpoint: str, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None when it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get((endpoint, key))
+            if entry is None or entry[0] <= self.clock():
+                if entry is not None:
+                    del self._entries[(endpoint, key)]
+                self._misses[endpoint] = self._misses.get(endpoint, 0) + 1
+                return None
+
+            self._entries.move_to_end((endpoint, key))
+            self._hits[endpoint] = self._hits.get(endpoint, 0) + 1
+            return entry[1]
+
+    def set(self, endpoint: str, key: Hashable, value: Any) -> None:
+        """Cache the value for the TTL of its endpoint."""
+        ttl = self.ttls.get(endpoint)
+        if not ttl or self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[(endpoint, key)] = (self.clock() + ttl, value)
+            self._entries.move_to_end((endpoint, key))
+            while len(self._entries) > self.maxsize:
+                (evicted, _), _ = self._entries.popitem(last=False)
+                self._evictions[evicted] = self._evictions.get(evicted, 0) + 1
+
+    def invalidate(self, endpoint: str, key: Hashable) -> None:
+        """Drop the cached value, e.g. after an action changed it."""
+        with self._lock:
+            self._entries.pop((endpoint, key), None)
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self, endpoint: Optional[str] = None) -> CacheStats:
+        """Return the counters of one endpoint, or of every endpoint."""
+        with self._lock:
+            if endpoint is None:
+                return CacheStats(
+                    hits=sum(self._hits.values()),
+                    misses=sum(self._misses.values()),
+                    evictions=sum(self._evictions.values()),
+                    size=len(self._entries),
+                )
+
+            return CacheStats(
+                hits=self._hits.get(endpoint, 0),
+                misses=self._misses.get(endpoint, 0),
+                evictions=self._evictions.get(endpoint, 0),
+                size=sum(1 for cached_endpoint, _ in self._entries if cached_endpoint == endpoint),
+            )
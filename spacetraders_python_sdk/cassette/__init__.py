@@ -0,0 +1,43 @@
+"""Init Cassette."""
+
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_getattr
+
+
+if TYPE_CHECKING:
+    from .cassette import Cassette, CassetteRecorder
+    from .interaction import CassetteMissError, Interaction
+    from .transports import (
+        RecordingAdapter,
+        RecordingAsyncTransport,
+        ReplayAdapter,
+        ReplayAsyncTransport,
+    )
+
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "Cassette": ".cassette",
+        "CassetteMissError": ".interaction",
+        "CassetteRecorder": ".cassette",
+        "Interaction": ".interaction",
+        "RecordingAdapter": ".transports",
+        "RecordingAsyncTransport": ".transports",
+        "ReplayAdapter": ".transports",
+        "ReplayAsyncTransport": ".transports",
+    },
+)
+
+
+__all__ = [
+    "Cassette",
+    "CassetteMissError",
+    "CassetteRecorder",
+    "Interaction",
+    "RecordingAdapter",
+    "RecordingAsyncTransport",
+    "ReplayAdapter",
+    "ReplayAsyncTransport",
+]
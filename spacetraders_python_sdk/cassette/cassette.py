@@ -0,0 +1,210 @@
+"""Cassette."""
+
+import gzip
+import json
+import threading
+import time
+
+from os import PathLike, fspath
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import httpx
+import requests
+
+from .interaction import CassetteMissError, Interaction, request_key
+from .transports import (
+    RecordingAdapter,
+    RecordingAsyncTransport,
+    ReplayAdapter,
+    ReplayAsyncTransport,
+)
+
+
+INDEX_VERSION = 1
+
+
+def index_path(path: Union[str, PathLike]) -> str:
+    """Return the path of the index written next to a cassette."""
+    return fspath(path) + ".idx"
+
+
+class CassetteRecorder:
+    """Record every request/response pair sent through its adapter or transport to a cassette file.
+
+    The cassette is a gzip'd JSON Lines file, one interaction per line, with an index next to it mapping each
+    request key to its lines. Request headers are not recorded, so the token never reaches the file. Mount
+    `adapter()` on a client's session, or pass `async_transport()` as the `transport` of an async client, and
+    `close` the recorder, or use it as a context manager, to write the index.
+    """
+
+    def __init__(self, path: Union[str, PathLike], clock: Callable[[], float] = time.monotonic) -> None:
+        """Init, truncating the file."""
+        self.path = path
+        self.clock = clock
+        self.started = clock()
+        self.keys: Dict[str, List[int]] = {}
+        self._count = 0
+        self._duration = 0.0
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, "wb", compresslevel=6)  # pylint: disable=consider-using-with
+
+    def __enter__(self) -> "CassetteRecorder":
+        """Enter."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit, writing the index."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return how many interactions were recorded."""
+        return self._count
+
+    def record(self, interaction: Interaction) -> None:
+        """Append an interaction."""
+        line = interaction.to_line()
+        with self._lock:
+            self._file.write(line)
+            self.keys.setdefault(interaction.key, []).append(self._count)
+            self._count += 1
+            self._duration = max(self._duration, interaction.offset + interaction.elapsed)
+
+    def close(self) -> None:
+        """Close the cassette and write its index."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.close()
+            index = {"version": INDEX_VERSION, "count": self._count, "duration": self._duration, "keys": self.keys}
+            with open(index_path(self.path), "w", encoding="utf-8") as file:
+                json.dump(index, file, separators=(",", ":"))
+
+    def adapter(self, adapter: Optional[requests.adapters.BaseAdapter] = None) -> RecordingAdapter:
+        """Return a `requests` adapter recording what `adapter`, a plain `HTTPAdapter` by default, sends."""
+        return RecordingAdapter(self, adapter)
+
+    def async_transport(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> RecordingAsyncTransport:
+        """Return an `httpx` transport recording what `transport`, a plain `AsyncHTTPTransport` by default, sends."""
+        return RecordingAsyncTransport(self, transport)
+
+
+class Cassette:
+    """A recorded session, answering requests with the responses recorded for them.
+
+    Each request gets the responses recorded for its key in order, the last one again once they run out, so a
+    bot polling more often than when recording still gets answers. Lines are decoded the first time they are
+    served, so loading a cassette costs one decompression and replaying a response a dict lookup.
+
+    Replay answers as fast as possible unless given a `speed`: 1.0 waits out the recorded latency of each
+    response, 10.0 a tenth of it. With `pace`, each response is also held until its recorded time into the
+    session, scaled by `speed`, which reproduces the gaps between requests too. Lift the client's rate limit,
+    e.g. `RateLimiter(rate=1e9, burst=0)`, to replay faster than the API allows, and replay through `mount`.
+    """
+
+    def __init__(
+        self,
+        lines: List[bytes],
+        keys: Dict[str, List[int]],
+        speed: Optional[float] = None,
+        pace: bool = False,
+        strict: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Init; use `load` to read a cassette file. With `strict`, running out of responses is a miss."""
+        self.lines = lines
+        self.keys = keys
+        self.speed = speed
+        self.pace = pace
+        self.strict = strict
+        self.clock = clock
+        self.started: Optional[float] = None
+        self._decoded: Dict[int, Interaction] = {}
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Union[str, PathLike], **kwargs: Any) -> "Cassette":
+        """Read a cassette and its index, rebuilding the index if it is missing."""
+        with gzip.open(path, "rb") as file:
+            lines = file.read().splitlines()
+        try:
+            with open(index_path(path), encoding="utf-8") as index_file:
+                index = json.load(index_file)
+        except FileNotFoundError:
+            index = None
+
+        if index is None or index.get("version") != INDEX_VERSION or index.get("count") != len(lines):
+            keys: Dict[str, List[int]] = {}
+            for number, line in enumerate(lines):
+                keys.setdefault(Interaction.from_line(line).key, []).append(number)
+        else:
+            keys = index["keys"]
+        return cls(lines, keys, **kwargs)
+
+    def __len__(self) -> int:
+        """Return how many interactions the cassette holds."""
+        return len(self.lines)
+
+    def interaction(self, number: int) -> Interaction:
+        """Return the interaction of a line."""
+        interaction = self._decoded.get(number)
+        if interaction is None:
+            interaction = self._decoded[number] = Interaction.from_line(self.lines[number])
+        return interaction
+
+    def interactions(self) -> List[Interaction]:
+        """Return every interaction, in the order they were recorded."""
+        return [self.interaction(number) for number in range(len(self.lines))]
+
+    def rewind(self) -> None:
+        """Replay again from the first response of every request."""
+        with self._lock:
+            self._cursors.clear()
+            self.started = None
+
+    def play(self, method: str, url: str, body: Optional[bytes] = None) -> Interaction:
+        """Return the next recorded response to a request, or raise `CassetteMissError`."""
+        key = request_key(method, url, body)
+        with self._lock:
+            numbers = self.keys.get(key)
+            if not numbers:
+                raise CassetteMissError(f"No recorded response to {key}.")
+            cursor = self._cursors.get(key, 0)
+            if cursor >= len(numbers):
+                if self.strict:
+                    raise CassetteMissError(f"The {len(numbers)} recorded responses to {key} were all replayed.")
+                cursor = len(numbers) - 1
+            self._cursors[key] = cursor + 1
+            if self.started is None:
+                self.started = self.clock()
+            return self.interaction(numbers[cursor])
+
+    def delay(self, interaction: Interaction) -> float:
+        """Return how long to wait before answering with an interaction."""
+        if not self.speed:
+            return 0.0
+        delay = interaction.elapsed / self.speed
+        if self.pace and self.started is not None:
+            due = self.started + (interaction.offset + interaction.elapsed) / self.speed
+            delay = max(delay, due - self.clock())
+        return delay
+
+    def adapter(self) -> ReplayAdapter:
+        """Return a `requests` adapter replaying this cassette; see `mount`."""
+        return ReplayAdapter(self)
+
+    def mount(self, session: requests.Session) -> ReplayAdapter:
+        """Answer every request of a `requests` session, e.g. `client.session`, from this cassette.
+
+        Also turns off the session's `trust_env`: replay never reaches the network, and `requests` otherwise looks
+        up proxy settings in the environment on every call, which costs more than replaying the response.
+        """
+        adapter = self.adapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.trust_env = False
+        return adapter
+
+    def async_transport(self) -> ReplayAsyncTransport:
+        """Return an `httpx` transport replaying this cassette; pass it as `transport` to an async client."""
+        return ReplayAsyncTransport(self)
@@ -0,0 +1,72 @@
+"""Interaction."""
+
+import base64
+import hashlib
+import json
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+
+# Headers never written to a cassette.
+UNRECORDED_HEADERS = frozenset({"set-cookie", "content-encoding", "transfer-encoding", "content-length"})
+
+
+class CassetteMissError(LookupError):
+    """Raised on replay for a request the cassette holds no response to."""
+
+
+def request_key(method: str, url: str, body: Optional[bytes] = None) -> str:
+    """Return what identifies a request in a cassette: method, path and query, and a digest of the body.
+
+    The scheme and host are left out, so a session recorded against the live API replays against any `api_url`.
+    """
+    split = urlsplit(url)
+    key = f"{method.upper()} {split.path}{'?' + split.query if split.query else ''}"
+    if body:
+        key += f" {hashlib.blake2b(body, digest_size=8).hexdigest()}"
+    return key
+
+
+@dataclass(frozen=True)
+class Interaction:
+    """A request and the response it got, `offset` seconds into the recording, after `elapsed` seconds."""
+
+    method: str
+    url: str
+    status_code: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    request_body: Optional[bytes] = None
+    offset: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def key(self) -> str:
+        """Return the key of the request."""
+        return request_key(self.method, self.url, self.request_body)
+
+    def to_line(self) -> bytes:
+        """Return the interaction as one compact JSON line, with bodies as text when they are UTF-8."""
+        data: Dict[str, Any] = asdict(self)
+        for name in ("body", "request_body"):
+            value = data.pop(name)
+            if value is None:
+                continue
+            try:
+                data[name] = value.decode()
+            except UnicodeDecodeError:
+                data[f"{name}_b64"] = base64.b64encode(value).decode()
+        return json.dumps(data, separators=(",", ":")).encode() + b"\n"
+
+    @classmethod
+    def from_line(cls, line: bytes) -> "Interaction":
+        """Return the interaction of a line written by `to_line`."""
+        data = json.loads(line)
+        for name in ("body", "request_body"):
+            if name in data:
+                data[name] = data[name].encode()
+            elif f"{name}_b64" in data:
+                data[name] = base64.b64decode(data.pop(f"{name}_b64"))
+        return cls(**data)
@@ -0,0 +1,144 @@
+"""Cassette Transports."""
+
+import asyncio
+import time
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+
+import httpx
+import requests
+
+from requests.structures import CaseInsensitiveDict
+
+from .interaction import UNRECORDED_HEADERS, Interaction
+
+
+if TYPE_CHECKING:
+    from .cassette import Cassette, CassetteRecorder
+
+
+def _headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Return the response headers worth recording."""
+    return {name: value for name, value in headers.items() if name.lower() not in UNRECORDED_HEADERS}
+
+
+def _request_body(body: Any) -> Optional[bytes]:
+    """Return the body of a prepared request as bytes."""
+    if isinstance(body, str):
+        return body.encode()
+    return body if isinstance(body, bytes) else None
+
+
+class RecordingAdapter(requests.adapters.BaseAdapter):
+    """`requests` adapter sending through another adapter and recording every exchange to a cassette."""
+
+    def __init__(self, recorder: "CassetteRecorder", adapter: Optional[requests.adapters.BaseAdapter] = None) -> None:
+        """Init."""
+        super().__init__()
+        self.recorder = recorder
+        self.adapter = adapter or requests.adapters.HTTPAdapter()
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        """Send the request and record the response."""
+        start = self.recorder.clock()
+        response = self.adapter.send(request, **kwargs)
+        content = response.content
+        self.recorder.record(
+            Interaction(
+                method=request.method or "GET",
+                url=request.url or "",
+                status_code=response.status_code,
+                headers=_headers(response.headers),
+                body=content,
+                request_body=_request_body(request.body),
+                offset=start - self.recorder.started,
+                elapsed=self.recorder.clock() - start,
+            )
+        )
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped adapter."""
+        self.adapter.close()
+
+
+class RecordingAsyncTransport(httpx.AsyncBaseTransport):
+    """`httpx` transport sending through another transport and recording every exchange to a cassette."""
+
+    def __init__(self, recorder: "CassetteRecorder", transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        """Init."""
+        self.recorder = recorder
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request and record the response."""
+        start = self.recorder.clock()
+        response = await self.transport.handle_async_request(request)
+        content = await response.aread()
+        self.recorder.record(
+            Interaction(
+                method=request.method,
+                url=str(request.url),
+                status_code=response.status_code,
+                headers=_headers(response.headers),
+                body=content,
+                request_body=await request.aread() or None,
+                offset=start - self.recorder.started,
+                elapsed=self.recorder.clock() - start,
+            )
+        )
+        return httpx.Response(
+            response.status_code, headers=_headers(response.headers), content=content, request=request
+        )
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
+
+
+class ReplayAdapter(requests.adapters.BaseAdapter):
+    """`requests` adapter answering from a cassette, without any network access."""
+
+    def __init__(self, cassette: "Cassette") -> None:
+        """Init."""
+        super().__init__()
+        self.cassette = cassette
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        """Answer the request with its recorded response."""
+        interaction = self.cassette.play(request.method or "GET", request.url or "", _request_body(request.body))
+        delay = self.cassette.delay(interaction)
+        if delay > 0:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = interaction.status_code
+        response.headers = CaseInsensitiveDict(interaction.headers)
+        response.url = request.url or ""
+        response.request = request
+        response.elapsed = timedelta(seconds=interaction.elapsed)
+        response._content = interaction.body  # pylint: disable=protected-access
+        return response
+
+    def close(self) -> None:
+        """Close."""
+
+
+class ReplayAsyncTransport(httpx.AsyncBaseTransport):
+    """`httpx` transport answering from a cassette, without any network access."""
+
+    def __init__(self, cassette: "Cassette") -> None:
+        """Init."""
+        self.cassette = cassette
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer the request with its recorded response."""
+        interaction = self.cassette.play(request.method, str(request.url), await request.aread() or None)
+        delay = self.cassette.delay(interaction)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return httpx.Response(
+            interaction.status_code, headers=interaction.headers, content=interaction.body, request=request
+        )
@@ -2,24 +2,24 @@
 
 import sys
 
+from functools import cached_property
 from os import environ
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import requests
+from .cache import FleetState, GalaxyCache, ResponseCache
+from .lazy import load_env
+from .metrics import MetricsHooks
+from .tracing import Tracer
+from .transport import RateLimiter, RetryPolicy, SpaceTradersSession, parse_response
 
-from dotenv import load_dotenv
 
-from .models.models import StatusReponseSchema
-
-
-from .agents import Agents
-from .contracts import Contracts
-from .factions import Factions
-from .fleet import Fleet
-from .systems import Systems
-
-
-load_dotenv()
+if TYPE_CHECKING:
+    from .agents import Agents
+    from .contracts import Contracts
+    from .factions import Factions
+    from .fleet import Fleet
+    from .models.models import StatusReponseSchema
+    from .systems import Systems
 
 
 class SpaceTradersClient:
@@ -29,19 +29,53 @@ def __init__(
         self,
         token: Optional[str] = None,
         api_url: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        galaxy_cache: Optional[GalaxyCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        fleet_state: Optional[FleetState] = None,
+        metrics: Optional[MetricsHooks] = None,
+        tracer: Optional[Tracer] = None,
     ) -> None:
-        """Init the Client."""
-        self.api_url = environ.get("API_URL", api_url)
-        if not self.api_url:
+        """Init the Client.
+
+        `token` and `api_url` default to the `TOKEN` and `API_URL` environment variables, also read from `.env`.
+        Every subclient sends its requests through `rate_limiter`, which defaults to the server's
+        sustained and burst limits. Check `rate_limiter.budget()` to plan around the remaining budget.
+        Failed requests are retried according to `retry_policy`; see `RetryPolicy` for the defaults.
+        Pass a `galaxy_cache` to keep systems, waypoints and jump gates on disk until the next server reset,
+        and a `response_cache` to reuse recent markets, shipyards and construction sites. Your own sales and
+        refuels drop the market they traded at from it.
+        Pass a `fleet_state` to keep your agent, ships and contracts current from every response and read them
+        without a request.
+        Pass `metrics` hooks, e.g. a `MetricsRegistry`, to record the latency, status, size, retries and
+        validation time of every request per endpoint.
+        Pass a `tracer` to emit a span for every subclient call, with its rate limiter waits, HTTP attempts,
+        retry backoffs and validation as child spans.
+        Subclients and their schemas are imported on first use.
+        """
+        load_env()
+
+        api_url = api_url or environ.get("API_URL")
+        if not api_url:
             print("API URL not found")
             sys.exit(1)
+        self.api_url: str = api_url
 
-        self.token = environ.get("TOKEN", token)
+        self.token = token or environ.get("TOKEN")
         if not self.token:
             print("TOKEN not found")
             sys.exit(1)
 
-        self.session = requests.Session()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+
+        self.session = SpaceTradersSession(
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            metrics=metrics,
+            tracer=tracer,
+        )
         self.session.headers.update(
             {
                 "Accept": "Accept: application/json",
@@ -50,42 +84,88 @@ def __init__(
             },
         )
 
-        self.agents = Agents(
+        self.galaxy_cache = galaxy_cache
+        self.response_cache = response_cache
+        self.fleet_state = fleet_state
+        self.metrics = metrics
+        self.tracer = tracer
+
+    @cached_property
+    def agents(self) -> "Agents":
+        """Agents subclient."""
+        from .agents import Agents  # pylint: disable=import-outside-toplevel
+
+        return Agents(
             api_url=self.api_url,
             session=self.session,
+            fleet_state=self.fleet_state,
         )
 
-        self.contracts = Contracts(
+    @cached_property
+    def contracts(self) -> "Contracts":
+        """Contracts subclient."""
+        from .contracts import Contracts  # pylint: disable=import-outside-toplevel
+
+        return Contracts(
             api_url=self.api_url,
             session=self.session,
+            fleet_state=self.fleet_state,
         )
 
-        self.factions = Factions(
+    @cached_property
+    def factions(self) -> "Factions":
+        """Factions subclient."""
+        from .factions import Factions  # pylint: disable=import-outside-toplevel
+
+        return Factions(
             api_url=self.api_url,
             session=self.session,
         )
 
-        self.fleet = Fleet(
+    @cached_property
+    def fleet(self) -> "Fleet":
+        """Fleet subclient."""
+        from .fleet import Fleet  # pylint: disable=import-outside-toplevel
+
+        return Fleet(
             api_url=self.api_url,
             session=self.session,
+            fleet_state=self.fleet_state,
+            response_cache=self.response_cache,
         )
 
-        self.systems = Systems(
+    @cached_property
+    def systems(self) -> "Systems":
+        """Systems subclient."""
+        from .systems import Systems  # pylint: disable=import-outside-toplevel
+
+        return Systems(
             api_url=self.api_url,
             session=self.session,
+            galaxy_cache=self.galaxy_cache,
+            response_cache=self.response_cache,
+            fleet_state=self.fleet_state,
         )
 
     def get_status(
         self,
-    ) -> StatusReponseSchema:
+    ) -> "StatusReponseSchema":
         """Return the status of the game server.
 
         This also includes a few global elements, such as announcements, server reset dates and leaderboards.
+        A new reset date invalidates the galaxy cache.
         """
+        from .models.models import StatusReponseSchema  # pylint: disable=import-outside-toplevel  # isort: skip
+
         response = self.session.get(
             url=f"{self.api_url}/",
         )
 
         response.raise_for_status()
 
-        return StatusReponseSchema.model_validate(response.json())
+        status = parse_response(StatusReponseSchema, response)
+
+        if self.galaxy_cache:
+            self.galaxy_cache.set_reset_date(status.resetDate)
+
+        return status
@@ -1,8 +1,25 @@
 """Init Contrats."""
 
-from .contracts import Contracts
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_getattr
+
+
+if TYPE_CHECKING:
+    from .async_contracts import AsyncContracts
+    from .contracts import Contracts
+
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "AsyncContracts": ".async_contracts",
+        "Contracts": ".contracts",
+    },
+)
 
 
 __all__ = [
     "Contracts",
+    "AsyncContracts",
 ]
@@ -0,0 +1,229 @@
+"""Async Contracts."""
+
+from typing import Annotated, List, Optional, Tuple
+
+import httpx
+
+from pydantic import Field
+
+from ..cache import FleetState
+from ..models.models import (
+    AcceptContractResponseSchema,
+    ContractResponseSchema,
+    ContractSchema,
+    DeliverContractResponseSchema,
+    ListContractsResponseSchema,
+)
+from ..pagination import AsyncPaginator
+from ..tracing import traced
+from ..transport import parse_response
+
+
+@traced
+class AsyncContracts:
+    """Async Contracts."""
+
+    def __init__(
+        self,
+        api_url: str,
+        session: httpx.AsyncClient,
+        fleet_state: Optional[FleetState] = None,
+    ) -> None:
+        """Init.
+
+        Every response is recorded into `fleet_state` when one is given, and reads are served from it.
+        """
+        self.api_url = api_url
+        self.session = session
+        self.fleet_state = fleet_state
+
+    async def list_contracts(
+        self,
+        page: Annotated[int, Field(description="What entry offset to request.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to return per page.", ge=1, le=20, default=10)] = 10,
+    ) -> Tuple[str, ListContractsResponseSchema | None]:
+        """Return a paginated list of all your contracts."""
+        try:
+            parameters = f"page={page}"
+            parameters += f"&limit={limit}"
+
+            response = await self.session.get(
+                url=f"{self.api_url}/my/contracts?{parameters}",
+            )
+
+            response.raise_for_status()
+
+            contracts = parse_response(ListContractsResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.set_contracts(contracts.data)
+
+            return (
+                "Succesfully listed contracts.",
+                contracts
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    def iter_contracts(
+        self,
+        page: Annotated[int, Field(description="What page to start from.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+    ) -> AsyncPaginator[ContractSchema]:
+        """Iterate lazily over all your contracts, page by page."""
+        return AsyncPaginator(
+            fetch_page=self.list_contracts,
+            page=page,
+            limit=limit,
+        )
+
+    async def fetch_all_contracts(
+        self,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+        max_workers: Annotated[int, Field(description="How many pages to fetch concurrently.", ge=1, default=8)] = 8,
+    ) -> List[ContractSchema]:
+        """Fetch all your contracts, downloading the pages concurrently."""
+        return await self.iter_contracts(limit=limit).fetch_all(max_workers=max_workers)
+
+    async def get_contract(
+        self,
+        contract_id: Annotated[str, Field(description="The contract ID.")],
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the fleet state.")] = True,
+    ) -> Tuple[str, ContractResponseSchema | None]:
+        """Get the details of a contract by ID."""
+        try:
+            if use_cache and self.fleet_state:
+                cached = self.fleet_state.contract(contract_id)
+                if cached:
+                    return "Successfully fetched contract details.", ContractResponseSchema(data=cached)
+
+            response = await self.session.get(
+                url=f"{self.api_url}/my/contracts/{contract_id}",
+            )
+
+            response.raise_for_status()
+
+            contract = parse_response(ContractResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.set_contract(contract.data)
+
+            return (
+                "Successfully fetched contract details.",
+                contract
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def accept_contract(
+        self,
+        contract_id: Annotated[str, Field(description="The contract ID.")]
+    ) -> Tuple[str, AcceptContractResponseSchema | None]:
+        """Accept a contract by ID.
+
+        You can only accept contracts that were offered to you, were not accepted yet,
+        and whose deadlines has not passed yet.
+        """
+        try:
+            response = await self.session.post(
+                url=f"{self.api_url}/my/contracts/{contract_id}/accept",
+            )
+
+            response.raise_for_status()
+
+            acceptance = parse_response(AcceptContractResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(acceptance.data)
+
+            return (
+                "Succesfully accepted contract.",
+                acceptance
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def deliver_cargo_to_contract(
+        self,
+        contract_id: Annotated[str, Field(description="The ID of the contract.")],
+        ship_symbol: Annotated[str, Field(description=(
+            "Symbol of a ship located in the destination to deliver a contract"
+            "and that has a good to deliver in its cargo."
+        ))],
+        trade_symbol: Annotated[str, Field(description="The symbol of the good to deliver.")],
+        units: Annotated[int, Field(description="Amount of units to deliver.")],
+
+    ) -> Tuple[str, DeliverContractResponseSchema | None]:
+        """Deliver cargo to a contract.
+
+        In order to use this API, a ship must be at the delivery location
+        (denoted in the delivery terms as destinationSymbol of a contract)
+        and must have a number of units of a good required by this contract in its cargo.
+
+        Cargo that was delivered will be removed from the ship's cargo.
+        """
+        try:
+            response = await self.session.post(
+                url=f"{self.api_url}/my/contracts/{contract_id}/deliver",
+                json={
+                    "shipSymbol": ship_symbol,
+                    "tradeSymbol": trade_symbol,
+                    "units": units,
+                },
+            )
+
+            response.raise_for_status()
+
+            delivery = parse_response(DeliverContractResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(delivery.data, ship_symbol=ship_symbol)
+
+            return (
+                "Succesfully accepted contract.",
+                delivery
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def fullfill_contract(
+        self,
+        contract_id: Annotated[str, Field(description="The ID of the contract to fulfill.")],
+    ) -> Tuple[str, AcceptContractResponseSchema | None]:
+        """Fulfill a contract.
+
+        Can only be used on contracts that have all of their delivery terms fulfilled.
+        """
+        try:
+            response = await self.session.post(
+                url=f"{self.api_url}/my/contracts/{contract_id}/fullfill",
+            )
+
+            response.raise_for_status()
+
+            fulfillment = parse_response(AcceptContractResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(fulfillment.data)
+
+            return (
+                "Succesfully accepted contract.",
+                fulfillment
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
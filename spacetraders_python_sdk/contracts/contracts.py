@@ -1,18 +1,25 @@
 """Contacts."""
 
-from typing import Annotated, Tuple
+from typing import Annotated, List, Optional, Tuple
 
 import requests
 
 from pydantic import Field
 
+from ..cache import FleetState
 from ..models.models import (
     AcceptContractResponseSchema,
     ContractResponseSchema,
+    ContractSchema,
+    DeliverContractResponseSchema,
     ListContractsResponseSchema,
 )
+from ..pagination import Paginator
+from ..tracing import traced
+from ..transport import parse_response
 
 
+@traced
 class Contracts:
     """Contracts."""
 
@@ -20,10 +27,15 @@ def __init__(
         self,
         api_url: str,
         session: requests.Session,
+        fleet_state: Optional[FleetState] = None,
     ) -> None:
-        """Init."""
+        """Init.
+
+        Every response is recorded into `fleet_state` when one is given, and reads are served from it.
+        """
         self.api_url = api_url
         self.session = session
+        self.fleet_state = fleet_state
 
     def list_contracts(
         self,
@@ -41,9 +53,14 @@ def list_contracts(
 
             response.raise_for_status()
 
+            contracts = parse_response(ListContractsResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.set_contracts(contracts.data)
+
             return (
                 "Succesfully listed contracts.",
-                ListContractsResponseSchema.model_validate(response.json())
+                contracts
             )
 
         except requests.exceptions.HTTPError as error:
@@ -51,21 +68,52 @@ def list_contracts(
                 case _:
                     return f"Unknown error: {error.response.text}", None
 
+    def iter_contracts(
+        self,
+        page: Annotated[int, Field(description="What page to start from.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+    ) -> Paginator[ContractSchema]:
+        """Iterate lazily over all your contracts, page by page."""
+        return Paginator(
+            fetch_page=self.list_contracts,
+            page=page,
+            limit=limit,
+        )
+
+    def fetch_all_contracts(
+        self,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+        max_workers: Annotated[int, Field(description="How many pages to fetch concurrently.", ge=1, default=8)] = 8,
+    ) -> List[ContractSchema]:
+        """Fetch all your contracts, downloading the pages concurrently."""
+        return self.iter_contracts(limit=limit).fetch_all(max_workers=max_workers)
+
     def get_contract(
         self,
-        contract_id: Annotated[str, Field(description="The contract ID.")]
+        contract_id: Annotated[str, Field(description="The contract ID.")],
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the fleet state.")] = True,
     ) -> Tuple[str, ContractResponseSchema | None]:
         """Get the details of a contract by ID."""
         try:
+            if use_cache and self.fleet_state:
+                cached = self.fleet_state.contract(contract_id)
+                if cached:
+                    return "Successfully fetched contract details.", ContractResponseSchema(data=cached)
+
             response = self.session.get(
                 url=f"{self.api_url}/my/contracts/{contract_id}",
             )
 
             response.raise_for_status()
 
+            contract = parse_response(ContractResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.set_contract(contract.data)
+
             return (
                 "Successfully fetched contract details.",
-                ContractResponseSchema.model_validate(response.json())
+                contract
             )
 
         except requests.exceptions.HTTPError as error:
@@ -89,9 +137,14 @@ def accept_contract(
 
             response.raise_for_status()
 
+            acceptance = parse_response(AcceptContractResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(acceptance.data)
+
             return (
                 "Succesfully accepted contract.",
-                AcceptContractResponseSchema.model_validate(response.json())
+                acceptance
             )
 
         except requests.exceptions.HTTPError as error:
@@ -109,7 +162,7 @@ def deliver_cargo_to_contract(
         trade_symbol: Annotated[str, Field(description="The symbol of the good to deliver.")],
         units: Annotated[int, Field(description="Amount of units to deliver.")],
 
-    ) -> Tuple[str, AcceptContractResponseSchema | None]:
+    ) -> Tuple[str, DeliverContractResponseSchema | None]:
         """Deliver cargo to a contract.
 
         In order to use this API, a ship must be at the delivery location
@@ -130,9 +183,14 @@ def deliver_cargo_to_contract(
 
             response.raise_for_status()
 
+            delivery = parse_response(DeliverContractResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(delivery.data, ship_symbol=ship_symbol)
+
             return (
                 "Succesfully accepted contract.",
-                AcceptContractResponseSchema.model_validate(response.json())
+                delivery
             )
 
         except requests.exceptions.HTTPError as error:
@@ -155,9 +213,14 @@ def fullfill_contract(
 
             response.raise_for_status()
 
+            fulfillment = parse_response(AcceptContractResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(fulfillment.data)
+
             return (
                 "Succesfully accepted contract.",
-                AcceptContractResponseSchema.model_validate(response.json())
+                fulfillment
             )
 
         except requests.exceptions.HTTPError as error:
@@ -1,8 +1,25 @@
 """Init Factions."""
 
-from .factions import Factions
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_getattr
+
+
+if TYPE_CHECKING:
+    from .async_factions import AsyncFactions
+    from .factions import Factions
+
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "AsyncFactions": ".async_factions",
+        "Factions": ".factions",
+    },
+)
 
 
 __all__ = [
     "Factions",
+    "AsyncFactions",
 ]
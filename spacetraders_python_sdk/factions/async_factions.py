@@ -0,0 +1,98 @@
+"""Async Factions."""
+
+from typing import Annotated, List, Tuple
+
+import httpx
+
+from pydantic import Field
+
+from ..models.models import (
+    FactionResponseSchema,
+    FactionSchema,
+    ListFactionsResponseSchema,
+)
+from ..pagination import AsyncPaginator
+from ..tracing import traced
+from ..transport import parse_response
+
+
+@traced
+class AsyncFactions:
+    """Async Factions."""
+
+    def __init__(
+        self,
+        api_url: str,
+        session: httpx.AsyncClient,
+    ) -> None:
+        """Init."""
+        self.api_url = api_url
+        self.session = session
+
+    async def list_factions(
+        self,
+        page: Annotated[int, Field(description="What entry offset to request.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to return per page.", ge=1, le=20, default=10)] = 10,
+    ) -> Tuple[str, ListFactionsResponseSchema | None]:
+        """Return a paginated list of all the factions in the game."""
+        try:
+            parameters = f"page={page}"
+            parameters += f"&limit={limit}"
+
+            response = await self.session.get(
+                url=f"{self.api_url}/factions?{parameters}",
+            )
+
+            response.raise_for_status()
+
+            return (
+                "Succesfully fetched factions.",
+                parse_response(ListFactionsResponseSchema, response)
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    def iter_factions(
+        self,
+        page: Annotated[int, Field(description="What page to start from.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+    ) -> AsyncPaginator[FactionSchema]:
+        """Iterate lazily over all the factions in the game, page by page."""
+        return AsyncPaginator(
+            fetch_page=self.list_factions,
+            page=page,
+            limit=limit,
+        )
+
+    async def fetch_all_factions(
+        self,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+        max_workers: Annotated[int, Field(description="How many pages to fetch concurrently.", ge=1, default=8)] = 8,
+    ) -> List[FactionSchema]:
+        """Fetch all the factions in the game, downloading the pages concurrently."""
+        return await self.iter_factions(limit=limit).fetch_all(max_workers=max_workers)
+
+    async def get_faction(
+        self,
+        faction_id: Annotated[str, Field(description="The faction ID.")]
+    ) -> Tuple[str, FactionResponseSchema | None]:
+        """Get the details of a faction by ID."""
+        try:
+            response = await self.session.get(
+                url=f"{self.api_url}/factions/{faction_id}",
+            )
+
+            response.raise_for_status()
+
+            return (
+                "Successfully fetched faction details.",
+                parse_response(FactionResponseSchema, response)
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
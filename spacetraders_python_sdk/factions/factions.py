@@ -1,6 +1,6 @@
 """Factions."""
 
-from typing import Annotated, Tuple
+from typing import Annotated, List, Tuple
 
 import requests
 
@@ -8,10 +8,15 @@
 
 from ..models.models import (
     FactionResponseSchema,
+    FactionSchema,
     ListFactionsResponseSchema,
 )
+from ..pagination import Paginator
+from ..tracing import traced
+from ..transport import parse_response
 
 
+@traced
 class Factions:
     """Factions."""
 
@@ -42,7 +47,7 @@ def list_factions(
 
             return (
                 "Succesfully fetched factions.",
-                ListFactionsResponseSchema.model_validate(response.json())
+                parse_response(ListFactionsResponseSchema, response)
             )
 
         except requests.exceptions.HTTPError as error:
@@ -50,6 +55,26 @@ def list_factions(
                 case _:
                     return f"Unknown error: {error.response.text}", None
 
+    def iter_factions(
+        self,
+        page: Annotated[int, Field(description="What page to start from.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+    ) -> Paginator[FactionSchema]:
+        """Iterate lazily over all the factions in the game, page by page."""
+        return Paginator(
+            fetch_page=self.list_factions,
+            page=page,
+            limit=limit,
+        )
+
+    def fetch_all_factions(
+        self,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+        max_workers: Annotated[int, Field(description="How many pages to fetch concurrently.", ge=1, default=8)] = 8,
+    ) -> List[FactionSchema]:
+        """Fetch all the factions in the game, downloading the pages concurrently."""
+        return self.iter_factions(limit=limit).fetch_all(max_workers=max_workers)
+
     def get_faction(
         self,
         faction_id: Annotated[str, Field(description="The faction ID.")]
@@ -64,7 +89,7 @@ def get_faction(
 
             return (
                 "Successfully fetched faction details.",
-                FactionResponseSchema.model_validate(response.json())
+                parse_response(FactionResponseSchema, response)
             )
 
         except requests.exceptions.HTTPError as error:
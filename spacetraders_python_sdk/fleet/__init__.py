@@ -1,8 +1,28 @@
 """Init Factions."""
 
-from .fleet import Fleet
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_getattr
+
+
+if TYPE_CHECKING:
+    from .async_fleet import AsyncFleet
+    from .batch import BatchResult
+    from .fleet import Fleet
+
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "AsyncFleet": ".async_fleet",
+        "BatchResult": ".batch",
+        "Fleet": ".fleet",
+    },
+)
 
 
 __all__ = [
     "Fleet",
+    "AsyncFleet",
+    "BatchResult",
 ]
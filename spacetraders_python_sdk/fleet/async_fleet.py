@@ -0,0 +1,603 @@
+"""Async Fleet."""
+
+from typing import Annotated, List, Mapping, Optional, Tuple
+
+import httpx
+
+from pydantic import Field
+
+from ..cache import FleetState, ResponseCache
+from ..models.models import (
+    CreateSurveyResponseSchema,
+    ExtractResponseSchema,
+    ListShipsResponseSchema,
+    NavigateShipResponseSchema,
+    PatchShipNavResponseSchema,
+    RefuelShipResponseSchema,
+    SellCargoResponseSchema,
+    ShipCargoResponseSchema,
+    ShipNavFlightModeEnum,
+    ShipOrbitResponseSchema,
+    ShipResponseSchema,
+    ShipSchema,
+    SurveySchema,
+    TradeGoodSchema,
+)
+from ..pagination import AsyncPaginator
+from ..tracing import traced
+from ..transport import parse_response
+from .batch import BatchResult, run_batch_async
+
+
+@traced
+class AsyncFleet:
+    """Async Fleet."""
+
+    def __init__(
+        self,
+        api_url: str,
+        session: httpx.AsyncClient,
+        fleet_state: Optional[FleetState] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ) -> None:
+        """Init.
+
+        Every response is recorded into `fleet_state` when one is given, and reads are served from it.
+        Selling and refuelling drop the market they traded at from `response_cache`, since the trade moves its
+        prices and volumes.
+        """
+        self.api_url = api_url
+        self.session = session
+        self.fleet_state = fleet_state
+        self.response_cache = response_cache
+
+    async def list_ships(
+        self,
+        page: Annotated[int, Field(description="What entry offset to request.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to return per page.", ge=1, le=20, default=10)] = 10,
+    ) -> Tuple[str, ListShipsResponseSchema | None]:
+        """Return a paginated list of all the ships in the game."""
+        try:
+            parameters = f"page={page}"
+            parameters += f"&limit={limit}"
+
+            response = await self.session.get(
+                url=f"{self.api_url}/my/ships?{parameters}",
+            )
+
+            response.raise_for_status()
+
+            ships = parse_response(ListShipsResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.set_ships(ships.data)
+
+            return (
+                "Succesfully fetched ships.",
+                ships
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    def iter_ships(
+        self,
+        page: Annotated[int, Field(description="What page to start from.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+    ) -> AsyncPaginator[ShipSchema]:
+        """Iterate lazily over all your ships, page by page."""
+        return AsyncPaginator(
+            fetch_page=self.list_ships,
+            page=page,
+            limit=limit,
+        )
+
+    async def fetch_all_ships(
+        self,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+        max_workers: Annotated[int, Field(description="How many pages to fetch concurrently.", ge=1, default=8)] = 8,
+    ) -> List[ShipSchema]:
+        """Fetch all your ships, downloading the pages concurrently."""
+        return await self.iter_ships(limit=limit).fetch_all(max_workers=max_workers)
+
+    async def get_ship(
+        self,
+        ship_symbol: Annotated[str, Field(description="The ship ID.")],
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the fleet state.")] = True,
+    ) -> Tuple[str, ShipResponseSchema | None]:
+        """Get the details of a ship by ID."""
+        try:
+            if use_cache and self.fleet_state:
+                cached = self.fleet_state.ship(ship_symbol)
+                if cached:
+                    return "Successfully fetched ship details.", ShipResponseSchema(data=cached)
+
+            response = await self.session.get(
+                url=f"{self.api_url}/my/ships/{ship_symbol}",
+            )
+
+            response.raise_for_status()
+
+            ship = parse_response(ShipResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.set_ship(ship.data)
+
+            return (
+                "Successfully fetched ship details.",
+                ship
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def get_ship_cargo(
+        self,
+        ship_symbol: Annotated[str, Field(description="The symbol of the ship.")],
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the fleet state.")] = True,
+    ) -> Tuple[str, ShipCargoResponseSchema | None]:
+        """Retrieve the cargo of a ship under your agent's ownership."""
+        try:
+            if use_cache and self.fleet_state:
+                cached = self.fleet_state.cargo(ship_symbol)
+                if cached:
+                    return "Successfully fetched ship's cargo.", ShipCargoResponseSchema(data=cached)
+
+            response = await self.session.get(
+                url=f"{self.api_url}/my/ships/{ship_symbol}/cargo",
+            )
+
+            response.raise_for_status()
+
+            cargo = parse_response(ShipCargoResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.update_ship(ship_symbol, cargo=cargo.data)
+
+            return (
+                "Successfully fetched ship's cargo.",
+                cargo
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def orbit_ship(
+        self,
+        ship_symbol: Annotated[str, Field(description="The symbol of the ship.")],
+    ) -> Tuple[str, ShipOrbitResponseSchema | None]:
+        """Attempt to move your ship into orbit at its current location.
+
+        The request will only succeed if your ship is capable of moving into orbit at the time of the request.
+        Orbiting ships are able to do actions that require the ship to be above surface such as navigating or
+        extracting, but cannot access elements in their current waypoint, such as the market or a shipyard.
+
+        The endpoint is idempotent - successive calls will succeed even if the ship is already in orbit.
+        """
+        try:
+            response = await self.session.post(
+                url=f"{self.api_url}/my/ships/{ship_symbol}/orbit",
+            )
+
+            response.raise_for_status()
+
+            orbit = parse_response(ShipOrbitResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(orbit.data, ship_symbol=ship_symbol)
+
+            return (
+                "The ship has successfully moved into orbit at its current location.",
+                orbit
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def navigate_ship(
+        self,
+        ship_symbol: Annotated[str, Field(description="The symbol of the ship.")],
+        waypoint_symbol: Annotated[str, Field(description="The target destination.")]
+    ) -> Tuple[str, NavigateShipResponseSchema | None]:
+        """Navigate to a target destination.
+
+        The ship must be in orbit to use this function.
+        The destination waypoint must be within the same system as the ship's current location.
+        Navigating will consume the necessary fuel from the ship's manifest based on the distance
+        to the target waypoint.
+
+        The returned response will detail the route information including the expected time of arrival
+        Most ship actions are unavailable until the ship has arrived at it's destination.
+
+        To travel between systems, see the ship's Warp or Jump actions.
+        """
+        try:
+            response = await self.session.post(
+                url=f"{self.api_url}/my/ships/{ship_symbol}/navigate",
+                json={
+                    "waypointSymbol": waypoint_symbol
+                }
+            )
+
+            response.raise_for_status()
+
+            navigation = parse_response(NavigateShipResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(navigation.data, ship_symbol=ship_symbol)
+
+            return (
+                (
+                    "The successful transit information including the route details and changes to ship fuel."
+                    "The route includes the expected time of arrival."
+                ),
+                navigation
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def patch_ship_nav(
+        self,
+        ship_symbol: Annotated[str, Field(description="The symbol of the ship.")],
+        flight_mode: Annotated[
+            ShipNavFlightModeEnum,
+            Field(description="The ship's set speed when traveling between waypoints or systems."),
+        ] = ShipNavFlightModeEnum.CRUISE,
+    ) -> Tuple[str, PatchShipNavResponseSchema | None]:
+        """Update the nav configuration of a ship.
+
+        Currently only supports configuring the Flight Mode of the ship, which affects its speed and fuel
+        consumption.
+        """
+        try:
+            response = await self.session.patch(
+                url=f"{self.api_url}/my/ships/{ship_symbol}/nav",
+                json={
+                    "flightMode": ShipNavFlightModeEnum(flight_mode).value
+                }
+            )
+
+            response.raise_for_status()
+
+            nav = parse_response(PatchShipNavResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.update_ship(ship_symbol, nav=nav.data)
+
+            return (
+                "The updated nav data of the ship.",
+                nav
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def dock_ship(
+        self,
+        ship_symbol: Annotated[str, Field(description="The symbol of the ship.")],
+    ) -> Tuple[str, ShipOrbitResponseSchema | None]:
+        """Attempt to dock your ship at its current location.
+
+        Docking will only succeed if your ship is capable of docking at the time of the request.
+
+        Docked ships can access elements in their current location,
+        such as the market or a shipyard, but cannot do actions that requir
+        the ship to be above surface such as navigating or extracting.
+
+        The endpoint is idempotent - successive calls will succeed even if the ship is already docked.
+        """
+        try:
+            response = await self.session.post(
+                url=f"{self.api_url}/my/ships/{ship_symbol}/dock",
+            )
+
+            response.raise_for_status()
+
+            dock = parse_response(ShipOrbitResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(dock.data, ship_symbol=ship_symbol)
+
+            return (
+                "The ship has successfully docked at its current location.",
+                dock
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def refuel_ship(
+        self,
+        ship_symbol: Annotated[str, Field(description="The symbol of the ship.")],
+        units: Annotated[
+            int,
+            Field(
+                description=(
+                    "The amount of fuel to fill in the ship's tanks."
+                    "When not specified, the ship will be refueled to its maximum fuel capacity."
+                    "If the amount specified is greater than the ship's remaining capacity,"
+                    "the ship will only be refueled to its maximum fuel capacity."
+                    "The amount specified is not in market units but in ship fuel units."
+                ),
+                ge=1,
+            )
+        ] = 100,
+        from_cargo: Annotated[
+            bool,
+            Field(description="Wether to use the FUEL thats in your cargo or not. Default: false")
+        ] = False,
+    ) -> Tuple[str, RefuelShipResponseSchema | None]:
+        """Refuel your ship by buying fuel from the local market.
+
+        Requires the ship to be docked in a waypoint that has the Marketplace trait,
+        and the market must be selling fuel in order to refuel.
+
+        Each fuel bought from the market replenishes 100 units in your ship's fuel.
+
+        Ships will always be refuel to their frame's maximum fuel capacity when using this action.
+        """
+        try:
+            response = await self.session.post(
+                url=f"{self.api_url}/my/ships/{ship_symbol}/refuel",
+                json={
+                    "units": units,
+                    "fromCargo": from_cargo,
+                }
+            )
+
+            response.raise_for_status()
+
+            refuel = parse_response(RefuelShipResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(refuel.data, ship_symbol=ship_symbol)
+
+            if self.response_cache:
+                self.response_cache.invalidate("market", refuel.data.transaction.waypointSymbol)
+
+            return (
+                "The ship has successfully docked at its current location.",
+                refuel
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def extract_resources(
+        self,
+        ship_symbol: Annotated[str, Field(description="The symbol of the ship.")],
+    ) -> Tuple[str, ExtractResponseSchema | None]:
+        """Extract resources from a waypoint that can be extracted, such as asteroid fields, into your ship.
+
+        Send an optional survey as the payload to target specific yields.
+
+        The ship must be in orbit to be able to extract and must have mining equipments installed
+        that can extract goods, such as the Gas Siphon mount for gas-based goods
+        or Mining Laser mount for ore-based goods.
+
+        The survey property is now deprecated. See the extract/survey endpoint for more details.
+        """
+        try:
+            response = await self.session.post(
+                url=f"{self.api_url}/my/ships/{ship_symbol}/extract",
+            )
+
+            response.raise_for_status()
+
+            extraction = parse_response(ExtractResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(extraction.data, ship_symbol=ship_symbol)
+
+            return (
+                "Extracted successfully.",
+                extraction
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def create_survey(
+        self,
+        ship_symbol: Annotated[str, Field(description="The symbol of the ship.")],
+    ) -> Tuple[str, CreateSurveyResponseSchema | None]:
+        """Create surveys on a waypoint that can be extracted such as asteroid fields.
+
+        A survey focuses on specific types of deposits from the extracted location.
+        When ships extract using this survey,
+        they are guaranteed to procure a high amount of one of the goods in the survey.
+
+        In order to use a survey, send the entire survey details in the body of the extract request.
+
+        Each survey may have multiple deposits, and if a symbol shows up more than once,
+        that indicates a higher chance of extracting that resource.
+
+        Your ship will enter a cooldown after surveying in which it is unable to perform certain actions.
+        Surveys will eventually expire after a period of time or will be exhausted after being extracted several times
+        based on the survey's size.
+        Multiple ships can use the same survey for extraction.
+
+        A ship must have the Surveyor mount installed in order to use this function.
+        """
+        try:
+            response = await self.session.post(
+                url=f"{self.api_url}/my/ships/{ship_symbol}/survey",
+            )
+
+            response.raise_for_status()
+
+            survey = parse_response(CreateSurveyResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(survey.data, ship_symbol=ship_symbol)
+
+            return (
+                "Surveys has been created.",
+                survey
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def extract_resources_with_survey(
+        self,
+        ship_symbol: Annotated[str, Field(description="The symbol of the ship.")],
+        survey: Annotated[SurveySchema, Field(description=(
+            "A resource survey of a waypoint, detailing a specific extraction location and the types of resources"
+            "that can be found there."
+        ))],
+    ) -> Tuple[str, ExtractResponseSchema | None]:
+        """Extract resources from a waypoint that can be extracted, such as asteroid fields, into your ship.
+
+        Send an optional survey as the payload to target specific yields.
+
+        The ship must be in orbit to be able to extract and must have mining equipments installed
+        that can extract goods, such as the Gas Siphon mount for gas-based goods
+        or Mining Laser mount for ore-based goods.
+
+        The survey property is now deprecated. See the extract/survey endpoint for more details.
+        """
+        try:
+            deposit_list = []
+            for deposit in survey.deposits:
+                deposit_list.append({"symbol": deposit.symbol})
+            survey_json = {
+                "signature": survey.signature,
+                "symbol": survey.symbol,
+                "deposits": deposit_list,
+                "expiration": survey.expiration,
+                "size": survey.size.value,
+            }
+            response = await self.session.post(
+                url=f"{self.api_url}/my/ships/{ship_symbol}/extract/survey",
+                json=survey_json,
+            )
+
+            response.raise_for_status()
+
+            extraction = parse_response(ExtractResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(extraction.data, ship_symbol=ship_symbol)
+
+            return (
+                "Extracted successfully.",
+                extraction
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def sell_cargo(
+        self,
+        ship_symbol: Annotated[str, Field(description="The symbol of the ship.")],
+        symbol: Annotated[TradeGoodSchema, Field(description="The good's symbol.")],
+        units: Annotated[int, Field(description="Amounts of units to sell of the selected good.")],
+    ) -> Tuple[str, SellCargoResponseSchema | None]:
+        """Sell cargo in your ship to a market that trades this cargo.
+
+        The ship must be docked in a waypoint that has the Marketplace trait in order to use this function.
+        """
+        try:
+            response = await self.session.post(
+                url=f"{self.api_url}/my/ships/{ship_symbol}/sell",
+                json={
+                    "symbol": symbol,
+                    "units": units,
+                }
+            )
+
+            response.raise_for_status()
+
+            sale = parse_response(SellCargoResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(sale.data, ship_symbol=ship_symbol)
+
+            if self.response_cache:
+                self.response_cache.invalidate("market", sale.data.transaction.waypointSymbol)
+
+            return (
+                "Cargo was successfully sold.",
+                sale
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def orbit_ships(
+        self,
+        ship_symbols: Annotated[List[str], Field(description="The symbols of the ships.")],
+        max_workers: Annotated[int, Field(description="How many ships to move concurrently.", ge=1, default=8)] = 8,
+    ) -> BatchResult[ShipOrbitResponseSchema]:
+        """Move several ships into orbit concurrently. A failure for one ship does not stop the others."""
+        return await run_batch_async(
+            lambda ship_symbol: self.orbit_ship(ship_symbol=ship_symbol), ship_symbols, max_workers
+        )
+
+    async def dock_ships(
+        self,
+        ship_symbols: Annotated[List[str], Field(description="The symbols of the ships.")],
+        max_workers: Annotated[int, Field(description="How many ships to move concurrently.", ge=1, default=8)] = 8,
+    ) -> BatchResult[ShipOrbitResponseSchema]:
+        """Dock several ships concurrently. A failure for one ship does not stop the others.
+
+        Chain batches on the ships that succeeded, e.g. `refuel_ships(list(dock_ships(miners).succeeded))`.
+        """
+        return await run_batch_async(
+            lambda ship_symbol: self.dock_ship(ship_symbol=ship_symbol), ship_symbols, max_workers
+        )
+
+    async def refuel_ships(
+        self,
+        ship_symbols: Annotated[List[str], Field(description="The symbols of the ships.")],
+        units: Annotated[int, Field(description="The amount of fuel to fill in each ship's tanks.", ge=1)] = 100,
+        from_cargo: Annotated[
+            bool,
+            Field(description="Wether to use the FUEL thats in your cargo or not. Default: false")
+        ] = False,
+        max_workers: Annotated[int, Field(description="How many ships to refuel concurrently.", ge=1, default=8)] = 8,
+    ) -> BatchResult[RefuelShipResponseSchema]:
+        """Refuel several docked ships concurrently. A failure for one ship does not stop the others."""
+        return await run_batch_async(
+            lambda ship_symbol: self.refuel_ship(ship_symbol=ship_symbol, units=units, from_cargo=from_cargo),
+            ship_symbols,
+            max_workers,
+        )
+
+    async def navigate_ships(
+        self,
+        destinations: Annotated[Mapping[str, str], Field(description="The target destination of each ship.")],
+        max_workers: Annotated[int, Field(description="How many ships to move concurrently.", ge=1, default=8)] = 8,
+    ) -> BatchResult[NavigateShipResponseSchema]:
+        """Navigate several ships in orbit concurrently. A failure for one ship does not stop the others."""
+        return await run_batch_async(
+            lambda ship_symbol: self.navigate_ship(ship_symbol=ship_symbol, waypoint_symbol=destinations[ship_symbol]),
+            destinations,
+            max_workers,
+        )
@@ -0,0 +1,101 @@
+"""Batch."""
+
+import asyncio
+import contextvars
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+
+ResultT = TypeVar("ResultT")
+
+Outcome = Tuple[str, Optional[ResultT]]
+
+
+@dataclass(frozen=True)
+class BatchResult(Generic[ResultT]):
+    """The `(message, result)` of an action for each ship, in the order the ships were given."""
+
+    results: Dict[str, Outcome]
+
+    def __len__(self) -> int:
+        """Return the number of ships."""
+        return len(self.results)
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the action succeeded for every ship."""
+        return not self.errors
+
+    @property
+    def succeeded(self) -> Dict[str, ResultT]:
+        """Return the result of each ship the action succeeded for."""
+        return {ship_symbol: result for ship_symbol, (_, result) in self.results.items() if result is not None}
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        """Return the error message of each ship the action failed for."""
+        return {ship_symbol: message for ship_symbol, (message, result) in self.results.items() if result is None}
+
+
+def _unique(ship_symbols: Iterable[str]) -> List[str]:
+    """Return the ship symbols without duplicates, in order."""
+    return list(dict.fromkeys(ship_symbols))
+
+
+def run_batch(
+    action: Callable[[str], Outcome],
+    ship_symbols: Iterable[str],
+    max_workers: int = 8,
+) -> BatchResult:
+    """Run `action` for every ship on a thread pool; the shared rate limiter keeps the workers within the budget.
+
+    An exception raised for one ship is reported as its error message and does not stop the others. Each ship
+    runs in a copy of the caller's context, so its spans are children of the caller's span.
+    """
+
+    def run(ship_symbol: str) -> Outcome:
+        try:
+            return action(ship_symbol)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return f"{type(error).__name__}: {error}", None
+
+    ship_symbols = _unique(ship_symbols)
+    contexts = [contextvars.copy_context() for _ in ship_symbols]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = executor.map(lambda context, ship_symbol: context.run(run, ship_symbol), contexts, ship_symbols)
+        return BatchResult(dict(zip(ship_symbols, outcomes)))
+
+
+async def run_batch_async(
+    action: Callable[[str], Awaitable[Outcome]],
+    ship_symbols: Iterable[str],
+    max_workers: int = 8,
+) -> BatchResult:
+    """Run `action` for every ship as concurrent tasks, at most `max_workers` at once.
+
+    An exception raised for one ship is reported as its error message and does not stop the others.
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(ship_symbol: str) -> Outcome:
+        async with semaphore:
+            try:
+                return await action(ship_symbol)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                return f"{type(error).__name__}: {error}", None
+
+    ship_symbols = _unique(ship_symbols)
+    outcomes = await asyncio.gather(*(run(ship_symbol) for ship_symbol in ship_symbols))
+    return BatchResult(dict(zip(ship_symbols, outcomes)))
@@ -1,26 +1,35 @@
 """Fleet."""
 
-from typing import Annotated, Tuple
+from typing import Annotated, List, Mapping, Optional, Tuple
 
 import requests
 
 from pydantic import Field
 
+from ..cache import FleetState, ResponseCache
 from ..models.models import (
     CreateSurveyResponseSchema,
     ExtractResponseSchema,
     ListShipsResponseSchema,
     NavigateShipResponseSchema,
+    PatchShipNavResponseSchema,
     RefuelShipResponseSchema,
     SellCargoResponseSchema,
     ShipCargoResponseSchema,
+    ShipNavFlightModeEnum,
     ShipOrbitResponseSchema,
     ShipResponseSchema,
+    ShipSchema,
     SurveySchema,
     TradeGoodSchema,
 )
+from ..pagination import Paginator
+from ..tracing import traced
+from ..transport import parse_response
+from .batch import BatchResult, run_batch
 
 
+@traced
 class Fleet:
     """Fleet."""
 
@@ -28,10 +37,19 @@ def __init__(
         self,
         api_url: str,
         session: requests.Session,
+        fleet_state: Optional[FleetState] = None,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
-        """Init."""
+        """Init.
+
+        Every response is recorded into `fleet_state` when one is given, and reads are served from it.
+        Selling and refuelling drop the market they traded at from `response_cache`, since the trade moves its
+        prices and volumes.
+        """
         self.api_url = api_url
         self.session = session
+        self.fleet_state = fleet_state
+        self.response_cache = response_cache
 
     def list_ships(
         self,
@@ -49,9 +67,14 @@ def list_ships(
 
             response.raise_for_status()
 
+            ships = parse_response(ListShipsResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.set_ships(ships.data)
+
             return (
                 "Succesfully fetched ships.",
-                ListShipsResponseSchema.model_validate(response.json())
+                ships
             )
 
         except requests.exceptions.HTTPError as error:
@@ -59,21 +82,52 @@ def list_ships(
                 case _:
                     return f"Unknown error: {error.response.text}", None
 
+    def iter_ships(
+        self,
+        page: Annotated[int, Field(description="What page to start from.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+    ) -> Paginator[ShipSchema]:
+        """Iterate lazily over all your ships, page by page."""
+        return Paginator(
+            fetch_page=self.list_ships,
+            page=page,
+            limit=limit,
+        )
+
+    def fetch_all_ships(
+        self,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+        max_workers: Annotated[int, Field(description="How many pages to fetch concurrently.", ge=1, default=8)] = 8,
+    ) -> List[ShipSchema]:
+        """Fetch all your ships, downloading the pages concurrently."""
+        return self.iter_ships(limit=limit).fetch_all(max_workers=max_workers)
+
     def get_ship(
         self,
         ship_symbol: Annotated[str, Field(description="The ship ID.")],
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the fleet state.")] = True,
     ) -> Tuple[str, ShipResponseSchema | None]:
         """Get the details of a ship by ID."""
         try:
+            if use_cache and self.fleet_state:
+                cached = self.fleet_state.ship(ship_symbol)
+                if cached:
+                    return "Successfully fetched ship details.", ShipResponseSchema(data=cached)
+
             response = self.session.get(
                 url=f"{self.api_url}/my/ships/{ship_symbol}",
             )
 
             response.raise_for_status()
 
+            ship = parse_response(ShipResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.set_ship(ship.data)
+
             return (
                 "Successfully fetched ship details.",
-                ShipResponseSchema.model_validate(response.json())
+                ship
             )
 
         except requests.exceptions.HTTPError as error:
@@ -84,18 +138,29 @@ def get_ship(
     def get_ship_cargo(
         self,
         ship_symbol: Annotated[str, Field(description="The symbol of the ship.")],
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the fleet state.")] = True,
     ) -> Tuple[str, ShipCargoResponseSchema | None]:
         """Retrieve the cargo of a ship under your agent's ownership."""
         try:
+            if use_cache and self.fleet_state:
+                cached = self.fleet_state.cargo(ship_symbol)
+                if cached:
+                    return "Successfully fetched ship's cargo.", ShipCargoResponseSchema(data=cached)
+
             response = self.session.get(
                 url=f"{self.api_url}/my/ships/{ship_symbol}/cargo",
             )
 
             response.raise_for_status()
 
+            cargo = parse_response(ShipCargoResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.update_ship(ship_symbol, cargo=cargo.data)
+
             return (
                 "Successfully fetched ship's cargo.",
-                ShipCargoResponseSchema.model_validate(response.json())
+                cargo
             )
 
         except requests.exceptions.HTTPError as error:
@@ -122,9 +187,14 @@ def orbit_ship(
 
             response.raise_for_status()
 
+            orbit = parse_response(ShipOrbitResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(orbit.data, ship_symbol=ship_symbol)
+
             return (
                 "The ship has successfully moved into orbit at its current location.",
-                ShipOrbitResponseSchema.model_validate(response.json())
+                orbit
             )
 
         except requests.exceptions.HTTPError as error:
@@ -159,12 +229,55 @@ def navigate_ship(
 
             response.raise_for_status()
 
+            navigation = parse_response(NavigateShipResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(navigation.data, ship_symbol=ship_symbol)
+
             return (
                 (
                     "The successful transit information including the route details and changes to ship fuel."
                     "The route includes the expected time of arrival."
                 ),
-                NavigateShipResponseSchema.model_validate(response.json())
+                navigation
+            )
+
+        except requests.exceptions.HTTPError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    def patch_ship_nav(
+        self,
+        ship_symbol: Annotated[str, Field(description="The symbol of the ship.")],
+        flight_mode: Annotated[
+            ShipNavFlightModeEnum,
+            Field(description="The ship's set speed when traveling between waypoints or systems."),
+        ] = ShipNavFlightModeEnum.CRUISE,
+    ) -> Tuple[str, PatchShipNavResponseSchema | None]:
+        """Update the nav configuration of a ship.
+
+        Currently only supports configuring the Flight Mode of the ship, which affects its speed and fuel
+        consumption.
+        """
+        try:
+            response = self.session.patch(
+                url=f"{self.api_url}/my/ships/{ship_symbol}/nav",
+                json={
+                    "flightMode": ShipNavFlightModeEnum(flight_mode).value
+                }
+            )
+
+            response.raise_for_status()
+
+            nav = parse_response(PatchShipNavResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.update_ship(ship_symbol, nav=nav.data)
+
+            return (
+                "The updated nav data of the ship.",
+                nav
             )
 
         except requests.exceptions.HTTPError as error:
@@ -193,9 +306,14 @@ def dock_ship(
 
             response.raise_for_status()
 
+            dock = parse_response(ShipOrbitResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(dock.data, ship_symbol=ship_symbol)
+
             return (
                 "The ship has successfully docked at its current location.",
-                ShipOrbitResponseSchema.model_validate(response.json())
+                dock
             )
 
         except requests.exceptions.HTTPError as error:
@@ -244,9 +362,17 @@ def refuel_ship(
 
             response.raise_for_status()
 
+            refuel = parse_response(RefuelShipResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(refuel.data, ship_symbol=ship_symbol)
+
+            if self.response_cache:
+                self.response_cache.invalidate("market", refuel.data.transaction.waypointSymbol)
+
             return (
                 "The ship has successfully docked at its current location.",
-                RefuelShipResponseSchema.model_validate(response.json())
+                refuel
             )
 
         except requests.exceptions.HTTPError as error:
@@ -275,9 +401,14 @@ def extract_resources(
 
             response.raise_for_status()
 
+            extraction = parse_response(ExtractResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(extraction.data, ship_symbol=ship_symbol)
+
             return (
                 "Extracted successfully.",
-                ExtractResponseSchema.model_validate(response.json())
+                extraction
             )
 
         except requests.exceptions.HTTPError as error:
@@ -313,9 +444,14 @@ def create_survey(
 
             response.raise_for_status()
 
+            survey = parse_response(CreateSurveyResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(survey.data, ship_symbol=ship_symbol)
+
             return (
                 "Surveys has been created.",
-                CreateSurveyResponseSchema.model_validate(response.json())
+                survey
             )
 
         except requests.exceptions.HTTPError as error:
@@ -359,9 +495,14 @@ def extract_resources_with_survey(
 
             response.raise_for_status()
 
+            extraction = parse_response(ExtractResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(extraction.data, ship_symbol=ship_symbol)
+
             return (
                 "Extracted successfully.",
-                ExtractResponseSchema.model_validate(response.json())
+                extraction
             )
 
         except requests.exceptions.HTTPError as error:
@@ -390,12 +531,68 @@ def sell_cargo(
 
             response.raise_for_status()
 
+            sale = parse_response(SellCargoResponseSchema, response)
+
+            if self.fleet_state:
+                self.fleet_state.record(sale.data, ship_symbol=ship_symbol)
+
+            if self.response_cache:
+                self.response_cache.invalidate("market", sale.data.transaction.waypointSymbol)
+
             return (
                 "Cargo was successfully sold.",
-                SellCargoResponseSchema.model_validate(response.json())
+                sale
             )
 
         except requests.exceptions.HTTPError as error:
             match error.response.status_code:
                 case _:
                     return f"Unknown error: {error.response.text}", None
+
+    def orbit_ships(
+        self,
+        ship_symbols: Annotated[List[str], Field(description="The symbols of the ships.")],
+        max_workers: Annotated[int, Field(description="How many ships to move concurrently.", ge=1, default=8)] = 8,
+    ) -> BatchResult[ShipOrbitResponseSchema]:
+        """Move several ships into orbit concurrently. A failure for one ship does not stop the others."""
+        return run_batch(lambda ship_symbol: self.orbit_ship(ship_symbol=ship_symbol), ship_symbols, max_workers)
+
+    def dock_ships(
+        self,
+        ship_symbols: Annotated[List[str], Field(description="The symbols of the ships.")],
+        max_workers: Annotated[int, Field(description="How many ships to move concurrently.", ge=1, default=8)] = 8,
+    ) -> BatchResult[ShipOrbitResponseSchema]:
+        """Dock several ships concurrently. A failure for one ship does not stop the others.
+
+        Chain batches on the ships that succeeded, e.g. `refuel_ships(list(dock_ships(miners).succeeded))`.
+        """
+        return run_batch(lambda ship_symbol: self.dock_ship(ship_symbol=ship_symbol), ship_symbols, max_workers)
+
+    def refuel_ships(
+        self,
+        ship_symbols: Annotated[List[str], Field(description="The symbols of the ships.")],
+        units: Annotated[int, Field(description="The amount of fuel to fill in each ship's tanks.", ge=1)] = 100,
+        from_cargo: Annotated[
+            bool,
+            Field(description="Wether to use the FUEL thats in your cargo or not. Default: false")
+        ] = False,
+        max_workers: Annotated[int, Field(description="How many ships to refuel concurrently.", ge=1, default=8)] = 8,
+    ) -> BatchResult[RefuelShipResponseSchema]:
+        """Refuel several docked ships concurrently. A failure for one ship does not stop the others."""
+        return run_batch(
+            lambda ship_symbol: self.refuel_ship(ship_symbol=ship_symbol, units=units, from_cargo=from_cargo),
+            ship_symbols,
+            max_workers,
+        )
+
+    def navigate_ships(
+        self,
+        destinations: Annotated[Mapping[str, str], Field(description="The target destination of each ship.")],
+        max_workers: Annotated[int, Field(description="How many ships to move concurrently.", ge=1, default=8)] = 8,
+    ) -> BatchResult[NavigateShipResponseSchema]:
+        """Navigate several ships in orbit concurrently. A failure for one ship does not stop the others."""
+        return run_batch(
+            lambda ship_symbol: self.navigate_ship(ship_symbol=ship_symbol, waypoint_symbol=destinations[ship_symbol]),
+            destinations,
+            max_workers,
+        )
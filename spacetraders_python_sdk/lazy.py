@@ -0,0 +1,32 @@
+"""Lazy Loading.
+
+Importing the SDK stays cheap: subclients, schemas and the HTTP backends are only imported when first used,
+and the `.env` file is only read when a client is created.
+"""
+
+import importlib
+
+from functools import cache
+from typing import Any, Callable, Mapping
+
+
+def lazy_getattr(package: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """Return a module `__getattr__` importing each name of `exports` from its module on first access.
+
+    `exports` maps a public name to the module defining it, relative to `package`.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return getattr(importlib.import_module(exports[name], package), name)
+
+    return __getattr__
+
+
+@cache
+def load_env() -> None:
+    """Load the `.env` file into the environment, once."""
+    from dotenv import load_dotenv  # pylint: disable=import-outside-toplevel
+
+    load_dotenv()
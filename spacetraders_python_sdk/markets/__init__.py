@@ -0,0 +1,32 @@
+"""Init Markets.
+
+Requires numpy, installed with the `analytics` extra.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_getattr
+
+
+if TYPE_CHECKING:
+    from .price_history import PriceHistory, PriceSeries
+    from .price_matrix import ArbitrageOpportunity, PriceMatrix
+
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "ArbitrageOpportunity": ".price_matrix",
+        "PriceHistory": ".price_history",
+        "PriceMatrix": ".price_matrix",
+        "PriceSeries": ".price_history",
+    },
+)
+
+
+__all__ = [
+    "ArbitrageOpportunity",
+    "PriceHistory",
+    "PriceMatrix",
+    "PriceSeries",
+]
@@ -0,0 +1,303 @@
+"""Price History."""
+
+import threading
+import time
+
+from dataclasses import dataclass
+from os import PathLike
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..models import enum_value
+
+
+SUPPLY_LEVELS = ("SCARCE", "LIMITED", "MODERATE", "HIGH", "ABUNDANT")
+ACTIVITY_LEVELS = ("WEAK", "GROWING", "STRONG", "RESTRICTED")
+
+COLUMNS: Dict[str, np.dtype] = {
+    "timestamp": np.dtype("<f8"),
+    "waypoint": np.dtype("<i4"),
+    "symbol": np.dtype("<i2"),
+    "purchase_price": np.dtype("<i4"),
+    "sell_price": np.dtype("<i4"),
+    "trade_volume": np.dtype("<i4"),
+    "supply": np.dtype("i1"),
+    "activity": np.dtype("i1"),
+}
+
+AGGREGATIONS = ("mean", "min", "max", "first", "last")
+
+
+@dataclass(frozen=True)
+class PriceSeries:
+    """Prices of one good at one market over time, oldest first.
+
+    `supply` and `activity` are indexes into `SUPPLY_LEVELS` and `ACTIVITY_LEVELS`, -1 when unknown. Downsampled
+    series hold the start of each bucket and the number of snapshots it aggregates in `counts`.
+    """
+
+    timestamps: np.ndarray
+    purchase_prices: np.ndarray
+    sell_prices: np.ndarray
+    trade_volumes: np.ndarray
+    supply: np.ndarray
+    activity: np.ndarray
+    counts: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return len(self.timestamps)
+
+
+class PriceHistory:
+    """Append-only, columnar on-disk history of market prices, keyed by waypoint, trade good and timestamp.
+
+    Every column lives in its own little-endian binary file under `path`, and waypoint and good symbols are
+    interned into ids kept in two text files. Rows are buffered and appended in batches; reads memory-map the
+    columns, so queries over millions of rows only page in what they touch. Snapshots must be recorded in
+    time order, which lets range queries binary-search the timestamp column; the rows in range are then
+    scanned in chunks of `chunk_size` for the requested key.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, PathLike],
+        buffer_size: int = 4096,
+        chunk_size: int = 1 << 20,
+    ) -> None:
+        """Init, creating the directory if needed and reopening any history already in it."""
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.buffer_size = buffer_size
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self._buffer: List[Tuple[float, int, int, int, int, int, int, int]] = []
+
+        self._waypoints = self._load_symbols("waypoints.txt")
+        self._symbols = self._load_symbols("symbols.txt")
+        sizes = [self._column_path(name).stat().st_size // dtype.itemsize for name, dtype in COLUMNS.items()]
+        self._rows = min(sizes)
+        if max(sizes) != self._rows:
+            self._truncate()
+        self._last_timestamp = float(self._column("timestamp")[-1]) if self._rows else -np.inf
+
+    def __len__(self) -> int:
+        """Return the number of rows, buffered ones included."""
+        return self._rows + len(self._buffer)
+
+    def __enter__(self) -> "PriceHistory":
+        """Enter."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit, writing buffered rows."""
+        self.flush()
+
+    @property
+    def waypoints(self) -> List[str]:
+        """Return the waypoints with recorded prices."""
+        return list(self._waypoints)
+
+    @property
+    def symbols(self) -> List[str]:
+        """Return the trade goods with recorded prices."""
+        return list(self._symbols)
+
+    def record(self, market: Any, timestamp: Optional[float] = None) -> int:
+        """Append the prices of a `MarketSchema` snapshot, taken now by default. Return the number of rows added.
+
+        Snapshots without `tradeGoods`, taken without a ship present, add nothing.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            if timestamp < self._last_timestamp:
+                raise ValueError(f"Snapshot at {timestamp} is older than the last recorded one.")
+
+            for good in market.tradeGoods or ():
+                activity = enum_value(good.activity)
+                self._buffer.append(
+                    (
+                        timestamp,
+                        self._intern("waypoints.txt", self._waypoints, market.symbol),
+                        self._intern("symbols.txt", self._symbols, enum_value(good.symbol)),
+                        good.purchasePrice,
+                        good.sellPrice,
+                        good.tradeVolume,
+                        SUPPLY_LEVELS.index(enum_value(good.supply)),
+                        ACTIVITY_LEVELS.index(activity) if activity else -1,
+                    )
+                )
+            self._last_timestamp = timestamp
+            if len(self._buffer) >= self.buffer_size:
+                self._write()
+            return len(market.tradeGoods or ())
+
+    def record_many(self, markets: Iterable[Tuple[Any, float]]) -> int:
+        """Append several `(MarketSchema, timestamp)` snapshots. Return the number of rows added."""
+        return sum(self.record(market, timestamp) for market, timestamp in markets)
+
+    def flush(self) -> None:
+        """Write buffered rows to disk."""
+        with self._lock:
+            self._write()
+
+    def series(
+        self,
+        waypoint: str,
+        symbol: Any,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> PriceSeries:
+        """Return the prices of a good at a market with `start <= timestamp < end`."""
+        self.flush()
+        waypoint_id = self._waypoints.get(waypoint)
+        symbol_id = self._symbols.get(enum_value(symbol))
+        if waypoint_id is None or symbol_id is None:
+            return self._select(np.empty(0, dtype=np.int64))
+
+        timestamps = self._column("timestamp")
+        first = 0 if start is None else int(np.searchsorted(timestamps, start, side="left"))
+        last = self._rows if end is None else int(np.searchsorted(timestamps, end, side="left"))
+
+        waypoints, symbols = self._column("waypoint"), self._column("symbol")
+        matches = [np.empty(0, dtype=np.int64)]
+        for offset in range(first, last, self.chunk_size):
+            stop = min(offset + self.chunk_size, last)
+            found = (waypoints[offset:stop] == waypoint_id) & (symbols[offset:stop] == symbol_id)
+            matches.append(np.flatnonzero(found) + offset)
+        return self._select(np.concatenate(matches))
+
+    def downsample(
+        self,
+        waypoint: str,
+        symbol: Any,
+        interval: float,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        how: str = "mean",
+    ) -> PriceSeries:
+        """Return the prices of a good at a market aggregated into buckets of `interval` seconds.
+
+        Buckets are aligned on multiples of `interval` and empty ones are left out. Prices and trade volumes are
+        aggregated with `how`, one of `AGGREGATIONS`; supply and activity are the last of each bucket.
+        """
+        if how not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation {how!r}, expected one of {AGGREGATIONS}.")
+
+        series = self.series(waypoint, symbol, start, end)
+        if not len(series):
+            return series
+
+        buckets = np.floor(series.timestamps / interval)
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(series)]
+
+        def aggregate(values: np.ndarray) -> np.ndarray:
+            if how == "mean":
+                return np.add.reduceat(values, starts, dtype=np.float64) / (ends - starts)
+            if how == "min":
+                return np.minimum.reduceat(values, starts)
+            if how == "max":
+                return np.maximum.reduceat(values, starts)
+            return values[starts] if how == "first" else values[ends - 1]
+
+        return PriceSeries(
+            timestamps=buckets[starts] * interval,
+            purchase_prices=aggregate(series.purchase_prices),
+            sell_prices=aggregate(series.sell_prices),
+            trade_volumes=aggregate(series.trade_volumes),
+            supply=series.supply[ends - 1],
+            activity=series.activity[ends - 1],
+            counts=ends - starts,
+        )
+
+    def latest(self, waypoint: str, symbol: Any) -> Optional[Dict[str, Any]]:
+        """Return the last recorded prices of a good at a market, if any."""
+        with self._lock:
+            waypoint_id = self._waypoints.get(waypoint)
+            symbol_id = self._symbols.get(enum_value(symbol))
+            if waypoint_id is None or symbol_id is None:
+                return None
+            for buffered in reversed(self._buffer):
+                if buffered[1] == waypoint_id and buffered[2] == symbol_id:
+                    return self._as_dict(buffered)
+
+        waypoints, symbols = self._column("waypoint"), self._column("symbol")
+        for stop in range(self._rows, 0, -self.chunk_size):
+            offset = max(0, stop - self.chunk_size)
+            found = np.flatnonzero((waypoints[offset:stop] == waypoint_id) & (symbols[offset:stop] == symbol_id))
+            if found.size:
+                row = offset + int(found[-1])
+                return self._as_dict(tuple(self._column(name)[row].item() for name in COLUMNS))
+        return None
+
+    def _select(self, rows: np.ndarray) -> PriceSeries:
+        """Return the series made of some rows."""
+        return PriceSeries(
+            timestamps=np.asarray(self._column("timestamp")[rows]),
+            purchase_prices=np.asarray(self._column("purchase_price")[rows]),
+            sell_prices=np.asarray(self._column("sell_price")[rows]),
+            trade_volumes=np.asarray(self._column("trade_volume")[rows]),
+            supply=np.asarray(self._column("supply")[rows]),
+            activity=np.asarray(self._column("activity")[rows]),
+        )
+
+    def _as_dict(self, row: Tuple[Any, ...]) -> Dict[str, Any]:
+        """Return a row as a dict with symbols and levels."""
+        values = dict(zip(COLUMNS, row))
+        return {
+            "timestamp": values["timestamp"],
+            "purchasePrice": values["purchase_price"],
+            "sellPrice": values["sell_price"],
+            "tradeVolume": values["trade_volume"],
+            "supply": SUPPLY_LEVELS[values["supply"]],
+            "activity": ACTIVITY_LEVELS[values["activity"]] if values["activity"] >= 0 else None,
+        }
+
+    def _column(self, name: str) -> np.ndarray:
+        """Memory-map the written rows of a column."""
+        if not self._rows:
+            return np.empty(0, dtype=COLUMNS[name])
+        return np.memmap(self._column_path(name), dtype=COLUMNS[name], mode="r", shape=(self._rows,))
+
+    def _column_path(self, name: str) -> Path:
+        """Return the file of a column, creating it if needed."""
+        path = self.path / f"{name}.bin"
+        path.touch(exist_ok=True)
+        return path
+
+    def _write(self) -> None:
+        """Append the buffered rows to every column file."""
+        if not self._buffer:
+            return
+
+        columns = list(zip(*self._buffer))
+        for (name, dtype), values in zip(COLUMNS.items(), columns):
+            with open(self._column_path(name), "ab") as file:
+                file.write(np.asarray(values, dtype=dtype).tobytes())
+        self._rows += len(self._buffer)
+        self._buffer.clear()
+
+    def _truncate(self) -> None:
+        """Drop the rows of an interrupted write that did not reach every column."""
+        for name, dtype in COLUMNS.items():
+            with open(self._column_path(name), "r+b") as file:
+                file.truncate(self._rows * dtype.itemsize)
+
+    def _load_symbols(self, name: str) -> Dict[str, int]:
+        """Read the ids of interned symbols."""
+        path = self.path / name
+        if not path.exists():
+            return {}
+        return {symbol: index for index, symbol in enumerate(path.read_text(encoding="utf-8").splitlines())}
+
+    def _intern(self, name: str, ids: Dict[str, int], symbol: str) -> int:
+        """Return the id of a symbol, appending it to its file if new."""
+        index = ids.get(symbol)
+        if index is None:
+            index = ids[symbol] = len(ids)
+            with open(self.path / name, "a", encoding="utf-8") as file:
+                file.write(f"{symbol}\n")
+        return index
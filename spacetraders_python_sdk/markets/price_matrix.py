@@ -0,0 +1,235 @@
+"""Price Matrix."""
+
+import threading
+import time
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from ..models import enum_value
+from ..models.models import TradeSymbolEnum
+
+
+@dataclass(frozen=True, slots=True)
+class ArbitrageOpportunity:
+    """Buy a good at one market and sell it at another."""
+
+    symbol: str
+    buy_market: str
+    sell_market: str
+    purchase_price: int
+    sell_price: int
+    units: int
+    profit: int
+    distance: float
+    score: float
+
+
+class PriceMatrix:
+    """Latest prices of every market, as NumPy arrays of markets × trade goods.
+
+    Each market snapshot overwrites its row, so the matrix stays current as markets are polled. Goods a market
+    does not trade, and markets seen without a ship present, hold NaN. Positions are the waypoint coordinates
+    within the system, and pairs of markets in different systems are left out of the arbitrage query.
+    """
+
+    def __init__(self, symbols: Optional[Sequence[str]] = None, capacity: int = 64) -> None:
+        """Init.
+
+        `symbols` are the trade goods of the columns, every `TradeSymbolEnum` member by default.
+        """
+        if symbols is None:
+            symbols = [symbol.value for symbol in TradeSymbolEnum]
+
+        self.symbols: List[str] = list(symbols)
+        self.columns: Dict[str, int] = {symbol: column for column, symbol in enumerate(self.symbols)}
+        self.markets: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        shape = (capacity, len(self.symbols))
+        self.purchase_prices = np.full(shape, np.nan)
+        self.sell_prices = np.full(shape, np.nan)
+        self.trade_volumes = np.zeros(shape)
+        self.positions = np.full((capacity, 2), np.nan)
+        self.systems = np.full(capacity, -1)
+        self.updated = np.full(capacity, np.nan)
+        self._system_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of markets."""
+        return len(self.markets)
+
+    def update(
+        self,
+        market: Any,
+        x: Optional[int] = None,
+        y: Optional[int] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Write the prices of a `MarketSchema` snapshot, and the market position if given.
+
+        Snapshots without `tradeGoods`, taken without a ship present, only record the market.
+        """
+        with self._lock:
+            row = self._row(market.symbol)
+            if x is not None and y is not None:
+                self._move(row, x, y)
+
+            if not market.tradeGoods:
+                return
+
+            self.purchase_prices[row] = np.nan
+            self.sell_prices[row] = np.nan
+            self.trade_volumes[row] = 0
+            for good in market.tradeGoods:
+                column = self.columns.get(enum_value(good.symbol))
+                if column is None:
+                    continue
+                self.purchase_prices[row, column] = good.purchasePrice
+                self.sell_prices[row, column] = good.sellPrice
+                self.trade_volumes[row, column] = good.tradeVolume
+            self.updated[row] = time.time() if timestamp is None else timestamp
+
+    def update_many(self, markets: Iterable[Any]) -> None:
+        """Write several snapshots."""
+        for market in markets:
+            self.update(market)
+
+    def set_position(self, market_symbol: str, x: int, y: int) -> None:
+        """Record the position of a market within its system."""
+        with self._lock:
+            self._move(self._row(market_symbol), x, y)
+
+    def prices(self, market_symbol: str) -> Dict[str, Dict[str, float]]:
+        """Return the known purchase and sell prices of a market by good."""
+        row = self.rows[market_symbol]
+        return {
+            symbol: {
+                "purchasePrice": float(self.purchase_prices[row, column]),
+                "sellPrice": float(self.sell_prices[row, column]),
+            }
+            for symbol, column in self.columns.items()
+            if not np.isnan(self.purchase_prices[row, column])
+        }
+
+    def arbitrage(
+        self,
+        top: int = 10,
+        cargo_capacity: Optional[int] = None,
+        goods: Optional[Iterable[Any]] = None,
+        distance_overhead: float = 15.0,
+        max_age: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> List[ArbitrageOpportunity]:
+        """Return the best buy-here, sell-there trades within a system, best first.
+
+        A trade moves as many units as both markets take in one transaction (`tradeVolume`), and at most
+        `cargo_capacity`. Trades are scored by profit per unit of distance flown, with `distance_overhead`
+        added to every trip to account for docking and fixed transit time; markets without a known position
+        are treated as being next to each other. Markets whose prices are older than `max_age` seconds are
+        left out.
+        """
+        with self._lock:
+            count = len(self.markets)
+            columns = np.arange(len(self.symbols))
+            if goods is not None:
+                columns = np.array([self.columns[enum_value(good)] for good in goods], dtype=int)
+            rows = np.arange(count)
+            if max_age is not None:
+                rows = rows[self.updated[:count] >= (time.time() if now is None else now) - max_age]
+
+            order = rows[np.argsort(self.systems[rows], kind="stable")]
+            _, starts = np.unique(self.systems[order], return_index=True)
+            candidates = []
+            for system_rows in np.split(order, starts[1:]):
+                if system_rows.size > 1:
+                    candidates.extend(
+                        self._system_arbitrage(system_rows, columns, top, cargo_capacity, distance_overhead)
+                    )
+
+        candidates.sort(key=lambda opportunity: -opportunity.score)
+        return candidates[:top]
+
+    def _system_arbitrage(
+        self,
+        rows: np.ndarray,
+        columns: np.ndarray,
+        top: int,
+        cargo_capacity: Optional[int],
+        distance_overhead: float,
+    ) -> List[ArbitrageOpportunity]:
+        """Return the best trades between markets of one system, over buy market × sell market × good."""
+        columns = columns[~np.isnan(self.purchase_prices[np.ix_(rows, columns)]).all(axis=0)]
+        purchase = self.purchase_prices[np.ix_(rows, columns)][:, None, :]
+        sell = self.sell_prices[np.ix_(rows, columns)][None, :, :]
+        volumes = self.trade_volumes[np.ix_(rows, columns)]
+
+        margin = sell - purchase
+        units = np.minimum(volumes[:, None, :], volumes[None, :, :])
+        if cargo_capacity is not None:
+            units = np.minimum(units, cargo_capacity)
+        profit = margin * units
+
+        deltas = self.positions[rows][:, None, :] - self.positions[rows][None, :, :]
+        distances = np.nan_to_num(np.hypot(deltas[..., 0], deltas[..., 1]))
+        with np.errstate(invalid="ignore"):
+            eligible = margin > 0
+        eligible[np.arange(rows.size), np.arange(rows.size)] = False
+        score = profit / (distances + distance_overhead)[:, :, None]
+
+        flat = np.flatnonzero(eligible)
+        if flat.size > top:
+            flat = flat[np.argpartition(score.ravel()[flat], -top)[-top:]]
+        opportunities = []
+        for buy, sell_at, good in zip(*np.unravel_index(flat, score.shape)):
+            opportunities.append(
+                ArbitrageOpportunity(
+                    symbol=self.symbols[columns[good]],
+                    buy_market=self.markets[rows[buy]],
+                    sell_market=self.markets[rows[sell_at]],
+                    purchase_price=int(purchase[buy, 0, good]),
+                    sell_price=int(sell[0, sell_at, good]),
+                    units=int(units[buy, sell_at, good]),
+                    profit=int(profit[buy, sell_at, good]),
+                    distance=float(distances[buy, sell_at]),
+                    score=float(score[buy, sell_at, good]),
+                )
+            )
+        return opportunities
+
+    def _row(self, market_symbol: str) -> int:
+        """Return the row of a market, adding it and growing the arrays if needed."""
+        row = self.rows.get(market_symbol)
+        if row is not None:
+            return row
+
+        row = self.rows[market_symbol] = len(self.markets)
+        self.markets.append(market_symbol)
+        if row == len(self.systems):
+            self._grow()
+
+        system_symbol = market_symbol.rsplit("-", 1)[0]
+        self.systems[row] = self._system_ids.setdefault(system_symbol, len(self._system_ids))
+        return row
+
+    def _grow(self) -> None:
+        """Double the capacity of every array."""
+
+        def grow(array: np.ndarray, fill: float) -> np.ndarray:
+            grown = np.full((2 * array.shape[0], *array.shape[1:]), fill, dtype=array.dtype)
+            grown[: array.shape[0]] = array
+            return grown
+
+        self.purchase_prices = grow(self.purchase_prices, np.nan)
+        self.sell_prices = grow(self.sell_prices, np.nan)
+        self.trade_volumes = grow(self.trade_volumes, 0)
+        self.positions = grow(self.positions, np.nan)
+        self.systems = grow(self.systems, -1)
+        self.updated = grow(self.updated, np.nan)
+
+    def _move(self, row: int, x: int, y: int) -> None:
+        """Set the position of a row."""
+        self.positions[row] = (x, y)
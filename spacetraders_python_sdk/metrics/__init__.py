@@ -0,0 +1,15 @@
+"""Init Metrics."""
+
+from .hooks import MetricsHooks, endpoint_template
+from .prometheus import render_prometheus
+from .registry import EndpointStats, Histogram, MetricsRegistry
+
+
+__all__ = [
+    "EndpointStats",
+    "Histogram",
+    "MetricsHooks",
+    "MetricsRegistry",
+    "endpoint_template",
+    "render_prometheus",
+]
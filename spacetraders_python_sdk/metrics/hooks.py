@@ -0,0 +1,56 @@
+"""Metrics Hooks."""
+
+from typing import Optional
+from urllib.parse import urlsplit
+
+
+ID_SEGMENTS = {
+    "agents": "{agentSymbol}",
+    "contracts": "{contractId}",
+    "factions": "{factionSymbol}",
+    "ships": "{shipSymbol}",
+    "systems": "{systemSymbol}",
+    "waypoints": "{waypointSymbol}",
+}
+
+
+def endpoint_template(url: str) -> str:
+    """Return the endpoint of a request URL, e.g. `/my/ships/{shipSymbol}/orbit` for `.../v2/my/ships/S-1/orbit`.
+
+    Symbols and ids are replaced by placeholders and the API version prefix and query string are dropped, so
+    every request to an endpoint shares its metrics whatever ship, system or contract it is for.
+    """
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    if segments and segments[0][:1] == "v" and segments[0][1:].isdigit():
+        segments = segments[1:]
+
+    for index in range(1, len(segments)):
+        placeholder = ID_SEGMENTS.get(segments[index - 1])
+        if placeholder is not None:
+            segments[index] = placeholder
+    return "/" + "/".join(segments)
+
+
+class MetricsHooks:
+    """Instrumentation hooks the sessions call for every request they send; every hook does nothing by default.
+
+    Subclass it to forward measurements to your own monitoring, or use `MetricsRegistry` to keep them in process.
+    Hooks are called from every thread and event loop sending requests, so implementations must be thread-safe.
+    """
+
+    def on_request(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: Optional[int],
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        """Record one attempt at a request: its network time, and None as status if no response came back."""
+
+    def on_retry(self, method: str, endpoint: str, status_code: Optional[int]) -> None:
+        """Record that a request is sent again after failing with `status_code`, or a connection error if None."""
+
+    def on_parse(self, method: str, endpoint: str, schema: str, seconds: float) -> None:
+        """Record the time spent validating a response body against `schema`, apart from the network time."""
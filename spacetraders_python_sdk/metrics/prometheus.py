@@ -0,0 +1,74 @@
+"""Prometheus Exporter."""
+
+from typing import Dict, List
+
+from .registry import Histogram, MetricsRegistry
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    """Return labels in the Prometheus text format."""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _bound(bound: float) -> str:
+    """Return a bucket bound as Prometheus writes it."""
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def _histogram(lines: List[str], name: str, labels: Dict[str, str], histogram: Histogram) -> None:
+    """Append the bucket, sum and count samples of a histogram."""
+    for bound, total in histogram.cumulative():
+        lines.append(f"{name}_bucket{_labels({**labels, 'le': _bound(bound)})} {total}")
+    lines.append(f"{name}_sum{_labels(labels)} {histogram.sum!r}")
+    lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+
+def _family(lines: List[str], name: str, kind: str, help_text: str) -> None:
+    """Append the HELP and TYPE lines of a metric."""
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def render_prometheus(registry: MetricsRegistry, namespace: str = "spacetraders") -> str:
+    """Return the metrics of a registry in the Prometheus text exposition format, e.g. for a `/metrics` handler."""
+    stats = registry.stats()
+    lines: List[str] = []
+
+    name = f"{namespace}_request_duration_seconds"
+    _family(lines, name, "histogram", "Network time of each request attempt.")
+    for endpoint in stats:
+        _histogram(lines, name, {"method": endpoint.method, "endpoint": endpoint.endpoint}, endpoint.latency)
+
+    name = f"{namespace}_parse_duration_seconds"
+    _family(lines, name, "histogram", "Time spent validating response bodies.")
+    for endpoint in stats:
+        if endpoint.parse.count:
+            _histogram(lines, name, {"method": endpoint.method, "endpoint": endpoint.endpoint}, endpoint.parse)
+
+    name = f"{namespace}_requests_total"
+    _family(lines, name, "counter", "Request attempts by status code, 'error' when no response came back.")
+    for endpoint in stats:
+        for status, count in sorted(endpoint.statuses.items()):
+            labels = {"method": endpoint.method, "endpoint": endpoint.endpoint, "status": status}
+            lines.append(f"{name}{_labels(labels)} {count}")
+
+    name = f"{namespace}_retries_total"
+    _family(lines, name, "counter", "Retries by the status code, or connection 'error', that caused them.")
+    for endpoint in stats:
+        for status, count in sorted(endpoint.retries.items()):
+            labels = {"method": endpoint.method, "endpoint": endpoint.endpoint, "status": status}
+            lines.append(f"{name}{_labels(labels)} {count}")
+
+    for direction, attribute in (("sent", "request_bytes"), ("received", "response_bytes")):
+        name = f"{namespace}_{direction}_bytes_total"
+        _family(lines, name, "counter", f"Body bytes {direction}.")
+        for endpoint in stats:
+            labels = {"method": endpoint.method, "endpoint": endpoint.endpoint}
+            lines.append(f"{name}{_labels(labels)} {getattr(endpoint, attribute)}")
+
+    return "\n".join(lines) + "\n"
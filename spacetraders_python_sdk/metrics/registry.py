@@ -0,0 +1,159 @@
+"""Metrics Registry."""
+
+import bisect
+import threading
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .hooks import MetricsHooks
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PARSE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+class Histogram:
+    """Counts of observed values per bucket, with their sum, like a Prometheus histogram."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """Init with the upper bounds of the buckets, in increasing order; an infinite bucket is implied."""
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add a value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Return the number of values lower than or equal to each upper bound, the infinite one last."""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by interpolating within its bucket, or return None without values.
+
+        Values past the last bound are reported at that bound, as Prometheus' `histogram_quantile` does.
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        lower = 0.0
+        previous = 0
+        for bound, total in self.cumulative():
+            if total >= rank:
+                if bound == float("inf"):
+                    return self.buckets[-1] if self.buckets else None
+                in_bucket = total - previous
+                return lower + (bound - lower) * ((rank - previous) / in_bucket if in_bucket else 0.0)
+            lower, previous = bound, total
+        return None
+
+
+@dataclass
+class EndpointStats:
+    """Metrics of one endpoint and method."""
+
+    method: str
+    endpoint: str
+    latency: Histogram
+    parse: Histogram
+    statuses: Counter = field(default_factory=Counter)
+    retries: Counter = field(default_factory=Counter)
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+    @property
+    def requests(self) -> int:
+        """Return the number of attempts sent, retries included."""
+        return self.latency.count
+
+    @property
+    def errors(self) -> int:
+        """Return the number of attempts that got an error status or no response."""
+        return sum(count for status, count in self.statuses.items() if status == "error" or int(status) >= 400)
+
+
+class MetricsRegistry(MetricsHooks):
+    """In-process registry of per-endpoint request metrics.
+
+    Keeps, for every method and endpoint, a histogram of network latency, one of response validation time,
+    the count of each status code, the count of retries by cause, and the bytes sent and received. Pass it as
+    `metrics` to a client, then read `stats`, rank endpoints with `hot_paths`, or render everything with
+    `render_prometheus`.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+        parse_buckets: Sequence[float] = PARSE_BUCKETS,
+    ) -> None:
+        """Init."""
+        self.latency_buckets = tuple(latency_buckets)
+        self.parse_buckets = tuple(parse_buckets)
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], EndpointStats] = {}
+
+    def on_request(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: Optional[int],
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        """Record one attempt at a request."""
+        with self._lock:
+            stats = self._get(method, endpoint)
+            stats.latency.observe(seconds)
+            stats.statuses["error" if status_code is None else str(status_code)] += 1
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+
+    def on_retry(self, method: str, endpoint: str, status_code: Optional[int]) -> None:
+        """Record a retry."""
+        with self._lock:
+            self._get(method, endpoint).retries["error" if status_code is None else str(status_code)] += 1
+
+    def on_parse(self, method: str, endpoint: str, schema: str, seconds: float) -> None:
+        """Record the validation time of a response."""
+        with self._lock:
+            self._get(method, endpoint).parse.observe(seconds)
+
+    def stats(self, method: Optional[str] = None, endpoint: Optional[str] = None) -> List[EndpointStats]:
+        """Return the metrics of every endpoint, or of those matching `method` and `endpoint`."""
+        with self._lock:
+            return [
+                stats
+                for (stats_method, stats_endpoint), stats in sorted(self._stats.items())
+                if method in (None, stats_method) and endpoint in (None, stats_endpoint)
+            ]
+
+    def hot_paths(self, top: int = 10) -> List[EndpointStats]:
+        """Return the endpoints that spent the most time, on the network and in validation, first."""
+        return sorted(self.stats(), key=lambda stats: stats.latency.sum + stats.parse.sum, reverse=True)[:top]
+
+    def clear(self) -> None:
+        """Forget every metric."""
+        with self._lock:
+            self._stats.clear()
+
+    def _get(self, method: str, endpoint: str) -> EndpointStats:
+        """Return the metrics of an endpoint, creating them if needed."""
+        stats = self._stats.get((method, endpoint))
+        if stats is None:
+            stats = self._stats[(method, endpoint)] = EndpointStats(
+                method, endpoint, Histogram(self.latency_buckets), Histogram(self.parse_buckets)
+            )
+        return stats
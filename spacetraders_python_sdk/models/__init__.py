@@ -1 +1,15 @@
 """Init Models."""
+
+import importlib
+
+from typing import Any
+
+
+def enum_value(member: Any) -> Any:
+    """Return the value of an enum member, or the string itself."""
+    return getattr(member, "value", member)
+
+
+def __getattr__(name: str) -> Any:
+    """Build the schemas on first access to one of them."""
+    return getattr(importlib.import_module(".models", __name__), name)
@@ -1815,6 +1815,12 @@ class NavigateShipResponseSchema(BaseModel):
     data: NavigateShipSchema
 
 
+class PatchShipNavResponseSchema(BaseModel):
+    """Patch Ship Nav Response Schema."""
+
+    data: ShipNavSchema
+
+
 class RefuelShipSchema(BaseModel):
     """Refuel Ship Response Schema."""
 
@@ -1945,3 +1951,16 @@ class SellCargoResponseSchema(BaseModel):
     """Sell Cargo Response Schema."""
 
     data: SellCargoSchema
+
+
+class DeliverContractSchema(BaseModel):
+    """Deliver Contract Schema."""
+
+    contract: ContractSchema
+    cargo: ShipCargoSchema
+
+
+class DeliverContractResponseSchema(BaseModel):
+    """Deliver Contract Response Schema."""
+
+    data: DeliverContractSchema
@@ -0,0 +1,30 @@
+"""Init Navigation."""
+
+from .jump_gate_graph import JumpGateGraph
+from .route_planner import (
+    DistanceMatrix,
+    FlightLeg,
+    FlightPlan,
+    RoutePlanner,
+    RoutePlanningError,
+    follow_plan,
+    fuel_cost,
+    travel_time,
+)
+from .spatial_index import Neighbour, SpatialEntry, SpatialIndex
+
+
+__all__ = [
+    "DistanceMatrix",
+    "FlightLeg",
+    "FlightPlan",
+    "JumpGateGraph",
+    "Neighbour",
+    "RoutePlanner",
+    "RoutePlanningError",
+    "SpatialEntry",
+    "SpatialIndex",
+    "follow_plan",
+    "fuel_cost",
+    "travel_time",
+]
@@ -0,0 +1,221 @@
+"""Jump Gate Graph."""
+
+import heapq
+import json
+import math
+import threading
+
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Set, Tuple
+
+from ..cache import GalaxyCache
+from .route_planner import system_of
+
+
+Weight = Callable[[str, str], float]
+
+
+class JumpGateGraph:
+    """Network of the jump gates between systems, learned one `JumpGateSchema` at a time.
+
+    Nodes are jump gate waypoint symbols; every system has at most one gate, so a system symbol can be used
+    wherever a gate is expected once its gate is known. Connections are treated as two-way, like in the game.
+
+    With a `galaxy_cache`, known gates are loaded from it, and gates added later are written to it in the same
+    format as `Systems.get_jump_gate`, so the graph survives restarts and is dropped on server resets.
+
+    Route trees and connected components are cached until a gate adds new connections, so routing many ships
+    across the network is an in-memory lookup. Trees are kept per origin and weight function, the `max_trees`
+    most recently used ones; reuse the same function, e.g. `graph.distance`, rather than a new lambda per query.
+    """
+
+    def __init__(self, galaxy_cache: Optional[GalaxyCache] = None, max_trees: int = 256) -> None:
+        """Init."""
+        self.galaxy_cache = galaxy_cache
+        self.max_trees = max_trees
+        self._lock = threading.RLock()
+        self._edges: Dict[str, Set[str]] = {}
+        self._explored: Set[str] = set()
+        self._gates: Dict[str, str] = {}
+        self._positions: Dict[str, Tuple[int, int]] = {}
+        self._trees: OrderedDict[Tuple[str, Optional[Hashable]], Dict[str, Optional[str]]] = OrderedDict()
+        self._components: Optional[Dict[str, FrozenSet[str]]] = None
+
+        if galaxy_cache:
+            for symbol, payload in galaxy_cache.entries("jump_gate"):
+                self._connect(symbol, json.loads(payload)["data"]["connections"])
+
+    def __len__(self) -> int:
+        """Return the number of known gates."""
+        return len(self._edges)
+
+    def __contains__(self, symbol: object) -> bool:
+        """Return whether a gate, or the gate of a system, is known."""
+        return symbol in self._edges or symbol in self._gates
+
+    @property
+    def unexplored(self) -> Set[str]:
+        """Return the gates known from a connection whose own connections have not been fetched."""
+        with self._lock:
+            return set(self._edges) - self._explored
+
+    def add_jump_gate(self, jump_gate: Any) -> bool:
+        """Add the connections of a `JumpGateSchema`. Return whether they changed the graph."""
+        with self._lock:
+            changed = self._connect(jump_gate.symbol, jump_gate.connections)
+            if self.galaxy_cache:
+                body = {"data": {"symbol": jump_gate.symbol, "connections": list(jump_gate.connections)}}
+                self.galaxy_cache.set("jump_gate", jump_gate.symbol, json.dumps(body).encode())
+            return changed
+
+    def add_system(self, system: Any) -> None:
+        """Record the position of a `SystemSchema`, used by `distance`."""
+        with self._lock:
+            self._positions[system.symbol] = (system.x, system.y)
+            self._trees.clear()
+
+    def gate_of(self, symbol: str) -> str:
+        """Return the gate symbol for a gate or a system symbol."""
+        return self._gates.get(symbol, symbol)
+
+    def neighbours(self, symbol: str) -> FrozenSet[str]:
+        """Return the gates connected to a gate."""
+        with self._lock:
+            return frozenset(self._edges.get(self.gate_of(symbol), ()))
+
+    def distance(self, origin: str, destination: str) -> float:
+        """Return the distance between the systems of two gates, for weighted routing."""
+        origin_x, origin_y = self._positions[system_of(self.gate_of(origin))]
+        destination_x, destination_y = self._positions[system_of(self.gate_of(destination))]
+        return math.hypot(origin_x - destination_x, origin_y - destination_y)
+
+    def shortest_path(
+        self,
+        origin: str,
+        destination: str,
+        weight: Optional[Weight] = None,
+    ) -> Optional[List[str]]:
+        """Return the gates from `origin` to `destination`, both included, or None if they are not connected.
+
+        Without `weight` the path has the fewest jumps (BFS); with one, e.g. `graph.distance`, it has the lowest
+        total weight (Dijkstra). The whole tree of routes from `origin` is cached, so further queries from the
+        same origin only walk back the path.
+        """
+        origin, destination = self.gate_of(origin), self.gate_of(destination)
+        with self._lock:
+            if origin not in self._edges or destination not in self._edges:
+                return None
+
+            key = (origin, weight)
+            tree = self._trees.get(key)
+            if tree is None:
+                tree = self._trees[key] = self._bfs(origin) if weight is None else self._dijkstra(origin, weight)
+                if len(self._trees) > self.max_trees:
+                    self._trees.popitem(last=False)
+            else:
+                self._trees.move_to_end(key)
+
+        if destination not in tree:
+            return None
+
+        path = [destination]
+        while path[-1] != origin:
+            path.append(tree[path[-1]])  # type: ignore[arg-type]
+        path.reverse()
+        return path
+
+    def component(self, symbol: str) -> FrozenSet[str]:
+        """Return every gate reachable from a gate, itself included."""
+        with self._lock:
+            if self._components is None:
+                self._components = self._find_components()
+            return self._components.get(self.gate_of(symbol), frozenset())
+
+    def components(self) -> List[FrozenSet[str]]:
+        """Return the connected components of the network, largest first."""
+        with self._lock:
+            if self._components is None:
+                self._components = self._find_components()
+            unique = {id(component): component for component in self._components.values()}
+        return sorted(unique.values(), key=lambda component: (-len(component), min(component)))
+
+    def explore(self, systems: Any, start: str, limit: Optional[int] = None) -> int:
+        """Fetch the connections of unexplored gates reachable from `start` with `Systems.get_jump_gate`.
+
+        Stop after `limit` requests. Return the number of gates fetched.
+        """
+        queue = deque([self.gate_of(start)])
+        seen = {queue[0]}
+        fetched = 0
+        while queue and (limit is None or fetched < limit):
+            gate = queue.popleft()
+            if gate not in self._explored:
+                _, result = systems.get_jump_gate(system_symbol=system_of(gate), waypoint_symbol=gate)
+                fetched += 1
+                if result is None:
+                    continue
+                self.add_jump_gate(result.data)
+
+            for neighbour in sorted(self.neighbours(gate) - seen):
+                seen.add(neighbour)
+                queue.append(neighbour)
+        return fetched
+
+    def _connect(self, symbol: str, connections: List[str]) -> bool:
+        """Add two-way edges from a gate, invalidating the caches if any is new."""
+        self._explored.add(symbol)
+        new = False
+        for gate in (symbol, *connections):
+            if gate not in self._edges:
+                self._edges[gate] = set()
+                self._gates[system_of(gate)] = gate
+                new = True
+        for connection in connections:
+            if connection not in self._edges[symbol]:
+                self._edges[symbol].add(connection)
+                self._edges[connection].add(symbol)
+                new = True
+
+        if new:
+            self._trees.clear()
+            self._components = None
+        return new
+
+    def _bfs(self, origin: str) -> Dict[str, Optional[str]]:
+        """Return the parent of every gate on the fewest-jumps routes from `origin`."""
+        parents: Dict[str, Optional[str]] = {origin: None}
+        queue = deque([origin])
+        while queue:
+            gate = queue.popleft()
+            for neighbour in sorted(self._edges[gate]):
+                if neighbour not in parents:
+                    parents[neighbour] = gate
+                    queue.append(neighbour)
+        return parents
+
+    def _dijkstra(self, origin: str, weight: Weight) -> Dict[str, Optional[str]]:
+        """Return the parent of every gate on the lightest routes from `origin`."""
+        parents: Dict[str, Optional[str]] = {origin: None}
+        best = {origin: 0.0}
+        queue = [(0.0, origin)]
+        while queue:
+            total, gate = heapq.heappop(queue)
+            if total > best[gate]:
+                continue
+            for neighbour in self._edges[gate]:
+                candidate = total + weight(gate, neighbour)
+                if candidate < best.get(neighbour, math.inf):
+                    best[neighbour] = candidate
+                    parents[neighbour] = gate
+                    heapq.heappush(queue, (candidate, neighbour))
+        return parents
+
+    def _find_components(self) -> Dict[str, FrozenSet[str]]:
+        """Map every gate to its connected component."""
+        components: Dict[str, FrozenSet[str]] = {}
+        for gate in self._edges:
+            if gate not in components:
+                component = frozenset(self._bfs(gate))
+                for member in component:
+                    components[member] = component
+        return components
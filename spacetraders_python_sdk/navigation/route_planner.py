@@ -0,0 +1,345 @@
+"""Route Planner."""
+
+import heapq
+import math
+import time
+
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ..models import enum_value
+
+
+Objective = Literal["fastest", "cheapest"]
+
+FLIGHT_MODE_MULTIPLIERS: Mapping[str, float] = {
+    "BURN": 12.5,
+    "CRUISE": 25.0,
+    "STEALTH": 30.0,
+    "DRIFT": 250.0,
+}
+
+FUEL_PER_MARKET_UNIT = 100
+
+
+class RoutePlanningError(Exception):
+    """Raised when a route is asked for in a system or between waypoints the planner does not know."""
+
+
+def system_of(waypoint_symbol: str) -> str:
+    """Return the symbol of the system holding a waypoint."""
+    return waypoint_symbol.rsplit("-", 1)[0]
+
+
+def fuel_cost(distance: float, flight_mode: Any) -> int:
+    """Return the fuel a ship burns to fly `distance` in `flight_mode`."""
+    flight_mode = enum_value(flight_mode)
+    if flight_mode == "DRIFT":
+        return 1
+
+    fuel = max(1, round(distance))
+    return 2 * fuel if flight_mode == "BURN" else fuel
+
+
+def travel_time(distance: float, flight_mode: Any, engine_speed: int) -> int:
+    """Return the seconds a ship with an engine of `engine_speed` takes to fly `distance` in `flight_mode`."""
+    multiplier = FLIGHT_MODE_MULTIPLIERS[enum_value(flight_mode)]
+    return round(round(max(1, distance)) * (multiplier / engine_speed) + 15)
+
+
+class DistanceMatrix:
+    """Euclidean distances between every pair of waypoints of a system, computed once."""
+
+    def __init__(self, positions: Mapping[str, Tuple[int, int]]) -> None:
+        """Init."""
+        self.symbols: Tuple[str, ...] = tuple(positions)
+        self.index: Dict[str, int] = {symbol: position for position, symbol in enumerate(self.symbols)}
+        coordinates = [positions[symbol] for symbol in self.symbols]
+        self.rows: List[List[float]] = [
+            [math.hypot(x - other_x, y - other_y) for other_x, other_y in coordinates] for x, y in coordinates
+        ]
+
+    @classmethod
+    def from_waypoints(cls, waypoints: Iterable[Any]) -> "DistanceMatrix":
+        """Build the matrix of `WaypointSchema` or `SystemWaypointSchema` items."""
+        return cls({waypoint.symbol: (waypoint.x, waypoint.y) for waypoint in waypoints})
+
+    def __contains__(self, symbol: object) -> bool:
+        """Return whether `symbol` is in the matrix."""
+        return symbol in self.index
+
+    def distance(self, origin: str, destination: str) -> float:
+        """Return the distance between two waypoints."""
+        return self.rows[self.index[origin]][self.index[destination]]
+
+
+@dataclass(frozen=True, slots=True)
+class FlightLeg:
+    """One `navigate_ship` call, after buying `refuel` units of fuel at the origin if any."""
+
+    origin: str
+    destination: str
+    flight_mode: str
+    distance: float
+    fuel: int
+    seconds: int
+    refuel: int = 0
+    refuel_cost: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class FlightPlan:
+    """The legs flying a ship from its origin to its destination."""
+
+    legs: Tuple[FlightLeg, ...]
+
+    @property
+    def seconds(self) -> int:
+        """Return the flight time, ignoring the time spent docking and refueling."""
+        return sum(leg.seconds for leg in self.legs)
+
+    @property
+    def fuel(self) -> int:
+        """Return the fuel burnt."""
+        return sum(leg.fuel for leg in self.legs)
+
+    @property
+    def cost(self) -> int:
+        """Return the credits spent on fuel along the way."""
+        return sum(leg.refuel_cost for leg in self.legs)
+
+
+class RoutePlanner:
+    """Plan multi-hop flights within a system, refueling at the markets selling fuel.
+
+    Register each system's waypoints once with `add_system`: their distance matrix is computed then and
+    reused by every plan. Register the markets selling fuel with `record_market` or `add_fuel_station`.
+
+    Plans are found with Dijkstra over (waypoint, fuel left) states, only stopping at fuel stations: flying
+    straight is never longer than a detour through another waypoint. At a fuel station, a ship can fill its
+    tanks, and every leg can be flown in any of the allowed flight modes its fuel permits.
+    """
+
+    def __init__(self, default_fuel_price: int = 100) -> None:
+        """Init.
+
+        `default_fuel_price` is the price of one market unit of FUEL assumed at stations selling fuel at an
+        unknown price, e.g. recorded without a ship present.
+        """
+        self.default_fuel_price = default_fuel_price
+        self._matrices: Dict[str, DistanceMatrix] = {}
+        self._fuel_prices: Dict[str, Dict[str, Optional[int]]] = {}
+
+    def add_system(self, system_symbol: str, waypoints: Iterable[Any]) -> DistanceMatrix:
+        """Compute and keep the distance matrix of a system from its waypoints."""
+        matrix = self._matrices[system_symbol] = DistanceMatrix.from_waypoints(waypoints)
+        return matrix
+
+    def distance_matrix(self, system_symbol: str) -> DistanceMatrix:
+        """Return the distance matrix of a system registered with `add_system`."""
+        try:
+            return self._matrices[system_symbol]
+        except KeyError:
+            raise RoutePlanningError(f"Unknown system {system_symbol}, register it with add_system.") from None
+
+    def add_fuel_station(self, waypoint_symbol: str, price: Optional[int] = None) -> None:
+        """Mark a waypoint as selling fuel, at `price` credits per market unit if known."""
+        self._fuel_prices.setdefault(system_of(waypoint_symbol), {})[waypoint_symbol] = price
+
+    def remove_fuel_station(self, waypoint_symbol: str) -> None:
+        """Forget that a waypoint sells fuel."""
+        self._fuel_prices.get(system_of(waypoint_symbol), {}).pop(waypoint_symbol, None)
+
+    def record_market(self, market: Any) -> None:
+        """Update the fuel stations from a `MarketSchema`."""
+        prices = {enum_value(good.symbol): good.purchasePrice for good in market.tradeGoods or ()}
+        sold = {enum_value(good.symbol) for goods in (market.exports, market.exchange) for good in goods or ()}
+        if "FUEL" in prices:
+            self.add_fuel_station(market.symbol, prices["FUEL"])
+        elif "FUEL" in sold:
+            known_price = self.fuel_stations(system_of(market.symbol)).get(market.symbol)
+            self.add_fuel_station(market.symbol, known_price)
+        else:
+            self.remove_fuel_station(market.symbol)
+
+    def fuel_stations(self, system_symbol: str) -> Dict[str, Optional[int]]:
+        """Return the waypoints selling fuel in a system, with their price per market unit if known."""
+        return dict(self._fuel_prices.get(system_symbol, {}))
+
+    def plan(
+        self,
+        origin: str,
+        destination: str,
+        fuel: int,
+        fuel_capacity: int,
+        engine_speed: int,
+        objective: Objective = "fastest",
+        flight_modes: Sequence[Any] = ("BURN", "CRUISE", "DRIFT"),
+    ) -> Optional[FlightPlan]:
+        """Return the fastest, or cheapest in fuel credits, plan from `origin` to `destination`.
+
+        The other criterion breaks ties. Leave DRIFT out of `flight_modes` to keep the cheapest plans from
+        drifting everywhere. Ships without fuel tanks, such as probes, fly for free. Return None when the
+        destination cannot be reached.
+        """
+        system_symbol = system_of(origin)
+        if system_of(destination) != system_symbol:
+            raise RoutePlanningError(f"{origin} and {destination} are not in the same system.")
+
+        matrix = self.distance_matrix(system_symbol)
+        for waypoint_symbol in (origin, destination):
+            if waypoint_symbol not in matrix:
+                raise RoutePlanningError(f"Unknown waypoint {waypoint_symbol} in system {system_symbol}.")
+
+        modes = [enum_value(mode) for mode in flight_modes]
+        stations = {
+            symbol: self.default_fuel_price if price is None else price
+            for symbol, price in self._fuel_prices.get(system_symbol, {}).items()
+            if symbol in matrix
+        }
+        stops = [symbol for symbol in {**stations, destination: None} if symbol != origin]
+
+        def rank(seconds: int, cost: int) -> Tuple[int, int]:
+            return (seconds, cost) if objective == "fastest" else (cost, seconds)
+
+        State = Tuple[str, int]
+        start: State = (origin, fuel)
+        best: Dict[State, Tuple[int, int]] = {start: (0, 0)}
+        previous: Dict[State, Tuple[State, Optional[FlightLeg], int]] = {}
+        queue: List[Tuple[Tuple[int, int], int, int, State]] = [(rank(0, 0), 0, 0, start)]
+
+        while queue:
+            _, seconds, cost, state = heapq.heappop(queue)
+            if best[state] != (seconds, cost):
+                continue
+
+            waypoint_symbol, fuel_left = state
+            if waypoint_symbol == destination:
+                return FlightPlan(tuple(self._legs(previous, state)))
+
+            moves: List[Tuple[State, int, int, Optional[FlightLeg]]] = []
+            if waypoint_symbol in stations and fuel_left < fuel_capacity:
+                units = fuel_capacity - fuel_left
+                price = stations[waypoint_symbol] * -(-units // FUEL_PER_MARKET_UNIT)
+                moves.append(((waypoint_symbol, fuel_capacity), 0, price, None))
+
+            for stop in stops:
+                distance = matrix.distance(waypoint_symbol, stop)
+                for mode in modes:
+                    burnt = fuel_cost(distance, mode) if fuel_capacity else 0
+                    if burnt > fuel_left:
+                        continue
+                    leg = FlightLeg(
+                        origin=waypoint_symbol,
+                        destination=stop,
+                        flight_mode=mode,
+                        distance=distance,
+                        fuel=burnt,
+                        seconds=travel_time(distance, mode, engine_speed),
+                    )
+                    moves.append(((stop, fuel_left - burnt), leg.seconds, 0, leg))
+
+            for next_state, extra_seconds, extra_cost, move in moves:
+                score = (seconds + extra_seconds, cost + extra_cost)
+                known = best.get(next_state)
+                if known is None or rank(*score) < rank(*known):
+                    best[next_state] = score
+                    previous[next_state] = (state, move, extra_cost)
+                    heapq.heappush(queue, (rank(*score), *score, next_state))
+
+        return None
+
+    def plan_for_ship(
+        self,
+        ship: Any,
+        destination: str,
+        objective: Objective = "fastest",
+        flight_modes: Sequence[Any] = ("BURN", "CRUISE", "DRIFT"),
+    ) -> Optional[FlightPlan]:
+        """Plan the flight of a `ShipSchema` from where it is to `destination`."""
+        return self.plan(
+            origin=ship.nav.waypointSymbol,
+            destination=destination,
+            fuel=ship.fuel.current,
+            fuel_capacity=ship.fuel.capacity,
+            engine_speed=ship.engine.speed,
+            objective=objective,
+            flight_modes=flight_modes,
+        )
+
+    @staticmethod
+    def _legs(
+        previous: Mapping[Tuple[str, int], Tuple[Tuple[str, int], Optional[FlightLeg], int]],
+        state: Tuple[str, int],
+    ) -> List[FlightLeg]:
+        """Walk back from the final state, folding each refuel into the leg departing after it."""
+        steps = []
+        while state in previous:
+            previous_state, leg, cost = previous[state]
+            steps.append((previous_state[1], state[1], leg, cost))
+            state = previous_state
+
+        legs = []
+        refuel = refuel_cost = 0
+        for fuel_before, fuel_after, leg, cost in reversed(steps):
+            if leg is None:
+                refuel, refuel_cost = fuel_after - fuel_before, cost
+                continue
+            legs.append(replace(leg, refuel=refuel, refuel_cost=refuel_cost))
+            refuel = refuel_cost = 0
+        return legs
+
+
+def follow_plan(
+    fleet: Any,
+    ship_symbol: str,
+    plan: FlightPlan,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Tuple[str, Any]:
+    """Fly a ship along `plan` with a `Fleet`, refueling where planned and waiting for each arrival.
+
+    Return the message and the `NavigateShipResponseSchema` of the last leg, or the error message of the
+    first failed call and None.
+    """
+    result: Any = None
+    flight_mode = None
+    for leg in plan.legs:
+        if leg.refuel:
+            message, result = fleet.dock_ship(ship_symbol=ship_symbol)
+            if result is None:
+                return message, None
+
+            message, result = fleet.refuel_ship(ship_symbol=ship_symbol, units=leg.refuel)
+            if result is None:
+                return message, None
+
+        message, result = fleet.orbit_ship(ship_symbol=ship_symbol)
+        if result is None:
+            return message, None
+
+        if leg.flight_mode != flight_mode:
+            message, result = fleet.patch_ship_nav(ship_symbol=ship_symbol, flight_mode=leg.flight_mode)
+            if result is None:
+                return message, None
+            flight_mode = leg.flight_mode
+
+        message, result = fleet.navigate_ship(ship_symbol=ship_symbol, waypoint_symbol=leg.destination)
+        if result is None:
+            return message, None
+
+        arrival = datetime.fromisoformat(result.data.nav.route.arrival)
+        sleep(max(0.0, (arrival - datetime.now(timezone.utc)).total_seconds()))
+
+    return message, result
@@ -0,0 +1,250 @@
+"""Spatial Index."""
+
+import heapq
+import math
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from ..models import enum_value
+
+
+Filter = Optional[Iterable[Any]]
+Cell = Tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class SpatialEntry:
+    """A located waypoint or system."""
+
+    symbol: str
+    x: int
+    y: int
+    type: str = ""
+    traits: FrozenSet[str] = frozenset()
+
+    def distance_to(self, x: float, y: float) -> float:
+        """Return the euclidean distance to a point."""
+        return math.hypot(self.x - x, self.y - y)
+
+
+@dataclass(frozen=True, slots=True)
+class Neighbour:
+    """An entry matched by a query, with its distance to the query point."""
+
+    entry: SpatialEntry
+    distance: float
+
+
+class SpatialIndex:
+    """Uniform grid over waypoints or systems, for nearest-neighbour and radius queries.
+
+    Entries are bucketed into square cells of `cell_size`; queries only visit the cells that can hold a match,
+    so they stay fast on a galaxy with tens of thousands of systems. Pick a cell size close to the typical
+    spacing between entries: the default suits waypoints within a system. Use one index per system for
+    waypoints, since their coordinates are relative to their system, and one for the systems of the galaxy.
+
+    Queries can be narrowed to some `WaypointTypeEnum` types (any of them), to entries carrying all the given
+    `WaypointTraitSymbolEnum` traits, and by an arbitrary `predicate`, e.g. markets known to sell FUEL.
+    """
+
+    def __init__(self, cell_size: float = 100.0) -> None:
+        """Init."""
+        self.cell_size = cell_size
+        self._entries: Dict[str, SpatialEntry] = {}
+        self._cells: Dict[Cell, List[SpatialEntry]] = {}
+        self._bounds: Optional[Tuple[int, int, int, int]] = None
+
+    @classmethod
+    def from_waypoints(cls, waypoints: Iterable[Any], cell_size: float = 100.0) -> "SpatialIndex":
+        """Build an index from `WaypointSchema` or `SystemWaypointSchema` items, e.g. `iter_waypoints_in_system`."""
+        index = cls(cell_size=cell_size)
+        for waypoint in waypoints:
+            index.add_waypoint(waypoint)
+        return index
+
+    @classmethod
+    def from_systems(cls, systems: Iterable[Any], cell_size: float = 500.0) -> "SpatialIndex":
+        """Build an index from `SystemSchema` items, e.g. `iter_systems`."""
+        index = cls(cell_size=cell_size)
+        for system in systems:
+            index.add_system(system)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries)
+
+    def __contains__(self, symbol: object) -> bool:
+        """Return whether `symbol` is indexed."""
+        return symbol in self._entries
+
+    def get(self, symbol: str) -> Optional[SpatialEntry]:
+        """Return the entry of `symbol`, if indexed."""
+        return self._entries.get(symbol)
+
+    def add(
+        self,
+        symbol: str,
+        x: int,
+        y: int,
+        entry_type: Any = "",
+        traits: Iterable[Any] = (),
+    ) -> SpatialEntry:
+        """Index a point, replacing any previous entry with the same symbol."""
+        self.remove(symbol)
+        entry = SpatialEntry(
+            symbol=symbol,
+            x=x,
+            y=y,
+            type=enum_value(entry_type),
+            traits=frozenset(enum_value(trait) for trait in traits),
+        )
+        cell_x, cell_y = cell = self._cell(x, y)
+        self._entries[symbol] = entry
+        self._cells.setdefault(cell, []).append(entry)
+        if self._bounds is None:
+            self._bounds = (cell_x, cell_y, cell_x, cell_y)
+        else:
+            min_x, min_y, max_x, max_y = self._bounds
+            self._bounds = (min(min_x, cell_x), min(min_y, cell_y), max(max_x, cell_x), max(max_y, cell_y))
+        return entry
+
+    def add_waypoint(self, waypoint: Any) -> SpatialEntry:
+        """Index a `WaypointSchema`, or a `SystemWaypointSchema` (which has no traits)."""
+        return self.add(
+            symbol=waypoint.symbol,
+            x=waypoint.x,
+            y=waypoint.y,
+            entry_type=waypoint.type,
+            traits=(trait.symbol for trait in getattr(waypoint, "traits", ())),
+        )
+
+    def add_system(self, system: Any) -> SpatialEntry:
+        """Index a `SystemSchema`."""
+        return self.add(symbol=system.symbol, x=system.x, y=system.y, entry_type=system.type)
+
+    def remove(self, symbol: str) -> None:
+        """Drop `symbol` from the index, if indexed."""
+        entry = self._entries.pop(symbol, None)
+        if entry is None:
+            return
+
+        cell = self._cell(entry.x, entry.y)
+        self._cells[cell].remove(entry)
+        if not self._cells[cell]:
+            del self._cells[cell]
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int = 1,
+        types: Filter = None,
+        traits: Filter = None,
+        predicate: Optional[Callable[[SpatialEntry], bool]] = None,
+        max_distance: float = math.inf,
+    ) -> List[Neighbour]:
+        """Return the `k` nearest matching entries to a point, closest first.
+
+        Cells are visited in rings of growing radius around the point, and the search stops once no unvisited
+        cell can hold anything closer than the k-th match found so far.
+        """
+        match = self._matcher(types, traits, predicate)
+        center_x, center_y = self._cell(x, y)
+        max_ring = self._max_ring(center_x, center_y)
+        best: List[Tuple[float, str, SpatialEntry]] = []
+
+        ring = 0
+        while ring <= max_ring:
+            for cell in self._ring(center_x, center_y, ring):
+                for entry in self._cells.get(cell, ()):
+                    distance = entry.distance_to(x, y)
+                    if distance > max_distance or not match(entry):
+                        continue
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, entry.symbol, entry))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, entry.symbol, entry))
+
+            reach = ring * self.cell_size
+            if reach >= max_distance or (len(best) == k and -best[0][0] <= reach):
+                break
+            ring += 1
+
+        best.sort(key=lambda item: (-item[0], item[1]))
+        return [Neighbour(entry, -distance) for distance, _, entry in best]
+
+    def within(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        types: Filter = None,
+        traits: Filter = None,
+        predicate: Optional[Callable[[SpatialEntry], bool]] = None,
+    ) -> List[Neighbour]:
+        """Return every matching entry within `radius` of a point, closest first."""
+        if self._bounds is None:
+            return []
+
+        match = self._matcher(types, traits, predicate)
+        min_x, min_y = self._cell(x - radius, y - radius)
+        max_x, max_y = self._cell(x + radius, y + radius)
+        min_x, min_y = max(min_x, self._bounds[0]), max(min_y, self._bounds[1])
+        max_x, max_y = min(max_x, self._bounds[2]), min(max_y, self._bounds[3])
+
+        found = []
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                for entry in self._cells.get((cell_x, cell_y), ()):
+                    distance = entry.distance_to(x, y)
+                    if distance <= radius and match(entry):
+                        found.append(Neighbour(entry, distance))
+
+        found.sort(key=lambda neighbour: (neighbour.distance, neighbour.entry.symbol))
+        return found
+
+    def _cell(self, x: float, y: float) -> Cell:
+        """Return the cell holding a point."""
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def _max_ring(self, center_x: int, center_y: int) -> int:
+        """Return the ring around a cell beyond which no cell is occupied."""
+        if self._bounds is None:
+            return -1
+        min_x, min_y, max_x, max_y = self._bounds
+        return max(center_x - min_x, max_x - center_x, center_y - min_y, max_y - center_y)
+
+    @staticmethod
+    def _ring(center_x: int, center_y: int, ring: int) -> Iterable[Cell]:
+        """Yield the cells at a Chebyshev distance of `ring` cells from a cell."""
+        if ring == 0:
+            yield center_x, center_y
+            return
+
+        for offset in range(-ring, ring + 1):
+            yield center_x + offset, center_y - ring
+            yield center_x + offset, center_y + ring
+        for offset in range(-ring + 1, ring):
+            yield center_x - ring, center_y + offset
+            yield center_x + ring, center_y + offset
+
+    @staticmethod
+    def _matcher(
+        types: Filter,
+        traits: Filter,
+        predicate: Optional[Callable[[SpatialEntry], bool]],
+    ) -> Callable[[SpatialEntry], bool]:
+        """Return the filter of a query."""
+        wanted_types = frozenset(enum_value(entry_type) for entry_type in types) if types is not None else None
+        wanted_traits = frozenset(enum_value(trait) for trait in traits) if traits is not None else frozenset()
+
+        def match(entry: SpatialEntry) -> bool:
+            if wanted_types is not None and entry.type not in wanted_types:
+                return False
+            if not wanted_traits <= entry.traits:
+                return False
+            return predicate is None or predicate(entry)
+
+        return match
@@ -0,0 +1,10 @@
+"""Init Pagination."""
+
+from .pagination import AsyncPaginator, PaginationError, Paginator
+
+
+__all__ = [
+    "AsyncPaginator",
+    "PaginationError",
+    "Paginator",
+]
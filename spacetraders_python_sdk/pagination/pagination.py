@@ -0,0 +1,182 @@
+"""Pagination."""
+
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
+
+
+if TYPE_CHECKING:
+    from ..models.models import MetaSchema
+
+
+ItemT = TypeVar("ItemT")
+
+
+class ListResponse(Protocol):
+    """Any `List*ResponseSchema`."""
+
+    data: List[Any]
+    meta: "MetaSchema"
+
+
+class PaginationError(Exception):
+    """Raised when a page of a list endpoint cannot be fetched."""
+
+
+class Paginator(Generic[ItemT]):
+    """Lazily walk every page of a list endpoint.
+
+    Pages are fetched one at a time as the items are consumed, using `meta.total` to know when to stop,
+    so only one page is held in memory. Break out of the loop to stop early: `page` is the page being
+    read when iteration stopped, and iterating the paginator again resumes from it.
+
+    `fetch_all` instead reads the first page, then fetches the remaining pages concurrently.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[..., Tuple[str, Optional[ListResponse]]],
+        page: int = 1,
+        limit: int = 20,
+    ) -> None:
+        """Init."""
+        self.fetch_page = fetch_page
+        self.page = page
+        self.limit = limit
+        self.total: Optional[int] = None
+
+    @property
+    def last_page(self) -> Optional[int]:
+        """Return the number of the last page, once the first page has been read."""
+        if self.total is None:
+            return None
+
+        return max(1, -(-self.total // self.limit))
+
+    def __iter__(self) -> Iterator[ItemT]:
+        """Yield the items, page by page."""
+        while self.last_page is None or self.page <= self.last_page:
+            error, result = self.fetch_page(page=self.page, limit=self.limit)
+            if result is None:
+                raise PaginationError(error)
+
+            self.total = result.meta.total
+            yield from result.data
+
+            if not result.data:
+                return
+            self.page += 1
+
+    def fetch_all(self, max_workers: int = 8) -> List[ItemT]:
+        """Return every item from `page` on, fetching the pages after the first one on a thread pool.
+
+        The pages are independent once `meta.total` is known, so they are downloaded concurrently; the shared
+        rate limiter keeps the workers within the budget. Items are returned in page order.
+        """
+        error, first = self.fetch_page(page=self.page, limit=self.limit)
+        if first is None:
+            raise PaginationError(error)
+
+        self.total = first.meta.total
+        last_page = self.last_page or self.page
+        items = list(first.data)
+        pages = range(self.page + 1, last_page + 1)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for error, result in executor.map(lambda page: self.fetch_page(page=page, limit=self.limit), pages):
+                if result is None:
+                    raise PaginationError(error)
+                items.extend(result.data)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+        self.page = max(self.page, last_page + 1)
+        return items
+
+
+class AsyncPaginator(Generic[ItemT]):
+    """Lazily walk every page of a list endpoint from an async subclient.
+
+    Behaves like `Paginator`, with `async for` and an awaitable `fetch_all`.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[..., Awaitable[Tuple[str, Optional[ListResponse]]]],
+        page: int = 1,
+        limit: int = 20,
+    ) -> None:
+        """Init."""
+        self.fetch_page = fetch_page
+        self.page = page
+        self.limit = limit
+        self.total: Optional[int] = None
+
+    @property
+    def last_page(self) -> Optional[int]:
+        """Return the number of the last page, once the first page has been read."""
+        if self.total is None:
+            return None
+
+        return max(1, -(-self.total // self.limit))
+
+    async def __aiter__(self) -> AsyncIterator[ItemT]:
+        """Yield the items, page by page."""
+        while self.last_page is None or self.page <= self.last_page:
+            error, result = await self.fetch_page(page=self.page, limit=self.limit)
+            if result is None:
+                raise PaginationError(error)
+
+            self.total = result.meta.total
+            for item in result.data:
+                yield item
+
+            if not result.data:
+                return
+            self.page += 1
+
+    async def fetch_all(self, max_workers: int = 8) -> List[ItemT]:
+        """Return every item from `page` on, fetching the pages after the first one as concurrent tasks.
+
+        At most `max_workers` pages are in flight at once. Items are returned in page order.
+        """
+        error, first = await self.fetch_page(page=self.page, limit=self.limit)
+        if first is None:
+            raise PaginationError(error)
+
+        self.total = first.meta.total
+        last_page = self.last_page or self.page
+        items = list(first.data)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(page: int) -> Tuple[str, Optional[ListResponse]]:
+            async with semaphore:
+                return await self.fetch_page(page=page, limit=self.limit)
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(self.page + 1, last_page + 1)]
+        try:
+            for error, result in await asyncio.gather(*tasks):
+                if result is None:
+                    raise PaginationError(error)
+                items.extend(result.data)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        self.page = max(self.page, last_page + 1)
+        return items
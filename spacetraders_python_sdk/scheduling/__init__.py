@@ -0,0 +1,10 @@
+"""Init Scheduling."""
+
+from .scheduler import FleetScheduler, ScheduledAction, ready_at
+
+
+__all__ = [
+    "FleetScheduler",
+    "ScheduledAction",
+    "ready_at",
+]
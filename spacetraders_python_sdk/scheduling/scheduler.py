@@ -0,0 +1,214 @@
+"""Scheduler."""
+
+import heapq
+import itertools
+import threading
+import time
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ..models import enum_value
+from ..transport import RateLimiter
+
+
+Action = Callable[[str], Any]
+When = Union[None, float, str, datetime]
+
+
+def _timestamp(when: Union[float, str, datetime]) -> float:
+    """Return a POSIX timestamp from a number, a `datetime` or an ISO 8601 string."""
+    if isinstance(when, str):
+        when = datetime.fromisoformat(when)
+    if isinstance(when, datetime):
+        return when.timestamp()
+    return float(when)
+
+
+def ready_at(result: Any) -> Optional[float]:
+    """Return when the ship of a response can act again, as a POSIX timestamp, or None if it already can.
+
+    `result` is a subclient `(message, schema)` tuple, a response schema, its `data`, a `ShipSchema`, a
+    `ShipView`, or the time itself. The ship is ready once its reactor cooldown has expired and, if it is in
+    transit, it has arrived.
+    """
+    if isinstance(result, tuple):
+        result = result[1]
+    if result is None:
+        return None
+    if isinstance(result, (int, float, str, datetime)):
+        return _timestamp(result)
+
+    data = getattr(result, "data", result)
+    times = []
+
+    cooldown = getattr(data, "cooldown", None)
+    if cooldown is None and hasattr(data, "remainingSeconds"):
+        cooldown = data
+    if cooldown is not None and cooldown.remainingSeconds > 0 and cooldown.expiration:
+        times.append(_timestamp(cooldown.expiration))
+
+    nav = getattr(data, "nav", None)
+    if nav is None and hasattr(data, "status") and hasattr(data, "route"):
+        nav = data
+    if nav is not None and enum_value(nav.status) == "IN_TRANSIT":
+        times.append(_timestamp(getattr(nav, "route", nav).arrival))
+
+    return max(times) if times else None
+
+
+@dataclass(order=True)
+class ScheduledAction:
+    """An action waiting for its ship to be ready."""
+
+    when: float
+    sequence: int
+    ship_symbol: str = field(compare=False)
+    action: Action = field(compare=False)
+    repeat: bool = field(compare=False, default=True)
+    cancelled: bool = field(compare=False, default=False)
+
+
+class FleetScheduler:
+    """Single-threaded timer heap running each ship's next action as soon as the ship can act.
+
+    An action is called with the ship symbol and returns the response it got, e.g. the result of
+    `Fleet.extract_resources` or `Fleet.navigate_ship`. The cooldown expiration and arrival time in that
+    response decide when the action runs again, so no request is spent polling `get_ship`. Return None to
+    stop, or schedule another action for the ship and return None to switch to it.
+
+    Actions due at the same time run in the order they were scheduled. Before each one the scheduler waits
+    for the shared `rate_limiter` of the client, so a whole fleet runs within the budget of one thread and
+    ships take their turn instead of bursting past it. `margin` seconds are added to every wake-up to absorb
+    clock skew with the server.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        margin: float = 0.0,
+        on_error: Optional[Callable[[str, Any], None]] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Init.
+
+        `on_error` is called with the ship symbol and the exception raised by an action, or the error message
+        of a failed `(message, None)` response; the ship's action then stops. Without it, exceptions propagate.
+        """
+        self.rate_limiter = rate_limiter
+        self.margin = margin
+        self.on_error = on_error
+        self.clock = clock
+        self.sleep = sleep
+        self._heap: List[ScheduledAction] = []
+        self._pending: Dict[str, List[ScheduledAction]] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def __len__(self) -> int:
+        """Return the number of scheduled actions."""
+        with self._lock:
+            return sum(len(actions) for actions in self._pending.values())
+
+    def schedule(self, ship_symbol: str, action: Action, at: When = None, repeat: bool = True) -> ScheduledAction:
+        """Run `action` for a ship at `at`, now by default, and again whenever the ship is ready if `repeat`."""
+        when = self.clock() if at is None else _timestamp(at) + self.margin
+        scheduled = ScheduledAction(when, next(self._sequence), ship_symbol, action, repeat)
+        with self._lock:
+            heapq.heappush(self._heap, scheduled)
+            self._pending.setdefault(ship_symbol, []).append(scheduled)
+        return scheduled
+
+    def schedule_after(self, ship_symbol: str, result: Any, action: Action, repeat: bool = True) -> ScheduledAction:
+        """Run `action` for a ship once the cooldown and arrival of a response it got are over."""
+        return self.schedule(ship_symbol, action, at=ready_at(result), repeat=repeat)
+
+    def cancel(self, ship_symbol: str) -> int:
+        """Drop the scheduled actions of a ship. Return how many were dropped."""
+        with self._lock:
+            actions = self._pending.pop(ship_symbol, [])
+            for scheduled in actions:
+                scheduled.cancelled = True
+        return len(actions)
+
+    def next_wake(self) -> Optional[float]:
+        """Return when the next action is due, if any is scheduled."""
+        with self._lock:
+            self._drop_cancelled()
+            return self._heap[0].when if self._heap else None
+
+    def run_pending(self) -> int:
+        """Run every action that is due. Return how many ran."""
+        ran = 0
+        while not self._stopped.is_set():
+            with self._lock:
+                self._drop_cancelled()
+                if not self._heap or self._heap[0].when > self.clock():
+                    return ran
+                scheduled = heapq.heappop(self._heap)
+                self._pending[scheduled.ship_symbol].remove(scheduled)
+                if not self._pending[scheduled.ship_symbol]:
+                    del self._pending[scheduled.ship_symbol]
+
+            self._wait_for_budget()
+            self._run(scheduled)
+            ran += 1
+        return ran
+
+    def run(self, until: When = None) -> int:
+        """Run actions as they become due, until none is left, `until` is reached or `stop` is called.
+
+        Return how many ran.
+        """
+        deadline = None if until is None else _timestamp(until)
+        self._stopped.clear()
+        ran = 0
+        while not self._stopped.is_set():
+            wake = self.next_wake()
+            if wake is None:
+                break
+            if deadline is not None and wake > deadline:
+                self.sleep(max(0.0, deadline - self.clock()))
+                break
+            if wake > self.clock():
+                self.sleep(wake - self.clock())
+            ran += self.run_pending()
+        return ran
+
+    def stop(self) -> None:
+        """Make `run` return after the current action."""
+        self._stopped.set()
+
+    def _run(self, scheduled: ScheduledAction) -> None:
+        """Run an action and schedule its next run."""
+        try:
+            result = scheduled.action(scheduled.ship_symbol)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            if self.on_error is None:
+                raise
+            self.on_error(scheduled.ship_symbol, error)
+            return
+
+        if isinstance(result, tuple) and result[1] is None:
+            if self.on_error is not None:
+                self.on_error(scheduled.ship_symbol, result[0])
+            return
+
+        if result is not None and scheduled.repeat:
+            self.schedule_after(scheduled.ship_symbol, result, scheduled.action)
+
+    def _wait_for_budget(self) -> None:
+        """Wait until the shared rate limiter has a request slot."""
+        if self.rate_limiter is None:
+            return
+        wait = self.rate_limiter.budget().wait
+        if wait > 0:
+            self.sleep(wait)
+
+    def _drop_cancelled(self) -> None:
+        """Pop cancelled actions off the top of the heap."""
+        while self._heap and self._heap[0].cancelled:
+            heapq.heappop(self._heap)
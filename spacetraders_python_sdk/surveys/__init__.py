@@ -0,0 +1,16 @@
+"""Init Surveys."""
+
+from .survey_registry import (
+    SURVEY_EXHAUSTED,
+    SURVEY_EXPIRED,
+    SurveyRegistry,
+    error_code,
+)
+
+
+__all__ = [
+    "SURVEY_EXHAUSTED",
+    "SURVEY_EXPIRED",
+    "SurveyRegistry",
+    "error_code",
+]
@@ -0,0 +1,207 @@
+"""Survey Registry."""
+
+import heapq
+import itertools
+import json
+import threading
+import time
+
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from ..models import enum_value
+
+
+SURVEY_EXPIRED = 4221
+SURVEY_EXHAUSTED = 4224
+
+SIZE_WEIGHTS: Mapping[str, float] = {
+    "SMALL": 1.0,
+    "MODERATE": 2.0,
+    "LARGE": 3.0,
+}
+
+Key = Tuple[str, Optional[str]]
+Entry = Tuple[float, float, int, str]
+
+
+def error_code(message: str) -> Optional[int]:
+    """Return the API error code of a subclient error message, if it carries one."""
+    try:
+        return int(json.loads(message[message.index("{"):])["error"]["code"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+class SurveyRegistry:
+    """Pool of surveys shared by every ship, indexed by waypoint and deposit symbol.
+
+    Each survey is scored for every good it can yield: the share of its deposits that are that good, times a
+    weight for its size. For extractions without a target good, the score is the average price of its deposits
+    in `prices` times the size weight, or the size weight alone. Surveys sit in one heap per waypoint and good,
+    so handing out the best one is O(log n); expired surveys are dropped when they reach the top of a heap, and
+    exhausted or rejected ones as soon as an extraction reports it.
+    """
+
+    def __init__(
+        self,
+        prices: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Init."""
+        self.prices = prices
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._surveys: Dict[str, Any] = {}
+        self._expirations: Dict[str, float] = {}
+        self._heaps: Dict[Key, List[Entry]] = {}
+        self._index: Dict[Key, Set[str]] = {}
+        self._sequence = itertools.count()
+        self._stale = 0
+
+    def __len__(self) -> int:
+        """Return the number of surveys held, expired ones not yet dropped included."""
+        return len(self._surveys)
+
+    def __contains__(self, signature: object) -> bool:
+        """Return whether a survey is held."""
+        return signature in self._surveys
+
+    def get(self, signature: str) -> Optional[Any]:
+        """Return a survey by signature."""
+        return self._surveys.get(signature)
+
+    def add(self, survey: Any) -> bool:
+        """Add a `SurveySchema`. Return False if it is already held or has expired."""
+        expiration = datetime.fromisoformat(survey.expiration).timestamp()
+        with self._lock:
+            if survey.signature in self._surveys or expiration <= self.clock():
+                return False
+
+            self._surveys[survey.signature] = survey
+            self._expirations[survey.signature] = expiration
+            for key, score in self._scores(survey).items():
+                self._index.setdefault(key, set()).add(survey.signature)
+                heapq.heappush(self._heaps.setdefault(key, []), self._entry(survey.signature, score))
+            return True
+
+    def add_many(self, surveys: Iterable[Any]) -> int:
+        """Add several surveys. Return how many were added."""
+        return sum(self.add(survey) for survey in surveys)
+
+    def record(self, result: Any) -> int:
+        """Add the surveys of a `Fleet.create_survey` result or `CreateSurveyResponseSchema`. Return the count."""
+        if isinstance(result, tuple):
+            result = result[1]
+        if result is None:
+            return 0
+        return self.add_many(getattr(result, "data", result).surveys)
+
+    def remove(self, signature: str) -> bool:
+        """Drop a survey. Return whether it was held."""
+        with self._lock:
+            return self._remove(signature)
+
+    def surveys(self, waypoint: str, deposit: Optional[str] = None) -> List[Any]:
+        """Return the unexpired surveys of a waypoint, yielding `deposit` if given, soonest to expire first."""
+        now = self.clock()
+        with self._lock:
+            signatures = self._index.get((waypoint, deposit), set())
+            live = [signature for signature in signatures if self._expirations[signature] > now]
+        live.sort(key=lambda signature: (self._expirations[signature], signature))
+        return [self._surveys[signature] for signature in live]
+
+    def best(self, waypoint: str, good: Optional[Any] = None) -> Optional[Any]:
+        """Return the highest scored unexpired survey of a waypoint for `good`, or for any good, if there is one."""
+        key = (waypoint, enum_value(good))
+        now = self.clock()
+        with self._lock:
+            heap = self._heaps.get(key, [])
+            while heap:
+                _, _, _, signature = heap[0]
+                if signature not in self._surveys:
+                    heapq.heappop(heap)
+                    self._stale -= 1
+                elif self._expirations[signature] <= now:
+                    self._remove(signature)
+                else:
+                    return self._surveys[signature]
+            return None
+
+    def evict_expired(self) -> int:
+        """Drop every expired survey. Return how many were dropped."""
+        now = self.clock()
+        with self._lock:
+            expired = [signature for signature, expiration in self._expirations.items() if expiration <= now]
+            for signature in expired:
+                self._remove(signature)
+        return len(expired)
+
+    def handle_error(self, survey: Any, message: str) -> bool:
+        """Drop a survey if an extraction error message says it expired or is exhausted. Return whether it did."""
+        if error_code(message) in (SURVEY_EXPIRED, SURVEY_EXHAUSTED):
+            return self.remove(survey.signature)
+        return False
+
+    def extract(self, fleet: Any, ship_symbol: str, waypoint: str, good: Optional[Any] = None) -> Tuple[str, Any]:
+        """Extract with the best survey for `good` at the ship's waypoint, or without one if there is none.
+
+        Return the result of `Fleet.extract_resources_with_survey` or `Fleet.extract_resources`; a survey the
+        server reports as expired or exhausted is dropped.
+        """
+        survey = self.best(waypoint, good)
+        if survey is None:
+            return fleet.extract_resources(ship_symbol=ship_symbol)
+
+        message, result = fleet.extract_resources_with_survey(ship_symbol=ship_symbol, survey=survey)
+        if result is None:
+            self.handle_error(survey, message)
+        return message, result
+
+    def _scores(self, survey: Any) -> Dict[Key, float]:
+        """Return the score of a survey under every key it is indexed by."""
+        weight = SIZE_WEIGHTS.get(enum_value(survey.size), 1.0)
+        deposits = Counter(deposit.symbol for deposit in survey.deposits)
+        total = sum(deposits.values())
+        scores: Dict[Key, float] = {
+            (survey.symbol, symbol): weight * count / total for symbol, count in deposits.items()
+        }
+        if self.prices is None or not total:
+            scores[(survey.symbol, None)] = weight
+        else:
+            value = sum(self.prices.get(symbol, 0.0) * count for symbol, count in deposits.items()) / total
+            scores[(survey.symbol, None)] = weight * value
+        return scores
+
+    def _entry(self, signature: str, score: float) -> Entry:
+        """Return a heap entry: best score first, then the survey expiring last."""
+        return (-score, -self._expirations[signature], next(self._sequence), signature)
+
+    def _remove(self, signature: str) -> bool:
+        """Drop a survey, leaving its heap entries to be skipped, and compact the heaps once most are stale."""
+        survey = self._surveys.pop(signature, None)
+        if survey is None:
+            return False
+
+        keys = self._scores(survey)
+        for key in keys:
+            self._index[key].discard(signature)
+            if not self._index[key]:
+                del self._index[key]
+        del self._expirations[signature]
+        self._stale += len(keys)
+
+        if self._stale > 64 and self._stale > sum(map(len, self._heaps.values())) // 2:
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        """Rebuild the heaps from the held surveys."""
+        self._heaps = {}
+        for signature, survey in self._surveys.items():
+            for key, score in self._scores(survey).items():
+                self._heaps.setdefault(key, []).append(self._entry(signature, score))
+        for heap in self._heaps.values():
+            heapq.heapify(heap)
+        self._stale = 0
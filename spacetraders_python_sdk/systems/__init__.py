@@ -1,8 +1,25 @@
 """Init Systems."""
 
-from .systems import Systems
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_getattr
+
+
+if TYPE_CHECKING:
+    from .async_systems import AsyncSystems
+    from .systems import Systems
+
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "AsyncSystems": ".async_systems",
+        "Systems": ".systems",
+    },
+)
 
 
 __all__ = [
     "Systems",
+    "AsyncSystems",
 ]
@@ -0,0 +1,448 @@
+"""Async Systems."""
+
+from functools import partial
+from typing import Annotated, List, Optional, Tuple
+
+import httpx
+
+from pydantic import Field
+
+from ..cache import FleetState, GalaxyCache, ResponseCache
+from ..models.models import (
+    ConstructionResponseSchema,
+    JumpGateResponseSchema,
+    ListSystemsResponseSchema,
+    ListWaypointsResponseSchema,
+    MarketResponseSchema,
+    ShipyardResponseSchema,
+    SupplyConstructionResponseSchema,
+    SystemResponseSchema,
+    SystemSchema,
+    WaypointResponseSchema,
+    WaypointSchema,
+    WaypointTypeEnum,
+)
+from ..pagination import AsyncPaginator
+from ..tracing import traced
+from ..transport import parse_response
+
+
+@traced
+class AsyncSystems:
+    """Async Systems."""
+
+    def __init__(
+        self,
+        api_url: str,
+        session: httpx.AsyncClient,
+        galaxy_cache: Optional[GalaxyCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        fleet_state: Optional[FleetState] = None,
+    ) -> None:
+        """Init.
+
+        Systems, waypoints and jump gates are read through `galaxy_cache` when one is given.
+        Markets, shipyards and construction sites are read through `response_cache` when one is given.
+        The cargo left after supplying a construction site is recorded into `fleet_state` when one is given.
+        """
+        self.api_url = api_url
+        self.session = session
+        self.galaxy_cache = galaxy_cache
+        self.response_cache = response_cache
+        self.fleet_state = fleet_state
+
+    async def list_systems(
+        self,
+        page: Annotated[int, Field(description="What entry offset to request.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to return per page.", ge=1, le=20, default=10)] = 10,
+    ) -> Tuple[str, ListSystemsResponseSchema | None]:
+        """Return a paginated list of all the systems in the game."""
+        try:
+            parameters = f"page={page}"
+            parameters += f"&limit={limit}"
+
+            response = await self.session.get(
+                url=f"{self.api_url}/systems?{parameters}",
+            )
+
+            response.raise_for_status()
+
+            return (
+                "Succesfully fetched systems.",
+                parse_response(ListSystemsResponseSchema, response)
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    def iter_systems(
+        self,
+        page: Annotated[int, Field(description="What page to start from.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+    ) -> AsyncPaginator[SystemSchema]:
+        """Iterate lazily over all the systems in the game, page by page."""
+        return AsyncPaginator(
+            fetch_page=self.list_systems,
+            page=page,
+            limit=limit,
+        )
+
+    async def fetch_all_systems(
+        self,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+        max_workers: Annotated[int, Field(description="How many pages to fetch concurrently.", ge=1, default=8)] = 8,
+    ) -> List[SystemSchema]:
+        """Fetch all the systems in the game, downloading the pages concurrently."""
+        return await self.iter_systems(limit=limit).fetch_all(max_workers=max_workers)
+
+    async def get_system(
+        self,
+        system_symbol: Annotated[str, Field(description="The system ID.")],
+    ) -> Tuple[str, SystemResponseSchema | None]:
+        """Get the details of a system by ID."""
+        try:
+            if self.galaxy_cache:
+                cached = self.galaxy_cache.get("system", system_symbol)
+                if cached:
+                    return (
+                        "Successfully fetched system details.",
+                        SystemResponseSchema.model_validate_json(cached)
+                    )
+
+            response = await self.session.get(
+                url=f"{self.api_url}/systems/{system_symbol}",
+            )
+
+            response.raise_for_status()
+
+            if self.galaxy_cache:
+                self.galaxy_cache.set("system", system_symbol, response.content)
+
+            return (
+                "Successfully fetched system details.",
+                parse_response(SystemResponseSchema, response)
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def list_waypoints_in_system(
+        self,
+        system_symbol: Annotated[str, Field(description="The system symbol")],
+        traits: Annotated[str, Field(description="The unique identifier of the trait.")],
+        waypoint_type: Annotated[
+            Optional[WaypointTypeEnum], Field(description="Filter waypoints by type.", alias="type")
+        ] = None,
+        page: Annotated[int, Field(description="What entry offset to request.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to return per page.", ge=1, le=20, default=10)] = 10,
+    ) -> Tuple[str, ListWaypointsResponseSchema | None]:
+        """Return a paginated list of all the systems in the game."""
+        try:
+            parameters = f"page={page}"
+            parameters += f"&limit={limit}"
+            parameters += f"&traits={traits}" if traits else ""
+            parameters += f"&type={waypoint_type}" if waypoint_type else ""
+
+            if self.galaxy_cache:
+                cached = self.galaxy_cache.get("waypoints", f"{system_symbol}?{parameters}")
+                if cached:
+                    return (
+                        "Successfully fetched all waypoints in the system.",
+                        ListWaypointsResponseSchema.model_validate_json(cached)
+                    )
+
+            response = await self.session.get(
+                url=f"{self.api_url}/systems/{system_symbol}/waypoints?{parameters}",
+            )
+
+            response.raise_for_status()
+
+            if self.galaxy_cache and b"UNCHARTED" not in response.content:
+                self.galaxy_cache.set("waypoints", f"{system_symbol}?{parameters}", response.content)
+
+            return (
+                "Successfully fetched all waypoints in the system.",
+                parse_response(ListWaypointsResponseSchema, response)
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    def iter_waypoints_in_system(
+        self,
+        system_symbol: Annotated[str, Field(description="The system symbol")],
+        traits: Annotated[str, Field(description="The unique identifier of the trait.")] = "",
+        waypoint_type: Annotated[
+            Optional[WaypointTypeEnum], Field(description="Filter waypoints by type.", alias="type")
+        ] = None,
+        page: Annotated[int, Field(description="What page to start from.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+    ) -> AsyncPaginator[WaypointSchema]:
+        """Iterate lazily over all the waypoints in a system, page by page."""
+        return AsyncPaginator(
+            fetch_page=partial(
+                self.list_waypoints_in_system,
+                system_symbol=system_symbol,
+                traits=traits,
+                waypoint_type=waypoint_type,
+            ),
+            page=page,
+            limit=limit,
+        )
+
+    async def fetch_all_waypoints_in_system(
+        self,
+        system_symbol: Annotated[str, Field(description="The system symbol")],
+        traits: Annotated[str, Field(description="The unique identifier of the trait.")] = "",
+        waypoint_type: Annotated[
+            Optional[WaypointTypeEnum], Field(description="Filter waypoints by type.", alias="type")
+        ] = None,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+        max_workers: Annotated[int, Field(description="How many pages to fetch concurrently.", ge=1, default=8)] = 8,
+    ) -> List[WaypointSchema]:
+        """Fetch all the waypoints in a system, downloading the pages concurrently."""
+        return await self.iter_waypoints_in_system(
+            system_symbol=system_symbol,
+            traits=traits,
+            waypoint_type=waypoint_type,
+            limit=limit,
+        ).fetch_all(max_workers=max_workers)
+
+    async def get_waypoint(
+        self,
+        system_symbol: Annotated[str, Field(description="The system symbol.")],
+        waypoint_symbol: Annotated[str, Field(description="The waypoint symbol.")],
+    ) -> Tuple[str, WaypointResponseSchema | None]:
+        """View the details of a waypoint.
+
+        If the waypoint is uncharted, it will return the 'Uncharted' trait instead of its actual traits.
+        """
+        try:
+            if self.galaxy_cache:
+                cached = self.galaxy_cache.get("waypoint", waypoint_symbol)
+                if cached:
+                    return (
+                        "Successfully fetched waypoint.",
+                        WaypointResponseSchema.model_validate_json(cached)
+                    )
+
+            response = await self.session.get(
+                url=f"{self.api_url}/systems/{system_symbol}/waypoints/{waypoint_symbol}",
+            )
+
+            response.raise_for_status()
+
+            if self.galaxy_cache and b"UNCHARTED" not in response.content:
+                self.galaxy_cache.set("waypoint", waypoint_symbol, response.content)
+
+            return (
+                "Successfully fetched waypoint.",
+                parse_response(WaypointResponseSchema, response)
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def get_market(
+        self,
+        system_symbol: Annotated[str, Field(description="The system symbol.")],
+        waypoint_symbol: Annotated[str, Field(description="The waypoint symbol.")],
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the response cache.")] = True,
+    ) -> Tuple[str, MarketResponseSchema | None]:
+        """Retrieve imports, exports and exchange data from a marketplace.
+
+        Requires a waypoint that has the Marketplace trait to use.
+
+        Send a ship to the waypoint to access trade good prices and recent transactions.
+        Refer to the Market Overview page to gain better a understanding of the market in the game.
+
+        Only markets seen with a ship present, which carry trade goods, are kept in the response cache.
+        """
+        try:
+            if use_cache and self.response_cache:
+                cached = self.response_cache.get("market", waypoint_symbol)
+                if cached:
+                    return "Successfully fetched waypoint.", cached
+
+            response = await self.session.get(
+                url=f"{self.api_url}/systems/{system_symbol}/waypoints/{waypoint_symbol}/market",
+            )
+
+            response.raise_for_status()
+
+            market = parse_response(MarketResponseSchema, response)
+
+            if self.response_cache and "tradeGoods" in market.data.model_fields_set:
+                self.response_cache.set("market", waypoint_symbol, market)
+
+            return (
+                "Successfully fetched waypoint.",
+                market
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def get_shipyard(
+        self,
+        system_symbol: Annotated[str, Field(description="The system symbol.")],
+        waypoint_symbol: Annotated[str, Field(description="The waypoint symbol.")],
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the response cache.")] = True,
+    ) -> Tuple[str, ShipyardResponseSchema | None]:
+        """Get the shipyard for a waypoint.
+
+        Requires a waypoint that has the Shipyard trait to use.
+        Send a ship to the waypoint to access data on ships that are currently available
+        for purchase and recent transactions.
+        """
+        try:
+            if use_cache and self.response_cache:
+                cached = self.response_cache.get("shipyard", waypoint_symbol)
+                if cached:
+                    return "Successfully fetched shipyard.", cached
+
+            response = await self.session.get(
+                url=f"{self.api_url}/systems/{system_symbol}/waypoints/{waypoint_symbol}/shipyard",
+            )
+
+            response.raise_for_status()
+
+            shipyard = parse_response(ShipyardResponseSchema, response)
+
+            if self.response_cache:
+                self.response_cache.set("shipyard", waypoint_symbol, shipyard)
+
+            return (
+                "Successfully fetched shipyard.",
+                shipyard
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def get_jump_gate(
+        self,
+        system_symbol: Annotated[str, Field(description="The system symbol.")],
+        waypoint_symbol: Annotated[str, Field(description="The waypoint symbol.")],
+    ) -> Tuple[str, JumpGateResponseSchema | None]:
+        """Get jump gate details for a waypoint. Requires a waypoint of type JUMP_GATE to use.
+
+        Waypoints connected to this jump gate can be ...
+        """
+        try:
+            if self.galaxy_cache:
+                cached = self.galaxy_cache.get("jump_gate", waypoint_symbol)
+                if cached:
+                    return (
+                        "Successfully fetched jump gate.",
+                        JumpGateResponseSchema.model_validate_json(cached)
+                    )
+
+            response = await self.session.get(
+                url=f"{self.api_url}/systems/{system_symbol}/waypoints/{waypoint_symbol}/jump-gate",
+            )
+
+            response.raise_for_status()
+
+            if self.galaxy_cache:
+                self.galaxy_cache.set("jump_gate", waypoint_symbol, response.content)
+
+            return (
+                "Successfully fetched jump gate.",
+                parse_response(JumpGateResponseSchema, response)
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def get_construction_site(
+        self,
+        system_symbol: Annotated[str, Field(description="The system symbol.")],
+        waypoint_symbol: Annotated[str, Field(description="The waypoint symbol.")],
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the response cache.")] = True,
+    ) -> Tuple[str, ConstructionResponseSchema | None]:
+        """Get construction details for a waypoint.
+
+        Requires a waypoint with a property of isUnderConstruction to be true.
+        """
+        try:
+            if use_cache and self.response_cache:
+                cached = self.response_cache.get("construction", waypoint_symbol)
+                if cached:
+                    return "Successfully fetched construction site.", cached
+
+            response = await self.session.get(
+                url=f"{self.api_url}/systems/{system_symbol}/waypoints/{waypoint_symbol}/construction",
+            )
+
+            response.raise_for_status()
+
+            construction = parse_response(ConstructionResponseSchema, response)
+
+            if self.response_cache:
+                self.response_cache.set("construction", waypoint_symbol, construction)
+
+            return (
+                "Successfully fetched construction site.",
+                construction
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
+
+    async def supply_construction_site(
+        self,
+        system_symbol: Annotated[str, Field(description="The system symbol.")],
+        waypoint_symbol: Annotated[str, Field(description="The waypoint symbol.")],
+        ship_symbol: Annotated[str, Field(description="Symbol of the ship to use.")],
+        trade_symbol: Annotated[str, Field(description="The symbol of the good to supply.")],
+        units: Annotated[int, Field(description="Amount of units to supply.")],
+    ) -> Tuple[str, SupplyConstructionResponseSchema | None]:
+        """Get construction details for a waypoint.
+
+        Requires a waypoint with a property of isUnderConstruction to be true.
+        """
+        try:
+            response = await self.session.post(
+                url=f"{self.api_url}/systems/{system_symbol}/waypoints/{waypoint_symbol}/construction",
+                json={
+                    "shipSymbol": ship_symbol,
+                    "tradeSymbol": trade_symbol,
+                    "units": units,
+                }
+            )
+
+            response.raise_for_status()
+
+            supply = parse_response(SupplyConstructionResponseSchema, response)
+
+            if self.response_cache:
+                self.response_cache.invalidate("construction", waypoint_symbol)
+            if self.fleet_state:
+                self.fleet_state.update_ship(ship_symbol, cargo=supply.data.cargo)
+
+            return (
+                "Successfully fetched construction site.",
+                supply
+            )
+
+        except httpx.HTTPStatusError as error:
+            match error.response.status_code:
+                case _:
+                    return f"Unknown error: {error.response.text}", None
@@ -1,11 +1,13 @@
 """Systems."""
 
-from typing import Annotated, Tuple
+from functools import partial
+from typing import Annotated, List, Optional, Tuple
 
 import requests
 
 from pydantic import Field
 
+from ..cache import FleetState, GalaxyCache, ResponseCache
 from ..models.models import (
     ConstructionResponseSchema,
     JumpGateResponseSchema,
@@ -15,11 +17,17 @@
     ShipyardResponseSchema,
     SupplyConstructionResponseSchema,
     SystemResponseSchema,
+    SystemSchema,
     WaypointResponseSchema,
+    WaypointSchema,
     WaypointTypeEnum,
 )
+from ..pagination import Paginator
+from ..tracing import traced
+from ..transport import parse_response
 
 
+@traced
 class Systems:
     """Systems."""
 
@@ -27,10 +35,21 @@ def __init__(
         self,
         api_url: str,
         session: requests.Session,
+        galaxy_cache: Optional[GalaxyCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        fleet_state: Optional[FleetState] = None,
     ) -> None:
-        """Init."""
+        """Init.
+
+        Systems, waypoints and jump gates are read through `galaxy_cache` when one is given.
+        Markets, shipyards and construction sites are read through `response_cache` when one is given.
+        The cargo left after supplying a construction site is recorded into `fleet_state` when one is given.
+        """
         self.api_url = api_url
         self.session = session
+        self.galaxy_cache = galaxy_cache
+        self.response_cache = response_cache
+        self.fleet_state = fleet_state
 
     def list_systems(
         self,
@@ -50,7 +69,7 @@ def list_systems(
 
             return (
                 "Succesfully fetched systems.",
-                ListSystemsResponseSchema.model_validate(response.json())
+                parse_response(ListSystemsResponseSchema, response)
             )
 
         except requests.exceptions.HTTPError as error:
@@ -58,21 +77,52 @@ def list_systems(
                 case _:
                     return f"Unknown error: {error.response.text}", None
 
+    def iter_systems(
+        self,
+        page: Annotated[int, Field(description="What page to start from.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+    ) -> Paginator[SystemSchema]:
+        """Iterate lazily over all the systems in the game, page by page."""
+        return Paginator(
+            fetch_page=self.list_systems,
+            page=page,
+            limit=limit,
+        )
+
+    def fetch_all_systems(
+        self,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+        max_workers: Annotated[int, Field(description="How many pages to fetch concurrently.", ge=1, default=8)] = 8,
+    ) -> List[SystemSchema]:
+        """Fetch all the systems in the game, downloading the pages concurrently."""
+        return self.iter_systems(limit=limit).fetch_all(max_workers=max_workers)
+
     def get_system(
         self,
         system_symbol: Annotated[str, Field(description="The system ID.")],
     ) -> Tuple[str, SystemResponseSchema | None]:
         """Get the details of a system by ID."""
         try:
+            if self.galaxy_cache:
+                cached = self.galaxy_cache.get("system", system_symbol)
+                if cached:
+                    return (
+                        "Successfully fetched system details.",
+                        SystemResponseSchema.model_validate_json(cached)
+                    )
+
             response = self.session.get(
                 url=f"{self.api_url}/systems/{system_symbol}",
             )
 
             response.raise_for_status()
 
+            if self.galaxy_cache:
+                self.galaxy_cache.set("system", system_symbol, response.content)
+
             return (
                 "Successfully fetched system details.",
-                SystemResponseSchema.model_validate(response.json())
+                parse_response(SystemResponseSchema, response)
             )
 
         except requests.exceptions.HTTPError as error:
@@ -84,7 +134,9 @@ def list_waypoints_in_system(
         self,
         system_symbol: Annotated[str, Field(description="The system symbol")],
         traits: Annotated[str, Field(description="The unique identifier of the trait.")],
-        waypoint_type: Annotated[WaypointTypeEnum, Field(description="Filter waypoints by type.", alias="type")],
+        waypoint_type: Annotated[
+            Optional[WaypointTypeEnum], Field(description="Filter waypoints by type.", alias="type")
+        ] = None,
         page: Annotated[int, Field(description="What entry offset to request.", ge=1, default=1)] = 1,
         limit: Annotated[int, Field(description="How many entries to return per page.", ge=1, le=20, default=10)] = 10,
     ) -> Tuple[str, ListWaypointsResponseSchema | None]:
@@ -95,15 +147,26 @@ def list_waypoints_in_system(
             parameters += f"&traits={traits}" if traits else ""
             parameters += f"&type={waypoint_type}" if waypoint_type else ""
 
+            if self.galaxy_cache:
+                cached = self.galaxy_cache.get("waypoints", f"{system_symbol}?{parameters}")
+                if cached:
+                    return (
+                        "Successfully fetched all waypoints in the system.",
+                        ListWaypointsResponseSchema.model_validate_json(cached)
+                    )
+
             response = self.session.get(
                 url=f"{self.api_url}/systems/{system_symbol}/waypoints?{parameters}",
             )
 
             response.raise_for_status()
 
+            if self.galaxy_cache and b"UNCHARTED" not in response.content:
+                self.galaxy_cache.set("waypoints", f"{system_symbol}?{parameters}", response.content)
+
             return (
                 "Successfully fetched all waypoints in the system.",
-                ListWaypointsResponseSchema.model_validate(response.json())
+                parse_response(ListWaypointsResponseSchema, response)
             )
 
         except requests.exceptions.HTTPError as error:
@@ -111,6 +174,46 @@ def list_waypoints_in_system(
                 case _:
                     return f"Unknown error: {error.response.text}", None
 
+    def iter_waypoints_in_system(
+        self,
+        system_symbol: Annotated[str, Field(description="The system symbol")],
+        traits: Annotated[str, Field(description="The unique identifier of the trait.")] = "",
+        waypoint_type: Annotated[
+            Optional[WaypointTypeEnum], Field(description="Filter waypoints by type.", alias="type")
+        ] = None,
+        page: Annotated[int, Field(description="What page to start from.", ge=1, default=1)] = 1,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+    ) -> Paginator[WaypointSchema]:
+        """Iterate lazily over all the waypoints in a system, page by page."""
+        return Paginator(
+            fetch_page=partial(
+                self.list_waypoints_in_system,
+                system_symbol=system_symbol,
+                traits=traits,
+                waypoint_type=waypoint_type,
+            ),
+            page=page,
+            limit=limit,
+        )
+
+    def fetch_all_waypoints_in_system(
+        self,
+        system_symbol: Annotated[str, Field(description="The system symbol")],
+        traits: Annotated[str, Field(description="The unique identifier of the trait.")] = "",
+        waypoint_type: Annotated[
+            Optional[WaypointTypeEnum], Field(description="Filter waypoints by type.", alias="type")
+        ] = None,
+        limit: Annotated[int, Field(description="How many entries to fetch per page.", ge=1, le=20, default=20)] = 20,
+        max_workers: Annotated[int, Field(description="How many pages to fetch concurrently.", ge=1, default=8)] = 8,
+    ) -> List[WaypointSchema]:
+        """Fetch all the waypoints in a system, downloading the pages concurrently."""
+        return self.iter_waypoints_in_system(
+            system_symbol=system_symbol,
+            traits=traits,
+            waypoint_type=waypoint_type,
+            limit=limit,
+        ).fetch_all(max_workers=max_workers)
+
     def get_waypoint(
         self,
         system_symbol: Annotated[str, Field(description="The system symbol.")],
@@ -121,15 +224,26 @@ def get_waypoint(
         If the waypoint is uncharted, it will return the 'Uncharted' trait instead of its actual traits.
         """
         try:
+            if self.galaxy_cache:
+                cached = self.galaxy_cache.get("waypoint", waypoint_symbol)
+                if cached:
+                    return (
+                        "Successfully fetched waypoint.",
+                        WaypointResponseSchema.model_validate_json(cached)
+                    )
+
             response = self.session.get(
                 url=f"{self.api_url}/systems/{system_symbol}/waypoints/{waypoint_symbol}",
             )
 
             response.raise_for_status()
 
+            if self.galaxy_cache and b"UNCHARTED" not in response.content:
+                self.galaxy_cache.set("waypoint", waypoint_symbol, response.content)
+
             return (
                 "Successfully fetched waypoint.",
-                WaypointResponseSchema.model_validate(response.json())
+                parse_response(WaypointResponseSchema, response)
             )
 
         except requests.exceptions.HTTPError as error:
@@ -141,6 +255,7 @@ def get_market(
         self,
         system_symbol: Annotated[str, Field(description="The system symbol.")],
         waypoint_symbol: Annotated[str, Field(description="The waypoint symbol.")],
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the response cache.")] = True,
     ) -> Tuple[str, MarketResponseSchema | None]:
         """Retrieve imports, exports and exchange data from a marketplace.
 
@@ -148,17 +263,29 @@ def get_market(
 
         Send a ship to the waypoint to access trade good prices and recent transactions.
         Refer to the Market Overview page to gain better a understanding of the market in the game.
+
+        Only markets seen with a ship present, which carry trade goods, are kept in the response cache.
         """
         try:
+            if use_cache and self.response_cache:
+                cached = self.response_cache.get("market", waypoint_symbol)
+                if cached:
+                    return "Successfully fetched waypoint.", cached
+
             response = self.session.get(
                 url=f"{self.api_url}/systems/{system_symbol}/waypoints/{waypoint_symbol}/market",
             )
 
             response.raise_for_status()
 
+            market = parse_response(MarketResponseSchema, response)
+
+            if self.response_cache and "tradeGoods" in market.data.model_fields_set:
+                self.response_cache.set("market", waypoint_symbol, market)
+
             return (
                 "Successfully fetched waypoint.",
-                MarketResponseSchema.model_validate(response.json())
+                market
             )
 
         except requests.exceptions.HTTPError as error:
@@ -170,6 +297,7 @@ def get_shipyard(
         self,
         system_symbol: Annotated[str, Field(description="The system symbol.")],
         waypoint_symbol: Annotated[str, Field(description="The waypoint symbol.")],
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the response cache.")] = True,
     ) -> Tuple[str, ShipyardResponseSchema | None]:
         """Get the shipyard for a waypoint.
 
@@ -178,17 +306,25 @@ def get_shipyard(
         for purchase and recent transactions.
         """
         try:
+            if use_cache and self.response_cache:
+                cached = self.response_cache.get("shipyard", waypoint_symbol)
+                if cached:
+                    return "Successfully fetched shipyard.", cached
+
             response = self.session.get(
                 url=f"{self.api_url}/systems/{system_symbol}/waypoints/{waypoint_symbol}/shipyard",
             )
 
             response.raise_for_status()
 
-            print(response.json())
+            shipyard = parse_response(ShipyardResponseSchema, response)
+
+            if self.response_cache:
+                self.response_cache.set("shipyard", waypoint_symbol, shipyard)
 
             return (
                 "Successfully fetched shipyard.",
-                ShipyardResponseSchema.model_validate(response.json())
+                shipyard
             )
 
         except requests.exceptions.HTTPError as error:
@@ -206,15 +342,26 @@ def get_jump_gate(
         Waypoints connected to this jump gate can be ...
         """
         try:
+            if self.galaxy_cache:
+                cached = self.galaxy_cache.get("jump_gate", waypoint_symbol)
+                if cached:
+                    return (
+                        "Successfully fetched jump gate.",
+                        JumpGateResponseSchema.model_validate_json(cached)
+                    )
+
             response = self.session.get(
                 url=f"{self.api_url}/systems/{system_symbol}/waypoints/{waypoint_symbol}/jump-gate",
             )
 
             response.raise_for_status()
 
+            if self.galaxy_cache:
+                self.galaxy_cache.set("jump_gate", waypoint_symbol, response.content)
+
             return (
                 "Successfully fetched jump gate.",
-                JumpGateResponseSchema.model_validate(response.json())
+                parse_response(JumpGateResponseSchema, response)
             )
 
         except requests.exceptions.HTTPError as error:
@@ -226,21 +373,32 @@ def get_construction_site(
         self,
         system_symbol: Annotated[str, Field(description="The system symbol.")],
         waypoint_symbol: Annotated[str, Field(description="The waypoint symbol.")],
+        use_cache: Annotated[bool, Field(description="Whether to serve the response from the response cache.")] = True,
     ) -> Tuple[str, ConstructionResponseSchema | None]:
         """Get construction details for a waypoint.
 
         Requires a waypoint with a property of isUnderConstruction to be true.
         """
         try:
+            if use_cache and self.response_cache:
+                cached = self.response_cache.get("construction", waypoint_symbol)
+                if cached:
+                    return "Successfully fetched construction site.", cached
+
             response = self.session.get(
                 url=f"{self.api_url}/systems/{system_symbol}/waypoints/{waypoint_symbol}/construction",
             )
 
             response.raise_for_status()
 
+            construction = parse_response(ConstructionResponseSchema, response)
+
+            if self.response_cache:
+                self.response_cache.set("construction", waypoint_symbol, construction)
+
             return (
                 "Successfully fetched construction site.",
-                ConstructionResponseSchema.model_validate(response.json())
+                construction
             )
 
         except requests.exceptions.HTTPError as error:
@@ -272,9 +430,16 @@ def supply_construction_site(
 
             response.raise_for_status()
 
+            supply = parse_response(SupplyConstructionResponseSchema, response)
+
+            if self.response_cache:
+                self.response_cache.invalidate("construction", waypoint_symbol)
+            if self.fleet_state:
+                self.fleet_state.update_ship(ship_symbol, cargo=supply.data.cargo)
+
             return (
                 "Successfully fetched construction site.",
-                SupplyConstructionResponseSchema.model_validate(response.json())
+                supply
             )
 
         except requests.exceptions.HTTPError as error:
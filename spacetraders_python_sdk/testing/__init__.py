@@ -0,0 +1,30 @@
+"""Init Testing."""
+
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_getattr
+from . import payloads
+
+
+if TYPE_CHECKING:
+    from .stub_server import StubAdapter, StubAsyncTransport, StubHTTPServer, StubServer
+
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "StubAdapter": ".stub_server",
+        "StubAsyncTransport": ".stub_server",
+        "StubHTTPServer": ".stub_server",
+        "StubServer": ".stub_server",
+    },
+)
+
+
+__all__ = [
+    "payloads",
+    "StubServer",
+    "StubAdapter",
+    "StubAsyncTransport",
+    "StubHTTPServer",
+]
@@ -0,0 +1,499 @@
+"""Synthetic API Payloads.
+
+Plain JSON-ready dictionaries shaped like the SpaceTraders API responses, sized like the real ones,
+for tests and benchmarks that must not depend on the live server.
+"""
+
+import random
+
+from typing import Any, Dict, List, Optional, Sequence
+
+
+TIMESTAMP = "2024-08-31T12:00:00.000Z"
+
+WAYPOINT_TYPES = [
+    "PLANET",
+    "GAS_GIANT",
+    "MOON",
+    "ORBITAL_STATION",
+    "JUMP_GATE",
+    "ASTEROID_FIELD",
+    "ASTEROID",
+    "ENGINEERED_ASTEROID",
+    "ASTEROID_BASE",
+    "FUEL_STATION",
+]
+
+WAYPOINT_TRAITS = [
+    "MARKETPLACE",
+    "SHIPYARD",
+    "OUTPOST",
+    "INDUSTRIAL",
+    "COMMON_METAL_DEPOSITS",
+    "PRECIOUS_METAL_DEPOSITS",
+    "MINERAL_DEPOSITS",
+    "ICE_CRYSTALS",
+    "ROCKY",
+    "BARREN",
+    "TEMPERATE",
+    "SHALLOW_CRATERS",
+]
+
+TRADE_SYMBOLS = [
+    "FUEL",
+    "IRON_ORE",
+    "COPPER_ORE",
+    "ALUMINUM_ORE",
+    "SILVER_ORE",
+    "GOLD_ORE",
+    "PLATINUM_ORE",
+    "QUARTZ_SAND",
+    "SILICON_CRYSTALS",
+    "ICE_WATER",
+    "AMMONIA_ICE",
+    "PRECIOUS_STONES",
+    "IRON",
+    "COPPER",
+    "ALUMINUM",
+    "ELECTRONICS",
+    "MACHINERY",
+    "FOOD",
+]
+
+SUPPLIES = ["SCARCE", "LIMITED", "MODERATE", "HIGH", "ABUNDANT"]
+
+FACTION_SYMBOLS = ["COSMIC", "VOID", "GALACTIC", "QUANTUM", "DOMINION", "ASTRO", "CORSAIRS", "OBSIDIAN", "AEGIS"]
+
+SHIP_TYPES = ["SHIP_PROBE", "SHIP_MINING_DRONE", "SHIP_LIGHT_HAULER", "SHIP_COMMAND_FRIGATE"]
+
+
+def make_page(data: List[Dict[str, Any]], total: int, page: int = 1, limit: int = 20) -> Dict[str, Any]:
+    """Wrap the items of one page like a list endpoint."""
+    return {"data": data, "meta": {"total": total, "page": page, "limit": limit}}
+
+
+def make_agent(symbol: str = "BILLY1", credits: int = 175000, ship_count: int = 2) -> Dict[str, Any]:
+    """Return an agent."""
+    return {
+        "accountId": "cm0a1b2c3d4e5f6g7h8i9j0k",
+        "symbol": symbol,
+        "headquarters": "X1-GJ54-A1",
+        "credits": credits,
+        "startingFaction": "COSMIC",
+        "shipCount": ship_count,
+    }
+
+
+def make_contract(
+    contract_id: str = "cm0contract0001",
+    accepted: bool = False,
+    fulfilled: bool = False,
+) -> Dict[str, Any]:
+    """Return a procurement contract for iron ore."""
+    return {
+        "id": contract_id,
+        "factionSymbol": "COSMIC",
+        "type": "PROCUREMENT",
+        "terms": {
+            "deadline": TIMESTAMP,
+            "payment": {"onAccepted": 10000, "onFulfilled": 40000},
+            "deliver": [
+                {
+                    "tradeSymbol": "IRON_ORE",
+                    "destinationSymbol": "X1-GJ54-A1",
+                    "unitsRequired": 60,
+                    "unitsFulfilled": 60 if fulfilled else 0,
+                }
+            ],
+        },
+        "accepted": accepted,
+        "fulfilled": fulfilled,
+        "deadlineToAccept": TIMESTAMP,
+    }
+
+
+def make_trait(symbol: str) -> Dict[str, Any]:
+    """Return a waypoint trait."""
+    name = symbol.replace("_", " ").title()
+    return {
+        "symbol": symbol,
+        "name": name,
+        "description": f"{name}: a notable feature of this waypoint that influences what can be found or built here.",
+    }
+
+
+def make_waypoint(
+    symbol: str,
+    x: int = 0,
+    y: int = 0,
+    waypoint_type: str = "PLANET",
+    traits: Sequence[str] = ("MARKETPLACE",),
+    orbitals: Sequence[str] = (),
+    orbits: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Return a waypoint as returned by `get_waypoint`."""
+    waypoint: Dict[str, Any] = {
+        "symbol": symbol,
+        "systemSymbol": symbol.rsplit("-", 1)[0],
+        "type": waypoint_type,
+        "x": x,
+        "y": y,
+        "orbitals": [{"symbol": orbital} for orbital in orbitals],
+        "faction": {"symbol": "COSMIC"},
+        "traits": [make_trait(trait) for trait in traits],
+        "modifiers": [],
+        "chart": {"waypointSymbol": symbol, "submittedBy": "COSMIC", "submittedOn": TIMESTAMP},
+        "isUnderConstruction": False,
+    }
+    if orbits:
+        waypoint["orbits"] = orbits
+    return waypoint
+
+
+def make_system_waypoints(system_symbol: str, count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Return `count` waypoints spread around a system, with a realistic mix of types and traits."""
+    rng = random.Random(f"{system_symbol}-{seed}")
+    waypoints = []
+    for index in range(count):
+        waypoint_type = WAYPOINT_TYPES[index % len(WAYPOINT_TYPES)]
+        traits = rng.sample(WAYPOINT_TRAITS, k=rng.randint(2, 5))
+        if waypoint_type == "FUEL_STATION" and "MARKETPLACE" not in traits:
+            traits.append("MARKETPLACE")
+        waypoints.append(
+            make_waypoint(
+                symbol=f"{system_symbol}-{chr(65 + index // 26 % 26)}{index + 1}",
+                x=rng.randint(-800, 800),
+                y=rng.randint(-800, 800),
+                waypoint_type=waypoint_type,
+                traits=traits,
+            )
+        )
+    return waypoints
+
+
+def make_system(symbol: str, x: int = 0, y: int = 0, waypoint_count: int = 12, seed: int = 0) -> Dict[str, Any]:
+    """Return a system with its waypoints, as returned by `get_system`."""
+    waypoints = make_system_waypoints(symbol, waypoint_count, seed=seed)
+    return {
+        "symbol": symbol,
+        "sectorSymbol": symbol.split("-", 1)[0],
+        "type": "RED_STAR",
+        "x": x,
+        "y": y,
+        "waypoints": [
+            {
+                "symbol": waypoint["symbol"],
+                "type": waypoint["type"],
+                "x": waypoint["x"],
+                "y": waypoint["y"],
+                "orbitals": waypoint["orbitals"],
+            }
+            for waypoint in waypoints
+        ],
+        "factions": [{"symbol": "COSMIC"}],
+    }
+
+
+def make_requirements(power: int = 1, crew: int = 0, slots: int = 0) -> Dict[str, Any]:
+    """Return the installation requirements of a ship component."""
+    return {"power": power, "crew": crew, "slots": slots}
+
+
+def make_nav(
+    system_symbol: str,
+    waypoint_symbol: str,
+    status: str = "IN_ORBIT",
+    x: int = 0,
+    y: int = 0,
+    arrival: str = TIMESTAMP,
+) -> Dict[str, Any]:
+    """Return the navigation state of a ship."""
+    route_waypoint = {
+        "symbol": waypoint_symbol,
+        "type": "PLANET",
+        "systemSymbol": system_symbol,
+        "x": x,
+        "y": y,
+    }
+    return {
+        "systemSymbol": system_symbol,
+        "waypointSymbol": waypoint_symbol,
+        "route": {
+            "destination": route_waypoint,
+            "origin": route_waypoint,
+            "departureTime": TIMESTAMP,
+            "arrival": arrival,
+        },
+        "status": status,
+        "flightMode": "CRUISE",
+    }
+
+
+def make_fuel(current: int = 400, capacity: int = 400) -> Dict[str, Any]:
+    """Return the fuel tanks of a ship."""
+    return {"current": current, "capacity": capacity, "consumed": {"amount": 0, "timestamp": TIMESTAMP}}
+
+
+def make_cargo(capacity: int = 40, inventory: Sequence[Dict[str, Any]] = ()) -> Dict[str, Any]:
+    """Return the cargo hold of a ship."""
+    return {
+        "capacity": capacity,
+        "units": sum(item["units"] for item in inventory),
+        "inventory": list(inventory),
+    }
+
+
+def make_cargo_item(symbol: str, units: int) -> Dict[str, Any]:
+    """Return one good in a cargo hold."""
+    return {
+        "symbol": symbol,
+        "name": symbol.replace("_", " ").title(),
+        "description": f"Units of {symbol.lower().replace('_', ' ')} stored in the cargo hold.",
+        "units": units,
+    }
+
+
+def make_cooldown(ship_symbol: str, remaining_seconds: int = 0, expiration: str = TIMESTAMP) -> Dict[str, Any]:
+    """Return the cooldown of a ship."""
+    return {
+        "shipSymbol": ship_symbol,
+        "totalSeconds": remaining_seconds,
+        "remainingSeconds": remaining_seconds,
+        "expiration": expiration,
+    }
+
+
+def make_transaction(
+    ship_symbol: str,
+    trade_symbol: str,
+    units: int,
+    price_per_unit: int,
+    transaction_type: str = "SELL",
+    waypoint_symbol: str = "X1-GJ54-A1",
+) -> Dict[str, Any]:
+    """Return a market transaction."""
+    return {
+        "waypointSymbol": waypoint_symbol,
+        "shipSymbol": ship_symbol,
+        "tradeSymbol": trade_symbol,
+        "type": transaction_type,
+        "units": units,
+        "pricePerUnit": price_per_unit,
+        "totalPrice": units * price_per_unit,
+        "timestamp": TIMESTAMP,
+    }
+
+
+def make_ship(
+    symbol: str,
+    system_symbol: str = "X1-GJ54",
+    waypoint_symbol: str = "X1-GJ54-A1",
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Return a fully equipped mining ship, as returned by `get_ship`."""
+    rng = random.Random(f"{symbol}-{seed}")
+    inventory = [make_cargo_item(good, rng.randint(1, 10)) for good in rng.sample(TRADE_SYMBOLS[1:8], k=3)]
+    return {
+        "symbol": symbol,
+        "registration": {"name": symbol, "factionSymbol": "COSMIC", "role": "EXCAVATOR"},
+        "nav": make_nav(system_symbol, waypoint_symbol, x=rng.randint(-50, 50), y=rng.randint(-50, 50)),
+        "crew": {"current": 0, "required": 0, "capacity": 0, "rotation": "STRICT", "morale": 100, "wages": 0},
+        "frame": {
+            "symbol": "FRAME_MINER",
+            "name": "Miner",
+            "description": "A medium-sized ship with a reinforced hull and room for mining equipment.",
+            "condition": 1.0,
+            "integrity": 1.0,
+            "moduleSlots": 3,
+            "mountingPoints": 3,
+            "fuelCapacity": 400,
+            "requirements": make_requirements(power=3, crew=-10),
+        },
+        "reactor": {
+            "symbol": "REACTOR_FISSION_I",
+            "name": "Fission Reactor I",
+            "description": "A basic fission power reactor that generates electricity from nuclear fission reactions.",
+            "condition": 1.0,
+            "integrity": 1.0,
+            "powerOutput": 31,
+            "requirements": make_requirements(power=0, crew=8),
+        },
+        "engine": {
+            "symbol": "ENGINE_ION_DRIVE_I",
+            "name": "Ion Drive I",
+            "description": "An advanced propulsion system that uses ionized particles to generate high-speed thrust.",
+            "condition": 1.0,
+            "integrity": 1.0,
+            "speed": 30,
+            "requirements": make_requirements(power=3, crew=0),
+        },
+        "cooldown": make_cooldown(symbol),
+        "modules": [
+            {
+                "symbol": "MODULE_CARGO_HOLD_I",
+                "name": "Cargo Hold",
+                "description": "A module that increases a ship's cargo capacity.",
+                "capacity": 15,
+                "requirements": make_requirements(power=1, slots=1),
+            },
+            {
+                "symbol": "MODULE_MINERAL_PROCESSOR_I",
+                "name": "Mineral Processor",
+                "description": "Crushes and processes extracted minerals and ores into their component parts.",
+                "requirements": make_requirements(power=1, slots=2),
+            },
+        ],
+        "mounts": [
+            {
+                "symbol": "MOUNT_MINING_LASER_I",
+                "name": "Mining Laser I",
+                "description": "A basic mining laser that can be used to extract valuable minerals from asteroids.",
+                "strength": 10,
+                "deposits": [],
+                "requirements": make_requirements(power=1),
+            },
+            {
+                "symbol": "MOUNT_SURVEYOR_I",
+                "name": "Surveyor I",
+                "description": "A basic survey probe that can be used to gather information about a mineral deposit.",
+                "strength": 1,
+                "deposits": ["QUARTZ_SAND", "SILICON_CRYSTALS", "IRON_ORE", "COPPER_ORE", "ALUMINUM_ORE"],
+                "requirements": make_requirements(power=1),
+            },
+        ],
+        "cargo": make_cargo(capacity=60, inventory=inventory),
+        "fuel": make_fuel(),
+    }
+
+
+def make_survey(
+    signature: str,
+    waypoint_symbol: str = "X1-GJ54-B2",
+    deposits: Sequence[str] = ("IRON_ORE", "COPPER_ORE", "IRON_ORE"),
+    size: str = "MODERATE",
+    expiration: str = TIMESTAMP,
+) -> Dict[str, Any]:
+    """Return a survey of an asteroid field."""
+    return {
+        "signature": signature,
+        "symbol": waypoint_symbol,
+        "deposits": [{"symbol": deposit} for deposit in deposits],
+        "expiration": expiration,
+        "size": size,
+    }
+
+
+def make_trade_good(symbol: str) -> Dict[str, Any]:
+    """Return a good listed by a market."""
+    return {
+        "symbol": symbol,
+        "name": symbol.replace("_", " ").title(),
+        "description": f"{symbol.replace('_', ' ').title()} traded at this market.",
+    }
+
+
+def make_market(symbol: str, goods: Sequence[str] = TRADE_SYMBOLS[:8], seed: int = 0) -> Dict[str, Any]:
+    """Return a market with prices, as seen with a ship present."""
+    rng = random.Random(f"{symbol}-{seed}")
+    trade_goods = []
+    for good in goods:
+        purchase_price = rng.randint(10, 500)
+        trade_goods.append(
+            {
+                "symbol": good,
+                "type": rng.choice(["EXPORT", "IMPORT", "EXCHANGE"]),
+                "tradeVolume": rng.choice([10, 20, 60, 100]),
+                "supply": rng.choice(SUPPLIES),
+                "activity": rng.choice(["WEAK", "GROWING", "STRONG"]),
+                "purchasePrice": purchase_price,
+                "sellPrice": max(1, purchase_price - rng.randint(1, 50)),
+            }
+        )
+    return {
+        "symbol": symbol,
+        "exports": [make_trade_good(good) for good in goods[::3]],
+        "imports": [make_trade_good(good) for good in goods[1::3]],
+        "exchange": [make_trade_good(good) for good in goods[2::3]],
+        "transactions": [],
+        "tradeGoods": trade_goods,
+    }
+
+
+def make_status(reset_date: str = "2024-08-25", agents: int = 1200, systems: int = 8000) -> Dict[str, Any]:
+    """Return the status of the game server, as returned by `get_status`."""
+    return {
+        "status": "SpaceTraders is currently online and available to play",
+        "version": "v2.2.0",
+        "resetDate": reset_date,
+        "description": "SpaceTraders is a headless space trading game.",
+        "stats": {"agents": agents, "ships": agents * 6, "systems": systems, "waypoints": systems * 20},
+        "leaderboards": {
+            "mostCredits": [{"agentSymbol": f"AGENT{rank}", "credits": 10_000_000 // rank} for rank in range(1, 11)],
+            "mostSubmittedCharts": [
+                {"agentSymbol": f"AGENT{rank}", "chartCount": 500 // rank} for rank in range(1, 11)
+            ],
+        },
+        "serverResets": {"next": "2024-09-08T16:00:00.000Z", "frequency": "fortnightly"},
+        "announcements": [
+            {"title": "Server Resets", "body": "The server resets every other week; plan your bots accordingly."}
+        ],
+        "links": [{"name": "Website", "url": "https://spacetraders.io/"}],
+    }
+
+
+def make_faction(symbol: str = "COSMIC", traits: Sequence[str] = ("BUREAUCRATIC", "CAPITALISTIC")) -> Dict[str, Any]:
+    """Return a faction."""
+    name = symbol.title()
+    return {
+        "symbol": symbol,
+        "name": f"{name} Engineers",
+        "description": f"The {name} Engineers are a faction with a long history of building across the galaxy.",
+        "headquarters": "X1-GJ54-A1",
+        "traits": [make_trait(trait) for trait in traits],
+        "isRecruiting": True,
+    }
+
+
+def make_shipyard(symbol: str, ship_types: Sequence[str] = SHIP_TYPES[:3], seed: int = 0) -> Dict[str, Any]:
+    """Return a shipyard with its ships for sale, as seen with a ship present."""
+    rng = random.Random(f"{symbol}-{seed}")
+    template = make_ship(f"{symbol}-TEMPLATE", seed=seed)
+    ships = [
+        {
+            "type": ship_type,
+            "name": ship_type.removeprefix("SHIP_").replace("_", " ").title(),
+            "description": "A ship built at this shipyard, delivered fully crewed and ready to fly.",
+            "supply": rng.choice(SUPPLIES),
+            "activity": rng.choice(["WEAK", "GROWING", "STRONG"]),
+            "purchasePrice": rng.randint(20_000, 400_000),
+            **{part: template[part] for part in ("frame", "reactor", "engine", "modules", "mounts", "crew")},
+        }
+        for ship_type in ship_types
+    ]
+    return {
+        "symbol": symbol,
+        "shipTypes": [{"type": ship_type} for ship_type in ship_types],
+        "transactions": [],
+        "ships": ships,
+        "modificationsFee": 1000,
+    }
+
+
+def make_jump_gate(symbol: str, connections: Sequence[str] = ()) -> Dict[str, Any]:
+    """Return a jump gate."""
+    return {"symbol": symbol, "connections": list(connections)}
+
+
+def make_construction(
+    symbol: str,
+    materials: Sequence[str] = ("FAB_MATS", "ADVANCED_CIRCUITRY", "QUANTUM_STABILIZERS"),
+    fulfilled: int = 0,
+) -> Dict[str, Any]:
+    """Return a construction site."""
+    return {
+        "symbol": symbol,
+        "materials": [
+            {"TradeSymbol": material, "required": 4000, "fullfilled": min(fulfilled, 4000)} for material in materials
+        ],
+        "isComplete": False,
+    }
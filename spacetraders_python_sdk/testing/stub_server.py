@@ -0,0 +1,642 @@
+"""Stub Server."""
+
+import asyncio
+import json
+import math
+import random
+import re
+import threading
+import time
+
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import requests
+
+from ..metrics.hooks import endpoint_template
+from ..navigation.route_planner import FLIGHT_MODE_MULTIPLIERS, fuel_cost, travel_time
+from ..transport import RateLimiter
+from . import payloads
+
+
+Reply = Tuple[int, Dict[str, str], bytes]
+
+EXTRACT_COOLDOWN = 70
+SURVEY_COOLDOWN = 60
+FUEL_PRICE = 72
+
+
+class Body(dict):
+    """A complete response body, sent as is rather than wrapped in `data`."""
+
+
+class StubError(Exception):
+    """An error answer, with the API error code."""
+
+    def __init__(self, status: int, message: str, code: Optional[int] = None) -> None:
+        """Init."""
+        super().__init__(message)
+        self.status = status
+        self.code = code or status
+
+
+def _timestamp(seconds: float) -> str:
+    """Return a POSIX timestamp in the API's ISO 8601 format."""
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class StubServer:
+    """In-process stand-in for the SpaceTraders API, implementing every endpoint the SDK covers.
+
+    The game is generated from `seed`: an agent with `ships` mining ships docked at its headquarters, a few
+    contracts, and `systems` systems of `waypoints_per_system` waypoints with markets, shipyards, construction
+    sites and jump gates linking neighbouring systems. Payloads are built by `payloads`, so they have the size
+    and shape of real responses. Actions change the game: ships orbit, dock, travel, extract, survey, refuel and
+    sell, cooldowns and arrivals follow `clock`, and credits and contracts move accordingly.
+
+    Every request waits `latency` seconds plus up to `jitter` more. A share `inject_429` of requests is answered
+    429 with a `Retry-After` of `retry_after` seconds, and requests beyond the `rate_limit` bucket, if given, are
+    answered 429 until it refills. Serve it in process with `adapter` or `async_transport`, or on localhost with
+    `serve`; `stats` counts the answers by status and `endpoints` the requests by endpoint.
+    """
+
+    def __init__(
+        self,
+        ships: int = 10,
+        systems: int = 10,
+        waypoints_per_system: int = 20,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        inject_429: float = 0.0,
+        retry_after: float = 1.0,
+        rate_limit: Optional[RateLimiter] = None,
+        seed: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Init."""
+        self.latency = latency
+        self.jitter = jitter
+        self.inject_429 = inject_429
+        self.retry_after = retry_after
+        self.rate_limit = rate_limit
+        self.clock = clock
+        self.stats: Counter = Counter()
+        self.endpoints: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.RLock()
+        self._routes = self._compile_routes()
+
+        self.agent = payloads.make_agent(credits=175_000, ship_count=ships)
+        self.ships: Dict[str, Dict[str, Any]] = {}
+        for index in range(ships):
+            ship = payloads.make_ship(f"{self.agent['symbol']}-{index + 1}", seed=seed + index)
+            ship["nav"]["status"] = "DOCKED"
+            self.ships[ship["symbol"]] = ship
+        self.contracts = {
+            contract["id"]: contract
+            for contract in (payloads.make_contract(f"cm0contract{index:04d}") for index in range(1, 4))
+        }
+        self.factions = {symbol: payloads.make_faction(symbol) for symbol in payloads.FACTION_SYMBOLS}
+        self.public_agents = [self.agent] + [
+            payloads.make_agent(f"AGENT{index}", credits=self._rng.randint(0, 10**7)) for index in range(1, 40)
+        ]
+
+        self.systems: Dict[str, Dict[str, Any]] = {}
+        self.waypoints: Dict[str, Dict[str, Any]] = {}
+        self.system_waypoints: Dict[str, List[Dict[str, Any]]] = {}
+        symbols = ["X1-GJ54"] + [
+            f"X1-{chr(65 + index // 26 % 26)}{chr(65 + index % 26)}{index}" for index in range(1, systems)
+        ]
+        for index, symbol in enumerate(symbols):
+            system = payloads.make_system(
+                symbol, x=index * 100, y=self._rng.randint(-500, 500), waypoint_count=waypoints_per_system, seed=seed
+            )
+            waypoints = payloads.make_system_waypoints(symbol, waypoints_per_system, seed=seed)
+            self.systems[symbol] = system
+            self.system_waypoints[symbol] = waypoints
+            self.waypoints.update((waypoint["symbol"], waypoint) for waypoint in waypoints)
+        self.gates = {
+            system: [waypoint["symbol"] for waypoint in waypoints if waypoint["type"] == "JUMP_GATE"]
+            for system, waypoints in self.system_waypoints.items()
+        }
+        self.markets: Dict[str, Dict[str, Any]] = {}
+        self.constructions: Dict[str, Dict[str, Any]] = {}
+
+    def delay(self) -> float:
+        """Return how long to wait before answering the next request."""
+        return self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def handle(self, method: str, url: str, body: Optional[bytes] = None) -> Reply:
+        """Answer a request with its status, headers and body, without waiting for the latency."""
+        split = urlsplit(url)
+        path = re.sub(r"^/v\d+", "", split.path).rstrip("/") or "/"
+        query = {name: values[-1] for name, values in parse_qs(split.query).items()}
+        method = method.upper()
+
+        with self._lock:
+            self.stats["requests"] += 1
+            self.endpoints[f"{method} {endpoint_template(path)}"] += 1
+            headers = {"Content-Type": "application/json"}
+            try:
+                self._check_rate_limit(headers)
+                data = self._route(method, path, query, json.loads(body) if body else {})
+                status, payload = 200, data if isinstance(data, Body) else {"data": data}
+            except StubError as error:
+                status, payload = error.status, {"error": {"message": str(error), "code": error.code}}
+            self.stats[status] += 1
+
+        return status, headers, json.dumps(payload, separators=(",", ":")).encode()
+
+    def add_cargo(self, ship_symbol: str, good: str, units: int) -> None:
+        """Load units of a good onto a ship, e.g. to set up a delivery."""
+        with self._lock:
+            self._add_cargo(self._find(self.ships, ship_symbol), good, units)
+
+    def adapter(self) -> "StubAdapter":
+        """Return a `requests` adapter answering from this server; mount it on a client's session."""
+        return StubAdapter(self)
+
+    def async_transport(self) -> "StubAsyncTransport":
+        """Return an `httpx` transport answering from this server; pass it as `transport` to an async client."""
+        return StubAsyncTransport(self)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> "StubHTTPServer":
+        """Serve on localhost from a background thread; use the result as a context manager."""
+        return StubHTTPServer(self, host, port)
+
+    def _check_rate_limit(self, headers: Dict[str, str]) -> None:
+        """Raise a 429 for injected errors and requests beyond the rate limit."""
+        if self.inject_429 and self._rng.random() < self.inject_429:
+            headers["Retry-After"] = str(self.retry_after)
+            self.stats["injected_429"] += 1
+            raise StubError(429, "You have reached your API limit.", 429)
+
+        if self.rate_limit is None:
+            return
+        budget = self.rate_limit.budget()
+        headers.update(
+            {
+                "x-ratelimit-type": "IP-based",
+                "x-ratelimit-limit-per-second": str(self.rate_limit.rate),
+                "x-ratelimit-limit-burst": str(self.rate_limit.burst),
+                "x-ratelimit-remaining": str(math.floor(budget.sustained + budget.burst)),
+            }
+        )
+        if budget.wait > 0:
+            headers["Retry-After"] = f"{budget.wait:.3f}"
+            headers["x-ratelimit-reset"] = _timestamp(self.clock() + budget.wait)
+            raise StubError(429, "You have reached your API limit.", 429)
+        self.rate_limit.reserve()
+
+    def _compile_routes(self) -> List[Tuple[str, re.Pattern, Callable[..., Any]]]:
+        """Return the method, path pattern and handler of every endpoint."""
+        routes: List[Tuple[str, str, Callable[..., Any]]] = [
+            ("GET", "/", self._status),
+            ("GET", "/my/agent", lambda query, body: self.agent),
+            ("GET", "/agents", lambda query, body: self._page(self.public_agents, query)),
+            ("GET", "/agents/{symbol}", self._public_agent),
+            ("GET", "/factions", lambda query, body: self._page(list(self.factions.values()), query)),
+            ("GET", "/factions/{symbol}", lambda symbol, query, body: self._find(self.factions, symbol)),
+            ("GET", "/my/contracts", lambda query, body: self._page(list(self.contracts.values()), query)),
+            ("GET", "/my/contracts/{id}", lambda contract_id, query, body: self._contract(contract_id)),
+            ("POST", "/my/contracts/{id}/accept", self._accept_contract),
+            ("POST", "/my/contracts/{id}/deliver", self._deliver_contract),
+            ("POST", "/my/contracts/{id}/(?:fulfill|fullfill)", self._fulfill_contract),
+            ("GET", "/my/ships", lambda query, body: self._page([self._ship(s) for s in self.ships], query)),
+            ("GET", "/my/ships/{symbol}", lambda symbol, query, body: self._ship(symbol)),
+            ("GET", "/my/ships/{symbol}/cargo", lambda symbol, query, body: self._ship(symbol)["cargo"]),
+            ("POST", "/my/ships/{symbol}/orbit", lambda symbol, query, body: self._move(symbol, "IN_ORBIT")),
+            ("POST", "/my/ships/{symbol}/dock", lambda symbol, query, body: self._move(symbol, "DOCKED")),
+            ("POST", "/my/ships/{symbol}/navigate", self._navigate),
+            ("PATCH", "/my/ships/{symbol}/nav", self._patch_nav),
+            ("POST", "/my/ships/{symbol}/refuel", self._refuel),
+            ("POST", "/my/ships/{symbol}/extract(?:/survey)?", self._extract),
+            ("POST", "/my/ships/{symbol}/survey", self._survey),
+            ("POST", "/my/ships/{symbol}/sell", self._sell),
+            ("GET", "/systems", lambda query, body: self._page(list(self.systems.values()), query)),
+            ("GET", "/systems/{symbol}", lambda symbol, query, body: self._find(self.systems, symbol)),
+            (
+                "GET",
+                "/systems/{symbol}/waypoints",
+                lambda symbol, query, body: self._page(self._find(self.system_waypoints, symbol), query),
+            ),
+            ("GET", "/systems/{symbol}/waypoints/{symbol}", self._waypoint),
+            ("GET", "/systems/{symbol}/waypoints/{symbol}/market", self._market),
+            ("GET", "/systems/{symbol}/waypoints/{symbol}/shipyard", self._shipyard),
+            ("GET", "/systems/{symbol}/waypoints/{symbol}/jump-gate", self._jump_gate),
+            ("GET", "/systems/{symbol}/waypoints/{symbol}/construction", self._construction),
+            ("POST", "/systems/{symbol}/waypoints/{symbol}/construction(?:/supply)?", self._supply_construction),
+        ]
+        return [
+            (method, re.compile("^" + re.sub(r"\{\w+\}", "([^/]+)", path) + "$"), handler)
+            for method, path, handler in routes
+        ]
+
+    def _route(self, method: str, path: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Answer a request with the handler of its endpoint."""
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if match and route_method == method:
+                return handler(*match.groups(), query=query, body=body)
+        raise StubError(404, f"No route for {method} {path}.")
+
+    def _page(self, items: List[Any], query: Dict[str, str]) -> Any:
+        """Answer one page of a list."""
+        try:
+            page, limit = int(query.get("page", 1)), int(query.get("limit", 10))
+        except ValueError as error:
+            raise StubError(422, "Invalid pagination parameters.", 422) from error
+        if page < 1 or not 1 <= limit <= 20:
+            raise StubError(422, "Limit must be between 1 and 20 and page at least 1.", 422)
+        data = items[(page - 1) * limit:page * limit]
+        return Body(payloads.make_page(data, total=len(items), page=page, limit=limit))
+
+    @staticmethod
+    def _find(items: Dict[str, Any], symbol: str) -> Any:
+        """Return an item by symbol, or answer 404."""
+        if symbol not in items:
+            raise StubError(404, f"{symbol} not found.")
+        return items[symbol]
+
+    def _status(self, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Answer the server status."""
+        return Body(payloads.make_status(systems=len(self.systems)))
+
+    def _public_agent(self, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Answer a public agent."""
+        return self._find({agent["symbol"]: agent for agent in self.public_agents}, symbol)
+
+    def _contract(self, contract_id: str) -> Dict[str, Any]:
+        """Return a contract, or answer 404."""
+        return self._find(self.contracts, contract_id)
+
+    def _accept_contract(self, contract_id: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Accept a contract and get paid its advance."""
+        contract = self._contract(contract_id)
+        if contract["accepted"]:
+            raise StubError(400, "Contract has already been accepted.", 4501)
+        contract["accepted"] = True
+        self.agent["credits"] += contract["terms"]["payment"]["onAccepted"]
+        return {"agent": self.agent, "contract": contract}
+
+    def _deliver_contract(self, contract_id: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Deliver cargo of a docked ship to a contract."""
+        contract = self._contract(contract_id)
+        ship = self._ship(body.get("shipSymbol", ""))
+        terms = next(
+            (deliver for deliver in contract["terms"]["deliver"] if deliver["tradeSymbol"] == body.get("tradeSymbol")),
+            None,
+        )
+        if not contract["accepted"] or terms is None:
+            raise StubError(400, "Contract does not require this good or is not accepted.", 4508)
+        units = min(int(body.get("units", 0)), terms["unitsRequired"] - terms["unitsFulfilled"])
+        self._remove_cargo(ship, terms["tradeSymbol"], units)
+        terms["unitsFulfilled"] += units
+        return {"contract": contract, "cargo": ship["cargo"]}
+
+    def _fulfill_contract(self, contract_id: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Fulfill a contract whose deliveries are complete and get paid."""
+        contract = self._contract(contract_id)
+        if contract["fulfilled"] or any(
+            deliver["unitsFulfilled"] < deliver["unitsRequired"] for deliver in contract["terms"]["deliver"]
+        ):
+            raise StubError(400, "Contract terms have not been met.", 4502)
+        contract["fulfilled"] = True
+        self.agent["credits"] += contract["terms"]["payment"]["onFulfilled"]
+        return {"agent": self.agent, "contract": contract}
+
+    def _ship(self, symbol: str) -> Dict[str, Any]:
+        """Return a ship brought forward to now, or answer 404."""
+        ship = self._find(self.ships, symbol)
+        now = self.clock()
+        nav = ship["nav"]
+        if nav["status"] == "IN_TRANSIT" and datetime.fromisoformat(nav["route"]["arrival"]).timestamp() <= now:
+            nav["status"] = "IN_ORBIT"
+        cooldown = ship["cooldown"]
+        if cooldown["remainingSeconds"]:
+            expiration = datetime.fromisoformat(cooldown["expiration"]).timestamp()
+            cooldown["remainingSeconds"] = max(0, math.ceil(expiration - now))
+        return ship
+
+    def _require(self, ship: Dict[str, Any], status: str) -> None:
+        """Answer 400 unless a ship is in the given nav status."""
+        if ship["nav"]["status"] != status:
+            raise StubError(400, f"Ship {ship['symbol']} must be {status} but is {ship['nav']['status']}.", 4236)
+
+    def _move(self, symbol: str, status: str) -> Any:
+        """Orbit or dock a ship."""
+        ship = self._ship(symbol)
+        if ship["nav"]["status"] == "IN_TRANSIT":
+            raise StubError(400, f"Ship {symbol} is in transit.", 4214)
+        ship["nav"]["status"] = status
+        return {"nav": ship["nav"]}
+
+    def _navigate(self, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Send a ship in orbit to a waypoint of its system, burning fuel for the distance in its flight mode."""
+        ship = self._ship(symbol)
+        self._require(ship, "IN_ORBIT")
+        nav = ship["nav"]
+        origin = self.waypoints[nav["waypointSymbol"]]
+        destination = self._find(self.waypoints, body.get("waypointSymbol", ""))
+        if destination["systemSymbol"] != nav["systemSymbol"]:
+            raise StubError(400, "Destination is outside of the ship's system.", 4202)
+
+        distance = math.dist((origin["x"], origin["y"]), (destination["x"], destination["y"]))
+        fuel = fuel_cost(distance, nav["flightMode"])
+        if fuel > ship["fuel"]["current"]:
+            raise StubError(400, "Ship does not have enough fuel.", 4203)
+        now = self.clock()
+        ship["fuel"]["current"] -= fuel
+        ship["fuel"]["consumed"] = {"amount": fuel, "timestamp": _timestamp(now)}
+        nav["route"] = {
+            "origin": nav["route"]["destination"],
+            "destination": {key: destination[key] for key in ("symbol", "type", "systemSymbol", "x", "y")},
+            "departureTime": _timestamp(now),
+            "arrival": _timestamp(now + travel_time(distance, nav["flightMode"], ship["engine"]["speed"])),
+        }
+        nav["waypointSymbol"] = destination["symbol"]
+        nav["status"] = "IN_TRANSIT"
+        return {"nav": nav, "fuel": ship["fuel"], "events": []}
+
+    def _patch_nav(self, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Change the flight mode of a ship."""
+        ship = self._ship(symbol)
+        flight_mode = body.get("flightMode", ship["nav"]["flightMode"])
+        if flight_mode not in FLIGHT_MODE_MULTIPLIERS:
+            raise StubError(422, f"Invalid flight mode {flight_mode}.", 422)
+        ship["nav"]["flightMode"] = flight_mode
+        return ship["nav"]
+
+    def _refuel(self, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Fill the tanks of a docked ship at the market price."""
+        ship = self._ship(symbol)
+        self._require(ship, "DOCKED")
+        fuel = ship["fuel"]
+        units = min(int(body.get("units") or fuel["capacity"]), fuel["capacity"] - fuel["current"])
+        fuel["current"] += units
+        self.agent["credits"] -= units * FUEL_PRICE
+        transaction = payloads.make_transaction(
+            symbol,
+            "FUEL",
+            units,
+            FUEL_PRICE,
+            transaction_type="PURCHASE",
+            waypoint_symbol=ship["nav"]["waypointSymbol"],
+        )
+        return {"agent": self.agent, "fuel": fuel, "transaction": transaction}
+
+    def _start_cooldown(self, ship: Dict[str, Any], seconds: int) -> None:
+        """Start the reactor cooldown of a ship, or answer 409 if it is still cooling down."""
+        if ship["cooldown"]["remainingSeconds"]:
+            raise StubError(409, f"Ship {ship['symbol']} is on cooldown.", 4000)
+        ship["cooldown"] = payloads.make_cooldown(ship["symbol"], seconds, _timestamp(self.clock() + seconds))
+
+    def _extract(self, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Extract resources into the cargo of a ship in orbit, with or without a survey."""
+        ship = self._ship(symbol)
+        self._require(ship, "IN_ORBIT")
+        deposits = [deposit["symbol"] for deposit in body.get("deposits", ())] or payloads.TRADE_SYMBOLS[1:8]
+        cargo = ship["cargo"]
+        units = min(self._rng.randint(3, 12), cargo["capacity"] - cargo["units"])
+        if units <= 0:
+            raise StubError(400, f"Ship {symbol} has no cargo space left.", 4228)
+        self._start_cooldown(ship, EXTRACT_COOLDOWN)
+
+        good = self._rng.choice(deposits)
+        self._add_cargo(ship, good, units)
+        extraction = {"shipSymbol": symbol, "yield": {"symbol": good, "units": units}}
+        return {"cooldown": ship["cooldown"], "extraction": extraction, "cargo": cargo, "events": []}
+
+    def _survey(self, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Survey the waypoint of a ship in orbit."""
+        ship = self._ship(symbol)
+        self._require(ship, "IN_ORBIT")
+        self._start_cooldown(ship, SURVEY_COOLDOWN)
+        expiration = _timestamp(self.clock() + 900)
+        surveys = [
+            payloads.make_survey(
+                f"{ship['nav']['waypointSymbol']}-{self._rng.getrandbits(32):08X}",
+                waypoint_symbol=ship["nav"]["waypointSymbol"],
+                deposits=self._rng.choices(payloads.TRADE_SYMBOLS[1:8], k=self._rng.randint(3, 7)),
+                size=self._rng.choice(["SMALL", "MODERATE", "LARGE"]),
+                expiration=expiration,
+            )
+            for _ in range(self._rng.randint(1, 3))
+        ]
+        return {"cooldown": ship["cooldown"], "surveys": surveys}
+
+    def _sell(self, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Sell cargo of a docked ship at the market of its waypoint."""
+        ship = self._ship(symbol)
+        self._require(ship, "DOCKED")
+        good, units = body.get("symbol", ""), int(body.get("units", 0))
+        market = self._market_at(ship["nav"]["waypointSymbol"])
+        price = next((trade["sellPrice"] for trade in market["tradeGoods"] if trade["symbol"] == good), None)
+        if price is None:
+            raise StubError(400, f"Market does not trade {good}.", 4602)
+        self._remove_cargo(ship, good, units)
+        self.agent["credits"] += units * price
+        transaction = payloads.make_transaction(symbol, good, units, price, waypoint_symbol=market["symbol"])
+        return {"agent": self.agent, "cargo": ship["cargo"], "transaction": transaction}
+
+    def _add_cargo(self, ship: Dict[str, Any], good: str, units: int) -> None:
+        """Add units of a good to the cargo of a ship."""
+        cargo = ship["cargo"]
+        item = next((item for item in cargo["inventory"] if item["symbol"] == good), None)
+        if item is None:
+            cargo["inventory"].append(payloads.make_cargo_item(good, units))
+        else:
+            item["units"] += units
+        cargo["units"] += units
+
+    def _remove_cargo(self, ship: Dict[str, Any], good: str, units: int) -> None:
+        """Remove units of a good from the cargo of a ship, or answer 400 if it has fewer."""
+        cargo = ship["cargo"]
+        item = next((item for item in cargo["inventory"] if item["symbol"] == good), None)
+        if item is None or item["units"] < units or units < 1:
+            raise StubError(400, f"Ship {ship['symbol']} does not have {units} units of {good}.", 4219)
+        item["units"] -= units
+        cargo["units"] -= units
+        if not item["units"]:
+            cargo["inventory"].remove(item)
+
+    def _waypoint_with(self, system: str, symbol: str, trait: Optional[str] = None) -> Dict[str, Any]:
+        """Return a waypoint of a system, or answer 404, also if it lacks `trait`."""
+        waypoint = self._find(self.waypoints, symbol)
+        traits = {item["symbol"] for item in waypoint["traits"]}
+        if waypoint["systemSymbol"] != system or (trait is not None and trait not in traits):
+            raise StubError(404, f"{symbol} has no {trait or 'waypoint'} in {system}.")
+        return waypoint
+
+    def _market_at(self, symbol: str) -> Dict[str, Any]:
+        """Return the market of a waypoint, created on first visit."""
+        if symbol not in self.markets:
+            self.markets[symbol] = payloads.make_market(symbol, goods=payloads.TRADE_SYMBOLS, seed=len(self.markets))
+        return self.markets[symbol]
+
+    def _waypoint(self, system: str, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Answer a waypoint."""
+        return self._waypoint_with(system, symbol)
+
+    def _market(self, system: str, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Answer a market, with its prices and transactions only while one of your ships is there."""
+        self._waypoint_with(system, symbol, "MARKETPLACE")
+        market = self._market_at(symbol)
+        ships = (self._ship(ship_symbol)["nav"] for ship_symbol in self.ships)
+        if any(nav["waypointSymbol"] == symbol and nav["status"] != "IN_TRANSIT" for nav in ships):
+            return market
+        return {key: value for key, value in market.items() if key not in ("tradeGoods", "transactions")}
+
+    def _shipyard(self, system: str, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Answer a shipyard."""
+        self._waypoint_with(system, symbol, "SHIPYARD")
+        return payloads.make_shipyard(symbol)
+
+    def _jump_gate(self, system: str, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Answer a jump gate, connected to the gates of the neighbouring systems."""
+        waypoint = self._waypoint_with(system, symbol)
+        if waypoint["type"] != "JUMP_GATE":
+            raise StubError(404, f"{symbol} is not a jump gate.")
+        systems = list(self.systems)
+        index = systems.index(system)
+        neighbours = systems[max(0, index - 1):index] + systems[index + 1:index + 2]
+        return payloads.make_jump_gate(symbol, [gate for other in neighbours for gate in self.gates[other][:1]])
+
+    def _construction_at(self, system: str, symbol: str) -> Dict[str, Any]:
+        """Return the construction site of a jump gate, created on first visit."""
+        if self._waypoint_with(system, symbol)["type"] != "JUMP_GATE":
+            raise StubError(404, f"{symbol} is not under construction.", 4800)
+        if symbol not in self.constructions:
+            self.constructions[symbol] = payloads.make_construction(symbol)
+        return self.constructions[symbol]
+
+    def _construction(self, system: str, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Answer a construction site."""
+        return self._construction_at(system, symbol)
+
+    def _supply_construction(self, system: str, symbol: str, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        """Supply cargo of a docked ship to a construction site."""
+        construction = self._construction_at(system, symbol)
+        ship = self._ship(body.get("shipSymbol", ""))
+        self._require(ship, "DOCKED")
+        material = next(
+            (item for item in construction["materials"] if item["TradeSymbol"] == body.get("tradeSymbol")), None
+        )
+        if material is None:
+            raise StubError(400, f"Construction does not require {body.get('tradeSymbol')}.", 4801)
+        self._remove_cargo(ship, material["TradeSymbol"], int(body.get("units", 0)))
+        material["fullfilled"] = min(material["required"], material["fullfilled"] + int(body["units"]))
+        return {"construction": construction, "cargo": ship["cargo"]}
+
+
+class StubAdapter(requests.adapters.BaseAdapter):
+    """`requests` adapter answering from a `StubServer`, waiting out its latency on the calling thread."""
+
+    def __init__(self, server: StubServer) -> None:
+        """Init."""
+        super().__init__()
+        self.server = server
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        """Answer the request."""
+        delay = self.server.delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+        status, headers, content = self.server.handle(
+            request.method or "GET", request.url or "", body if isinstance(body, bytes) else None
+        )
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response.url = request.url or ""
+        response.request = request
+        response._content = content  # pylint: disable=protected-access
+        return response
+
+    def close(self) -> None:
+        """Close."""
+
+
+class StubAsyncTransport(httpx.AsyncBaseTransport):
+    """`httpx` transport answering from a `StubServer`, waiting out its latency on the event loop."""
+
+    def __init__(self, server: StubServer) -> None:
+        """Init."""
+        self.server = server
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer the request."""
+        delay = self.server.delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        status, headers, content = self.server.handle(request.method, str(request.url), await request.aread())
+        return httpx.Response(status, headers=headers, content=content, request=request)
+
+
+class StubHTTPServer:
+    """A `StubServer` answering HTTP on localhost from a background thread, e.g. for load tests across processes."""
+
+    def __init__(self, server: StubServer, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Init, binding the port; port 0 picks a free one."""
+        stub = server
+
+        class Handler(BaseHTTPRequestHandler):
+            """Request handler."""
+
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _answer(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                delay = stub.delay()
+                if delay > 0:
+                    time.sleep(delay)
+                status, headers, content = stub.handle(self.command, self.path, body)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PATCH = _answer
+
+            def log_message(self, *args: Any) -> None:  # pylint: disable=arguments-differ
+                """Stay quiet."""
+
+        self.stub = stub
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Return the API URL to give to a client."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host!s}:{port}/v2"
+
+    def __enter__(self) -> "StubHTTPServer":
+        """Start serving."""
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop serving."""
+        self.stop()
+
+    def start(self) -> None:
+        """Start serving."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,18 @@
+"""Init Tracing."""
+
+from .exporters import ConsoleExporter, InMemoryExporter, JsonLinesExporter, read_spans
+from .tracer import Span, SpanExporter, Tracer, current_span, start_span, traced
+
+
+__all__ = [
+    "ConsoleExporter",
+    "InMemoryExporter",
+    "JsonLinesExporter",
+    "Span",
+    "SpanExporter",
+    "Tracer",
+    "current_span",
+    "read_spans",
+    "start_span",
+    "traced",
+]
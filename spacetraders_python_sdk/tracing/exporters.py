@@ -0,0 +1,118 @@
+"""Span Exporters."""
+
+import json
+import sys
+import threading
+
+from os import PathLike
+from typing import Any, Dict, List, Optional, TextIO, Union
+
+from .tracer import Span
+
+
+def span_to_dict(span: Span) -> Dict[str, Any]:
+    """Return a span as a JSON-serializable dict with OpenTelemetry field names."""
+    return {
+        "name": span.name,
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "parentSpanId": span.parent_id,
+        "startTimeUnixNano": round(span.start_time * 1e9),
+        "endTimeUnixNano": None if span.end_time is None else round(span.end_time * 1e9),
+        "attributes": span.attributes,
+        "status": {"code": "ERROR", "message": span.error} if span.error is not None else {"code": "OK"},
+    }
+
+
+def span_from_dict(data: Dict[str, Any]) -> Span:
+    """Return the span of a dict written by `span_to_dict`."""
+    end = data["endTimeUnixNano"]
+    return Span(
+        name=data["name"],
+        trace_id=data["traceId"],
+        span_id=data["spanId"],
+        parent_id=data["parentSpanId"],
+        start_time=data["startTimeUnixNano"] / 1e9,
+        end_time=None if end is None else end / 1e9,
+        attributes=data["attributes"],
+        error=data["status"].get("message"),
+    )
+
+
+def read_spans(path: Union[str, PathLike]) -> List[Span]:
+    """Read the spans a `JsonLinesExporter` wrote, for offline analysis."""
+    with open(path, encoding="utf-8") as file:
+        return [span_from_dict(json.loads(line)) for line in file if line.strip()]
+
+
+class InMemoryExporter:
+    """Keep every span in `spans`, in the order they ended."""
+
+    def __init__(self) -> None:
+        """Init."""
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Keep a span."""
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self) -> None:
+        """Forget every span."""
+        with self._lock:
+            self.spans.clear()
+
+
+class ConsoleExporter:
+    """Write one line per span to a stream, stderr by default: trace, span and parent ids, duration, name."""
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """Init."""
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Write a span."""
+        attributes = " ".join(f"{name}={value}" for name, value in span.attributes.items())
+        error = f" ERROR {span.error}" if span.error is not None else ""
+        line = (
+            f"{span.trace_id[:8]} {span.span_id} {span.parent_id or '-':>16} "
+            f"{(span.duration or 0.0) * 1000:10.3f} ms  {span.name} {attributes}{error}".rstrip()
+        )
+        with self._lock:
+            print(line, file=self.stream or sys.stderr)
+
+
+class JsonLinesExporter:
+    """Append every span to a file as one JSON object per line; read them back with `read_spans`."""
+
+    def __init__(self, path: Union[str, PathLike]) -> None:
+        """Init."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+
+    def __enter__(self) -> "JsonLinesExporter":
+        """Enter."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit, closing the file."""
+        self.close()
+
+    def export(self, span: Span) -> None:
+        """Write a span."""
+        line = json.dumps(span_to_dict(span), separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def flush(self) -> None:
+        """Write buffered spans to disk."""
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the file."""
+        with self._lock:
+            self._file.close()
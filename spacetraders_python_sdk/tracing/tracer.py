@@ -0,0 +1,164 @@
+"""Tracer."""
+
+import contextlib
+import contextvars
+import functools
+import inspect
+import random
+import time
+
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    Optional,
+    Protocol,
+    TypeVar,
+)
+
+
+ClassT = TypeVar("ClassT", bound=type)
+
+Attribute = str | int | float | bool
+
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("spacetraders_span", default=None)
+_NO_SPAN: ContextManager[None] = contextlib.nullcontext()
+
+
+class SpanExporter(Protocol):
+    """Receives every span once it has ended."""
+
+    def export(self, span: "Span") -> None:
+        """Export a span."""
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace, with the span it is a child of, like an OpenTelemetry span."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_time: float
+    end_time: Optional[float] = None
+    attributes: Dict[str, Attribute] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Return how many seconds the span lasted, once it has ended."""
+        return None if self.end_time is None else self.end_time - self.start_time
+
+    def set_attribute(self, name: str, value: Attribute) -> None:
+        """Set an attribute."""
+        self.attributes[name] = value
+
+    def set_error(self, error: str) -> None:
+        """Mark the span as failed."""
+        self.error = error
+
+
+def current_span() -> Optional[Span]:
+    """Return the span open in the current thread or task, if any."""
+    return _current.get()
+
+
+class Tracer:
+    """Emit nested spans to an exporter.
+
+    Spans opened while another is open in the same thread or task become its children, so a subclient call
+    traced with `traced` holds the spans of its rate limiter waits, HTTP attempts, retry backoffs and response
+    validation. Clients trace nothing unless given a tracer, so the default costs one attribute check per call.
+    """
+
+    def __init__(self, exporter: SpanExporter, clock: Callable[[], float] = time.time) -> None:
+        """Init."""
+        self.exporter = exporter
+        self.clock = clock
+
+    @contextlib.contextmanager
+    def start_span(self, name: str, **attributes: Attribute) -> Iterator[Span]:
+        """Open a span for the duration of the block, as a child of the current span. Exceptions mark it failed."""
+        parent = _current.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else f"{random.getrandbits(128):032x}",
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent.span_id if parent else None,
+            start_time=self.clock(),
+            attributes=attributes,
+        )
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.set_error(f"{type(error).__name__}: {error}")
+            raise
+        finally:
+            _current.reset(token)
+            span.end_time = self.clock()
+            self.exporter.export(span)
+
+
+def start_span(tracer: Optional[Tracer], name: str, **attributes: Attribute) -> ContextManager[Any]:
+    """Open a span with `tracer`, or do nothing, at the cost of one call, if there is none."""
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.start_span(name, **attributes)
+
+
+def _attributes(arguments: Dict[str, Any]) -> Dict[str, Attribute]:
+    """Return the arguments of a call that can be span attributes."""
+    return {name: value for name, value in arguments.items() if isinstance(value, (str, int, float, bool))}
+
+
+def _record_result(span: Span, result: Any) -> None:
+    """Mark the span of a subclient call as failed if it returned an error message."""
+    if isinstance(result, tuple) and len(result) == 2 and result[1] is None and isinstance(result[0], str):
+        span.set_error(result[0])
+
+
+def traced(cls: ClassT) -> ClassT:
+    """Wrap every public method of a subclient in a span named after it, emitted by the tracer of its session.
+
+    Keyword arguments of simple types become span attributes, and a `(message, None)` result marks the span
+    as failed.
+    """
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(method):
+            continue
+        setattr(cls, name, _trace_method(f"{cls.__name__}.{name}", method))
+    return cls
+
+
+def _trace_method(span_name: str, method: Callable) -> Callable:
+    """Wrap one method."""
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            tracer = getattr(self.session, "tracer", None)
+            if tracer is None:
+                return await method(self, *args, **kwargs)
+            with tracer.start_span(span_name, **_attributes(kwargs)) as span:
+                result = await method(self, *args, **kwargs)
+                _record_result(span, result)
+                return result
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        tracer = getattr(self.session, "tracer", None)
+        if tracer is None:
+            return method(self, *args, **kwargs)
+        with tracer.start_span(span_name, **_attributes(kwargs)) as span:
+            result = method(self, *args, **kwargs)
+            _record_result(span, result)
+            return result
+
+    return wrapper
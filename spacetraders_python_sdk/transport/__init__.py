@@ -0,0 +1,35 @@
+"""Init Transport."""
+
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_getattr
+from .coalescing import AsyncSingleFlight, SingleFlight
+from .parsing import parse_response
+from .rate_limiter import RateLimitBudget, RateLimiter
+from .retry import RetryPolicy
+
+
+if TYPE_CHECKING:
+    from .async_session import AsyncSpaceTradersSession
+    from .session import SpaceTradersSession
+
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "AsyncSpaceTradersSession": ".async_session",
+        "SpaceTradersSession": ".session",
+    },
+)
+
+
+__all__ = [
+    "AsyncSingleFlight",
+    "AsyncSpaceTradersSession",
+    "RateLimitBudget",
+    "RateLimiter",
+    "RetryPolicy",
+    "SingleFlight",
+    "SpaceTradersSession",
+    "parse_response",
+]
@@ -0,0 +1,117 @@
+"""Async Session."""
+
+import asyncio
+import time
+
+from typing import Any, Optional
+
+import httpx
+
+from ..metrics.hooks import MetricsHooks, endpoint_template
+from ..tracing.tracer import Tracer, start_span
+from .coalescing import AsyncSingleFlight
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+
+
+class AsyncSpaceTradersSession(httpx.AsyncClient):
+    """Async session every async subclient routes its requests through.
+
+    Identical GETs sent while one is already in flight share its response, every attempt is reported to the
+    `metrics` hooks and traced by `tracer`, if given, like `SpaceTradersSession`.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        coalesce_gets: bool = True,
+        metrics: Optional[MetricsHooks] = None,
+        tracer: Optional[Tracer] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Init."""
+        super().__init__(**kwargs)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.coalesce_gets = coalesce_gets
+        self.metrics = metrics
+        self.tracer = tracer
+        self.single_flight = AsyncSingleFlight()
+
+    async def request(  # type: ignore[override]
+        self,
+        method: str,
+        url: httpx.URL | str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send the request, sharing the response of an identical GET already in flight."""
+        if self.coalesce_gets and method.upper() == "GET":
+            return await self.single_flight.do(
+                ("GET", str(url), repr(sorted(kwargs.items()))),
+                lambda: self.send_with_retries(method, url, **kwargs),
+            )
+
+        return await self.send_with_retries(method, url, **kwargs)
+
+    async def send_with_retries(
+        self,
+        method: str,
+        url: httpx.URL | str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Wait for a rate limit slot, then send the request, retrying it as the retry policy allows."""
+        endpoint = endpoint_template(str(url)) if self.metrics or self.tracer else ""
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                with start_span(self.tracer, "rate_limiter.wait"):
+                    await self.rate_limiter.acquire_async()
+
+            start = time.perf_counter()
+            try:
+                with start_span(self.tracer, "http.request", method=method, endpoint=endpoint, attempt=attempt) as span:
+                    response = await super().request(method, url, **kwargs)
+                    if span:
+                        span.set_attribute("status_code", response.status_code)
+            except httpx.TransportError:
+                if self.metrics:
+                    self.metrics.on_request(method, endpoint, None, time.perf_counter() - start, 0, 0)
+                if not self.retry_policy or not self.retry_policy.should_retry(method, str(url), None, attempt):
+                    raise
+                if self.metrics:
+                    self.metrics.on_retry(method, endpoint, None)
+                delay = self.retry_policy.get_delay(attempt, None, None)
+                with start_span(self.tracer, "retry.backoff", attempt=attempt, delay=delay):
+                    await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            if self.metrics:
+                self._measure(method, endpoint, response, time.perf_counter() - start)
+            if self.tracer:
+                response.__dict__["_spacetraders_tracer"] = self.tracer
+
+            if not self.retry_policy or not self.retry_policy.should_retry(
+                method, str(url), response.status_code, attempt
+            ):
+                return response
+
+            if self.metrics:
+                self.metrics.on_retry(method, endpoint, response.status_code)
+            delay = self.retry_policy.get_delay(attempt, response.status_code, response.headers)
+            with start_span(
+                self.tracer, "retry.backoff", attempt=attempt, delay=delay, status_code=response.status_code
+            ):
+                if response.status_code == 429 and self.rate_limiter:
+                    self.rate_limiter.pause(delay)
+                else:
+                    await asyncio.sleep(delay)
+            attempt += 1
+
+    def _measure(self, method: str, endpoint: str, response: httpx.Response, seconds: float) -> None:
+        """Report an attempt to the metrics hooks, and tag the response so its validation time is reported too."""
+        self.metrics.on_request(  # type: ignore[union-attr]
+            method, endpoint, response.status_code, seconds, len(response.request.content), len(response.content)
+        )
+        response.__dict__["_spacetraders_metrics"] = (self.metrics, method, endpoint)
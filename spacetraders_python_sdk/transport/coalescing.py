@@ -0,0 +1,112 @@
+"""Request Coalescing."""
+
+import asyncio
+import threading
+
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+
+ResultT = TypeVar("ResultT")
+
+
+class _Call(Generic[ResultT]):
+    """One in-flight call and the callers waiting for it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[ResultT] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Share one call between the threads asking for the same key at the same time.
+
+    The first caller runs the call; callers arriving while it is in flight wait and get the same result,
+    or the same exception. Once the call returns, the next caller starts a new one.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.shared = 0
+
+    def do(self, key: Hashable, call: Callable[[], ResultT]) -> ResultT:
+        """Run `call`, unless an identical one is already in flight."""
+        with self._lock:
+            in_flight = self._calls.get(key)
+            if in_flight is None:
+                in_flight = self._calls[key] = _Call()
+                leader = True
+            else:
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.result  # type: ignore[return-value]
+
+        try:
+            in_flight.result = call()
+            return in_flight.result
+        except BaseException as error:
+            in_flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            in_flight.done.set()
+
+
+class _AsyncCall:
+    """One in-flight call, running in its own task, and how many callers are awaiting it."""
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """Share one call between the tasks asking for the same key at the same time.
+
+    Behaves like `SingleFlight` on a single event loop. The call runs in a task of its own, so a caller that is
+    cancelled only stops waiting; the call is cancelled once no caller is left waiting for it.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+        self._calls: Dict[Hashable, _AsyncCall] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[ResultT]]) -> ResultT:
+        """Await `call`, unless an identical one is already in flight."""
+        in_flight = self._calls.get(key)
+        if in_flight is None:
+            in_flight = self._calls[key] = _AsyncCall(asyncio.ensure_future(self._run(key, call)))
+        else:
+            self.shared += 1
+
+        in_flight.waiters += 1
+        try:
+            result: Any = await asyncio.shield(in_flight.task)
+            return result
+        finally:
+            in_flight.waiters -= 1
+            if not in_flight.waiters and not in_flight.task.done():
+                self._forget(key, in_flight.task)
+                in_flight.task.cancel()
+
+    async def _run(self, key: Hashable, call: Callable[[], Awaitable[ResultT]]) -> ResultT:
+        """Await the shared call, then let the next caller start a new one."""
+        try:
+            return await call()
+        finally:
+            self._forget(key, asyncio.current_task())
+
+    def _forget(self, key: Hashable, task: Optional[asyncio.Future]) -> None:
+        """Stop sharing the call of `task`, unless a newer call for the key replaced it."""
+        in_flight = self._calls.get(key)
+        if in_flight is not None and in_flight.task is task:
+            del self._calls[key]
@@ -0,0 +1,39 @@
+"""Response Parsing."""
+
+import threading
+import time
+
+from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar
+
+from ..tracing.tracer import start_span
+
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+ModelT = TypeVar("ModelT", bound="BaseModel")
+
+
+def parse_response(schema: Type[ModelT], response: Any) -> ModelT:
+    """Validate the body of a `requests` or `httpx` response against `schema`.
+
+    The raw body bytes go straight to pydantic-core's JSON parser, skipping the intermediate dicts and lists
+    `response.json()` would build only for the model to walk them again.
+    The parsed model is kept on the response, so callers sharing a coalesced response share one parsed model
+    instead of validating the same body again. Treat it as read-only.
+    The validation time is reported to the metrics hooks and traced by the tracer of the session that got the
+    response, if it has any.
+    """
+    with response.__dict__.setdefault("_spacetraders_parse_lock", threading.Lock()):
+        parsed: Dict[type, "BaseModel"] = response.__dict__.setdefault("_spacetraders_parsed", {})
+        model = parsed.get(schema)
+        if model is None:
+            start = time.perf_counter()
+            with start_span(response.__dict__.get("_spacetraders_tracer"), "validate", schema=schema.__name__):
+                model = parsed[schema] = schema.model_validate_json(response.content)
+            metrics = response.__dict__.get("_spacetraders_metrics")
+            if metrics is not None:
+                hooks, method, endpoint = metrics
+                hooks.on_parse(method, endpoint, schema.__name__, time.perf_counter() - start)
+    return model  # type: ignore[return-value]
@@ -0,0 +1,107 @@
+"""Rate Limiter."""
+
+import asyncio
+import threading
+import time
+
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class RateLimitBudget:
+    """Snapshot of the client-side rate limit budget."""
+
+    sustained: float
+    burst: float
+    wait: float
+
+
+class RateLimiter:
+    """Token bucket matching the SpaceTraders static and burst limits.
+
+    Requests draw from a sustained bucket refilled at `rate` per second. When it is empty they draw from a burst
+    pool of `burst` requests refilled over `burst_duration` seconds. When both are empty the request reserves the
+    next sustained slot and the caller waits for it, so callers queue up in order instead of being bounced.
+    """
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: int = 30,
+        burst_duration: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Init."""
+        self.rate = rate
+        self.burst = burst
+        self.burst_duration = burst_duration
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(rate)
+        self._burst_tokens = float(burst)
+        self._paused_until = 0.0
+        self._updated = clock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(float(self.rate), self._tokens + elapsed * self.rate)
+        if self.burst_duration > 0:
+            self._burst_tokens = min(
+                float(self.burst),
+                self._burst_tokens + elapsed * self.burst / self.burst_duration,
+            )
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Reserve a request slot and return how many seconds to wait before sending it."""
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            paused = max(0.0, self._paused_until - now)
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return paused
+
+            if self._burst_tokens >= 1:
+                self._burst_tokens -= 1
+                return paused
+
+            delay = (1 - self._tokens) / self.rate
+            self._tokens -= 1
+            return max(delay, paused)
+
+    def acquire(self) -> float:
+        """Block until a request slot is available and return the time waited."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Wait on the event loop until a request slot is available and return the time waited."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for the next `seconds`, e.g. after the server answered 429."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self.clock() + seconds)
+
+    def budget(self) -> RateLimitBudget:
+        """Return the current budget so schedulers can plan around it."""
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            if self._tokens >= 1 or self._burst_tokens >= 1:
+                wait = 0.0
+            else:
+                wait = (1 - self._tokens) / self.rate
+            return RateLimitBudget(
+                sustained=max(0.0, self._tokens),
+                burst=self._burst_tokens,
+                wait=max(wait, self._paused_until - now, 0.0),
+            )
@@ -0,0 +1,97 @@
+"""Retry Policy."""
+
+import random
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable, Mapping, Optional
+from urllib.parse import urlsplit
+
+
+class RetryPolicy:
+    """Decide whether and when a failed request is sent again.
+
+    Rate limited requests (429) wait for the server's `Retry-After` or `x-ratelimit-reset` header.
+    Gateway errors (502, 503, 504) and connection errors back off exponentially with full jitter.
+    Only idempotent requests are retried: every GET, plus the POST endpoints listed in `idempotent_paths`,
+    so actions such as `sell_cargo` or `deliver_cargo_to_contract` are never sent twice.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: Iterable[int] = (429, 502, 503, 504),
+        idempotent_methods: Iterable[str] = ("GET", "HEAD", "OPTIONS"),
+        idempotent_paths: Iterable[str] = ("/orbit", "/dock"),
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        """Init."""
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(method.upper() for method in idempotent_methods)
+        self.idempotent_paths = tuple(idempotent_paths)
+        self.jitter = jitter
+
+    def is_idempotent(self, method: str, url: str) -> bool:
+        """Return whether sending the request twice has the same effect as sending it once."""
+        if method.upper() in self.idempotent_methods:
+            return True
+
+        return urlsplit(url).path.rstrip("/").endswith(self.idempotent_paths)
+
+    def should_retry(self, method: str, url: str, status_code: Optional[int], attempt: int) -> bool:
+        """Return whether to send the request again after `attempt` retries.
+
+        `status_code` is None when the request failed before getting a response.
+        """
+        if attempt >= self.max_retries:
+            return False
+
+        if status_code is not None and status_code not in self.retry_statuses:
+            return False
+
+        return self.is_idempotent(method, url)
+
+    def backoff(self, attempt: int) -> float:
+        """Return an exponential backoff with full jitter for the given retry attempt."""
+        return self.jitter() * min(self.backoff_max, self.backoff_base * 2**attempt)
+
+    def get_delay(self, attempt: int, status_code: Optional[int], headers: Optional[Mapping[str, str]]) -> float:
+        """Return how many seconds to wait before the next attempt."""
+        if status_code == 429 and headers:
+            delay = self.parse_reset(headers)
+            if delay is not None:
+                return min(self.backoff_max, delay)
+
+        return self.backoff(attempt)
+
+    @staticmethod
+    def parse_reset(headers: Mapping[str, str]) -> Optional[float]:
+        """Read the server's `Retry-After` or `x-ratelimit-reset` header, in seconds from now."""
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    reset = parsedate_to_datetime(retry_after)
+                except (TypeError, ValueError):
+                    reset = None
+                if reset:
+                    if reset.tzinfo is None:
+                        reset = reset.replace(tzinfo=timezone.utc)
+                    return max(0.0, (reset - datetime.now(timezone.utc)).total_seconds())
+
+        ratelimit_reset = headers.get("x-ratelimit-reset")
+        if ratelimit_reset:
+            try:
+                reset = datetime.fromisoformat(ratelimit_reset.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+            return max(0.0, (reset - datetime.now(timezone.utc)).total_seconds())
+
+        return None
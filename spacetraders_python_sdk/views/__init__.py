@@ -0,0 +1,22 @@
+"""Init Views."""
+
+from .views import (
+    MarketTradeGoodView,
+    ShipCargoItemView,
+    ShipCargoView,
+    ShipCooldownView,
+    ShipFuelView,
+    ShipNavView,
+    ShipView,
+)
+
+
+__all__ = [
+    "MarketTradeGoodView",
+    "ShipCargoItemView",
+    "ShipCargoView",
+    "ShipCooldownView",
+    "ShipFuelView",
+    "ShipNavView",
+    "ShipView",
+]
@@ -0,0 +1,245 @@
+"""Read Views.
+
+Compact, immutable views of the objects a long-running bot keeps in memory for its whole fleet.
+They use `__slots__`, keep only the fields read in hot loops, under the same names as the schemas,
+and share one interned string per symbol. They are built from the pydantic models, or from the raw JSON
+of the API without validating it through pydantic first.
+"""
+
+import json
+import sys
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+from ..models import enum_value
+
+
+if TYPE_CHECKING:
+    from ..models.models import (
+        MarketTradeGoodSchema,
+        ShipCargoSchema,
+        ShipNavSchema,
+        ShipSchema,
+    )
+
+
+RawJSON = Union[Dict[str, Any], str, bytes]
+
+
+def _load(data: RawJSON) -> Dict[str, Any]:
+    """Decode raw JSON, unwrapping the `data` envelope of a response body."""
+    loaded: Dict[str, Any] = json.loads(data) if isinstance(data, (str, bytes)) else data
+    if isinstance(loaded.get("data"), dict):
+        return loaded["data"]
+    return loaded
+
+
+def _symbol(value: Any) -> str:
+    """Return an enum member or string as one shared interned string."""
+    return sys.intern(enum_value(value))
+
+
+@dataclass(frozen=True, slots=True)
+class ShipNavView:
+    """Where a ship is, or where it is going."""
+
+    systemSymbol: str
+    waypointSymbol: str
+    status: str
+    flightMode: str
+    originSymbol: str
+    destinationSymbol: str
+    departureTime: str
+    arrival: str
+
+    @classmethod
+    def from_model(cls, nav: "ShipNavSchema") -> "ShipNavView":
+        """Build the view of a `ShipNavSchema`."""
+        return cls(
+            systemSymbol=_symbol(nav.systemSymbol),
+            waypointSymbol=_symbol(nav.waypointSymbol),
+            status=_symbol(nav.status),
+            flightMode=_symbol(nav.flightMode),
+            originSymbol=_symbol(nav.route.origin.symbol),
+            destinationSymbol=_symbol(nav.route.destination.symbol),
+            departureTime=nav.route.departureTime,
+            arrival=nav.route.arrival,
+        )
+
+    @classmethod
+    def from_json(cls, data: RawJSON) -> "ShipNavView":
+        """Build the view of a ship nav from raw JSON."""
+        nav = _load(data)
+        route = nav["route"]
+        return cls(
+            systemSymbol=_symbol(nav["systemSymbol"]),
+            waypointSymbol=_symbol(nav["waypointSymbol"]),
+            status=_symbol(nav["status"]),
+            flightMode=_symbol(nav.get("flightMode", "CRUISE")),
+            originSymbol=_symbol(route["origin"]["symbol"]),
+            destinationSymbol=_symbol(route["destination"]["symbol"]),
+            departureTime=route["departureTime"],
+            arrival=route["arrival"],
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ShipCargoItemView:
+    """Units of one good in a cargo hold."""
+
+    symbol: str
+    units: int
+
+
+@dataclass(frozen=True, slots=True)
+class ShipCargoView:
+    """What a ship carries."""
+
+    capacity: int
+    units: int
+    inventory: Tuple[ShipCargoItemView, ...]
+
+    @property
+    def available(self) -> int:
+        """Return the free room in the cargo hold."""
+        return self.capacity - self.units
+
+    def units_of(self, symbol: Any) -> int:
+        """Return the units of the good `symbol` in the cargo hold."""
+        symbol = _symbol(symbol)
+        return next((item.units for item in self.inventory if item.symbol == symbol), 0)
+
+    @classmethod
+    def from_model(cls, cargo: "ShipCargoSchema") -> "ShipCargoView":
+        """Build the view of a `ShipCargoSchema`."""
+        return cls(
+            capacity=cargo.capacity,
+            units=cargo.units,
+            inventory=tuple(
+                ShipCargoItemView(_symbol(item.symbol), item.units)
+                for item in cargo.inventory
+            ),
+        )
+
+    @classmethod
+    def from_json(cls, data: RawJSON) -> "ShipCargoView":
+        """Build the view of a ship cargo from raw JSON."""
+        cargo = _load(data)
+        return cls(
+            capacity=cargo["capacity"],
+            units=cargo.get("units", 0),
+            inventory=tuple(
+                ShipCargoItemView(_symbol(item["symbol"]), item["units"])
+                for item in cargo["inventory"]
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ShipFuelView:
+    """The fuel tanks of a ship."""
+
+    current: int
+    capacity: int
+
+
+@dataclass(frozen=True, slots=True)
+class ShipCooldownView:
+    """The reactor cooldown of a ship."""
+
+    remainingSeconds: int
+    expiration: str
+
+
+@dataclass(frozen=True, slots=True)
+class ShipView:
+    """A ship, reduced to its state and to the equipment deciding what it can do.
+
+    Names, descriptions, crew, and the condition and requirements of components are left out.
+    """
+
+    symbol: str
+    role: str
+    nav: ShipNavView
+    cargo: ShipCargoView
+    fuel: ShipFuelView
+    cooldown: ShipCooldownView
+    frameSymbol: str
+    engineSpeed: int
+    modules: Tuple[str, ...]
+    mounts: Tuple[str, ...]
+
+    @classmethod
+    def from_model(cls, ship: "ShipSchema") -> "ShipView":
+        """Build the view of a `ShipSchema`."""
+        return cls(
+            symbol=ship.symbol,
+            role=_symbol(ship.registration.role),
+            nav=ShipNavView.from_model(ship.nav),
+            cargo=ShipCargoView.from_model(ship.cargo),
+            fuel=ShipFuelView(ship.fuel.current, ship.fuel.capacity),
+            cooldown=ShipCooldownView(ship.cooldown.remainingSeconds, ship.cooldown.expiration),
+            frameSymbol=_symbol(ship.frame.symbol),
+            engineSpeed=ship.engine.speed,
+            modules=tuple(_symbol(module.symbol) for module in ship.modules),
+            mounts=tuple(_symbol(mount.symbol) for mount in ship.mounts),
+        )
+
+    @classmethod
+    def from_json(cls, data: RawJSON) -> "ShipView":
+        """Build the view of a ship from raw JSON."""
+        ship = _load(data)
+        cooldown = ship["cooldown"]
+        return cls(
+            symbol=ship["symbol"],
+            role=_symbol(ship["registration"]["role"]),
+            nav=ShipNavView.from_json(ship["nav"]),
+            cargo=ShipCargoView.from_json(ship["cargo"]),
+            fuel=ShipFuelView(ship["fuel"]["current"], ship["fuel"]["capacity"]),
+            cooldown=ShipCooldownView(cooldown["remainingSeconds"], cooldown.get("expiration", "")),
+            frameSymbol=_symbol(ship["frame"]["symbol"]),
+            engineSpeed=ship["engine"]["speed"],
+            modules=tuple(_symbol(module["symbol"]) for module in ship["modules"]),
+            mounts=tuple(_symbol(mount["symbol"]) for mount in ship["mounts"]),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MarketTradeGoodView:
+    """The price of one good at a market."""
+
+    symbol: str
+    type: str
+    tradeVolume: int
+    supply: str
+    activity: Optional[str]
+    purchasePrice: int
+    sellPrice: int
+
+    @classmethod
+    def from_model(cls, good: "MarketTradeGoodSchema") -> "MarketTradeGoodView":
+        """Build the view of a `MarketTradeGoodSchema`."""
+        return cls(
+            symbol=_symbol(good.symbol),
+            type=_symbol(good.type),
+            tradeVolume=good.tradeVolume,
+            supply=_symbol(good.supply),
+            activity=_symbol(good.activity) if good.activity is not None else None,
+            purchasePrice=good.purchasePrice,
+            sellPrice=good.sellPrice,
+        )
+
+    @classmethod
+    def from_json(cls, data: RawJSON) -> "MarketTradeGoodView":
+        """Build the view of a market trade good from raw JSON."""
+        good = _load(data)
+        return cls(
+            symbol=_symbol(good["symbol"]),
+            type=_symbol(good["type"]),
+            tradeVolume=good["tradeVolume"],
+            supply=_symbol(good["supply"]),
+            activity=_symbol(good["activity"]) if good.get("activity") is not None else None,
+            purchasePrice=good["purchasePrice"],
+            sellPrice=good["sellPrice"],
+        )
@@ -0,0 +1,81 @@
+"""Shared fixtures."""
+
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from spacetraders_python_sdk import SpaceTradersClient
+from spacetraders_python_sdk.transport import RateLimiter, RetryPolicy
+
+
+class ScriptedAdapter(requests.adapters.BaseAdapter):
+    """Adapter answering with the scripted status codes, then from `answer`.
+
+    `answer(method, path)` returns the body, or the status and body, for a path below `/v2`; it defaults to an
+    empty 200. A scripted `None` drops the connection. Every answer takes `delay` seconds and carries `headers`.
+    `sent` lists the requests as "METHOD path", and `most_in_flight` is the most answered at once.
+    """
+
+    def __init__(self, answer=None, statuses=(), headers=None, delay=0.0) -> None:
+        """Init."""
+        super().__init__()
+        self.answer = answer or (lambda method, path: {})
+        self.statuses = list(statuses)
+        self.headers = headers or {}
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.sent: list = []
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    def send(self, request, **kwargs):
+        """Answer the request."""
+        path = request.path_url.split("/v2", 1)[-1]
+        with self.lock:
+            self.sent.append(f"{request.method} {path}")
+            scripted = bool(self.statuses)
+            status = self.statuses.pop(0) if scripted else None
+            self.in_flight += 1
+            self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+
+        if scripted and status is None:
+            raise requests.exceptions.ConnectionError("reset by peer")
+        answer = self.answer(request.method, path)
+        answered_status, body = answer if isinstance(answer, tuple) else (200, answer)
+        response = requests.Response()
+        response.status_code = status if scripted else answered_status
+        response.headers.update(self.headers)
+        response.request = request
+        response._content = json.dumps(body).encode()
+        return response
+
+    def close(self):
+        """Close."""
+
+
+@pytest.fixture(name="scripted_client")
+def scripted_client_fixture():
+    """Return a factory of clients answered by a `ScriptedAdapter`, without backoff sleeps or client-side rate limit.
+
+    The factory takes the arguments of the adapter, and options of the client overriding these defaults; it
+    returns the client and its adapter.
+    """
+
+    def make(answer=None, statuses=(), headers=None, delay=0.0, **options):
+        adapter = ScriptedAdapter(answer, statuses, headers, delay)
+        options = {
+            "rate_limiter": RateLimiter(rate=1e6, burst=0),
+            "retry_policy": RetryPolicy(backoff_base=0),
+            **options,
+        }
+        client = SpaceTradersClient(token="token", api_url="http://stub/v2", **options)
+        client.session.mount("http://", adapter)
+        return client, adapter
+
+    return make
@@ -0,0 +1,81 @@
+"""Test Async Client."""
+
+import asyncio
+import json
+
+import httpx
+
+from spacetraders_python_sdk import AsyncSpaceTradersClient
+
+
+AGENT = {
+    "accountId": "account-1",
+    "symbol": "BILLY1",
+    "headquarters": "X1-GJ54-A1",
+    "credits": 175000,
+    "startingFaction": "COSMIC",
+    "shipCount": 2,
+}
+
+
+def stub_handler(request: httpx.Request) -> httpx.Response:
+    """Answer like the SpaceTraders API for the few routes used below."""
+    match request.method, request.url.path:
+        case "GET", "/v2/my/agent":
+            return httpx.Response(200, json={"data": AGENT})
+        case "GET", "/v2/agents":
+            page = int(request.url.params["page"])
+            limit = int(request.url.params["limit"])
+            return httpx.Response(200, json={"data": [AGENT], "meta": {"total": 1, "page": page, "limit": limit}})
+        case "POST", "/v2/my/ships/BILLY1-1/orbit":
+            return httpx.Response(400, json={"error": {"message": "Ship is in transit.", "code": 4214}})
+    return httpx.Response(404, json={"error": {"message": "Not found.", "code": 404}})
+
+
+def make_client() -> AsyncSpaceTradersClient:
+    """Build a client served by the local stub."""
+    return AsyncSpaceTradersClient(
+        token="token",
+        api_url="https://api.spacetraders.io/v2",
+        transport=httpx.MockTransport(stub_handler),
+    )
+
+
+def test_get_agent():
+    """Tests."""
+
+    async def run():
+        async with make_client() as client:
+            return await client.agents.get_agent()
+
+    error, result = asyncio.run(run())
+
+    if not result:
+        raise Exception(error)
+
+    assert result.data.symbol == "BILLY1"
+
+
+def test_list_agents_concurrently():
+    """Tests."""
+
+    async def run():
+        async with make_client() as client:
+            return await asyncio.gather(*(client.agents.list_agents(page=page) for page in range(1, 11)))
+
+    results = asyncio.run(run())
+
+    assert [result.meta.page for _, result in results] == list(range(1, 11))
+
+
+def test_orbit_ship_error():
+    """Tests."""
+
+    async def run():
+        async with make_client() as client:
+            return await client.fleet.orbit_ship(ship_symbol="BILLY1-1")
+
+    error, result = asyncio.run(run())
+
+    assert result is None
+    assert json.loads(error.removeprefix("Unknown error: "))["error"]["code"] == 4214
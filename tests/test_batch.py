@@ -0,0 +1,102 @@
+"""Test Batch."""
+
+import asyncio
+
+import httpx
+
+from spacetraders_python_sdk import AsyncSpaceTradersClient
+from spacetraders_python_sdk.fleet.batch import run_batch
+from spacetraders_python_sdk.testing import payloads
+
+
+def answer(method, path):
+    """Return the status and body the server answers; SHIP-2 is broken down."""
+    ship_symbol, action = path.split("/")[3:5]
+    if ship_symbol == "SHIP-2":
+        return 400, {"error": {"message": "Ship is damaged.", "code": 4236}}
+
+    bodies = {
+        "orbit": {"nav": payloads.make_nav("X1-GJ54", "X1-GJ54-A1")},
+        "dock": {"nav": payloads.make_nav("X1-GJ54", "X1-GJ54-A1", status="DOCKED")},
+        "refuel": {
+            "agent": payloads.make_agent(),
+            "fuel": payloads.make_fuel(),
+            "transaction": payloads.make_transaction(ship_symbol, "FUEL", 1, 72, transaction_type="PURCHASE"),
+        },
+        "navigate": {
+            "nav": payloads.make_nav("X1-GJ54", "X1-GJ54-A1", status="IN_TRANSIT"),
+            "fuel": payloads.make_fuel(current=350),
+            "events": [],
+        },
+    }
+    return 200, {"data": bodies[action]}
+
+
+def test_batch_reports_each_ship_and_keeps_going(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(answer, delay=0.02)
+
+    result = client.fleet.orbit_ships(ship_symbols=["SHIP-3", "SHIP-2", "SHIP-1", "SHIP-3"], max_workers=3)
+
+    assert list(result.results) == ["SHIP-3", "SHIP-2", "SHIP-1"]
+    assert len(result) == 3
+    assert not result.ok
+    assert set(result.succeeded) == {"SHIP-1", "SHIP-3"}
+    assert result.succeeded["SHIP-1"].data.nav.status == "IN_ORBIT"
+    assert list(result.errors) == ["SHIP-2"]
+    assert "Ship is damaged." in result.errors["SHIP-2"]
+    assert len(adapter.sent) == 3
+    assert adapter.most_in_flight > 1
+
+
+def test_batches_chain_on_succeeded_ships(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(answer, delay=0.02)
+
+    docked = client.fleet.dock_ships(ship_symbols=["SHIP-1", "SHIP-2", "SHIP-3"])
+    refueled = client.fleet.refuel_ships(ship_symbols=list(docked.succeeded), units=72)
+    navigated = client.fleet.navigate_ships(destinations={"SHIP-1": "X1-GJ54-B2", "SHIP-3": "X1-GJ54-C3"})
+
+    assert refueled.ok and navigated.ok
+    assert refueled.succeeded["SHIP-3"].data.transaction.units == 1
+    assert "POST /my/ships/SHIP-2/refuel" not in adapter.sent
+    assert navigated.succeeded["SHIP-1"].data.nav.status == "IN_TRANSIT"
+
+
+def test_batch_turns_exceptions_into_errors():
+    """Tests."""
+
+    def action(ship_symbol):
+        if ship_symbol == "SHIP-2":
+            raise ConnectionError("reset by peer")
+        return "ok", ship_symbol
+
+    result = run_batch(action, ["SHIP-1", "SHIP-2"])
+
+    assert result.succeeded == {"SHIP-1": "SHIP-1"}
+    assert result.errors == {"SHIP-2": "ConnectionError: reset by peer"}
+
+
+def test_async_batch():
+    """Tests."""
+    in_flight = []
+
+    async def handler(request):
+        in_flight.append(1)
+        await asyncio.sleep(0.01)
+        status, body = answer(request.method, request.url.path.removeprefix("/v2"))
+        return httpx.Response(status, json=body)
+
+    async def run():
+        async with AsyncSpaceTradersClient(
+            token="token",
+            api_url="http://stub/v2",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return await client.fleet.orbit_ships(ship_symbols=["SHIP-1", "SHIP-2", "SHIP-3"], max_workers=2)
+
+    result = asyncio.run(run())
+    assert list(result.results) == ["SHIP-1", "SHIP-2", "SHIP-3"]
+    assert set(result.succeeded) == {"SHIP-1", "SHIP-3"}
+    assert list(result.errors) == ["SHIP-2"]
+    assert len(in_flight) == 3
@@ -0,0 +1,77 @@
+"""Test Benchmarks."""
+
+import json
+
+import pytest
+
+from benchmarks import bench_memory, bench_schemas, bench_sync, bench_throughput
+from benchmarks.harness import Result, compare, read_report, write_report
+
+
+@pytest.fixture(autouse=True)
+def live_environment(monkeypatch):
+    """Point the environment at the live API, which the benchmarks must never reach."""
+    monkeypatch.setenv("API_URL", "http://live-api.invalid/v2")
+    monkeypatch.setenv("TOKEN", "live-token")
+
+
+def test_every_response_schema_has_a_valid_benchmark_body():
+    """Tests."""
+    schemas = bench_schemas.response_schemas()
+
+    assert "StatusReponseSchema" in schemas and "ListShipsResponseSchema" in schemas
+    assert set(schemas) == set(bench_schemas.BODIES)
+    for name, schema in schemas.items():
+        schema.model_validate_json(json.dumps(bench_schemas.BODIES[name]()))
+
+
+def test_report_round_trip_and_regressions(tmp_path):
+    """Tests."""
+    baseline = [
+        Result("schemas", "ShipResponseSchema", "validate_json", 50.0, "us"),
+        Result("throughput", "get_ship", "rps", 1000.0, "req/s", higher_is_better=True),
+        Result("memory", "ship as ShipView", "bytes_per_item", 1000.0, "B"),
+    ]
+    current = [
+        Result("schemas", "ShipResponseSchema", "validate_json", 60.0, "us"),
+        Result("throughput", "get_ship", "rps", 850.0, "req/s", higher_is_better=True),
+        Result("memory", "ship as ShipView", "bytes_per_item", 900.0, "B"),
+        Result("sync", "sequential", "seconds", 1.0, "s"),
+    ]
+    path = tmp_path / "baseline.json"
+
+    report = write_report(baseline, path)
+
+    assert read_report(path) == baseline
+    assert report["environment"]["python"]
+    regressions = compare(read_report(path), current, tolerance=0.1)
+    assert [(r.result.name, round(r.change, 2)) for r in regressions] == [
+        ("ShipResponseSchema", 0.2),
+        ("get_ship", 0.15),
+    ]
+    assert compare(baseline, current, tolerance=0.25) == []
+
+
+def test_suites_run_at_small_sizes():
+    """Tests."""
+    sync = bench_sync.run(systems=3, waypoints=25, latency=0.0, workers=2)
+    throughput = bench_throughput.run(requests=10, latency=0.0, workers=2)
+    memory = bench_memory.run(ships=5, waypoints=10)
+
+    assert [result.name for result in sync] == [
+        "sequential",
+        "concurrent",
+        "concurrent cold cache",
+        "concurrent warm cache",
+    ]
+    assert sync[0].params["requests"] == 1 + 3 * 2
+    assert sync[-1].params == {**sync[0].params, "requests": 1, "workers": 2}
+    assert all(result.higher_is_better and result.value > 0 for result in throughput)
+    assert {result.name: result.value > 0 for result in memory} == {
+        "ship as ShipSchema": True,
+        "ship as FleetState": True,
+        "ship as ShipView": True,
+        "ship as JSON bytes": True,
+        "waypoint as WaypointSchema": True,
+        "waypoint as JSON bytes": True,
+    }
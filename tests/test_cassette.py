@@ -0,0 +1,139 @@
+"""Test Cassette."""
+
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from spacetraders_python_sdk import AsyncSpaceTradersClient, SpaceTradersClient
+from spacetraders_python_sdk.cassette import (
+    Cassette,
+    CassetteMissError,
+    CassetteRecorder,
+    Interaction,
+)
+from spacetraders_python_sdk.testing import StubServer
+from spacetraders_python_sdk.transport import RateLimiter
+
+
+def make_client(adapter=None):
+    """Return a client sending through `adapter`, or replaying through a mounted cassette, without rate limit."""
+    client = SpaceTradersClient(token="secret-token", api_url="http://stub/v2", rate_limiter=RateLimiter(1e9, 0))
+    if adapter is not None:
+        client.session.mount("http://", adapter)
+    return client
+
+
+def replay_client(cassette):
+    """Return a client answered by `cassette`."""
+    client = make_client()
+    cassette.mount(client.session)
+    return client
+
+
+def play_turn(client):
+    """Play a short turn of a mining bot; return what it saw."""
+    seen = [client.fleet.get_ship(ship_symbol="BILLY1-1", use_cache=False)[1].data.nav.status]
+    client.fleet.orbit_ship(ship_symbol="BILLY1-1")
+    seen.append(client.fleet.get_ship(ship_symbol="BILLY1-1", use_cache=False)[1].data.nav.status)
+    seen.append(client.fleet.extract_resources(ship_symbol="BILLY1-1")[1].data.cargo.units)
+    seen.append(client.agents.get_agent()[1].data.credits)
+    return seen
+
+
+@pytest.fixture(name="recorded")
+def recorded_fixture(tmp_path):
+    """Record a turn against the stub server; return the cassette path and what the bot saw."""
+    path = tmp_path / "session.jsonl.gz"
+    with CassetteRecorder(path) as recorder:
+        seen = play_turn(make_client(recorder.adapter(StubServer(ships=2).adapter())))
+    return path, seen
+
+
+def test_record_writes_compact_cassette_and_index(recorded):
+    """Tests."""
+    path, _ = recorded
+
+    with gzip.open(path, "rb") as file:
+        interactions = [Interaction.from_line(line) for line in file]
+    index = json.loads(path.with_name(path.name + ".idx").read_text())
+
+    assert [i.method for i in interactions] == ["GET", "POST", "GET", "POST", "GET"]
+    assert index["count"] == 5
+    assert index["keys"]["GET /v2/my/ships/BILLY1-1"] == [0, 2]
+    assert all(i.elapsed >= 0 and i.offset >= 0 for i in interactions)
+    assert b"secret-token" not in gzip.decompress(path.read_bytes())
+
+
+def test_replay_answers_like_the_recording(recorded):
+    """Tests."""
+    path, seen = recorded
+    cassette = Cassette.load(path)
+
+    client = replay_client(cassette)
+    assert play_turn(client) == seen
+    assert seen[:2] == ["DOCKED", "IN_ORBIT"]
+    assert client.session.trust_env is False
+    assert client.session.get_adapter("https://api.spacetraders.io/v2") is client.session.get_adapter("http://stub")
+
+    with pytest.raises(CassetteMissError):
+        client.fleet.get_ship(ship_symbol="BILLY1-2")
+
+    cassette.rewind()
+    assert play_turn(replay_client(cassette)) == seen
+
+
+def test_replay_repeats_the_last_response_unless_strict(recorded):
+    """Tests."""
+    path, _ = recorded
+    path.with_name(path.name + ".idx").unlink()
+
+    cassette = Cassette.load(path)
+    client = replay_client(cassette)
+    statuses = [client.fleet.get_ship(ship_symbol="BILLY1-1", use_cache=False)[1].data.nav.status for _ in range(3)]
+    assert statuses == ["DOCKED", "IN_ORBIT", "IN_ORBIT"]
+
+    strict = Cassette.load(path, strict=True)
+    strict.play("GET", "http://other-host/v2/my/agent")
+    with pytest.raises(CassetteMissError):
+        strict.play("GET", "http://other-host/v2/my/agent")
+
+
+def test_replay_timing():
+    """Tests."""
+    now = [100.0]
+    lines = [
+        Interaction("GET", "/v2/my/agent", 200, offset=0.0, elapsed=0.2).to_line(),
+        Interaction("GET", "/v2/my/ships", 200, offset=10.0, elapsed=0.4).to_line(),
+    ]
+    keys = {"GET /v2/my/agent": [0], "GET /v2/my/ships": [1]}
+
+    instant = Cassette(lines, keys)
+    assert instant.delay(instant.play("GET", "/v2/my/ships")) == 0.0
+
+    original = Cassette(lines, keys, speed=1.0)
+    assert original.delay(original.play("GET", "/v2/my/ships")) == 0.4
+
+    paced = Cassette(lines, keys, speed=2.0, pace=True, clock=lambda: now[0])
+    assert paced.delay(paced.play("GET", "/v2/my/agent")) == 0.1
+    now[0] += 1.0
+    assert paced.delay(paced.play("GET", "/v2/my/ships")) == pytest.approx(4.2)
+
+
+def test_async_record_and_replay(tmp_path):
+    """Tests."""
+    path = tmp_path / "async.jsonl.gz"
+    server = StubServer(ships=3)
+
+    async def orbit(transport):
+        async with AsyncSpaceTradersClient(token="token", api_url="http://stub/v2", transport=transport) as client:
+            result = await client.fleet.orbit_ships(ship_symbols=["BILLY1-1", "BILLY1-2", "BILLY1-3"])
+            return {symbol: nav.data.nav.status for symbol, (_, nav) in result.results.items()}
+
+    with CassetteRecorder(path) as recorder:
+        recorded = asyncio.run(orbit(recorder.async_transport(server.async_transport())))
+    replayed = asyncio.run(orbit(Cassette.load(path).async_transport()))
+
+    assert recorded == replayed == {"BILLY1-1": "IN_ORBIT", "BILLY1-2": "IN_ORBIT", "BILLY1-3": "IN_ORBIT"}
+    assert len(Cassette.load(path)) == 3
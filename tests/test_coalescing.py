@@ -0,0 +1,148 @@
+"""Test Request Coalescing."""
+
+import asyncio
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from spacetraders_python_sdk import AsyncSpaceTradersClient
+from spacetraders_python_sdk.transport import (
+    AsyncSingleFlight,
+    RateLimiter,
+    SingleFlight,
+)
+
+
+WAYPOINT = {
+    "symbol": "X1-GJ54-A1",
+    "type": "PLANET",
+    "x": 1,
+    "y": 2,
+    "orbitals": [],
+    "traits": [],
+    "modifiers": [],
+    "isUnderConstruction": False,
+}
+
+
+def answer(method, path):
+    """Answer every request with a waypoint."""
+    return {"data": WAYPOINT}
+
+
+def test_concurrent_identical_gets_share_one_call(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(answer, delay=0.1, rate_limiter=RateLimiter(burst=100))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda _: client.systems.get_waypoint(system_symbol="X1-GJ54", waypoint_symbol="X1-GJ54-A1"),
+                range(8),
+            )
+        )
+
+    assert len(adapter.sent) == 1
+    assert all(result is results[0][1] for _, result in results)
+    assert client.session.single_flight.shared == 7
+
+
+def test_posts_are_not_coalesced(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(answer, delay=0.1, rate_limiter=RateLimiter(burst=100))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: client.session.post("http://stub/v2/my/ships/BILLY1-1/orbit"), range(4)))
+
+    assert len(adapter.sent) == 4
+
+
+def test_single_flight_shares_errors():
+    """Tests."""
+    single_flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        time.sleep(0.05)
+        raise RuntimeError("boom")
+
+    def call(fn):
+        try:
+            single_flight.do("key", fn)
+        except RuntimeError as error:
+            errors.append(error)
+
+    leader = threading.Thread(target=call, args=(fail,))
+    leader.start()
+    started.wait()
+    call(lambda: "not called")
+    leader.join()
+
+    assert len(errors) == 2
+    assert errors[0] is errors[1]
+
+
+def test_async_identical_gets_share_one_call():
+    """Tests."""
+    sent = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"data": WAYPOINT})
+
+    async def run():
+        async with AsyncSpaceTradersClient(
+            token="token",
+            api_url="https://api.spacetraders.io/v2",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return await asyncio.gather(
+                *(client.systems.get_waypoint(system_symbol="X1-GJ54", waypoint_symbol="X1-GJ54-A1") for _ in range(5))
+            )
+
+    results = asyncio.run(run())
+
+    assert len(sent) == 1
+    assert all(result is results[0][1] for _, result in results)
+
+
+def test_async_single_flight_outlives_a_cancelled_caller():
+    """Tests."""
+    calls = []
+
+    async def fetch():
+        calls.append("started")
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            calls.append("cancelled")
+            raise
+        return "response"
+
+    async def run():
+        single_flight = AsyncSingleFlight()
+        leader = asyncio.create_task(single_flight.do("key", fetch))
+        follower = asyncio.create_task(single_flight.do("key", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        shared = await follower
+
+        alone = asyncio.create_task(single_flight.do("key", fetch))
+        await asyncio.sleep(0.01)
+        alone.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await alone
+        await asyncio.sleep(0)
+        return shared, single_flight.shared, await single_flight.do("key", fetch)
+
+    assert asyncio.run(run()) == ("response", 1, "response")
+    assert calls == ["started", "started", "cancelled", "started"]
@@ -0,0 +1,190 @@
+"""Test Fleet State."""
+
+import asyncio
+
+import httpx
+
+from spacetraders_python_sdk import AsyncSpaceTradersClient, SpaceTradersClient
+from spacetraders_python_sdk.cache import FleetState
+from spacetraders_python_sdk.models.models import ShipNavSchema, ShipNavStatusEnum
+from spacetraders_python_sdk.testing import StubServer, payloads
+from spacetraders_python_sdk.transport import RateLimiter
+
+
+START = 1_725_105_600.0
+ARRIVAL = "2024-08-31T12:02:00+00:00"
+
+
+def answer(method, path):
+    """Return the data the server answers for the actions of one ship."""
+    nav = payloads.make_nav("X1-GJ54", "X1-GJ54-A1")
+    cargo = payloads.make_cargo(inventory=[payloads.make_cargo_item("IRON_ORE", 12)])
+    bodies = {
+        "GET /my/agent": payloads.make_agent(credits=1000),
+        "GET /my/ships/SHIP-1": payloads.make_ship("SHIP-1"),
+        "GET /my/contracts/cm0contract0001": payloads.make_contract(),
+        "POST /my/ships/SHIP-1/orbit": {"nav": nav},
+        "POST /my/ships/SHIP-1/navigate": {
+            "nav": payloads.make_nav("X1-GJ54", "X1-GJ54-A1", status="IN_TRANSIT", arrival=ARRIVAL),
+            "fuel": payloads.make_fuel(current=350),
+            "events": [],
+        },
+        "POST /my/ships/SHIP-1/extract": {
+            "cooldown": payloads.make_cooldown("SHIP-1", 70, "2024-08-31T12:01:10+00:00"),
+            "extraction": {"shipSymbol": "SHIP-1", "yield": {"symbol": "IRON_ORE", "units": 12}},
+            "cargo": cargo,
+            "events": [],
+        },
+        "POST /my/ships/SHIP-1/sell": {
+            "agent": payloads.make_agent(credits=1360),
+            "cargo": payloads.make_cargo(),
+            "transaction": payloads.make_transaction("SHIP-1", "IRON_ORE", 12, 30),
+        },
+        "POST /my/contracts/cm0contract0001/accept": {
+            "agent": payloads.make_agent(credits=11360),
+            "contract": payloads.make_contract(accepted=True),
+        },
+    }
+    return {"data": bodies[f"{method} {path}"]}
+
+
+def test_actions_update_the_state(scripted_client):
+    """Tests."""
+    now = [START]
+    client, adapter = scripted_client(answer, fleet_state=FleetState(clock=lambda: now[0]))
+    state = client.fleet_state
+
+    client.fleet.orbit_ship(ship_symbol="SHIP-1")
+    assert "SHIP-1" in state
+    assert state.nav("SHIP-1").status == "IN_ORBIT"
+    assert state.ship("SHIP-1") is None
+
+    client.fleet.get_ship(ship_symbol="SHIP-1")
+    client.fleet.navigate_ship(ship_symbol="SHIP-1", waypoint_symbol="X1-GJ54-B2")
+    assert state.fuel("SHIP-1").current == 350
+    assert state.ship("SHIP-1").fuel.current == 350
+    assert state.nav("SHIP-1").status == "IN_TRANSIT"
+
+    client.fleet.extract_resources(ship_symbol="SHIP-1")
+    assert state.cargo("SHIP-1").units == 12
+    assert state.cooldown("SHIP-1").remainingSeconds == 70
+
+    now[0] = START + 40
+    assert state.cooldown("SHIP-1").remainingSeconds == 30
+    assert state.nav("SHIP-1").status == "IN_TRANSIT"
+    now[0] = START + 120
+    nav = state.ship("SHIP-1").nav
+    assert isinstance(nav, ShipNavSchema)
+    assert (nav.status, nav.waypointSymbol) == ("IN_ORBIT", "X1-GJ54-A1")
+    assert nav.status is ShipNavStatusEnum.IN_ORBIT
+    assert state.cooldown("SHIP-1").remainingSeconds == 0
+
+    client.fleet.sell_cargo(ship_symbol="SHIP-1", symbol="IRON_ORE", units=12)
+    assert state.agent.credits == 1360
+    assert state.cargo("SHIP-1").units == 0
+
+    client.contracts.accept_contract(contract_id="cm0contract0001")
+    assert state.agent.credits == 11360
+    assert state.contract("cm0contract0001").accepted
+    assert len(adapter.sent) == 6
+
+
+def test_reads_are_served_locally(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(answer, fleet_state=FleetState(clock=lambda: START))
+
+    for _ in range(3):
+        assert client.fleet.get_ship(ship_symbol="SHIP-1")[1].data.symbol == "SHIP-1"
+        assert client.fleet.get_ship_cargo(ship_symbol="SHIP-1")[1].data.capacity == 60
+        assert client.agents.get_agent()[1].data.credits == 1000
+        assert not client.contracts.get_contract(contract_id="cm0contract0001")[1].data.accepted
+    assert adapter.sent == ["GET /my/ships/SHIP-1", "GET /my/agent", "GET /my/contracts/cm0contract0001"]
+
+    client.fleet.get_ship(ship_symbol="SHIP-1", use_cache=False)
+    assert len(adapter.sent) == 4
+
+    client.fleet_state.clear()
+    assert client.agents.get_agent()[1].data.credits == 1000
+    assert len(adapter.sent) == 5
+
+
+def test_state_without_client():
+    """Tests."""
+    state = FleetState()
+    assert state.ship("SHIP-1") is None
+    assert state.nav("SHIP-1") is None
+    assert state.ships() == []
+    assert state.contracts() == []
+
+
+def test_async_subclients_update_the_state():
+    """Tests."""
+    sent = []
+
+    def handler(request):
+        sent.append(request.url.path)
+        return httpx.Response(200, json=answer(request.method, request.url.path.removeprefix("/v2")))
+
+    async def run():
+        async with AsyncSpaceTradersClient(
+            token="token",
+            api_url="http://stub/v2",
+            fleet_state=FleetState(clock=lambda: START),
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            await client.fleet.extract_resources(ship_symbol="SHIP-1")
+            await client.fleet.sell_cargo(ship_symbol="SHIP-1", symbol="IRON_ORE", units=12)
+            await client.contracts.accept_contract(contract_id="cm0contract0001")
+            _, agent = await client.agents.get_agent()
+            return client.fleet_state, agent
+
+    state, agent = asyncio.run(run())
+    assert agent.data.credits == 11360
+    assert state.cargo("SHIP-1").units == 0
+    assert state.cooldown("SHIP-1").remainingSeconds == 70
+    assert len(sent) == 3
+
+
+def test_supplying_a_construction_site_updates_the_cargo():
+    """Tests."""
+    server = StubServer(ships=1)
+    client = SpaceTradersClient(
+        token="token", api_url="http://stub/v2", rate_limiter=RateLimiter(rate=1e6, burst=0), fleet_state=FleetState()
+    )
+    client.session.mount("http://", server.adapter())
+    gate = server.gates["X1-GJ54"][0]
+    construction = client.systems.get_construction_site(system_symbol="X1-GJ54", waypoint_symbol=gate)[1]
+    material = construction.data.materials[0].TradeSymbol.value
+    server.add_cargo("BILLY1-1", material, 10)
+    before = client.fleet.get_ship_cargo(ship_symbol="BILLY1-1")[1].data.units
+
+    _, supply = client.systems.supply_construction_site(
+        system_symbol="X1-GJ54", waypoint_symbol=gate, ship_symbol="BILLY1-1", trade_symbol=material, units=10
+    )
+
+    assert supply is not None
+    cargo = client.fleet.get_ship_cargo(ship_symbol="BILLY1-1")[1].data
+    assert cargo.units == before - 10 == server.ships["BILLY1-1"]["cargo"]["units"]
+    assert client.fleet_state.cargo("BILLY1-1") is supply.data.cargo
+
+
+def test_delivering_to_a_contract_updates_the_cargo():
+    """Tests."""
+    server = StubServer(ships=1)
+    client = SpaceTradersClient(
+        token="token", api_url="http://stub/v2", rate_limiter=RateLimiter(rate=1e6, burst=0), fleet_state=FleetState()
+    )
+    client.session.mount("http://", server.adapter())
+    client.contracts.accept_contract(contract_id="cm0contract0001")
+    server.add_cargo("BILLY1-1", "IRON_ORE", 10)
+    before = client.fleet.get_ship_cargo(ship_symbol="BILLY1-1")[1].data.units
+
+    _, delivery = client.contracts.deliver_cargo_to_contract(
+        contract_id="cm0contract0001", ship_symbol="BILLY1-1", trade_symbol="IRON_ORE", units=10
+    )
+
+    assert delivery is not None
+    assert delivery.data.contract.terms.deliver[0].unitsFulfilled == 10
+    cargo = client.fleet.get_ship_cargo(ship_symbol="BILLY1-1")[1].data
+    assert cargo.units == before - 10 == server.ships["BILLY1-1"]["cargo"]["units"]
+    assert client.fleet_state.cargo("BILLY1-1") is delivery.data.cargo
@@ -0,0 +1,79 @@
+"""Test Galaxy Cache."""
+
+from spacetraders_python_sdk.cache import GalaxyCache
+
+
+SYSTEM = {
+    "symbol": "X1-GJ54",
+    "sectorSymbol": "X1",
+    "type": "RED_STAR",
+    "x": 10,
+    "y": -20,
+    "waypoints": [{"symbol": "X1-GJ54-A1", "type": "PLANET", "x": 1, "y": 2, "orbitals": []}],
+    "factions": [],
+}
+
+
+def make_status(reset_date: str) -> dict:
+    """Build a server status payload."""
+    return {
+        "status": "SpaceTraders is currently online and available to play",
+        "version": "v2.2.0",
+        "resetDate": reset_date,
+        "description": "SpaceTraders is a headless game.",
+        "stats": {"agents": 1, "ships": 2, "systems": 3, "waypoints": 4},
+        "leaderboards": {"mostCredits": [], "mostSubmittedCharts": []},
+        "serverResets": {"next": "2024-09-15T16:00:00.000Z", "frequency": "fortnightly"},
+        "announcements": [],
+        "links": [],
+    }
+
+
+def serve(reset_date: str):
+    """Return an `answer` serving the status with `reset_date`, and one system."""
+    return lambda method, path: make_status(reset_date) if path == "/" else {"data": SYSTEM}
+
+
+def test_get_system_reads_through_cache(tmp_path, scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(serve("2024-08-18"), galaxy_cache=GalaxyCache(tmp_path / "galaxy.sqlite3"))
+    client.get_status()
+
+    for _ in range(3):
+        error, result = client.systems.get_system(system_symbol="X1-GJ54")
+        if not result:
+            raise Exception(error)
+        assert result.data.waypoints[0].symbol == "X1-GJ54-A1"
+
+    assert adapter.sent.count("GET /systems/X1-GJ54") == 1
+
+
+def test_cache_persists_until_reset(tmp_path, scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(serve("2024-08-18"), galaxy_cache=GalaxyCache(tmp_path / "galaxy.sqlite3"))
+    client.get_status()
+    client.systems.get_system(system_symbol="X1-GJ54")
+    client.galaxy_cache.close()
+
+    client, adapter = scripted_client(serve("2024-08-18"), galaxy_cache=GalaxyCache(tmp_path / "galaxy.sqlite3"))
+    client.get_status()
+    client.systems.get_system(system_symbol="X1-GJ54")
+    assert "GET /systems/X1-GJ54" not in adapter.sent
+
+    adapter.answer = serve("2024-09-01")
+    client.get_status()
+    assert client.galaxy_cache.reset_date == "2024-09-01"
+    client.systems.get_system(system_symbol="X1-GJ54")
+    assert "GET /systems/X1-GJ54" in adapter.sent
+
+
+def test_new_reset_date_clears_entries(tmp_path):
+    """Tests."""
+    cache = GalaxyCache(tmp_path / "galaxy.sqlite3")
+
+    cache.set("system", "X1-GJ54", b"{}")
+    assert cache.get("system", "X1-GJ54") == b"{}"
+
+    assert cache.set_reset_date("2024-08-18")
+    assert not cache.set_reset_date("2024-08-18")
+    assert cache.get("system", "X1-GJ54") is None
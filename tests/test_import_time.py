@@ -0,0 +1,54 @@
+"""Test Import Time."""
+
+import json
+import subprocess
+import sys
+
+from pathlib import Path
+
+import spacetraders_python_sdk
+
+from benchmarks.bench_import import measure_import
+from spacetraders_python_sdk.models import ShipSchema, models
+
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ["dotenv", "httpx", "spacetraders_python_sdk.models.models"]
+CREATE_CLIENT = (
+    "from spacetraders_python_sdk import SpaceTradersClient\n"
+    "client = SpaceTradersClient(token='-', api_url='-')"
+)
+
+
+def loaded_after(statement: str) -> list:
+    """Return the heavy modules loaded by running `statement` in a fresh interpreter."""
+    script = f"import json, sys\n{statement}\nprint(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, check=True, text=True, cwd=ROOT)
+    return json.loads(result.stdout)
+
+
+def test_package_import_loads_nothing_heavy():
+    """Tests."""
+    assert loaded_after("import spacetraders_python_sdk") == []
+
+
+def test_sync_client_defers_schemas_until_a_subclient_is_used():
+    """Tests."""
+    assert loaded_after(CREATE_CLIENT) == ["dotenv"]
+    assert loaded_after(f"{CREATE_CLIENT}\nclient.agents") == ["dotenv", "spacetraders_python_sdk.models.models"]
+
+
+def test_lazy_attributes():
+    """Tests."""
+    assert ShipSchema is models.ShipSchema
+    assert spacetraders_python_sdk.SpaceTradersClient.__name__ == "SpaceTradersClient"
+    assert not hasattr(spacetraders_python_sdk, "Missing")
+
+
+def test_import_time_benchmark():
+    """Tests."""
+    package = measure_import("import spacetraders_python_sdk", repeat=3)
+    schemas = measure_import("import spacetraders_python_sdk.models.models", repeat=3)
+
+    print(f"import spacetraders_python_sdk: {package * 1000:.1f} ms, all schemas: {schemas * 1000:.1f} ms")
+    assert package * 5 < schemas
@@ -0,0 +1,106 @@
+"""Test Jump Gate Graph."""
+
+from types import SimpleNamespace
+
+from spacetraders_python_sdk.cache import GalaxyCache
+from spacetraders_python_sdk.models.models import JumpGateResponseSchema, JumpGateSchema
+from spacetraders_python_sdk.navigation import JumpGateGraph
+
+
+NETWORK = {
+    "X1-AA-I1": ["X1-BB-I1", "X1-CC-I1"],
+    "X1-BB-I1": ["X1-AA-I1", "X1-DD-I1"],
+    "X1-CC-I1": ["X1-AA-I1", "X1-DD-I1"],
+    "X1-DD-I1": ["X1-BB-I1", "X1-CC-I1", "X1-EE-I1"],
+    "X1-EE-I1": ["X1-DD-I1"],
+    "X1-ZZ-I1": ["X1-YY-I1"],
+}
+
+
+class FakeSystems:
+    """Systems subclient serving the jump gates of NETWORK."""
+
+    def __init__(self):
+        """Init."""
+        self.fetched = []
+
+    def get_jump_gate(self, system_symbol, waypoint_symbol):
+        """Return a jump gate."""
+        self.fetched.append(waypoint_symbol)
+        jump_gate = {"symbol": waypoint_symbol, "connections": NETWORK.get(waypoint_symbol, [])}
+        return "Successfully fetched jump gate.", JumpGateResponseSchema.model_validate({"data": jump_gate})
+
+
+def make_graph(galaxy_cache=None):
+    """Build the graph of NETWORK."""
+    graph = JumpGateGraph(galaxy_cache=galaxy_cache)
+    for symbol, connections in NETWORK.items():
+        graph.add_jump_gate(JumpGateSchema(symbol=symbol, connections=connections))
+    return graph
+
+
+def test_fewest_jumps_accepts_systems_and_gates():
+    """Tests."""
+    graph = make_graph()
+
+    assert graph.shortest_path("X1-AA", "X1-EE-I1") == ["X1-AA-I1", "X1-BB-I1", "X1-DD-I1", "X1-EE-I1"]
+    assert graph.shortest_path("X1-AA", "X1-ZZ") is None
+    assert graph.shortest_path("X1-AA", "X1-UNKNOWN") is None
+
+
+def test_weighted_routes_use_system_positions():
+    """Tests."""
+    graph = make_graph()
+    for symbol, x, y in [
+        ("X1-AA", 0, 0),
+        ("X1-BB", 0, 500),
+        ("X1-CC", 100, 100),
+        ("X1-DD", 200, 200),
+        ("X1-EE", 300, 300),
+    ]:
+        graph.add_system(SimpleNamespace(symbol=symbol, x=x, y=y))
+
+    assert graph.shortest_path("X1-AA", "X1-DD", weight=graph.distance) == ["X1-AA-I1", "X1-CC-I1", "X1-DD-I1"]
+    for _ in range(300):
+        graph.shortest_path("X1-AA", "X1-DD", weight=lambda origin, destination: graph.distance(origin, destination))
+    assert len(graph._trees) == graph.max_trees
+
+
+def test_components():
+    """Tests."""
+    graph = make_graph()
+
+    assert graph.component("X1-EE") == frozenset({"X1-AA-I1", "X1-BB-I1", "X1-CC-I1", "X1-DD-I1", "X1-EE-I1"})
+    assert graph.components()[1] == frozenset({"X1-ZZ-I1", "X1-YY-I1"})
+
+
+def test_new_connections_invalidate_cached_routes():
+    """Tests."""
+    graph = make_graph()
+    assert len(graph.shortest_path("X1-AA", "X1-EE")) == 4
+
+    graph.add_jump_gate(JumpGateSchema(symbol="X1-AA-I1", connections=["X1-EE-I1"]))
+
+    assert graph.shortest_path("X1-AA", "X1-EE") == ["X1-AA-I1", "X1-EE-I1"]
+    assert not graph.add_jump_gate(JumpGateSchema(symbol="X1-AA-I1", connections=["X1-EE-I1"]))
+
+
+def test_graph_persists_in_galaxy_cache(tmp_path):
+    """Tests."""
+    make_graph(GalaxyCache(tmp_path / "galaxy.db"))
+
+    graph = JumpGateGraph(GalaxyCache(tmp_path / "galaxy.db"))
+
+    assert len(graph) == 7
+    assert graph.unexplored == {"X1-YY-I1"}
+    assert graph.shortest_path("X1-EE", "X1-AA") == ["X1-EE-I1", "X1-DD-I1", "X1-BB-I1", "X1-AA-I1"]
+
+
+def test_explore_fetches_each_gate_once():
+    """Tests."""
+    systems = FakeSystems()
+    graph = JumpGateGraph()
+
+    assert graph.explore(systems, "X1-AA-I1") == 5
+    assert graph.explore(systems, "X1-AA") == 0
+    assert sorted(systems.fetched) == ["X1-AA-I1", "X1-BB-I1", "X1-CC-I1", "X1-DD-I1", "X1-EE-I1"]
@@ -0,0 +1,112 @@
+"""Test Metrics."""
+
+import asyncio
+
+import httpx
+
+from spacetraders_python_sdk import AsyncSpaceTradersClient
+from spacetraders_python_sdk.metrics import (
+    Histogram,
+    MetricsRegistry,
+    endpoint_template,
+    render_prometheus,
+)
+from spacetraders_python_sdk.testing import payloads
+
+
+def answer(method, path):
+    """Answer every request with a ship."""
+    return {"data": payloads.make_ship("SHIP-1")}
+
+
+def test_endpoint_template():
+    """Tests."""
+    assert endpoint_template("http://stub/v2/my/ships/SHIP-1/orbit") == "/my/ships/{shipSymbol}/orbit"
+    assert endpoint_template("http://stub/v2/my/ships?page=2") == "/my/ships"
+    assert endpoint_template("http://stub/v2/my/contracts/cm0abc/deliver") == "/my/contracts/{contractId}/deliver"
+    assert (
+        endpoint_template("http://stub/v2/systems/X1-GJ54/waypoints/X1-GJ54-A1/market")
+        == "/systems/{systemSymbol}/waypoints/{waypointSymbol}/market"
+    )
+    assert endpoint_template("http://stub/v2/") == "/"
+
+
+def test_histogram():
+    """Tests."""
+    histogram = Histogram([0.1, 0.2, 0.4])
+    for value in (0.05, 0.1, 0.15, 0.3, 1.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(0.1, 2), (0.2, 3), (0.4, 4), (float("inf"), 5)]
+    assert histogram.count == 5
+    assert round(histogram.sum, 6) == 1.6
+    assert round(histogram.quantile(0.5), 6) == 0.15
+    assert histogram.quantile(0.99) == 0.4
+    assert Histogram([1.0]).quantile(0.5) is None
+
+
+def test_client_records_requests_retries_and_parse_time(scripted_client):
+    """Tests."""
+    registry = MetricsRegistry()
+    client, _ = scripted_client(answer, statuses=[None, 503], metrics=registry)
+
+    message, ship = client.fleet.get_ship(ship_symbol="SHIP-1")
+    client.fleet.get_ship(ship_symbol="SHIP-1")
+
+    assert ship is not None, message
+    [stats] = registry.stats()
+    assert (stats.method, stats.endpoint) == ("GET", "/my/ships/{shipSymbol}")
+    assert stats.requests == 4
+    assert stats.statuses == {"error": 1, "503": 1, "200": 2}
+    assert stats.errors == 2
+    assert stats.retries == {"error": 1, "503": 1}
+    assert stats.request_bytes == 0
+    assert stats.response_bytes > 1000
+    assert stats.parse.count == 2
+    assert stats.latency.sum > 0 and stats.parse.sum > 0
+    assert registry.hot_paths() == [stats]
+
+
+def test_prometheus_exposition():
+    """Tests."""
+    registry = MetricsRegistry(latency_buckets=[0.5, 1.0])
+    registry.on_request("POST", "/my/ships/{shipSymbol}/orbit", 200, 0.25, 0, 120)
+    registry.on_request("POST", "/my/ships/{shipSymbol}/orbit", 429, 0.75, 0, 60)
+    registry.on_retry("POST", "/my/ships/{shipSymbol}/orbit", 429)
+    registry.on_parse("POST", "/my/ships/{shipSymbol}/orbit", "ShipOrbitResponseSchema", 0.001)
+
+    text = render_prometheus(registry)
+
+    labels = 'method="POST",endpoint="/my/ships/{shipSymbol}/orbit"'
+    assert "# TYPE spacetraders_request_duration_seconds histogram" in text
+    assert f'spacetraders_request_duration_seconds_bucket{{{labels},le="0.5"}} 1' in text
+    assert f'spacetraders_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"spacetraders_request_duration_seconds_sum{{{labels}}} 1.0" in text
+    assert f"spacetraders_parse_duration_seconds_count{{{labels}}} 1" in text
+    assert f'spacetraders_requests_total{{{labels},status="429"}} 1' in text
+    assert f'spacetraders_retries_total{{{labels},status="429"}} 1' in text
+    assert f"spacetraders_received_bytes_total{{{labels}}} 180" in text
+    assert text.endswith("\n")
+
+
+def test_async_client_records_requests():
+    """Tests."""
+    registry = MetricsRegistry()
+
+    def handler(request):
+        return httpx.Response(200, json={"data": {"nav": payloads.make_nav("X1-GJ54", "X1-GJ54-A1", status="DOCKED")}})
+
+    async def run():
+        async with AsyncSpaceTradersClient(
+            token="token",
+            api_url="http://stub/v2",
+            metrics=registry,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            await asyncio.gather(*(client.fleet.dock_ship(ship_symbol=f"SHIP-{n}") for n in range(3)))
+
+    asyncio.run(run())
+    [stats] = registry.stats(method="POST")
+    assert stats.endpoint == "/my/ships/{shipSymbol}/dock"
+    assert stats.statuses == {"200": 3}
+    assert stats.parse.count == 3
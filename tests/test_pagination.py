@@ -0,0 +1,145 @@
+"""Test Pagination."""
+
+import asyncio
+
+from itertools import islice
+
+import pytest
+
+from spacetraders_python_sdk.models.models import ListAgentsResponseSchema
+from spacetraders_python_sdk.pagination import (
+    AsyncPaginator,
+    PaginationError,
+    Paginator,
+)
+
+
+TOTAL = 45
+
+
+def make_page(page: int, limit: int) -> ListAgentsResponseSchema:
+    """Build one page of a synthetic agents listing."""
+    first = (page - 1) * limit
+    return ListAgentsResponseSchema.model_validate(
+        {
+            "data": [
+                {
+                    "symbol": f"AGENT{index}",
+                    "headquarters": "X1-GJ54-A1",
+                    "credits": index,
+                    "startingFaction": "COSMIC",
+                    "shipCount": 1,
+                }
+                for index in range(first, min(first + limit, TOTAL))
+            ],
+            "meta": {"total": TOTAL, "page": page, "limit": limit},
+        }
+    )
+
+
+class FetchPage:
+    """Record the pages requested."""
+
+    def __init__(self) -> None:
+        """Init."""
+        self.pages = []
+
+    def __call__(self, page: int, limit: int):
+        """Return one page."""
+        self.pages.append(page)
+        return "Successfully fetched agents details.", make_page(page, limit)
+
+
+def test_iterates_every_page_lazily():
+    """Tests."""
+    fetch_page = FetchPage()
+    paginator = Paginator(fetch_page=fetch_page, limit=20)
+
+    items = iter(paginator)
+    assert fetch_page.pages == []
+
+    symbols = [agent.symbol for agent in items]
+
+    assert symbols == [f"AGENT{index}" for index in range(TOTAL)]
+    assert fetch_page.pages == [1, 2, 3]
+    assert paginator.last_page == 3
+
+
+def test_early_termination_and_resume():
+    """Tests."""
+    fetch_page = FetchPage()
+    paginator = Paginator(fetch_page=fetch_page, limit=20)
+
+    first = list(islice(paginator, 25))
+    assert first[-1].symbol == "AGENT24"
+    assert paginator.page == 2
+    assert fetch_page.pages == [1, 2]
+
+    rest = list(Paginator(fetch_page=fetch_page, page=paginator.page, limit=20))
+    assert rest[0].symbol == "AGENT20"
+    assert rest[-1].symbol == f"AGENT{TOTAL - 1}"
+
+
+def test_error_raises():
+    """Tests."""
+    paginator = Paginator(fetch_page=lambda page, limit: ("Unknown error: boom", None))
+
+    with pytest.raises(PaginationError, match="boom"):
+        list(paginator)
+
+
+def test_async_paginator():
+    """Tests."""
+
+    async def fetch_page(page: int, limit: int):
+        return "Successfully fetched agents details.", make_page(page, limit)
+
+    async def run():
+        return [agent.symbol async for agent in AsyncPaginator(fetch_page=fetch_page, page=2, limit=20)]
+
+    assert asyncio.run(run()) == [f"AGENT{index}" for index in range(20, TOTAL)]
+
+
+def test_fetch_all_in_order():
+    """Tests."""
+    fetch_page = FetchPage()
+    paginator = Paginator(fetch_page=fetch_page, limit=10)
+
+    symbols = [agent.symbol for agent in paginator.fetch_all(max_workers=4)]
+
+    assert symbols == [f"AGENT{index}" for index in range(TOTAL)]
+    assert sorted(fetch_page.pages) == [1, 2, 3, 4, 5]
+    assert paginator.page == 6
+
+
+def test_fetch_all_error_raises():
+    """Tests."""
+
+    def fetch_page(page: int, limit: int):
+        if page == 3:
+            return "Unknown error: boom", None
+        return "Successfully fetched agents details.", make_page(page, limit)
+
+    with pytest.raises(PaginationError, match="boom"):
+        Paginator(fetch_page=fetch_page, limit=10).fetch_all()
+
+
+def test_async_fetch_all_runs_pages_concurrently():
+    """Tests."""
+    in_flight = []
+    peak = []
+
+    async def fetch_page(page: int, limit: int):
+        in_flight.append(page)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(page)
+        return "Successfully fetched agents details.", make_page(page, limit)
+
+    async def run():
+        return await AsyncPaginator(fetch_page=fetch_page, limit=5).fetch_all(max_workers=3)
+
+    symbols = [agent.symbol for agent in asyncio.run(run())]
+
+    assert symbols == [f"AGENT{index}" for index in range(TOTAL)]
+    assert max(peak) == 3
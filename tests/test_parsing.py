@@ -0,0 +1,41 @@
+"""Test Response Parsing."""
+
+import json
+
+import requests
+
+from spacetraders_python_sdk.models.models import (
+    ListShipsResponseSchema,
+    ListWaypointsResponseSchema,
+)
+from spacetraders_python_sdk.testing import payloads
+from spacetraders_python_sdk.transport import parse_response
+
+
+def make_response(body: dict) -> requests.Response:
+    """Build a response carrying `body`."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode()
+    return response
+
+
+def test_parse_response_validates_raw_bytes():
+    """Tests."""
+    ships = [payloads.make_ship(f"BILLY1-{index}", seed=index) for index in range(1, 4)]
+    response = make_response(payloads.make_page(ships, total=3))
+
+    parsed = parse_response(ListShipsResponseSchema, response)
+
+    assert parsed == ListShipsResponseSchema.model_validate(json.loads(response.content))
+    assert [ship.symbol for ship in parsed.data] == ["BILLY1-1", "BILLY1-2", "BILLY1-3"]
+
+
+def test_parse_response_is_memoized_per_schema():
+    """Tests."""
+    waypoints = payloads.make_system_waypoints("X1-GJ54", 5)
+    response = make_response(payloads.make_page(waypoints, total=5))
+
+    first = parse_response(ListWaypointsResponseSchema, response)
+
+    assert parse_response(ListWaypointsResponseSchema, response) is first
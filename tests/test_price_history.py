@@ -0,0 +1,132 @@
+"""Test Price History."""
+
+import pytest
+
+from spacetraders_python_sdk.models.models import MarketSchema
+from spacetraders_python_sdk.testing import payloads
+
+
+np = pytest.importorskip("numpy")
+
+from spacetraders_python_sdk.markets import (  # noqa: E402  pylint: disable=wrong-import-position
+    PriceHistory,
+)
+
+
+GOODS = ["IRON_ORE", "FUEL"]
+
+
+def make_market(symbol, price):
+    """Return a `MarketSchema` selling every good of `GOODS` at `price`."""
+    market = payloads.make_market(symbol, goods=GOODS)
+    for good in market["tradeGoods"]:
+        good["purchasePrice"], good["sellPrice"], good["supply"], good["activity"] = price, price - 5, "HIGH", "WEAK"
+    return MarketSchema.model_validate(market)
+
+
+def make_history(path, **kwargs):
+    """Record hourly snapshots of two markets over ten hours."""
+    history = PriceHistory(path, **kwargs)
+    for hour in range(10):
+        history.record(make_market("X1-GJ54-A1", 100 + hour), timestamp=hour * 3600)
+        history.record(make_market("X1-GJ54-B2", 200 + hour), timestamp=hour * 3600 + 60)
+    return history
+
+
+def test_range_queries(tmp_path):
+    """Tests."""
+    history = make_history(tmp_path, buffer_size=7, chunk_size=5)
+    assert len(history) == 40
+    assert history.waypoints == ["X1-GJ54-A1", "X1-GJ54-B2"]
+    assert history.symbols == GOODS
+
+    series = history.series("X1-GJ54-A1", "IRON_ORE")
+    assert len(series) == 10
+    assert series.purchase_prices.tolist() == list(range(100, 110))
+    assert series.sell_prices.tolist() == list(range(95, 105))
+    assert series.supply.tolist() == [3] * 10
+
+    series = history.series("X1-GJ54-B2", "FUEL", start=3600, end=4 * 3600)
+    assert series.timestamps.tolist() == [3660, 7260, 10860]
+    assert series.purchase_prices.tolist() == [201, 202, 203]
+
+    assert len(history.series("X1-GJ54-C3", "FUEL")) == 0
+    assert len(history.series("X1-GJ54-A1", "FUEL", start=10 * 3600)) == 0
+
+
+def test_downsampling(tmp_path):
+    """Tests."""
+    history = make_history(tmp_path)
+
+    series = history.downsample("X1-GJ54-A1", "IRON_ORE", interval=4 * 3600)
+    assert series.timestamps.tolist() == [0, 4 * 3600, 8 * 3600]
+    assert series.purchase_prices.tolist() == [101.5, 105.5, 108.5]
+    assert series.counts.tolist() == [4, 4, 2]
+
+    assert history.downsample("X1-GJ54-A1", "IRON_ORE", 4 * 3600, how="max").purchase_prices.tolist() == [
+        103,
+        107,
+        109,
+    ]
+    assert history.downsample("X1-GJ54-A1", "IRON_ORE", 4 * 3600, how="first").sell_prices.tolist() == [95, 99, 103]
+    assert len(history.downsample("X1-GJ54-C3", "IRON_ORE", 3600)) == 0
+    with pytest.raises(ValueError):
+        history.downsample("X1-GJ54-A1", "IRON_ORE", 3600, how="median")
+
+
+def test_persistence(tmp_path):
+    """Tests."""
+    with make_history(tmp_path, buffer_size=1000):
+        pass
+
+    history = PriceHistory(tmp_path)
+    assert len(history) == 40
+    assert history.latest("X1-GJ54-B2", "FUEL") == {
+        "timestamp": 9 * 3600 + 60,
+        "purchasePrice": 209,
+        "sellPrice": 204,
+        "tradeVolume": history.series("X1-GJ54-B2", "FUEL").trade_volumes[-1],
+        "supply": "HIGH",
+        "activity": "WEAK",
+    }
+    assert history.latest("X1-GJ54-C3", "FUEL") is None
+
+    with pytest.raises(ValueError):
+        history.record(make_market("X1-GJ54-A1", 100), timestamp=0)
+
+    history.record(make_market("X1-GJ54-C3", 300), timestamp=10 * 3600)
+    assert history.latest("X1-GJ54-C3", "FUEL")["purchasePrice"] == 300
+
+    with open(tmp_path / "timestamp.bin", "ab") as file:
+        file.write(b"\0" * 8)
+    assert len(PriceHistory(tmp_path)) == 40
+    assert (tmp_path / "timestamp.bin").stat().st_size == 40 * 8
+
+
+def test_millions_of_rows(tmp_path):
+    """Tests."""
+    (tmp_path / "waypoints.txt").write_text("".join(f"X1-GJ54-W{index}\n" for index in range(100)))
+    (tmp_path / "symbols.txt").write_text("".join(f"{symbol}\n" for symbol in GOODS))
+
+    rows = 2_000_000
+    index = np.arange(rows)
+    columns = {
+        "timestamp": index.astype("<f8"),
+        "waypoint": (index // 2 % 100).astype("<i4"),
+        "symbol": (index % 2).astype("<i2"),
+        "purchase_price": (index % 1000).astype("<i4"),
+        "sell_price": (index % 1000).astype("<i4"),
+        "trade_volume": np.full(rows, 10, dtype="<i4"),
+        "supply": np.full(rows, 2, dtype="i1"),
+        "activity": np.full(rows, -1, dtype="i1"),
+    }
+    for name, values in columns.items():
+        values.tofile(tmp_path / f"{name}.bin")
+
+    history = PriceHistory(tmp_path, chunk_size=1 << 18)
+    assert len(history) == rows
+
+    series = history.series("X1-GJ54-W7", "FUEL", start=1_000_000, end=1_500_000)
+    assert len(series) == 2500
+    assert np.all(series.timestamps % 200 == 15)
+    assert len(history.downsample("X1-GJ54-W7", "FUEL", interval=100_000)) == 20
@@ -0,0 +1,122 @@
+"""Test Price Matrix."""
+
+import time
+
+import pytest
+
+from spacetraders_python_sdk.models.models import MarketSchema
+from spacetraders_python_sdk.testing import payloads
+
+
+pytest.importorskip("numpy")
+
+from spacetraders_python_sdk.markets import (  # noqa: E402  pylint: disable=wrong-import-position
+    PriceMatrix,
+)
+
+
+SYMBOLS = ["IRON_ORE", "COPPER_ORE", "FUEL"]
+
+
+def make_market(symbol, prices, volume=20):
+    """Return a `MarketSchema` trading each good at the given (purchase, sell) prices."""
+    market = payloads.make_market(symbol, goods=list(prices))
+    for good in market["tradeGoods"]:
+        good["purchasePrice"], good["sellPrice"] = prices[good["symbol"]]
+        good["tradeVolume"] = volume
+    return MarketSchema.model_validate(market)
+
+
+def make_matrix():
+    """Three markets in one system and one in another."""
+    matrix = PriceMatrix(symbols=SYMBOLS, capacity=2)
+    matrix.update(make_market("X1-GJ54-A1", {"IRON_ORE": (10, 8), "FUEL": (70, 65)}), x=0, y=0)
+    matrix.update(make_market("X1-GJ54-B2", {"IRON_ORE": (40, 35), "COPPER_ORE": (20, 18)}), x=100, y=0)
+    matrix.update(make_market("X1-GJ54-C3", {"IRON_ORE": (30, 25), "COPPER_ORE": (50, 45)}), x=10, y=0)
+    matrix.update(make_market("X1-AB12-A1", {"IRON_ORE": (500, 480), "FUEL": (90, 85)}), x=0, y=0)
+    return matrix
+
+
+def test_arbitrage_ranks_profit_per_distance_within_a_system():
+    """Tests."""
+    matrix = make_matrix()
+    assert len(matrix) == 4
+
+    opportunities = matrix.arbitrage()
+    trades = [(item.symbol, item.buy_market, item.sell_market) for item in opportunities]
+    assert trades == [
+        ("IRON_ORE", "X1-GJ54-A1", "X1-GJ54-C3"),
+        ("COPPER_ORE", "X1-GJ54-B2", "X1-GJ54-C3"),
+        ("IRON_ORE", "X1-GJ54-A1", "X1-GJ54-B2"),
+        ("IRON_ORE", "X1-GJ54-C3", "X1-GJ54-B2"),
+    ]
+
+    best = opportunities[0]
+    assert (best.purchase_price, best.sell_price, best.units, best.profit) == (10, 25, 20, 300)
+    assert best.distance == 10
+    assert best.score == pytest.approx(300 / 25)
+    assert all(item.sell_market != "X1-AB12-A1" for item in opportunities)
+
+
+def test_arbitrage_filters():
+    """Tests."""
+    matrix = make_matrix()
+    assert matrix.arbitrage(top=1)[0].sell_market == "X1-GJ54-C3"
+    assert matrix.arbitrage(cargo_capacity=5)[0].profit == 75
+    assert {item.symbol for item in matrix.arbitrage(goods=["COPPER_ORE"])} == {"COPPER_ORE"}
+    assert matrix.arbitrage(goods=["IRON_ORE"], distance_overhead=1000)[0].sell_market == "X1-GJ54-B2"
+
+    matrix.update(make_market("X1-GJ54-A1", {"IRON_ORE": (10, 8)}), timestamp=time.time() - 3600)
+    assert all(item.buy_market != "X1-GJ54-A1" for item in matrix.arbitrage(max_age=60))
+    assert matrix.arbitrage(max_age=7200)[0].buy_market == "X1-GJ54-A1"
+
+
+def test_incremental_updates():
+    """Tests."""
+    matrix = make_matrix()
+    matrix.update(make_market("X1-GJ54-B2", {"IRON_ORE": (40, 200), "COPPER_ORE": (20, 18)}))
+    best = matrix.arbitrage()[0]
+    assert (best.buy_market, best.sell_market, best.sell_price) == ("X1-GJ54-A1", "X1-GJ54-B2", 200)
+
+    matrix.set_position("X1-GJ54-B2", 1, 0)
+    assert matrix.arbitrage()[0].distance == 1
+    assert matrix.prices("X1-GJ54-B2") == {
+        "IRON_ORE": {"purchasePrice": 40.0, "sellPrice": 200.0},
+        "COPPER_ORE": {"purchasePrice": 20.0, "sellPrice": 18.0},
+    }
+
+    market = payloads.make_market("X1-GJ54-D4")
+    del market["tradeGoods"]
+    matrix.update(MarketSchema.model_validate(market))
+    assert "X1-GJ54-D4" in matrix.rows
+    assert matrix.prices("X1-GJ54-D4") == {}
+
+
+def test_no_opportunities():
+    """Tests."""
+    matrix = PriceMatrix(symbols=SYMBOLS)
+    assert matrix.arbitrage() == []
+
+    matrix.update(make_market("X1-GJ54-A1", {"IRON_ORE": (10, 80)}))
+    assert matrix.arbitrage() == []
+
+
+def test_many_markets():
+    """Tests."""
+    matrix = PriceMatrix()
+    for system in range(50):
+        for waypoint in range(20):
+            symbol = f"X1-S{system}-W{waypoint}"
+            market = MarketSchema.model_validate(payloads.make_market(symbol, goods=payloads.TRADE_SYMBOLS))
+            matrix.update(market, x=waypoint * 7 % 50, y=waypoint * 13 % 50)
+    assert len(matrix) == 1000
+
+    start = time.perf_counter()
+    opportunities = matrix.arbitrage(top=25, cargo_capacity=40)
+    elapsed = time.perf_counter() - start
+
+    print(f"arbitrage over 1000 markets: {elapsed * 1000:.1f} ms")
+    assert len(opportunities) == 25
+    assert [item.score for item in opportunities] == sorted((item.score for item in opportunities), reverse=True)
+    assert all(item.buy_market.rsplit("-", 1)[0] == item.sell_market.rsplit("-", 1)[0] for item in opportunities)
+    assert elapsed < 2
@@ -0,0 +1,70 @@
+"""Test Rate Limiter."""
+
+from spacetraders_python_sdk.transport import RateLimiter
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        """Init."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_sustained_then_burst_then_wait():
+    """Tests."""
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2.0, burst=3, burst_duration=60.0, clock=clock)
+
+    delays = [limiter.reserve() for _ in range(7)]
+
+    assert delays[:5] == [0.0] * 5
+    assert delays[5:] == [0.5, 1.0]
+
+
+def test_budget_refills():
+    """Tests."""
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2.0, burst=30, burst_duration=60.0, clock=clock)
+
+    for _ in range(32):
+        limiter.reserve()
+
+    budget = limiter.budget()
+    assert budget.sustained == 0
+    assert budget.burst == 0
+    assert budget.wait == 0.5
+
+    clock.now = 10.0
+    budget = limiter.budget()
+    assert budget.sustained == 2.0
+    assert budget.burst == 5.0
+    assert budget.wait == 0.0
+
+
+def test_pause():
+    """Tests."""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+
+    limiter.pause(3.0)
+
+    assert limiter.reserve() == 3.0
+    assert limiter.budget().wait == 3.0
+
+
+def test_session_routes_through_limiter(scripted_client):
+    """Tests."""
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2.0, burst=0, clock=clock)
+    client, adapter = scripted_client(rate_limiter=limiter)
+
+    client.session.get("http://stub/v2/my/agent")
+    client.session.get("http://stub/v2/my/agent")
+
+    assert len(adapter.sent) == 2
+    assert limiter.budget().wait == 0.5
@@ -0,0 +1,119 @@
+"""Test Response Cache."""
+
+from spacetraders_python_sdk import SpaceTradersClient
+from spacetraders_python_sdk.cache import ResponseCache
+from spacetraders_python_sdk.testing import StubServer
+from spacetraders_python_sdk.transport import RateLimiter
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        """Init."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def serve_markets(ship_present: bool = True):
+    """Return an `answer` serving an empty market for every waypoint, with trade goods if a ship is present."""
+
+    def answer(method, path):
+        market = {"symbol": path.split("/")[-2]}
+        if ship_present:
+            market["tradeGoods"] = []
+        return {"data": market}
+
+    return answer
+
+
+def test_ttl_and_stats():
+    """Tests."""
+    clock = FakeClock()
+    cache = ResponseCache(ttls={"market": 10.0}, clock=clock)
+
+    assert cache.get("market", "X1-GJ54-A1") is None
+    cache.set("market", "X1-GJ54-A1", "market")
+    cache.set("shipyard", "X1-GJ54-A1", "not cached without a TTL")
+    assert cache.get("market", "X1-GJ54-A1") == "market"
+    assert cache.get("shipyard", "X1-GJ54-A1") is None
+
+    clock.now = 10.0
+    assert cache.get("market", "X1-GJ54-A1") is None
+
+    stats = cache.stats("market")
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 0)
+    assert cache.stats().misses == 3
+
+
+def test_lru_eviction():
+    """Tests."""
+    cache = ResponseCache(maxsize=2)
+
+    cache.set("market", "A", 1)
+    cache.set("market", "B", 2)
+    cache.get("market", "A")
+    cache.set("market", "C", 3)
+
+    assert cache.get("market", "B") is None
+    assert cache.get("market", "A") == 1
+    assert cache.get("market", "C") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_get_market_reads_through_cache(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(serve_markets(), response_cache=ResponseCache())
+
+    for _ in range(3):
+        error, result = client.systems.get_market(system_symbol="X1-GJ54", waypoint_symbol="X1-GJ54-A1")
+        if not result:
+            raise Exception(error)
+        assert result.data.symbol == "X1-GJ54-A1"
+    assert len(adapter.sent) == 1
+
+    client.systems.get_market(system_symbol="X1-GJ54", waypoint_symbol="X1-GJ54-A1", use_cache=False)
+    assert len(adapter.sent) == 2
+    assert client.response_cache.stats("market").hits == 2
+
+
+def test_markets_seen_without_a_ship_are_not_cached(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(serve_markets(ship_present=False), response_cache=ResponseCache())
+
+    client.systems.get_market(system_symbol="X1-GJ54", waypoint_symbol="X1-GJ54-A1")
+    adapter.answer = serve_markets()
+    client.systems.get_market(system_symbol="X1-GJ54", waypoint_symbol="X1-GJ54-A1")
+    client.systems.get_market(system_symbol="X1-GJ54", waypoint_symbol="X1-GJ54-A1")
+
+    assert len(adapter.sent) == 2
+
+
+def test_own_trades_drop_the_cached_market():
+    """Tests."""
+    server = StubServer(ships=1)
+    client = SpaceTradersClient(
+        token="token",
+        api_url="http://stub/v2",
+        rate_limiter=RateLimiter(rate=1e6, burst=0),
+        response_cache=ResponseCache(),
+    )
+    client.session.mount("http://", server.adapter())
+    waypoint = next(
+        w["symbol"] for w in server.system_waypoints["X1-GJ54"] if "MARKETPLACE" in {t["symbol"] for t in w["traits"]}
+    )
+    server.ships["BILLY1-1"]["nav"]["waypointSymbol"] = waypoint
+    server.add_cargo("BILLY1-1", "IRON_ORE", 10)
+
+    def read_market():
+        client.systems.get_market(system_symbol="X1-GJ54", waypoint_symbol=waypoint)
+        return server.endpoints["GET /systems/{systemSymbol}/waypoints/{waypointSymbol}/market"]
+
+    assert read_market() == read_market() == 1
+    assert client.fleet.sell_cargo(ship_symbol="BILLY1-1", symbol="IRON_ORE", units=10)[1]
+    assert read_market() == read_market() == 2
+    assert client.fleet.refuel_ship(ship_symbol="BILLY1-1", units=100)[1]
+    assert read_market() == 3
@@ -0,0 +1,93 @@
+"""Test Retry Policy."""
+
+import asyncio
+
+import httpx
+
+from spacetraders_python_sdk.transport import (
+    AsyncSpaceTradersSession,
+    RateLimiter,
+    RetryPolicy,
+)
+
+
+def test_get_is_retried_on_gateway_errors(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(statuses=[502, 503, 504])
+
+    response = client.session.get("http://stub/v2/my/ships")
+
+    assert response.status_code == 200
+    assert len(adapter.sent) == 4
+
+
+def test_retries_are_bounded(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(statuses=[503] * 10)
+
+    response = client.session.get("http://stub/v2/my/ships")
+
+    assert response.status_code == 503
+    assert len(adapter.sent) == 4
+
+
+def test_idempotent_post_is_retried(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(statuses=[503])
+
+    response = client.session.post("http://stub/v2/my/ships/BILLY1-1/orbit")
+
+    assert response.status_code == 200
+    assert len(adapter.sent) == 2
+
+
+def test_sell_cargo_is_not_retried(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(statuses=[503, 429])
+
+    assert client.session.post("http://stub/v2/my/ships/BILLY1-1/sell").status_code == 503
+    assert client.session.post("http://stub/v2/my/contracts/abc/deliver").status_code == 429
+    assert len(adapter.sent) == 2
+
+
+def test_client_errors_are_not_retried(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(statuses=[400])
+
+    assert client.session.get("http://stub/v2/my/ships").status_code == 400
+    assert len(adapter.sent) == 1
+
+
+def test_rate_limited_request_waits_for_retry_after(scripted_client):
+    """Tests."""
+    client, adapter = scripted_client(statuses=[429], headers={"Retry-After": "0.05"}, rate_limiter=RateLimiter())
+
+    response = client.session.get("http://stub/v2/my/agent")
+
+    assert response.status_code == 200
+    assert len(adapter.sent) == 2
+
+
+def test_parse_reset():
+    """Tests."""
+    assert RetryPolicy.parse_reset({"Retry-After": "1.5"}) == 1.5
+    assert RetryPolicy.parse_reset({"x-ratelimit-reset": "2000-01-01T00:00:00.000Z"}) == 0.0
+    assert RetryPolicy.parse_reset({}) is None
+
+
+def test_async_session_retries():
+    """Tests."""
+    statuses = [503, 502]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0) if statuses else 200, json={})
+
+    async def run():
+        async with AsyncSpaceTradersSession(
+            retry_policy=RetryPolicy(backoff_base=0),
+            transport=httpx.MockTransport(handler),
+        ) as session:
+            return await session.post("http://stub/v2/my/ships/BILLY1-1/dock")
+
+    assert asyncio.run(run()).status_code == 200
+    assert not statuses
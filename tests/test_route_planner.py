@@ -0,0 +1,140 @@
+"""Test Route Planner."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from spacetraders_python_sdk.models.models import MarketSchema, ShipSchema
+from spacetraders_python_sdk.navigation import (
+    RoutePlanner,
+    RoutePlanningError,
+    follow_plan,
+    fuel_cost,
+    travel_time,
+)
+from spacetraders_python_sdk.testing import payloads
+
+
+def make_planner():
+    """Plan in a system with two fuel stations between the origin and the destination."""
+    planner = RoutePlanner()
+    planner.add_system(
+        "X1-GJ54",
+        [
+            SimpleNamespace(symbol="X1-GJ54-A1", x=0, y=0),
+            SimpleNamespace(symbol="X1-GJ54-B2", x=150, y=0),
+            SimpleNamespace(symbol="X1-GJ54-C3", x=300, y=0),
+            SimpleNamespace(symbol="X1-GJ54-D4", x=0, y=10),
+        ],
+    )
+    planner.add_fuel_station("X1-GJ54-B2", price=50)
+    planner.add_fuel_station("X1-GJ54-D4", price=80)
+    return planner
+
+
+def test_flight_formulas():
+    """Tests."""
+    assert fuel_cost(150, "CRUISE") == 150
+    assert fuel_cost(150, "BURN") == 300
+    assert fuel_cost(150, "DRIFT") == 1
+    assert travel_time(150, "CRUISE", 30) == 140
+    assert travel_time(10, "BURN", 30) == 19
+
+
+def test_fastest_plan_stops_to_refuel():
+    """Tests."""
+    plan = make_planner().plan("X1-GJ54-A1", "X1-GJ54-C3", fuel=100, fuel_capacity=200, engine_speed=30)
+
+    assert [(leg.destination, leg.flight_mode) for leg in plan.legs] == [
+        ("X1-GJ54-D4", "BURN"),
+        ("X1-GJ54-B2", "CRUISE"),
+        ("X1-GJ54-C3", "CRUISE"),
+    ]
+    assert [(leg.refuel, leg.refuel_cost) for leg in plan.legs] == [(0, 0), (120, 160), (150, 100)]
+    assert plan.seconds == 19 + 140 + 140
+    assert plan.cost == 260
+
+
+def test_cheapest_plan_drifts_when_allowed():
+    """Tests."""
+    planner = make_planner()
+
+    drifting = planner.plan("X1-GJ54-A1", "X1-GJ54-C3", 100, 200, 30, objective="cheapest")
+    cruising = planner.plan("X1-GJ54-A1", "X1-GJ54-C3", 100, 200, 30, "cheapest", flight_modes=["CRUISE"])
+
+    assert [(leg.destination, leg.flight_mode) for leg in drifting.legs] == [("X1-GJ54-C3", "DRIFT")]
+    assert drifting.cost == 0
+    assert all(leg.flight_mode == "CRUISE" for leg in cruising.legs)
+    fastest = planner.plan("X1-GJ54-A1", "X1-GJ54-C3", 100, 200, 30, flight_modes=["CRUISE"])
+    assert cruising.cost <= fastest.cost
+
+
+def test_unreachable_and_unknown():
+    """Tests."""
+    planner = make_planner()
+    planner.remove_fuel_station("X1-GJ54-B2")
+    planner.remove_fuel_station("X1-GJ54-D4")
+
+    assert planner.plan("X1-GJ54-A1", "X1-GJ54-C3", 100, 200, 30, flight_modes=["CRUISE"]) is None
+    assert planner.plan("X1-GJ54-A1", "X1-GJ54-C3", 0, 0, 30, flight_modes=["CRUISE"]).fuel == 0
+    with pytest.raises(RoutePlanningError):
+        planner.plan("X1-ZZ99-A1", "X1-ZZ99-B2", 100, 200, 30)
+
+
+def test_record_market_and_plan_for_ship():
+    """Tests."""
+    planner = make_planner()
+    planner.remove_fuel_station("X1-GJ54-D4")
+    market = MarketSchema.model_validate(payloads.make_market("X1-GJ54-D4", goods=["FUEL", "IRON_ORE"]))
+    planner.record_market(market)
+    ship = ShipSchema.model_validate(payloads.make_ship("BILLY1-1", waypoint_symbol="X1-GJ54-A1"))
+
+    plan = planner.plan_for_ship(ship, "X1-GJ54-C3")
+
+    assert planner.fuel_stations("X1-GJ54")["X1-GJ54-D4"] == market.tradeGoods[0].purchasePrice
+    assert plan.legs[0].origin == "X1-GJ54-A1"
+    assert plan.legs[-1].destination == "X1-GJ54-C3"
+
+
+class FakeFleet:
+    """Fleet recording the calls made to it."""
+
+    def __init__(self):
+        """Init."""
+        self.calls = []
+
+    def __getattr__(self, name):
+        """Record the call and answer with an arrival in the past."""
+
+        def call(**kwargs):
+            self.calls.append((name, kwargs.get("waypoint_symbol") or kwargs.get("flight_mode") or kwargs.get("units")))
+            nav = SimpleNamespace(route=SimpleNamespace(arrival="2024-08-31T12:00:00.000Z"))
+            return "ok", SimpleNamespace(data=SimpleNamespace(nav=nav))
+
+        return call
+
+
+def test_follow_plan_drives_the_fleet():
+    """Tests."""
+    plan = make_planner().plan("X1-GJ54-A1", "X1-GJ54-C3", fuel=100, fuel_capacity=200, engine_speed=30)
+    fleet = FakeFleet()
+    slept = []
+
+    message, _ = follow_plan(fleet, "BILLY1-1", plan, sleep=slept.append)
+
+    assert message == "ok"
+    assert fleet.calls == [
+        ("orbit_ship", None),
+        ("patch_ship_nav", "BURN"),
+        ("navigate_ship", "X1-GJ54-D4"),
+        ("dock_ship", None),
+        ("refuel_ship", 120),
+        ("orbit_ship", None),
+        ("patch_ship_nav", "CRUISE"),
+        ("navigate_ship", "X1-GJ54-B2"),
+        ("dock_ship", None),
+        ("refuel_ship", 150),
+        ("orbit_ship", None),
+        ("navigate_ship", "X1-GJ54-C3"),
+    ]
+    assert slept == [0.0, 0.0, 0.0]
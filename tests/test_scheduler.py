@@ -0,0 +1,158 @@
+"""Test Scheduler."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from spacetraders_python_sdk.models.models import (
+    CooldownSchema,
+    NavigateShipResponseSchema,
+    ShipSchema,
+)
+from spacetraders_python_sdk.scheduling import FleetScheduler, ready_at
+from spacetraders_python_sdk.testing import payloads
+from spacetraders_python_sdk.transport import RateLimiter
+from spacetraders_python_sdk.views import ShipView
+
+
+START = 1_725_105_600.0
+
+
+class FakeClock:
+    """Clock advanced by sleeping."""
+
+    def __init__(self):
+        """Init."""
+        self.now = START
+        self.sleeps = []
+
+    def __call__(self):
+        """Return the time."""
+        return self.now
+
+    def sleep(self, seconds):
+        """Advance the time."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def iso(timestamp):
+    """Return a timestamp in the format of the API."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def cooldown(ship_symbol, now, seconds):
+    """Return a reactor cooldown of `seconds` starting at `now`."""
+    return CooldownSchema.model_validate(payloads.make_cooldown(ship_symbol, seconds, iso(now + seconds)))
+
+
+def in_transit(now, seconds):
+    """Return the response of a navigation arriving `seconds` after `now`."""
+    nav = payloads.make_nav("X1-GJ54", "X1-GJ54-B2", status="IN_TRANSIT", arrival=iso(now + seconds))
+    return NavigateShipResponseSchema.model_validate({"data": {"fuel": payloads.make_fuel(), "nav": nav, "events": []}})
+
+
+def test_ready_at():
+    """Tests."""
+    assert ready_at(None) is None
+    assert ready_at(("Error", None)) is None
+    assert ready_at(START) == START
+    assert ready_at(iso(START)) == START
+    assert ready_at(cooldown("SHIP-1", START, 70)) == START + 70
+    assert ready_at(cooldown("SHIP-1", START, 0)) is None
+
+    response = in_transit(START, 120)
+    assert ready_at(("Ship navigated", response)) == START + 120
+    assert ready_at(response.data.nav) == START + 120
+
+    ship = payloads.make_ship("SHIP-1")
+    ship["nav"] = response.data.nav.model_dump(mode="json")
+    ship["cooldown"] = payloads.make_cooldown("SHIP-1", 200, iso(START + 200))
+    assert ready_at(ShipSchema.model_validate(ship)) == START + 200
+    assert ready_at(ShipView.from_json(ship)) == START + 200
+
+    ship["nav"]["status"] = "IN_ORBIT"
+    ship["cooldown"] = payloads.make_cooldown("SHIP-1", 0)
+    assert ready_at(ShipSchema.model_validate(ship)) is None
+
+
+def test_actions_run_when_ships_are_ready():
+    """Tests."""
+    clock = FakeClock()
+    scheduler = FleetScheduler(clock=clock, sleep=clock.sleep)
+    runs = []
+
+    def extract(ship_symbol):
+        runs.append((clock.now - START, ship_symbol))
+        return "Resources extracted", cooldown(ship_symbol, clock.now, 70)
+
+    def navigate(ship_symbol):
+        runs.append((clock.now - START, ship_symbol))
+        if len([run for run in runs if run[1] == ship_symbol]) == 2:
+            return None
+        return in_transit(clock.now, 100)
+
+    scheduler.schedule("SHIP-1", extract)
+    scheduler.schedule("SHIP-2", navigate, at=START + 30)
+    scheduler.schedule("SHIP-3", extract, at=iso(START + 10))
+    assert len(scheduler) == 3
+
+    assert scheduler.run(until=START + 100) == 5
+    assert runs == [(0, "SHIP-1"), (10, "SHIP-3"), (30, "SHIP-2"), (70, "SHIP-1"), (80, "SHIP-3")]
+    assert clock.now == START + 100
+    assert scheduler.next_wake() == START + 130
+    assert len(scheduler) == 3
+
+    assert scheduler.cancel("SHIP-1") == 1
+    assert scheduler.run(until=START + 150) == 2
+    assert runs[-2:] == [(130, "SHIP-2"), (150, "SHIP-3")]
+    assert scheduler.cancel("SHIP-3") == 1
+    assert scheduler.run() == 0
+
+
+def test_errors_and_switching_actions():
+    """Tests."""
+    clock = FakeClock()
+    errors = []
+    scheduler = FleetScheduler(on_error=lambda ship_symbol, error: errors.append((ship_symbol, error)), clock=clock)
+
+    def dock(ship_symbol):
+        scheduler.schedule(ship_symbol, fail, repeat=False)
+
+    def fail(ship_symbol):
+        raise RuntimeError(ship_symbol)
+
+    scheduler.schedule("SHIP-1", dock)
+    scheduler.schedule("SHIP-2", lambda ship_symbol: ("Ship is not docked", None))
+    assert scheduler.run_pending() == 3
+    assert [(ship_symbol, str(error)) for ship_symbol, error in errors] == [
+        ("SHIP-2", "Ship is not docked"),
+        ("SHIP-1", "SHIP-1"),
+    ]
+    assert len(scheduler) == 0
+
+    scheduler = FleetScheduler(clock=clock)
+    scheduler.schedule("SHIP-1", fail)
+    with pytest.raises(RuntimeError):
+        scheduler.run()
+
+
+def test_fleet_shares_the_rate_budget():
+    """Tests."""
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2, burst=0, burst_duration=0, clock=clock)
+    scheduler = FleetScheduler(rate_limiter=limiter, clock=clock, sleep=clock.sleep)
+
+    def extract(ship_symbol):
+        limiter.acquire()
+        sent.setdefault(ship_symbol, []).append(clock.now - START)
+        return cooldown(ship_symbol, clock.now, 60)
+
+    sent = {}
+    for index in range(100):
+        scheduler.schedule(f"SHIP-{index}", extract)
+
+    assert scheduler.run(until=START + 100) == 182
+    times = sorted(time for ship_times in sent.values() for time in ship_times)
+    assert all(sum(start <= time < start + 10 for time in times) <= 22 for start in times)
+    assert all(ship_times[1] - ship_times[0] == 60 for ship_times in sent.values() if len(ship_times) == 2)
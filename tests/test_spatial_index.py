@@ -0,0 +1,101 @@
+"""Test Spatial Index."""
+
+import random
+import time
+
+from spacetraders_python_sdk.models.models import (
+    ListWaypointsResponseSchema,
+    WaypointTraitSymbolEnum,
+    WaypointTypeEnum,
+)
+from spacetraders_python_sdk.navigation import SpatialIndex
+from spacetraders_python_sdk.testing import payloads
+
+
+def brute_force(index, x, y, types=None, traits=()):
+    """Rank every matching entry by distance."""
+    entries = [index.get(symbol) for symbol in index._entries]
+    matching = [entry for entry in entries if (types is None or entry.type in types) and set(traits) <= entry.traits]
+    return sorted(matching, key=lambda entry: (entry.distance_to(x, y), entry.symbol))
+
+
+def make_index():
+    """Index a system of synthetic waypoints."""
+    waypoints = payloads.make_system_waypoints("X1-GJ54", 300)
+    response = ListWaypointsResponseSchema.model_validate(payloads.make_page(waypoints, total=len(waypoints)))
+    return SpatialIndex.from_waypoints(response.data, cell_size=50)
+
+
+def test_nearest_matches_brute_force():
+    """Tests."""
+    index = make_index()
+    rng = random.Random(1)
+
+    for _ in range(50):
+        x, y = rng.uniform(-900, 900), rng.uniform(-900, 900)
+        expected = brute_force(index, x, y)[:5]
+        assert [neighbour.entry for neighbour in index.nearest(x, y, k=5)] == expected
+
+
+def test_nearest_filters_by_type_and_traits():
+    """Tests."""
+    index = make_index()
+
+    found = index.nearest(
+        0,
+        0,
+        k=3,
+        types=[WaypointTypeEnum.FUEL_STATION, WaypointTypeEnum.PLANET],
+        traits=[WaypointTraitSymbolEnum.MARKETPLACE],
+    )
+
+    assert [neighbour.entry for neighbour in found] == brute_force(
+        index, 0, 0, types={"FUEL_STATION", "PLANET"}, traits={"MARKETPLACE"}
+    )[:3]
+    assert all(neighbour.entry.type in ("FUEL_STATION", "PLANET") for neighbour in found)
+
+
+def test_within_radius():
+    """Tests."""
+    index = make_index()
+
+    found = index.within(100, -100, 250, types=["ASTEROID"])
+
+    expected = [
+        entry for entry in brute_force(index, 100, -100, types={"ASTEROID"}) if entry.distance_to(100, -100) <= 250
+    ]
+    assert [neighbour.entry for neighbour in found] == expected
+    assert all(neighbour.distance <= 250 for neighbour in found)
+
+
+def test_add_replaces_and_remove_drops():
+    """Tests."""
+    index = SpatialIndex(cell_size=10)
+    index.add("X1-A1", 0, 0, "PLANET")
+    index.add("X1-A1", 100, 100, "PLANET")
+    index.add("X1-B2", 5, 5, "MOON")
+
+    assert len(index) == 2
+    assert index.nearest(0, 0)[0].entry.symbol == "X1-B2"
+
+    index.remove("X1-B2")
+
+    assert "X1-B2" not in index
+    assert index.nearest(0, 0)[0].entry.symbol == "X1-A1"
+    assert index.nearest(0, 0, max_distance=50) == []
+
+
+def test_nearest_scales_to_a_galaxy():
+    """Tests."""
+    rng = random.Random(2)
+    index = SpatialIndex(cell_size=500)
+    for number in range(30000):
+        index.add(f"X1-{number}", rng.randint(-50000, 50000), rng.randint(-50000, 50000), "RED_STAR")
+
+    start = time.perf_counter()
+    for _ in range(200):
+        index.nearest(rng.uniform(-50000, 50000), rng.uniform(-50000, 50000), k=10)
+    elapsed = time.perf_counter() - start
+
+    print(f"200 10-nearest queries over 30000 systems: {elapsed * 1000:.1f} ms")
+    assert elapsed < 2
@@ -0,0 +1,185 @@
+"""Test Stub Server."""
+
+import asyncio
+
+from spacetraders_python_sdk import AsyncSpaceTradersClient, SpaceTradersClient
+from spacetraders_python_sdk.models import SurveySchema
+from spacetraders_python_sdk.testing import StubServer
+from spacetraders_python_sdk.transport import RateLimiter, RetryPolicy
+
+
+def make_client(server, **kwargs):
+    """Return a client answered in process by `server`, without backoff sleeps or client-side rate limit."""
+    options = {"rate_limiter": RateLimiter(rate=1e6, burst=0), "retry_policy": RetryPolicy(backoff_base=0), **kwargs}
+    client = SpaceTradersClient(token="token", api_url="http://stub/v2", **options)
+    client.session.mount("http://", server.adapter())
+    return client
+
+
+def test_every_endpoint_answers_its_schema():
+    """Tests."""
+    clock = [1_725_000_000.0]
+    server = StubServer(ships=3, systems=3, waypoints_per_system=12, clock=lambda: clock[0])
+    client = make_client(server)
+
+    def check(result):
+        message, data = result
+        assert data is not None, message
+        return data.data
+
+    assert client.get_status().stats.systems == 3
+    assert check(client.agents.get_agent()).symbol == "BILLY1"
+    assert client.agents.list_agents(limit=20)[1].meta.total == 40
+    assert check(client.agents.get_public_agent(agent_symbol="AGENT3")).symbol == "AGENT3"
+    assert len(check(client.factions.list_factions())) == 9
+    assert check(client.factions.get_faction(faction_id="VOID")).symbol == "VOID"
+    assert len(client.fleet.fetch_all_ships()) == 3
+    assert len(client.systems.fetch_all_waypoints_in_system(system_symbol="X1-GJ54")) == 12
+    assert check(client.systems.get_system(system_symbol="X1-GJ54")).symbol == "X1-GJ54"
+    assert client.systems.list_systems()[1].meta.total == 3
+
+    waypoints = server.system_waypoints["X1-GJ54"]
+    market = next(w["symbol"] for w in waypoints if "MARKETPLACE" in {t["symbol"] for t in w["traits"]})
+    shipyard = next(w["symbol"] for w in waypoints if "SHIPYARD" in {t["symbol"] for t in w["traits"]})
+    gate = server.gates["X1-GJ54"][0]
+    assert check(client.systems.get_waypoint(system_symbol="X1-GJ54", waypoint_symbol=market)).symbol == market
+    unvisited = check(client.systems.get_market(system_symbol="X1-GJ54", waypoint_symbol=market))
+    assert unvisited.symbol == market and "tradeGoods" not in unvisited.model_fields_set
+    assert check(client.systems.get_shipyard(system_symbol="X1-GJ54", waypoint_symbol=shipyard)).shipTypes
+    connections = check(client.systems.get_jump_gate(system_symbol="X1-GJ54", waypoint_symbol=gate)).connections
+    assert connections == [server.gates[list(server.systems)[1]][0]]
+    assert check(client.systems.get_construction_site(system_symbol="X1-GJ54", waypoint_symbol=gate)).materials
+
+    [contract] = check(client.contracts.list_contracts(limit=1))
+    check(client.contracts.accept_contract(contract_id=contract.id))
+    assert server.agent["credits"] == 185_000
+
+    ship = "BILLY1-1"
+    assert check(client.fleet.get_ship(ship_symbol=ship)).nav.status == "DOCKED"
+    check(client.fleet.orbit_ship(ship_symbol=ship))
+    extraction = check(client.fleet.extract_resources(ship_symbol=ship)).extraction
+    assert extraction.extracted_resource.units > 0
+    message, _ = client.fleet.create_survey(ship_symbol=ship)
+    assert message.startswith("Unknown error") and "cooldown" in message
+    clock[0] += 70
+    surveys = check(client.fleet.create_survey(ship_symbol=ship)).surveys
+    clock[0] += 60
+    check(client.fleet.extract_resources_with_survey(ship_symbol=ship, survey=SurveySchema(**surveys[0].model_dump())))
+
+    destination = min(
+        (w for w in waypoints if w["symbol"] != "X1-GJ54-A1" and "MARKETPLACE" in {t["symbol"] for t in w["traits"]}),
+        key=lambda w: abs(w["x"] - waypoints[0]["x"]) + abs(w["y"] - waypoints[0]["y"]),
+    )
+    check(client.fleet.patch_ship_nav(ship_symbol=ship, flight_mode="DRIFT"))
+    assert check(client.fleet.navigate_ship(ship_symbol=ship, waypoint_symbol=destination["symbol"])).nav.status
+    assert client.fleet.dock_ship(ship_symbol=ship)[1] is None
+    clock[0] += 86400
+    check(client.fleet.dock_ship(ship_symbol=ship))
+    server.ships[ship]["fuel"]["current"] = 100
+    check(client.fleet.refuel_ship(ship_symbol=ship, units=400))
+    assert server.ships[ship]["fuel"]["current"] == 400
+    assert check(client.systems.get_market(system_symbol="X1-GJ54", waypoint_symbol=destination["symbol"])).tradeGoods
+
+    cargo = check(client.fleet.get_ship_cargo(ship_symbol=ship))
+    sold = check(client.fleet.sell_cargo(ship_symbol=ship, symbol=cargo.inventory[0].symbol, units=1))
+    assert sold.transaction.units == 1
+
+    material = server.constructions[gate]["materials"][0]["TradeSymbol"]
+    server.add_cargo(ship, "IRON_ORE", 60)
+    server.add_cargo(ship, material, 5)
+    check(
+        client.systems.supply_construction_site(
+            system_symbol="X1-GJ54", waypoint_symbol=gate, ship_symbol=ship, trade_symbol=material, units=5
+        )
+    )
+    delivered = check(
+        client.contracts.deliver_cargo_to_contract(
+            contract_id=contract.id, ship_symbol=ship, trade_symbol="IRON_ORE", units=30
+        )
+    )
+    assert delivered.cargo.units == server.ships[ship]["cargo"]["units"]
+    delivery = client.session.post(
+        url=f"http://stub/v2/my/contracts/{contract.id}/deliver",
+        json={"shipSymbol": ship, "tradeSymbol": "IRON_ORE", "units": 30},
+    )
+    assert set(delivery.json()["data"]) == {"contract", "cargo"}
+    credits = server.agent["credits"]
+    check(client.contracts.fullfill_contract(contract_id=contract.id))
+    assert server.agent["credits"] == credits + 40_000
+
+    assert server.stats[404] == 0
+    assert server.endpoints["POST /my/ships/{shipSymbol}/orbit"] == 1
+    assert len(server.endpoints) >= 28
+
+
+def test_errors_and_pagination_limits():
+    """Tests."""
+    server = StubServer(ships=1, systems=1)
+
+    status, _, body = server.handle("GET", "http://stub/v2/my/ships?limit=50")
+    assert status == 422 and b'"code":422' in body
+    status, _, body = server.handle("GET", "/v2/nowhere")
+    assert status == 404 and b"No route" in body
+    status, _, _ = server.handle("POST", "/v2/my/ships/BILLY1-1/sell", b'{"symbol": "IRON_ORE", "units": 1}')
+    assert status == 400
+    assert server.stats == {"requests": 3, 422: 1, 404: 1, 400: 1}
+
+
+def test_injected_429s_are_retried():
+    """Tests."""
+    server = StubServer(ships=2, inject_429=0.5, retry_after=0, seed=3)
+    client = make_client(server, retry_policy=RetryPolicy(max_retries=10, backoff_base=0))
+
+    for _ in range(20):
+        message, ship = client.fleet.get_ship(ship_symbol="BILLY1-2")
+        assert ship is not None, message
+
+    assert server.stats["injected_429"] > 0
+    assert server.stats[200] == 20
+    assert server.stats[429] == server.stats["injected_429"]
+
+
+def test_rate_limit_answers_429_with_headers():
+    """Tests."""
+    server = StubServer(rate_limit=RateLimiter(rate=2.0, burst=0, clock=lambda: 0.0))
+
+    answers = [server.handle("GET", "/v2/my/agent") for _ in range(3)]
+
+    assert [status for status, _, _ in answers] == [200, 200, 429]
+    headers = answers[2][1]
+    assert float(headers["Retry-After"]) > 0
+    assert headers["x-ratelimit-limit-per-second"] == "2.0"
+    assert headers["x-ratelimit-reset"].endswith("Z")
+
+
+def test_async_transport():
+    """Tests."""
+    server = StubServer(ships=5, latency=0.01)
+
+    async def run():
+        async with AsyncSpaceTradersClient(
+            token="token", api_url="http://stub/v2", transport=server.async_transport()
+        ) as client:
+            return await client.fleet.orbit_ships(ship_symbols=list(server.ships))
+
+    result = asyncio.run(run())
+
+    assert result.ok and len(result) == 5
+    assert {ship["nav"]["status"] for ship in server.ships.values()} == {"IN_ORBIT"}
+
+
+def test_serves_on_localhost(monkeypatch):
+    """Tests."""
+    monkeypatch.setenv("API_URL", "http://live-api.invalid/v2")
+    monkeypatch.setenv("TOKEN", "live-token")
+    server = StubServer(ships=2)
+
+    with server.serve() as http:
+        client = SpaceTradersClient(token="token", api_url=http.url)
+        _, ship = client.fleet.get_ship(ship_symbol="BILLY1-1")
+        message, nav = client.fleet.orbit_ship(ship_symbol="BILLY1-2")
+
+    assert ship is not None and ship.data.symbol == "BILLY1-1"
+    assert nav is not None, message
+    assert server.stats[200] == 2
+    assert client.token == "token"
@@ -0,0 +1,133 @@
+"""Test Survey Registry."""
+
+import json
+
+from datetime import datetime, timezone
+
+from spacetraders_python_sdk.models.models import (
+    CreateSurveyResponseSchema,
+    SurveySchema,
+)
+from spacetraders_python_sdk.surveys import SURVEY_EXHAUSTED, SurveyRegistry, error_code
+from spacetraders_python_sdk.testing import payloads
+
+
+START = 1_725_105_600.0
+
+
+def make_survey(signature, deposits=("IRON_ORE", "COPPER_ORE", "IRON_ORE"), size="MODERATE", expires_in=900):
+    """Return a `SurveySchema` of X1-GJ54-B2 expiring `expires_in` seconds after `START`."""
+    expiration = datetime.fromtimestamp(START + expires_in, timezone.utc).isoformat()
+    survey = payloads.make_survey(signature, deposits=deposits, size=size, expiration=expiration)
+    return SurveySchema.model_validate(survey)
+
+
+def make_registry(now, **kwargs):
+    """Return a registry holding four surveys of X1-GJ54-B2."""
+    registry = SurveyRegistry(clock=lambda: now[0], **kwargs)
+    registry.add(make_survey("S1", ("IRON_ORE", "COPPER_ORE", "IRON_ORE")))
+    registry.add(make_survey("S2", ("IRON_ORE", "IRON_ORE", "IRON_ORE"), size="SMALL", expires_in=300))
+    registry.add(make_survey("S3", ("IRON_ORE", "IRON_ORE", "IRON_ORE"), size="LARGE", expires_in=600))
+    registry.add(make_survey("S4", ("COPPER_ORE", "GOLD_ORE"), size="LARGE"))
+    return registry
+
+
+class SurveyFleet:
+    """Fleet answering extractions with the errors of a survey."""
+
+    def __init__(self, codes):
+        """Init."""
+        self.codes = codes
+        self.used = []
+
+    def extract_resources(self, ship_symbol):
+        """Extract without survey."""
+        self.used.append(None)
+        return "Extracted successfully.", object()
+
+    def extract_resources_with_survey(self, ship_symbol, survey):
+        """Extract with a survey."""
+        self.used.append(survey.signature)
+        code = self.codes.get(survey.signature)
+        if code is None:
+            return "Extracted successfully.", object()
+        return f"Unknown error: {json.dumps({'error': {'message': 'Survey failed.', 'code': code}})}", None
+
+
+def test_best_survey_per_good():
+    """Tests."""
+    now = [START]
+    registry = make_registry(now)
+    assert len(registry) == 4
+
+    assert registry.best("X1-GJ54-B2", "IRON_ORE").signature == "S3"
+    assert registry.best("X1-GJ54-B2", "COPPER_ORE").signature == "S4"
+    assert registry.best("X1-GJ54-B2", "GOLD_ORE").signature == "S4"
+    assert registry.best("X1-GJ54-B2", "QUARTZ_SAND") is None
+    assert registry.best("X1-GJ54-C3", "IRON_ORE") is None
+    assert registry.best("X1-GJ54-B2").signature in ("S3", "S4")
+    assert [survey.signature for survey in registry.surveys("X1-GJ54-B2", "IRON_ORE")] == ["S2", "S3", "S1"]
+
+    now[0] = START + 601
+    assert registry.best("X1-GJ54-B2", "IRON_ORE").signature == "S1"
+    assert "S3" not in registry
+    assert registry.evict_expired() == 1
+    assert len(registry) == 2
+
+
+def test_prices_rank_surveys_for_any_good():
+    """Tests."""
+    registry = make_registry([START], prices={"IRON_ORE": 40, "COPPER_ORE": 60, "GOLD_ORE": 300})
+    assert registry.best("X1-GJ54-B2").signature == "S4"
+
+    registry.remove("S4")
+    assert registry.best("X1-GJ54-B2").signature == "S3"
+    assert not registry.remove("S4")
+
+
+def test_extraction_errors_evict_surveys():
+    """Tests."""
+    registry = make_registry([START])
+    fleet = SurveyFleet({"S3": SURVEY_EXHAUSTED, "S1": 4000})
+
+    message, result = registry.extract(fleet, "SHIP-1", "X1-GJ54-B2", "IRON_ORE")
+    assert result is None
+    assert error_code(message) == SURVEY_EXHAUSTED
+    assert "S3" not in registry
+
+    assert registry.extract(fleet, "SHIP-1", "X1-GJ54-B2", "IRON_ORE")[1] is None
+    assert "S1" in registry
+
+    registry.remove("S1")
+    assert registry.extract(fleet, "SHIP-1", "X1-GJ54-B2", "IRON_ORE")[1] is not None
+    assert registry.extract(fleet, "SHIP-1", "X1-GJ54-C3", "IRON_ORE")[1] is not None
+    assert fleet.used == ["S3", "S1", "S2", None]
+    assert error_code("Unknown error: Bad Gateway") is None
+
+
+def test_record_create_survey_result():
+    """Tests."""
+    registry = SurveyRegistry(clock=lambda: START)
+    surveys = [payloads.make_survey(f"S{index}", expiration="2024-08-31T13:00:00Z") for index in range(3)]
+    response = CreateSurveyResponseSchema.model_validate(
+        {"data": {"cooldown": payloads.make_cooldown("SHIP-1", 60), "surveys": surveys}}
+    )
+
+    assert registry.record(("Surveys has been created.", response)) == 3
+    assert registry.record(response) == 0
+    assert registry.record(("Unknown error", None)) == 0
+    assert not registry.add(make_survey("OLD", expires_in=-1))
+    assert len(registry) == 3
+
+
+def test_many_surveys():
+    """Tests."""
+    registry = SurveyRegistry(clock=lambda: START)
+    for index in range(5000):
+        deposits = ("IRON_ORE",) * (index % 7 + 1) + ("COPPER_ORE",) * (7 - index % 7)
+        registry.add(make_survey(f"S{index}", deposits=deposits, expires_in=900 + index))
+
+    for _ in range(4000):
+        registry.remove(registry.best("X1-GJ54-B2", "IRON_ORE").signature)
+    assert len(registry) == 1000
+    assert registry.best("X1-GJ54-B2", "IRON_ORE") is not None
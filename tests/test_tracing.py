@@ -0,0 +1,131 @@
+"""Test Tracing."""
+
+import asyncio
+import io
+
+import httpx
+
+from spacetraders_python_sdk import AsyncSpaceTradersClient
+from spacetraders_python_sdk.fleet.batch import run_batch
+from spacetraders_python_sdk.testing import payloads
+from spacetraders_python_sdk.tracing import (
+    ConsoleExporter,
+    InMemoryExporter,
+    JsonLinesExporter,
+    Tracer,
+    current_span,
+    read_spans,
+)
+
+
+def answer(method, path):
+    """Answer every request with a ship."""
+    return {"data": payloads.make_ship("SHIP-1")}
+
+
+def test_subclient_call_holds_its_phases_as_child_spans(scripted_client):
+    """Tests."""
+    exporter = InMemoryExporter()
+    client, _ = scripted_client(answer, statuses=[503], tracer=Tracer(exporter))
+
+    client.fleet.get_ship(ship_symbol="SHIP-1")
+
+    names = [span.name for span in exporter.spans]
+    assert names == [
+        "rate_limiter.wait",
+        "http.request",
+        "retry.backoff",
+        "rate_limiter.wait",
+        "http.request",
+        "validate",
+        "Fleet.get_ship",
+    ]
+    root = exporter.spans[-1]
+    assert root.parent_id is None
+    assert root.attributes == {"ship_symbol": "SHIP-1"}
+    assert all(span.parent_id == root.span_id for span in exporter.spans[:-1])
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+    assert [span.attributes["status_code"] for span in exporter.spans if span.name == "http.request"] == [503, 200]
+    assert exporter.spans[1].attributes["endpoint"] == "/my/ships/{shipSymbol}"
+    assert exporter.spans[5].attributes["schema"] == "ShipResponseSchema"
+    assert all(span.duration >= 0 for span in exporter.spans)
+
+
+def test_failed_call_marks_its_span(scripted_client):
+    """Tests."""
+    exporter = InMemoryExporter()
+    client, _ = scripted_client(answer, statuses=[404], tracer=Tracer(exporter))
+
+    message, _ = client.fleet.get_ship(ship_symbol="SHIP-1")
+
+    assert exporter.spans[-1].error == message
+    assert exporter.spans[-2].error is None
+
+
+def test_batch_spans_share_the_caller_trace(scripted_client):
+    """Tests."""
+    exporter = InMemoryExporter()
+    client, _ = scripted_client(answer, tracer=Tracer(exporter))
+
+    with client.tracer.start_span("check ships") as root:
+        run_batch(lambda ship_symbol: client.fleet.get_ship(ship_symbol=ship_symbol), ["SHIP-1", "SHIP-2"])
+
+    calls = [span for span in exporter.spans if span.name == "Fleet.get_ship"]
+    assert len(calls) == 2
+    assert all(span.parent_id == root.span_id for span in calls)
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+
+
+def test_untraced_client_emits_nothing(scripted_client):
+    """Tests."""
+    client, _ = scripted_client(answer)
+
+    _, ship = client.fleet.get_ship(ship_symbol="SHIP-1")
+
+    assert ship is not None
+    assert client.session.tracer is None
+    assert current_span() is None
+
+
+def test_exporters(tmp_path):
+    """Tests."""
+    stream = io.StringIO()
+    path = tmp_path / "spans.jsonl"
+    with JsonLinesExporter(path) as exporter:
+        tracer = Tracer(exporter, clock=iter([1.0, 1.5, 1.75, 2.0]).__next__)
+        with tracer.start_span("outer", ship_symbol="SHIP-1"):
+            with tracer.start_span("inner"):
+                pass
+
+    inner, outer = read_spans(path)
+    assert (inner.name, outer.name) == ("inner", "outer")
+    assert inner.parent_id == outer.span_id
+    assert outer.duration == 1.0
+    assert outer.attributes == {"ship_symbol": "SHIP-1"}
+
+    ConsoleExporter(stream).export(outer)
+    assert stream.getvalue().endswith("1000.000 ms  outer ship_symbol=SHIP-1\n")
+
+
+def test_async_spans():
+    """Tests."""
+    exporter = InMemoryExporter()
+
+    def handler(request):
+        return httpx.Response(200, json={"data": {"nav": payloads.make_nav("X1-GJ54", "X1-GJ54-A1")}})
+
+    async def run():
+        async with AsyncSpaceTradersClient(
+            token="token",
+            api_url="http://stub/v2",
+            tracer=Tracer(exporter),
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            await client.fleet.orbit_ships(ship_symbols=["SHIP-1", "SHIP-2"])
+
+    asyncio.run(run())
+    [batch] = [span for span in exporter.spans if span.name == "AsyncFleet.orbit_ships"]
+    calls = [span for span in exporter.spans if span.name == "AsyncFleet.orbit_ship"]
+    assert sorted(span.attributes["ship_symbol"] for span in calls) == ["SHIP-1", "SHIP-2"]
+    assert all(span.parent_id == batch.span_id for span in calls)
+    assert len(exporter.spans) == 1 + 2 * 4
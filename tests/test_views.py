@@ -0,0 +1,74 @@
+"""Test Read Views."""
+
+import dataclasses
+import json
+import tracemalloc
+
+import pytest
+
+from spacetraders_python_sdk.models.models import MarketSchema, ShipSchema
+from spacetraders_python_sdk.testing import payloads
+from spacetraders_python_sdk.views import MarketTradeGoodView, ShipCargoView, ShipView
+
+
+def test_ship_view_from_model_matches_from_json():
+    """Tests."""
+    raw = payloads.make_ship("BILLY1-1")
+    ship = ShipSchema.model_validate(raw)
+
+    view = ShipView.from_model(ship)
+
+    assert view == ShipView.from_json(json.dumps({"data": raw}))
+    assert view.nav.waypointSymbol == ship.nav.waypointSymbol
+    assert view.role == "EXCAVATOR"
+    assert view.engineSpeed == 30
+    assert view.mounts == ("MOUNT_MINING_LASER_I", "MOUNT_SURVEYOR_I")
+
+
+def test_views_are_frozen_and_slotted():
+    """Tests."""
+    view = ShipView.from_json(payloads.make_ship("BILLY1-1"))
+
+    assert not hasattr(view, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        view.symbol = "BILLY1-2"  # type: ignore[misc]
+
+
+def test_cargo_view_units_of():
+    """Tests."""
+    cargo = ShipCargoView.from_json(
+        payloads.make_cargo(capacity=40, inventory=[payloads.make_cargo_item("IRON_ORE", 12)])
+    )
+
+    assert cargo.units_of("IRON_ORE") == 12
+    assert cargo.units_of("FUEL") == 0
+    assert cargo.available == 28
+
+
+def test_market_trade_good_view():
+    """Tests."""
+    market = MarketSchema.model_validate(payloads.make_market("X1-GJ54-A1"))
+
+    views = [MarketTradeGoodView.from_model(good) for good in market.tradeGoods]
+
+    assert [view.symbol for view in views] == [good.symbol.value for good in market.tradeGoods]
+    assert views[0].sellPrice == market.tradeGoods[0].sellPrice
+
+
+def test_ship_views_are_smaller_than_models():
+    """Tests."""
+    raw = [payloads.make_ship(f"BILLY1-{index}", seed=index) for index in range(100)]
+
+    tracemalloc.start()
+    models = [ShipSchema.model_validate(ship) for ship in raw]
+    model_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    views = [ShipView.from_json(ship) for ship in raw]
+    view_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"100 ships: models {model_size / 1024:.0f} KiB, views {view_size / 1024:.0f} KiB")
+    assert len(models) == len(views)
+    assert view_size * 4 < model_size